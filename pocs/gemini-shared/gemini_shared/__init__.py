@@ -0,0 +1,10 @@
+"""POC 공통 Gemini 모델 호출 모듈
+
+클라이언트 레지스트리, 속도 제한, 재시도, 기록/재생, 프롬프트 캐시, 이미지 업로드/인코딩,
+토큰 사용량 집계와 로컬 대체 서버를 gemini-vision-item-gen과 pdf-item-extractor가 함께 사용합니다.
+"""
+
+from .config import SharedSettings, configure
+from .schemas import TokenUsage
+
+__all__ = ["SharedSettings", "configure", "TokenUsage"]
@@ -0,0 +1,222 @@
+"""Gemini 클라이언트 레지스트리
+
+프로세스 전체에서 (API 키, 엔드포인트)별 genai.Client를 재사용합니다.
+모델은 요청마다 지정하므로 같은 키의 모든 모델이 클라이언트 하나를 공유합니다.
+동기/비동기(client.aio) 요청은 각각 keep-alive가 설정된 공유 HTTP 연결 풀을 사용하므로
+컴포넌트나 문항마다 클라이언트 생성과 TLS 핸드셰이크를 반복하지 않습니다.
+비동기 연결은 이벤트 루프에 묶이므로 비동기 연결 풀은 실행 중인 루프별로 따로 둡니다.
+settings.gemini_base_url이 지정되면 해당 주소(로컬 대체 서버 등)로 요청합니다.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+from google import genai
+from google.genai import types
+
+from .config import get_settings
+
+
+class ClientRegistry:
+    """(API 키, 엔드포인트)별 genai.Client 레지스트리"""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None
+    ):
+        """레지스트리 초기화
+
+        Args:
+            max_connections: HTTP 연결 풀 최대 연결 수 (없으면 설정에서 로드)
+            keepalive_expiry: 유휴 연결 유지 시간(초) (없으면 설정에서 로드)
+            timeout: HTTP 요청 기본 제한 시간(초) (없으면 설정에서 로드)
+        """
+        settings = get_settings()
+        self.max_connections = max_connections or settings.http_max_connections
+        self.keepalive_expiry = keepalive_expiry or settings.http_keepalive_expiry
+        self.timeout = timeout or settings.http_timeout
+        self.connect_timeout = min(settings.http_connect_timeout, self.timeout)
+
+        self._clients: dict[tuple[str, str], genai.Client] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+        # 통계
+        self.created = 0
+        self.reused = 0
+
+    def get(self, api_key: str) -> genai.Client:
+        """클라이언트 반환 (없으면 생성)
+
+        Args:
+            api_key: Google API 키
+
+        Returns:
+            공유 genai.Client
+        """
+        base_url = get_settings().gemini_base_url or ""
+        key = (api_key, base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.reused += 1
+                return client
+
+            client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    base_url=base_url or None,
+                    httpx_client=self._shared_http_client(),
+                    httpx_async_client=self._shared_async_http_client()
+                )
+            )
+            self._clients[key] = client
+            self.created += 1
+            return client
+
+    def _limits(self) -> httpx.Limits:
+        """공유 연결 풀 제한"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def _timeout(self) -> httpx.Timeout:
+        """공유 클라이언트 기본 제한 시간 (시도별 HttpOptions.timeout이 있으면 그 값이 우선)"""
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout)
+
+    def _shared_http_client(self) -> httpx.Client:
+        """keep-alive 연결 풀을 가진 공유 HTTP 클라이언트 (lock 보유 상태에서 호출)"""
+        if self._http_client is None:
+            self._http_client = httpx.Client(limits=self._limits(), timeout=self._timeout())
+        return self._http_client
+
+    def _shared_async_http_client(self) -> httpx.AsyncClient:
+        """client.aio 요청용 공유 비동기 HTTP 클라이언트 (lock 보유 상태에서 호출)
+
+        연결 풀은 _LoopTransport가 이벤트 루프별로 나눠 관리하므로
+        asyncio.run을 여러 번 호출해도 닫힌 루프의 연결을 재사용하지 않습니다.
+        """
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                transport=_LoopTransport(self._limits()),
+                timeout=self._timeout()
+            )
+        return self._async_http_client
+
+    def stats(self) -> dict:
+        """레지스트리 통계"""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "created": self.created,
+                "reused": self.reused,
+                "max_connections": self.max_connections,
+            }
+
+    def close(self):
+        """모든 클라이언트와 연결 풀 정리"""
+        with self._lock:
+            self._clients.clear()
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+            async_http_client, self._async_http_client = self._async_http_client, None
+
+        if async_http_client is not None:
+            _close_async_client(async_http_client)
+
+
+class _LoopTransport(httpx.AsyncBaseTransport):
+    """이벤트 루프별 비동기 연결 풀
+
+    httpx 비동기 연결은 생성된 이벤트 루프에서만 쓸 수 있습니다.
+    요청마다 실행 중인 루프의 연결 풀로 위임하고, 닫힌 루프의 연결 풀은 버립니다.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        """
+        Args:
+            limits: 루프별 연결 풀 제한
+        """
+        self.limits = limits
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _current(self) -> httpx.AsyncHTTPTransport:
+        """실행 중인 루프의 연결 풀 반환 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._discard_closed_loops()
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(limits=self.limits)
+                self._transports[loop] = transport
+            return transport
+
+    def _discard_closed_loops(self):
+        """닫힌 루프의 연결 풀 제거 (lock 보유 상태에서 호출)"""
+        for closed in [loop for loop in self._transports if loop.is_closed()]:
+            del self._transports[closed]
+
+    def pool_count(self) -> int:
+        """살아 있는 루프의 연결 풀 수"""
+        with self._lock:
+            self._discard_closed_loops()
+            return len(self._transports)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current().handle_async_request(request)
+
+    async def aclose(self):
+        """실행 중인 루프의 연결 풀을 닫고 나머지는 버림 (다른 루프의 연결은 여기서 닫을 수 없음)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.pop(loop, None)
+            self._transports.clear()
+        if transport is not None:
+            await transport.aclose()
+
+
+def _close_async_client(http_client: httpx.AsyncClient):
+    """비동기 HTTP 클라이언트 종료 (실행 중인 이벤트 루프가 있으면 태스크로 예약)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    try:
+        if loop is None:
+            asyncio.run(http_client.aclose())
+        else:
+            loop.create_task(http_client.aclose())
+    except Exception as e:
+        print(f"  - 비동기 HTTP 연결 풀 종료 실패: {e}")
+
+
+# 프로세스 전역 레지스트리 (configure() 이후 첫 사용 시 생성해야 POC 설정이 반영됨)
+_registry: Optional[ClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ClientRegistry:
+    """전역 클라이언트 레지스트리 반환 (첫 호출 시 현재 설정으로 생성)"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ClientRegistry()
+        return _registry
+
+
+def get_client(api_key: str) -> genai.Client:
+    """전역 레지스트리에서 클라이언트 반환"""
+    return get_registry().get(api_key)
@@ -0,0 +1,106 @@
+"""공유 모델 호출 설정
+
+각 POC의 Settings는 SharedSettings를 상속하고, 생성한 설정 인스턴스를 configure()로 등록합니다.
+공유 모듈은 호출 시점에 get_settings()로 읽으므로 등록한 인스턴스의 값(테스트의 monkeypatch 포함)을 따릅니다.
+"""
+
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SharedSettings(BaseSettings):
+    """공유 모델 호출 모듈 설정"""
+
+    # 모델 호출 대상 설정 (로컬 대체 서버, 기록/재생)
+    gemini_base_url: str = Field(
+        default="",
+        description="Gemini API 기본 URL (비우면 공식 엔드포인트, 예: http://127.0.0.1:8765)"
+    )
+    model_call_mode: str = Field(default="live", description="모델 호출 모드 (live, record, replay)")
+    recordings_dir: Path = Field(
+        default=Path("./output/recordings"),
+        description="record/replay 모드의 요청/응답 기록 디렉토리"
+    )
+
+    # HTTP 연결 풀 설정
+    http_max_connections: int = Field(default=32, description="공유 HTTP 연결 풀 최대 연결 수")
+    http_keepalive_expiry: float = Field(default=30.0, description="유휴 HTTP 연결 유지 시간 (초)")
+    http_timeout: float = Field(default=120.0, description="HTTP 요청 기본 제한 시간 (초, 시도별 제한 시간이 없을 때 적용)")
+    http_connect_timeout: float = Field(default=10.0, description="HTTP 연결 수립 제한 시간 (초)")
+
+    # 속도 제한 설정 (모델별 토큰 버킷)
+    rate_limit_enabled: bool = Field(default=True, description="모델별 RPM/TPM 속도 제한 사용 여부")
+    rate_limit_rpm: int = Field(default=60, description="기본 분당 요청 수")
+    rate_limit_tpm: int = Field(default=1_000_000, description="기본 분당 토큰 수")
+    model_rate_limits: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description='모델별 쿼터 (예: {"gemini-3-pro-image-preview": {"rpm": 20, "tpm": 100000}})'
+    )
+    rate_limit_backoff_base: float = Field(default=2.0, description="429 응답 시 초기 대기 시간 (초)")
+    rate_limit_backoff_max: float = Field(default=60.0, description="429 응답 시 최대 대기 시간 (초)")
+
+    # 모델 호출 재시도 설정 (429, 5xx, 타임아웃)
+    api_max_attempts: int = Field(default=4, description="모델 호출 최대 시도 횟수 (첫 시도 포함)")
+    api_retry_base_delay: float = Field(default=1.0, description="재시도 백오프 기본 대기 시간 (초)")
+    api_retry_max_delay: float = Field(default=30.0, description="재시도 백오프 최대 대기 시간 (초)")
+    api_request_deadline: float = Field(
+        default=300.0, description="요청 1건의 전체 제한 시간 (초, 재시도 포함, 0이면 무제한)"
+    )
+
+    # 프롬프트 캐시 설정 (정적 프롬프트 서버 측 캐시)
+    prompt_cache_enabled: bool = Field(default=True, description="배치 실행 중 정적 프롬프트 컨텍스트 캐시 사용 여부")
+    prompt_cache_ttl_seconds: int = Field(default=3600, description="프롬프트 캐시 유효 시간 (초, 실행 중 자동 연장)")
+
+    # 토큰 사용량/비용 집계 설정 (USD / 1M 토큰, 가장 긴 접두사가 일치하는 모델 적용)
+    model_prices: dict[str, dict[str, float]] = Field(
+        default_factory=lambda: {
+            "gemini-2.0-flash": {"input": 0.10, "cached_input": 0.025, "output": 0.40},
+            "gemini-2.5-flash": {"input": 0.30, "cached_input": 0.075, "output": 2.50},
+            "gemini-2.5-pro": {"input": 1.25, "cached_input": 0.31, "output": 10.0},
+            "gemini-3-flash": {"input": 0.50, "cached_input": 0.05, "output": 3.0},
+            "gemini-3-pro": {"input": 2.0, "cached_input": 0.20, "output": 12.0},
+            "gemini-3-pro-image": {"input": 2.0, "cached_input": 0.20, "output": 120.0},
+        },
+        description="모델별 토큰 가격 (USD/1M, input/cached_input/output, 생각 토큰은 output 가격)"
+    )
+
+    # 이미지 업로드 설정 (Files API 파일 참조 재사용)
+    file_upload_enabled: bool = Field(default=True, description="반복 전송되는 이미지를 Files API로 한 번 업로드해 참조할지 여부 (첫 요청은 인라인, 두 번째 요청부터 업로드)")
+    file_upload_min_kb: int = Field(default=256, description="업로드 대상 최소 이미지 크기 (KB, 미만은 인라인 전송)")
+    file_upload_expiry_margin_seconds: float = Field(
+        default=600.0, description="업로드 파일 만료까지 남은 시간이 이보다 짧으면 다시 업로드 (초)"
+    )
+
+    # 비동기 호출 설정
+    async_max_concurrency: int = Field(default=16, description="비동기 모델 호출 최대 동시 실행 수 (전체 클라이언트 공유)")
+
+    model_config = {
+        "env_file": ".env",
+        "env_file_encoding": "utf-8",
+        "extra": "ignore"
+    }
+
+
+# 공유 모듈이 읽는 설정 인스턴스 (POC가 configure()로 교체)
+settings: SharedSettings = SharedSettings()
+
+
+def configure(poc_settings: SharedSettings) -> SharedSettings:
+    """공유 모듈이 사용할 설정 인스턴스 등록
+
+    Args:
+        poc_settings: SharedSettings를 상속한 POC 설정 인스턴스
+
+    Returns:
+        등록한 설정 인스턴스
+    """
+    global settings
+    settings = poc_settings
+    return poc_settings
+
+
+def get_settings() -> SharedSettings:
+    """공유 모듈이 사용할 설정 인스턴스 (configure()로 등록한 POC 설정, 없으면 기본 설정)"""
+    return settings
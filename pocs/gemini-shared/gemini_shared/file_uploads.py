@@ -0,0 +1,255 @@
+"""이미지 업로드 관리자 (Files API)
+
+같은 이미지를 여러 단계(레이아웃 분석 → 문항 추출, 문항 생성 → 검증)에서
+매번 인라인 바이트로 보내는 대신 Files API로 한 번 업로드하고 파일 참조(URI)로 전송합니다.
+한 번만 쓰이는 이미지에 업로드 왕복이 더해지지 않도록 첫 요청은 인라인으로 보내고,
+같은 이미지가 다시 요청될 때(재사용이 확인된 시점) 업로드합니다.
+업로드는 (클라이언트, 이미지 sha256, MIME 타입) 단위로 재사용되며,
+만료 시각이 가까워진 파일은 다시 업로드합니다.
+업로드가 불가능하면(미지원 엔드포인트 등) 인라인 바이트로 전송합니다.
+"""
+
+import asyncio
+import hashlib
+import io
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Optional
+
+from google import genai
+from google.genai import types
+
+from .config import get_settings
+
+
+# 만료 시각 정보가 없을 때 가정하는 유효 시간 (Files API 기본 48시간)
+DEFAULT_FILE_TTL_SECONDS = 48 * 3600
+
+# 처리 중(PROCESSING) 상태 파일 대기 설정
+ACTIVE_POLL_INTERVAL = 0.5
+ACTIVE_POLL_TIMEOUT = 30.0
+
+
+@dataclass
+class UploadedFile:
+    """업로드된 파일 정보"""
+    name: str
+    uri: str
+    mime_type: str
+    size_bytes: int
+    expires_at: float  # time.time() 기준
+
+
+class FileUploadManager:
+    """이미지 해시 기반 업로드 관리자"""
+
+    def __init__(self, min_bytes: int, expiry_margin_seconds: float):
+        """관리자 초기화
+
+        Args:
+            min_bytes: 업로드 대상 최소 크기 (이보다 작은 이미지는 인라인 전송)
+            expiry_margin_seconds: 만료까지 남은 시간이 이보다 짧으면 다시 업로드
+        """
+        self.min_bytes = min_bytes
+        self.expiry_margin_seconds = expiry_margin_seconds
+        self._files: dict[tuple[int, str, str], UploadedFile] = {}
+        self._key_locks: dict[tuple[int, str, str], threading.Lock] = {}
+        # 인라인으로 한 번 이상 전송했거나 업로드했던 이미지 (다음 요청부터 업로드)
+        self._seen: set[tuple[int, str, str]] = set()
+        # 업로드가 불가능했던 클라이언트 (이후 인라인 전송)
+        self._unavailable: set[int] = set()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.uploads = 0
+        self.reused = 0
+        self.expired = 0
+        self.inline = 0
+        self.failures = 0
+        self.bytes_uploaded = 0
+        self.bytes_saved = 0
+
+    def image_part(self, client: genai.Client, data: bytes, mime_type: str) -> types.Part:
+        """이미지 요청 파트
+
+        Args:
+            client: genai 클라이언트
+            data: 이미지 바이트
+            mime_type: 이미지 MIME 타입
+
+        Returns:
+            업로드된 파일을 참조하는 파트
+            (첫 사용이거나 업로드 대상이 아니거나 업로드가 불가능하면 인라인 파트)
+        """
+        if len(data) < self.min_bytes or id(client) in self._unavailable:
+            return self._inline(data, mime_type)
+
+        key = (id(client), hashlib.sha256(data).hexdigest(), mime_type)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # 같은 이미지를 동시에 요청해도 한 번만 업로드
+        with key_lock:
+            uploaded = self._valid_file(key)
+            if uploaded is not None:
+                with self._lock:
+                    self.reused += 1
+                    self.bytes_saved += len(data)
+            else:
+                with self._lock:
+                    first_use = key not in self._seen
+                    self._seen.add(key)
+                if first_use:
+                    return self._inline(data, mime_type)
+                uploaded = self._upload(client, data, mime_type, key[1])
+                if uploaded is None:
+                    return self._inline(data, mime_type)
+                with self._lock:
+                    self._files[key] = uploaded
+
+        return types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type)
+
+    def _valid_file(self, key: tuple[int, str, str]) -> Optional[UploadedFile]:
+        """만료 여유가 남은 업로드 파일 조회"""
+        with self._lock:
+            uploaded = self._files.get(key)
+            if uploaded is None:
+                return None
+            if uploaded.expires_at - time.time() > self.expiry_margin_seconds:
+                return uploaded
+            del self._files[key]
+            self.expired += 1
+            return None
+
+    def _upload(
+        self,
+        client: genai.Client,
+        data: bytes,
+        mime_type: str,
+        digest: str
+    ) -> Optional[UploadedFile]:
+        """Files API 업로드 (실패 시 None)"""
+        try:
+            file = client.files.upload(
+                file=io.BytesIO(data),
+                config=types.UploadFileConfig(mime_type=mime_type, display_name=f"image-{digest[:16]}")
+            )
+            file = self._wait_until_active(client, file)
+        except Exception as e:
+            with self._lock:
+                self.failures += 1
+                self._unavailable.add(id(client))
+            print(f"  - 이미지 업로드 불가, 인라인으로 전송합니다: {e}")
+            return None
+
+        with self._lock:
+            self.uploads += 1
+            self.bytes_uploaded += len(data)
+        return UploadedFile(
+            name=file.name,
+            uri=file.uri,
+            mime_type=file.mime_type or mime_type,
+            size_bytes=len(data),
+            expires_at=_expiration_timestamp(file)
+        )
+
+    @staticmethod
+    def _wait_until_active(client: genai.Client, file: types.File) -> types.File:
+        """처리 중인 파일이 ACTIVE 상태가 될 때까지 대기
+
+        Raises:
+            RuntimeError: 처리 실패 또는 대기 시간 초과
+        """
+        deadline = time.monotonic() + ACTIVE_POLL_TIMEOUT
+        while file.state == types.FileState.PROCESSING:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"파일 처리 대기 시간 초과: {file.name}")
+            time.sleep(ACTIVE_POLL_INTERVAL)
+            file = client.files.get(name=file.name)
+        if file.state == types.FileState.FAILED:
+            raise RuntimeError(f"파일 처리 실패: {file.name}")
+        if not file.uri:
+            raise RuntimeError(f"업로드된 파일 URI가 없습니다: {file.name}")
+        return file
+
+    def _inline(self, data: bytes, mime_type: str) -> types.Part:
+        """인라인 바이트 파트"""
+        with self._lock:
+            self.inline += 1
+        return types.Part.from_bytes(data=data, mime_type=mime_type)
+
+    def stats(self) -> dict:
+        """업로드 통계"""
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "uploads": self.uploads,
+                "reused": self.reused,
+                "expired": self.expired,
+                "inline": self.inline,
+                "failures": self.failures,
+                "bytes_uploaded": self.bytes_uploaded,
+                "bytes_saved": self.bytes_saved,
+            }
+
+
+def _expiration_timestamp(file: types.File) -> float:
+    """파일 만료 시각 (time.time() 기준)"""
+    expiration = file.expiration_time
+    if expiration is None:
+        return time.time() + DEFAULT_FILE_TTL_SECONDS
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=timezone.utc)
+    return expiration.timestamp()
+
+
+# 프로세스 전역 관리자 (최초 사용 시 생성)
+_manager: Optional[FileUploadManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_upload_manager() -> Optional[FileUploadManager]:
+    """설정에 따른 전역 업로드 관리자 반환
+
+    Returns:
+        FileUploadManager (비활성화되었거나 live 모드가 아니면 None)
+    """
+    global _manager
+    settings = get_settings()
+    # 기록/재생 요청 키가 업로드 URI에 따라 달라지지 않도록 live 모드에서만 사용
+    if not settings.file_upload_enabled or settings.model_call_mode != "live":
+        return None
+
+    with _manager_lock:
+        if _manager is None:
+            _manager = FileUploadManager(
+                min_bytes=settings.file_upload_min_kb * 1024,
+                expiry_margin_seconds=settings.file_upload_expiry_margin_seconds
+            )
+        return _manager
+
+
+def image_part(client: genai.Client, data: bytes, mime_type: str) -> types.Part:
+    """이미지 요청 파트 (업로드 관리자 사용 가능 시 파일 참조)
+
+    Args:
+        client: genai 클라이언트
+        data: 이미지 바이트
+        mime_type: 이미지 MIME 타입
+
+    Returns:
+        파일 참조 파트 또는 인라인 파트
+    """
+    manager = get_upload_manager()
+    if manager is None:
+        return types.Part.from_bytes(data=data, mime_type=mime_type)
+    return manager.image_part(client, data, mime_type)
+
+
+async def image_part_async(client: genai.Client, data: bytes, mime_type: str) -> types.Part:
+    """image_part() 비동기 버전 (업로드 호출은 스레드에서 실행)"""
+    if get_upload_manager() is None:
+        return types.Part.from_bytes(data=data, mime_type=mime_type)
+    return await asyncio.to_thread(image_part, client, data, mime_type)
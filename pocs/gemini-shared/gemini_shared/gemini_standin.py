@@ -0,0 +1,537 @@
+"""로컬 Gemini 대체 서버
+
+generateContent 엔드포인트를 흉내 내는 표준 라이브러리 HTTP 서버입니다.
+API 키나 네트워크 없이 파이프라인을 부하 테스트할 수 있도록
+지연 시간 분포, 오류 주입, 요청 종류별 고정 응답(JSON/이미지)을 제공합니다.
+Files API 업로드(재개 가능 업로드, 조회, 삭제)도 지원하며,
+generateContent 요청의 파일 참조가 없거나 만료된 파일이면 403을 반환합니다.
+streamGenerateContent(SSE)는 같은 응답 텍스트를 일정 길이의 청크로 나누어 보냅니다.
+
+사용 예:
+    python -m gemini_shared.gemini_standin --port 8765 --latency lognormal:800,0.5 --error-rate 0.05
+    GEMINI_BASE_URL=http://127.0.0.1:8765 GOOGLE_API_KEY=dummy python ...
+"""
+
+import argparse
+import base64
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+
+# 1x1 흰색 PNG (이미지 생성 응답용)
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGP4//8/AAX+Av4N70a4AAAAAElFTkSuQmCC"
+)
+
+# 요청 종류별 기본 응답 (프롬프트에 match 문자열이 포함되면 해당 응답 사용, 위에서부터 검사)
+DEFAULT_CANNED: list[dict] = [
+    {
+        "name": "parsing",
+        "match": "boxed_content",
+        "response": {
+            "item_number": "1",
+            "question": [{"type": "text", "value": "다음 중 옳은 것은?"}],
+            "choices": [
+                {"label": str(n), "content": [{"type": "text", "value": f"선택지 {n}"}]}
+                for n in range(1, 6)
+            ],
+            "has_boxed_text": False,
+            "boxed_content": [],
+        },
+    },
+    {
+        "name": "validation",
+        "match": "is_valid",
+        "response": {"is_valid": True, "failure_codes": [], "details": [], "recommendations": []},
+    },
+    {
+        "name": "layout",
+        "match": "item_number_pattern",
+        "response": {"columns": 2, "item_number_pattern": "숫자.", "width": 1654, "height": 2339},
+    },
+    {
+        "name": "segmentation",
+        "match": "passages",
+        "response": {
+            "items": [
+                {"item_number": "1", "box_2d": [80, 60, 480, 490]},
+                {"item_number": "2", "box_2d": [500, 60, 920, 490]},
+                {"item_number": "3", "box_2d": [80, 510, 480, 940]},
+            ],
+            "passages": [],
+        },
+    },
+    {
+        "name": "generation",
+        "match": "evidence_facts",
+        "response": {
+            "stem": "자료를 보고 알 수 있는 내용으로 가장 적절한 것은?",
+            "choices": [
+                {"label": label, "text": f"선택지 {label}의 내용입니다."}
+                for label in ["A", "B", "C", "D", "E"]
+            ],
+            "correct_answer": "A",
+            "explanation": "자료에서 A의 내용을 직접 확인할 수 있습니다.",
+            "evidence_facts": ["자료의 제목", "자료의 수치"],
+        },
+    },
+]
+
+
+@dataclass
+class LatencyModel:
+    """응답 지연 시간 분포 (밀리초)
+
+    - fixed:MS
+    - uniform:MIN,MAX
+    - lognormal:MEDIAN,SIGMA
+    """
+    kind: str = "fixed"
+    params: tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """"kind:a,b" 형식 문자열 파싱"""
+        kind, _, args = spec.partition(":")
+        params = tuple(float(v) for v in args.split(",") if v) or (0.0,)
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"알 수 없는 지연 분포: {kind}")
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        """지연 시간 샘플 (초)"""
+        if self.kind == "uniform":
+            ms = rng.uniform(self.params[0], self.params[-1])
+        elif self.kind == "lognormal":
+            median, sigma = self.params[0], (self.params[1] if len(self.params) > 1 else 0.5)
+            ms = rng.lognormvariate(0.0, sigma) * median
+        else:
+            ms = self.params[0]
+        return max(0.0, ms) / 1000.0
+
+
+@dataclass
+class StandInConfig:
+    """대체 서버 동작 설정"""
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0
+    error_codes: tuple[int, ...] = (429, 503)
+    canned: list[dict] = field(default_factory=lambda: list(DEFAULT_CANNED))
+    seed: Optional[int] = None
+    file_ttl_seconds: float = 48 * 3600
+    stream_chunk_chars: int = 64
+    stream_chunk_delay: float = 0.0
+
+
+ERROR_STATUS = {
+    400: "INVALID_ARGUMENT",
+    403: "PERMISSION_DENIED",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+    504: "DEADLINE_EXCEEDED",
+}
+
+
+def _timestamp(value: float) -> str:
+    """RFC 3339 UTC 시각 문자열"""
+    return datetime.fromtimestamp(value, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _field(data: dict, camel: str, snake: str, default=None):
+    """camelCase/snake_case 어느 쪽으로 전송된 필드든 조회"""
+    return data.get(camel, data.get(snake, default))
+
+
+def _request_file_uris(body: dict) -> list[str]:
+    """요청 본문의 파일 참조 URI"""
+    return [
+        _field(_field(part, "fileData", "file_data"), "fileUri", "file_uri", "")
+        for content in body.get("contents", [])
+        for part in content.get("parts", [])
+        if _field(part, "fileData", "file_data")
+    ]
+
+
+def _request_texts(body: dict) -> str:
+    """요청 본문의 모든 텍스트 파트"""
+    texts = []
+    for content in body.get("contents", []):
+        for part in content.get("parts", []):
+            if "text" in part:
+                texts.append(part["text"])
+    system = body.get("systemInstruction") or {}
+    for part in system.get("parts", []):
+        if "text" in part:
+            texts.append(part["text"])
+    return "\n".join(texts)
+
+
+class StandInServer:
+    """generateContent 대체 서버"""
+
+    PATH_PATTERN = re.compile(r"^/[^/]+/models/(?P<model>[^:/]+):(?P<method>\w+)")
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[StandInConfig] = None):
+        """서버 초기화
+
+        Args:
+            host: 바인딩 주소
+            port: 포트 (0이면 임의 포트)
+            config: 동작 설정
+        """
+        self.config = config or StandInConfig()
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats: dict[str, int] = {"requests": 0, "errors": 0}
+
+        # Files API 상태 (업로드 세션, 업로드된 파일)
+        self._files_lock = threading.Lock()
+        self._uploads: dict[str, dict] = {}
+        self._files: dict[str, dict] = {}
+        self._file_ids = itertools.count(1)
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                server._handle(self)
+
+            def do_GET(self):
+                if self.path.rstrip("/") == "/stats":
+                    server._send_json(self, 200, server.snapshot())
+                else:
+                    server._handle_file(self, delete=False)
+
+            def do_DELETE(self):
+                server._handle_file(self, delete=True)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """settings.gemini_base_url에 지정할 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def snapshot(self) -> dict:
+        """요청 통계"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        """generateContent 및 파일 업로드 요청 처리"""
+        if urlparse(handler.path).path.rstrip("/").endswith("/upload/v1beta/files"):
+            self._handle_upload(handler)
+            return
+
+        match = self.PATH_PATTERN.match(handler.path)
+        if not match or match.group("method") not in ("generateContent", "streamGenerateContent"):
+            self._send_json(handler, 404, {"error": {"code": 404, "message": f"지원하지 않는 경로: {handler.path}"}})
+            return
+
+        length = int(handler.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(handler.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_error(handler, 400)
+            return
+
+        self._count("requests")
+        with self._rng_lock:
+            delay = self.config.latency.sample(self._rng)
+            inject_error = self._rng.random() < self.config.error_rate
+            error_code = self._rng.choice(self.config.error_codes) if self.config.error_codes else 503
+        time.sleep(delay)
+
+        if inject_error:
+            self._count("errors")
+            self._send_error(handler, error_code)
+            return
+
+        file_uris = _request_file_uris(body)
+        missing = [uri for uri in file_uris if self._lookup_file(uri) is None]
+        if missing:
+            self._count("errors")
+            self._send_error(handler, 403, f"파일이 없거나 만료되었습니다: {missing[0]}")
+            return
+        if file_uris:
+            self._count("file_refs")
+
+        name, parts = self._build_parts(body)
+        self._count(name)
+        prompt_tokens = len(_request_texts(body)) // 4 + 258
+        output_tokens = sum(len(p.get("text", "")) for p in parts) // 4 + (1290 if name == "image" else 0)
+        usage = {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens,
+        }
+        if match.group("method") == "streamGenerateContent":
+            self._count("streams")
+            self._send_stream(handler, parts, usage, match.group("model"))
+            return
+        self._send_json(handler, 200, {
+            "candidates": [{
+                "content": {"role": "model", "parts": parts},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": usage,
+            "modelVersion": match.group("model"),
+        })
+
+    def _send_stream(self, handler: BaseHTTPRequestHandler, parts: list[dict], usage: dict, model: str):
+        """SSE 스트리밍 응답 (텍스트 파트는 청크로 분할, 사용량은 마지막 청크에만)"""
+        size = max(1, self.config.stream_chunk_chars)
+        chunk_parts = []
+        for part in parts:
+            text = part.get("text")
+            if text is None:
+                chunk_parts.append([part])
+                continue
+            chunk_parts.extend([{"text": text[i:i + size]}] for i in range(0, max(len(text), 1), size))
+
+        events = []
+        for index, chunk in enumerate(chunk_parts):
+            last = index == len(chunk_parts) - 1
+            payload = {
+                "candidates": [{
+                    "content": {"role": "model", "parts": chunk},
+                    "index": 0,
+                    **({"finishReason": "STOP"} if last else {}),
+                }],
+                "modelVersion": model,
+            }
+            if last:
+                payload["usageMetadata"] = usage
+            events.append(f"data: {json.dumps(payload, ensure_ascii=False)}\r\n\r\n".encode("utf-8"))
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Content-Length", str(sum(len(event) for event in events)))
+        handler.end_headers()
+        for index, event in enumerate(events):
+            if index and self.config.stream_chunk_delay > 0:
+                time.sleep(self.config.stream_chunk_delay)
+            handler.wfile.write(event)
+            handler.wfile.flush()
+
+    def _build_parts(self, body: dict) -> tuple[str, list[dict]]:
+        """요청 종류에 맞는 응답 파트 (종류 이름, 파트 목록)"""
+        generation_config = body.get("generationConfig") or {}
+        if "IMAGE" in (generation_config.get("responseModalities") or []):
+            return "image", [
+                {"text": "요청한 이미지를 생성했습니다."},
+                {"inlineData": {"mimeType": "image/png", "data": base64.b64encode(BLANK_PNG).decode("ascii")}},
+            ]
+
+        text = _request_texts(body)
+        for canned in self.config.canned:
+            if canned["match"] in text:
+                response = canned["response"]
+                if not isinstance(response, str):
+                    response = json.dumps(response, ensure_ascii=False)
+                return canned["name"], [{"text": response}]
+
+        return "default", [{"text": "{}"}]
+
+    def _handle_upload(self, handler: BaseHTTPRequestHandler):
+        """재개 가능 업로드 처리 (시작 요청 → 데이터 전송/완료 요청)"""
+        length = int(handler.headers.get("Content-Length", 0))
+        data = handler.rfile.read(length)
+        command = handler.headers.get("X-Goog-Upload-Command", "")
+        query = parse_qs(urlparse(handler.path).query)
+
+        if "upload_id" not in query:
+            # 업로드 시작: 파일 메타데이터를 받고 업로드 URL 발급
+            try:
+                metadata = (json.loads(data or b"{}").get("file") or {})
+            except json.JSONDecodeError:
+                self._send_error(handler, 400)
+                return
+            upload_id = f"upload-{next(self._file_ids)}"
+            with self._files_lock:
+                self._uploads[upload_id] = {"metadata": metadata, "data": bytearray()}
+            self._send_json(handler, 200, {}, headers={
+                "X-Goog-Upload-URL": f"{self.base_url}/upload/v1beta/files?upload_id={upload_id}",
+                "X-Goog-Upload-Status": "active",
+            })
+            return
+
+        upload_id = query["upload_id"][0]
+        with self._files_lock:
+            upload = self._uploads.get(upload_id)
+            if upload is not None:
+                upload["data"].extend(data)
+                if "finalize" in command:
+                    del self._uploads[upload_id]
+        if upload is None:
+            self._send_error(handler, 404, f"업로드 세션이 없습니다: {upload_id}")
+            return
+        if "finalize" not in command:
+            self._send_json(handler, 200, {}, headers={"X-Goog-Upload-Status": "active"})
+            return
+
+        file = self._create_file(upload["metadata"], bytes(upload["data"]))
+        self._count("uploads")
+        self._send_json(handler, 200, {"file": file}, headers={"X-Goog-Upload-Status": "final"})
+
+    def _create_file(self, metadata: dict, data: bytes) -> dict:
+        """업로드 완료 파일 등록"""
+        now = time.time()
+        file_id = f"file{next(self._file_ids):06d}"
+        file = {
+            "name": f"files/{file_id}",
+            "displayName": _field(metadata, "displayName", "display_name", file_id),
+            "mimeType": _field(metadata, "mimeType", "mime_type", "application/octet-stream"),
+            "sizeBytes": str(len(data)),
+            "createTime": _timestamp(now),
+            "updateTime": _timestamp(now),
+            "expirationTime": _timestamp(now + self.config.file_ttl_seconds),
+            "sha256Hash": base64.b64encode(hashlib.sha256(data).digest()).decode("ascii"),
+            "uri": f"{self.base_url}/v1beta/files/{file_id}",
+            "state": "ACTIVE",
+            "source": "UPLOADED",
+        }
+        with self._files_lock:
+            self._files[file["name"]] = {"file": file, "expires_at": now + self.config.file_ttl_seconds}
+        return file
+
+    def _lookup_file(self, name_or_uri: str) -> Optional[dict]:
+        """파일 이름 또는 URI로 유효한 파일 조회 (만료 파일은 제거)"""
+        name = "files/" + urlparse(name_or_uri).path.rstrip("/").rsplit("/", 1)[-1]
+        with self._files_lock:
+            entry = self._files.get(name)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= time.time():
+                del self._files[name]
+                return None
+            return entry["file"]
+
+    def _handle_file(self, handler: BaseHTTPRequestHandler, delete: bool):
+        """파일 조회/삭제 (GET, DELETE /v1beta/files/{id})"""
+        path = urlparse(handler.path).path.rstrip("/")
+        if "/files/" not in path:
+            self._send_json(handler, 404, {"error": {"code": 404, "message": "not found"}})
+            return
+
+        file = self._lookup_file(path)
+        if file is None:
+            self._send_error(handler, 404, f"파일이 없습니다: {path}")
+            return
+        if delete:
+            with self._files_lock:
+                self._files.pop(file["name"], None)
+            self._send_json(handler, 200, {})
+        else:
+            self._send_json(handler, 200, file)
+
+    def _send_error(self, handler: BaseHTTPRequestHandler, code: int, message: Optional[str] = None):
+        """Gemini 형식 오류 응답"""
+        status = ERROR_STATUS.get(code, "UNKNOWN")
+        self._send_json(handler, code, {
+            "error": {"code": code, "message": message or f"대체 서버 주입 오류 ({status})", "status": status}
+        })
+
+    @staticmethod
+    def _send_json(
+        handler: BaseHTTPRequestHandler,
+        code: int,
+        payload: dict,
+        headers: Optional[dict[str, str]] = None
+    ):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        handler.send_response(code)
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+
+def load_canned(path: Path) -> list[dict]:
+    """사용자 고정 응답 로드 (기본 응답보다 먼저 검사)
+
+    파일 형식: [{"name": "...", "match": "프롬프트 포함 문자열", "response": {...} 또는 "텍스트"}]
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f) + DEFAULT_CANNED
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Gemini generateContent 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소")
+    parser.add_argument("--port", type=int, default=8765, help="포트")
+    parser.add_argument(
+        "--latency", default="fixed:0",
+        help="지연 분포 (fixed:MS, uniform:MIN,MAX, lognormal:MEDIAN,SIGMA)"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-codes", default="429,503", help="주입할 오류 코드 (콤마 구분)")
+    parser.add_argument("--canned", type=str, default=None, help="추가 고정 응답 JSON 파일")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument("--file-ttl", type=float, default=48 * 3600, help="업로드 파일 유효 시간 (초)")
+    parser.add_argument("--stream-chunk-chars", type=int, default=64, help="스트리밍 응답 청크 길이 (문자)")
+    parser.add_argument("--stream-chunk-delay", type=float, default=0.0, help="스트리밍 청크 간 지연 (초)")
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency=LatencyModel.parse(args.latency),
+        error_rate=args.error_rate,
+        error_codes=tuple(int(c) for c in args.error_codes.split(",") if c),
+        canned=load_canned(Path(args.canned)) if args.canned else list(DEFAULT_CANNED),
+        seed=args.seed,
+        file_ttl_seconds=args.file_ttl,
+        stream_chunk_chars=args.stream_chunk_chars,
+        stream_chunk_delay=args.stream_chunk_delay
+    )
+    server = StandInServer(args.host, args.port, config)
+    print(f"Gemini 대체 서버 실행 중: {server.base_url} (GEMINI_BASE_URL로 지정)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"요청 통계: {server.snapshot()}")
+
+
+if __name__ == "__main__":
+    main()
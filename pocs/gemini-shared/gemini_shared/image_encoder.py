@@ -0,0 +1,262 @@
+"""모델 요청용 이미지 인코더
+
+요청마다 해상도, 그레이스케일 변환, 팔레트 양자화, 인코딩 포맷(PNG/JPEG/WebP)을 골라
+이미지 토큰 예산과 픽셀 예산 안에서 가장 작은 페이로드를 만듭니다.
+
+- 축소는 종횡비를 유지하는 균일 배율만 사용하고 자르거나 여백을 넣지 않으므로
+  모델의 0-1000 정규화 좌표(box_2d)는 원본 이미지에 그대로 대응합니다.
+- 확대하지 않으며, 결과가 원본 인코딩보다 크면 원본 바이트를 그대로 사용합니다.
+- 이미지 토큰은 Gemini 규칙(양 변 384px 이하 258토큰, 그 외 768px 타일당 258토큰)으로 추정합니다.
+
+설정을 읽지 않으므로 예산, 포맷, 품질은 각 POC가 자기 설정에서 인자로 넘깁니다.
+"""
+
+import io
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageChops
+
+TOKENS_PER_TILE = 258
+TILE_SIZE = 768
+SMALL_IMAGE_SIZE = 384
+
+FORMAT_MIME_TYPES = {"PNG": "image/png", "JPEG": "image/jpeg", "WEBP": "image/webp"}
+ENCODING_FORMATS = ("auto", "png", "jpeg", "webp")
+
+# 채널 간 최대 차이가 이 값 이하이면 그레이스케일로 판단
+GRAYSCALE_TOLERANCE = 8
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """모델 요청용으로 인코딩된 이미지"""
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    source_width: int
+    source_height: int
+    source_bytes: Optional[int]
+    grayscale: bool
+    colors: Optional[int]
+    estimated_tokens: int
+
+    @property
+    def scale(self) -> float:
+        """원본 대비 축소 배율"""
+        return self.width / self.source_width if self.source_width else 1.0
+
+    def describe(self) -> dict:
+        """로그 기록용 인코딩 정보"""
+        return {
+            "mime_type": self.mime_type,
+            "size": [self.width, self.height],
+            "source_size": [self.source_width, self.source_height],
+            "scale": round(self.scale, 4),
+            "grayscale": self.grayscale,
+            "colors": self.colors,
+            "bytes": len(self.data),
+            "source_bytes": self.source_bytes,
+            "estimated_tokens": self.estimated_tokens,
+        }
+
+    def summary(self) -> str:
+        """한 줄 요약 (콘솔 출력용)"""
+        mode = "그레이스케일" if self.grayscale else "컬러"
+        if self.colors:
+            mode += f" {self.colors}색"
+        size = f"{len(self.data) / 1024:.0f}KB"
+        if self.source_bytes is not None:
+            size = f"{self.source_bytes / 1024:.0f}KB → {size}"
+        return (f"{self.mime_type.split('/')[-1]} {self.width}x{self.height} {mode}, "
+                f"{size}, 예상 토큰 {self.estimated_tokens:,}")
+
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """이미지 입력 토큰 추정 (Gemini 타일 규칙)"""
+    if width <= SMALL_IMAGE_SIZE and height <= SMALL_IMAGE_SIZE:
+        return TOKENS_PER_TILE
+    return math.ceil(width / TILE_SIZE) * math.ceil(height / TILE_SIZE) * TOKENS_PER_TILE
+
+
+def target_size(width: int, height: int, token_budget: int, max_pixels: int) -> tuple[int, int]:
+    """토큰/픽셀 예산을 만족하는 최대 크기 (종횡비 유지, 확대 없음)
+
+    Args:
+        width: 원본 너비
+        height: 원본 높이
+        token_budget: 이미지 토큰 예산 (0 이하면 제한 없음)
+        max_pixels: 최대 픽셀 수 (0 이하면 제한 없음)
+
+    Returns:
+        (너비, 높이)
+    """
+    scale = 1.0
+    if max_pixels > 0 and width * height > max_pixels:
+        scale = math.sqrt(max_pixels / (width * height))
+
+    if token_budget > 0 and estimate_image_tokens(width, height) > token_budget:
+        # 예산 안의 타일 배치(열 x 행) 중 가장 큰 배율 선택
+        tiles = token_budget // TOKENS_PER_TILE
+        best = min(SMALL_IMAGE_SIZE / width, SMALL_IMAGE_SIZE / height)
+        for cols in range(1, tiles + 1):
+            rows = tiles // cols
+            best = max(best, min(cols * TILE_SIZE / width, rows * TILE_SIZE / height))
+        scale = min(scale, best)
+
+    if scale >= 1.0:
+        return width, height
+    # 반올림으로 타일 경계를 넘지 않도록 내림
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def is_grayscale(image: Image.Image) -> bool:
+    """채널 간 차이가 거의 없는 이미지인지 여부 (축소본으로 검사)"""
+    if image.mode in ("1", "L", "LA", "I", "F"):
+        return True
+    thumb = image.convert("RGB")
+    thumb.thumbnail((256, 256))
+    r, g, b = thumb.split()
+    for a, c in ((r, g), (g, b), (r, b)):
+        if ImageChops.difference(a, c).getextrema()[1] > GRAYSCALE_TOLERANCE:
+            return False
+    return True
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """투명 영역을 흰 배경으로 합성 (모델 입력에는 알파 채널 불필요)"""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+        return Image.alpha_composite(background, rgba).convert("RGB")
+    if image.mode not in ("L", "RGB"):
+        return image.convert("RGB")
+    return image
+
+
+def _save(image: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "PNG":
+        image.save(buffer, format="PNG")
+    elif fmt == "JPEG":
+        image.save(buffer, format="JPEG", quality=quality, optimize=True)
+    else:
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+    return buffer.getvalue()
+
+
+def encode_for_model(
+    image: Image.Image,
+    token_budget: int = 0,
+    max_pixels: int = 0,
+    fmt: str = "auto",
+    quality: int = 85,
+    palette_colors: int = 16,
+    source_bytes: Optional[bytes] = None,
+    source_mime_type: Optional[str] = None
+) -> EncodedImage:
+    """예산에 맞춰 모델 요청용 이미지 인코딩
+
+    auto 포맷은 그레이스케일 이미지를 palette_colors 단계로 양자화한 PNG로,
+    256색 이하 컬러 이미지를 무손실 팔레트 PNG로, 그 외는 WebP로 인코딩합니다.
+
+    Args:
+        image: 원본 이미지
+        token_budget: 이미지 토큰 예산 (0 이하면 제한 없음)
+        max_pixels: 최대 픽셀 수 (0 이하면 제한 없음)
+        fmt: 인코딩 포맷 (auto, png, jpeg, webp)
+        quality: JPEG/WebP 품질
+        palette_colors: 그레이스케일 양자화 단계 수 (0이면 양자화하지 않음)
+        source_bytes: 원본 인코딩 바이트 (결과가 더 크고 크기 변화가 없으면 그대로 사용)
+        source_mime_type: 원본 인코딩 MIME 타입
+
+    Returns:
+        인코딩된 이미지
+
+    Raises:
+        ValueError: 지원하지 않는 포맷인 경우
+    """
+    if fmt not in ENCODING_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 인코딩 포맷: {fmt} ({', '.join(ENCODING_FORMATS)})")
+
+    source_width, source_height = image.size
+    width, height = target_size(source_width, source_height, token_budget, max_pixels)
+
+    working = _flatten(image)
+    grayscale = is_grayscale(working)
+    if grayscale and working.mode != "L":
+        working = working.convert("L")
+    if (width, height) != (source_width, source_height):
+        working = working.resize((width, height), Image.Resampling.LANCZOS)
+
+    colors = None
+    if fmt == "auto":
+        if grayscale and palette_colors > 0:
+            working = working.quantize(colors=palette_colors)
+            colors = palette_colors
+            out_format = "PNG"
+        else:
+            distinct = working.getcolors(maxcolors=256)
+            if distinct is not None:
+                working = working.quantize(colors=len(distinct))
+                colors = len(distinct)
+                out_format = "PNG"
+            else:
+                out_format = "WEBP"
+    else:
+        out_format = fmt.upper()
+
+    data = _save(working, out_format, quality)
+    mime_type = FORMAT_MIME_TYPES[out_format]
+
+    if (source_bytes is not None and source_mime_type
+            and (width, height) == (source_width, source_height) and len(source_bytes) <= len(data)):
+        data, mime_type, colors = source_bytes, source_mime_type, None
+        grayscale = image.mode in ("1", "L", "LA")
+
+    return EncodedImage(
+        data=data,
+        mime_type=mime_type,
+        width=width,
+        height=height,
+        source_width=source_width,
+        source_height=source_height,
+        source_bytes=len(source_bytes) if source_bytes is not None else None,
+        grayscale=grayscale,
+        colors=colors,
+        estimated_tokens=estimate_image_tokens(width, height)
+    )
+
+
+
+def original_image(
+    image: Image.Image,
+    source_bytes: Optional[bytes] = None,
+    source_mime_type: Optional[str] = None
+) -> EncodedImage:
+    """재인코딩하지 않은 요청 이미지 (이미지 인코딩을 끈 경우)
+
+    Args:
+        image: 원본 이미지
+        source_bytes: 원본 인코딩 바이트 (없으면 원본 크기 PNG로 인코딩)
+        source_mime_type: 원본 인코딩 MIME 타입
+
+    Returns:
+        원본 크기 그대로의 이미지
+    """
+    if source_bytes is None or not source_mime_type:
+        source_bytes, source_mime_type = _save(image, "PNG", 0), "image/png"
+    return EncodedImage(
+        data=source_bytes,
+        mime_type=source_mime_type,
+        width=image.width,
+        height=image.height,
+        source_width=image.width,
+        source_height=image.height,
+        source_bytes=len(source_bytes),
+        grayscale=image.mode in ("1", "L", "LA"),
+        colors=None,
+        estimated_tokens=estimate_image_tokens(image.width, image.height)
+    )
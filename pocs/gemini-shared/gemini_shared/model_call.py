@@ -0,0 +1,316 @@
+"""Gemini 모델 호출 공통 모듈
+
+모든 클라이언트의 generate_content 호출은 이 모듈을 거칩니다.
+- 비동기 호출(client.aio)은 이벤트 루프마다 하나의 동시 실행 제한
+  (settings.async_max_concurrency)을 공유합니다.
+- 모든 호출은 모델별 RPM/TPM 속도 제한을 거치며, 429 응답 시 해당 모델 전체를 늦춥니다.
+  실패한 시도의 TPM 예약은 반환하고, 스트리밍 도중 실패하면 받은 청크의 사용량으로 보정합니다.
+- 일시적 오류(429, 5xx, 타임아웃)는 호출 단위로 지터 백오프 후 재시도하고,
+  재시도할 수 없으면 ModelCallError를 발생시킵니다.
+- settings.model_call_mode가 record/replay이면 요청/응답을 기록하거나 기록된 응답을 반환합니다.
+- 스트리밍 호출(generate_content_stream)은 첫 청크를 받기 전까지만 재시도합니다.
+- 성공한 응답의 토큰 사용량/비용은 현재 usage_scope()에 합산됩니다.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Any, Iterator, Optional
+
+from google import genai
+from google.genai import types
+
+from .config import get_settings
+from .rate_limiter import (
+    ModelRateLimiter, estimate_tokens, get_rate_limiter, is_rate_limited,
+    retry_after_seconds, usage_tokens
+)
+from .prompt_cache import get_active_prompt_cache
+from .recorder import get_recorder
+from .retry_policy import RetryPolicy, is_transient
+from .usage_tracker import record_usage
+
+
+class ModelCallError(RuntimeError):
+    """재시도 정책으로 회복하지 못한 모델 호출 오류"""
+
+    def __init__(self, error: Exception, attempts: int):
+        """오류 초기화
+
+        Args:
+            error: 마지막 시도의 예외
+            attempts: 시도 횟수
+        """
+        self.transient = is_transient(error)
+        self.attempts = attempts
+        kind = "일시적 오류" if self.transient else "영구 오류"
+        super().__init__(f"모델 호출 실패 ({kind}, {attempts}회 시도): {error}")
+
+
+def find_model_call_error(error: BaseException) -> Optional[ModelCallError]:
+    """예외 체인(__cause__)에서 ModelCallError 검색"""
+    while error is not None:
+        if isinstance(error, ModelCallError):
+            return error
+        error = error.__cause__
+    return None
+
+
+# 이벤트 루프별 공유 동시 실행 제한
+_async_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_limiter() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 공유 세마포어 반환"""
+    loop = asyncio.get_running_loop()
+    limiter = _async_limiters.get(loop)
+    if limiter is None:
+        limiter = asyncio.Semaphore(max(1, get_settings().async_max_concurrency))
+        _async_limiters[loop] = limiter
+    return limiter
+
+
+def _with_timeout(config: Any, timeout: Optional[float]) -> Any:
+    """요청 설정에 시도별 HTTP 타임아웃 적용"""
+    if timeout is None:
+        return config
+    http_options = types.HttpOptions(timeout=max(1, int(timeout * 1000)))
+    if config is None:
+        return types.GenerateContentConfig(http_options=http_options)
+    if config.http_options is not None:
+        http_options = config.http_options.model_copy(update={"timeout": http_options.timeout})
+    return config.model_copy(update={"http_options": http_options})
+
+
+def _retry_delay(
+    policy: RetryPolicy,
+    limiter: Optional[ModelRateLimiter],
+    error: Exception
+) -> float:
+    """실패한 시도의 재시도 대기 시간 (재시도 불가면 ModelCallError 발생)"""
+    if limiter is not None and is_rate_limited(error):
+        limiter.backoff(retry_after_seconds(error))
+
+    delay = policy.next_delay(error)
+    if delay is None:
+        raise ModelCallError(error, policy.attempts) from error
+
+    print(f"  - 일시적 오류, {delay:.1f}초 후 재시도 "
+          f"({policy.attempts}/{policy.max_attempts}): {error}")
+    return delay
+
+
+def merge_stream_chunks(chunks: list[types.GenerateContentResponse]) -> types.GenerateContentResponse:
+    """스트리밍 청크를 하나의 응답으로 병합 (텍스트 연결, 마지막 청크의 사용량 유지)"""
+    text = "".join(chunk.text or "" for chunk in chunks)
+    last = chunks[-1] if chunks else types.GenerateContentResponse()
+    finish_reason = last.candidates[0].finish_reason if last.candidates else None
+    return types.GenerateContentResponse(
+        candidates=[types.Candidate(
+            content=types.Content(role="model", parts=[types.Part.from_text(text=text)]),
+            finish_reason=finish_reason
+        )],
+        usage_metadata=last.usage_metadata,
+        model_version=last.model_version
+    )
+
+
+def generate_content(
+    client: genai.Client,
+    model: str,
+    contents: Any,
+    config: Any = None
+):
+    """동기 generate_content 호출 (속도 제한, 재시도 정책 적용)
+
+    Args:
+        client: genai 클라이언트
+        model: 모델 이름
+        contents: 요청 콘텐츠
+        config: GenerateContentConfig
+
+    Returns:
+        GenerateContentResponse
+
+    Raises:
+        ModelCallError: 영구 오류이거나 재시도 횟수/데드라인을 소진한 경우
+        RecordingNotFoundError: 재생 모드에서 기록된 응답이 없는 경우
+    """
+    recorder = get_recorder()
+    if recorder is not None and recorder.replaying:
+        response = recorder.load(model, contents, config)
+        record_usage(model, response)
+        return response
+
+    policy = RetryPolicy.from_settings()
+    limiter = get_rate_limiter(model) if get_settings().rate_limit_enabled else None
+    estimate = estimate_tokens(contents, config)
+
+    while True:
+        if limiter is not None:
+            wait = limiter.reserve(estimate)
+            if wait > 0:
+                time.sleep(wait)
+
+        timeout = policy.begin_attempt()
+        try:
+            if timeout is not None and timeout <= 0:
+                raise TimeoutError("요청 데드라인 초과")
+            response = client.models.generate_content(
+                model=model, contents=contents, config=_with_timeout(config, timeout)
+            )
+        except Exception as e:
+            if limiter is not None:
+                limiter.refund(estimate)
+            time.sleep(_retry_delay(policy, limiter, e))
+            continue
+
+        if limiter is not None:
+            limiter.record_usage(estimate, usage_tokens(response))
+        prompt_cache = get_active_prompt_cache()
+        if prompt_cache is not None:
+            prompt_cache.record_usage(response)
+        if recorder is not None:
+            recorder.save(model, contents, config, response)
+        record_usage(model, response)
+        return response
+
+
+async def generate_content_async(
+    client: genai.Client,
+    model: str,
+    contents: Any,
+    config: Any = None
+):
+    """비동기 generate_content 호출 (공유 동시 실행 제한, 속도 제한, 재시도 정책 적용)
+
+    Args:
+        client: genai 클라이언트
+        model: 모델 이름
+        contents: 요청 콘텐츠
+        config: GenerateContentConfig
+
+    Returns:
+        GenerateContentResponse
+
+    Raises:
+        ModelCallError: 영구 오류이거나 재시도 횟수/데드라인을 소진한 경우
+        RecordingNotFoundError: 재생 모드에서 기록된 응답이 없는 경우
+    """
+    recorder = get_recorder()
+    if recorder is not None and recorder.replaying:
+        response = recorder.load(model, contents, config)
+        record_usage(model, response)
+        return response
+
+    policy = RetryPolicy.from_settings()
+    limiter = get_rate_limiter(model) if get_settings().rate_limit_enabled else None
+    estimate = estimate_tokens(contents, config)
+
+    while True:
+        # 속도 제한 대기와 재시도 대기는 동시 실행 슬롯을 점유하지 않음
+        if limiter is not None:
+            wait = limiter.reserve(estimate)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        try:
+            async with get_async_limiter():
+                timeout = policy.begin_attempt()
+                if timeout is not None and timeout <= 0:
+                    raise TimeoutError("요청 데드라인 초과")
+                response = await client.aio.models.generate_content(
+                    model=model, contents=contents, config=_with_timeout(config, timeout)
+                )
+        except Exception as e:
+            if limiter is not None:
+                limiter.refund(estimate)
+            await asyncio.sleep(_retry_delay(policy, limiter, e))
+            continue
+
+        if limiter is not None:
+            limiter.record_usage(estimate, usage_tokens(response))
+        prompt_cache = get_active_prompt_cache()
+        if prompt_cache is not None:
+            prompt_cache.record_usage(response)
+        if recorder is not None:
+            recorder.save(model, contents, config, response)
+        record_usage(model, response)
+        return response
+
+
+def generate_content_stream(
+    client: genai.Client,
+    model: str,
+    contents: Any,
+    config: Any = None
+) -> Iterator[types.GenerateContentResponse]:
+    """동기 generate_content_stream 호출 (속도 제한, 재시도 정책 적용)
+
+    첫 청크를 받기 전의 오류만 재시도합니다. 이미 청크를 내보낸 뒤의 오류는
+    응답을 이어 붙일 수 없으므로 바로 ModelCallError로 발생시킵니다.
+    스트림이 끝나면 사용량/프롬프트 캐시 통계와 토큰 사용량을 갱신하고, 기록 모드에서는 병합된 응답을 저장합니다.
+
+    Args:
+        client: genai 클라이언트
+        model: 모델 이름
+        contents: 요청 콘텐츠
+        config: GenerateContentConfig
+
+    Yields:
+        GenerateContentResponse 청크 (재생 모드에서는 기록된 응답 하나)
+
+    Raises:
+        ModelCallError: 영구 오류, 재시도 소진, 또는 스트리밍 도중 오류
+        RecordingNotFoundError: 재생 모드에서 기록된 응답이 없는 경우
+    """
+    recorder = get_recorder()
+    if recorder is not None and recorder.replaying:
+        response = recorder.load(model, contents, config)
+        record_usage(model, response)
+        yield response
+        return
+
+    policy = RetryPolicy.from_settings()
+    limiter = get_rate_limiter(model) if get_settings().rate_limit_enabled else None
+    estimate = estimate_tokens(contents, config)
+    chunks: list[types.GenerateContentResponse] = []
+
+    while True:
+        if limiter is not None:
+            wait = limiter.reserve(estimate)
+            if wait > 0:
+                time.sleep(wait)
+
+        timeout = policy.begin_attempt()
+        try:
+            if timeout is not None and timeout <= 0:
+                raise TimeoutError("요청 데드라인 초과")
+            for chunk in client.models.generate_content_stream(
+                model=model, contents=contents, config=_with_timeout(config, timeout)
+            ):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            if chunks:
+                # 이미 받은 청크만큼은 소비했으므로 예약을 반환하지 않고 사용량으로 보정
+                if limiter is not None:
+                    limiter.record_usage(estimate, usage_tokens(merge_stream_chunks(chunks)))
+                raise ModelCallError(e, policy.attempts) from e
+            if limiter is not None:
+                limiter.refund(estimate)
+            time.sleep(_retry_delay(policy, limiter, e))
+            continue
+        break
+
+    response = merge_stream_chunks(chunks)
+    if limiter is not None:
+        limiter.record_usage(estimate, usage_tokens(response))
+    prompt_cache = get_active_prompt_cache()
+    if prompt_cache is not None:
+        prompt_cache.record_usage(response)
+    if recorder is not None:
+        recorder.save(model, contents, config, response)
+    record_usage(model, response)
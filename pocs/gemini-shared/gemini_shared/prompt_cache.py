@@ -0,0 +1,268 @@
+"""정적 프롬프트 컨텍스트 캐시
+
+페이지/문항마다 반복 전송되는 긴 정적 프롬프트(시스템 지시문)를
+서버 측 캐시 콘텐츠(client.caches)로 한 번만 등록하고 이후 요청은 캐시 이름으로 참조합니다.
+캐시는 prompt_cache_session() 범위(배치 실행 1회)에서만 사용되며,
+세션이 끝나면 생성한 캐시를 모두 삭제합니다.
+캐시 생성이 불가능한 경우(최소 토큰 미달, 미지원 엔드포인트 등)에도 프롬프트를
+system_instruction으로 전송하므로 요청 형태는 캐시 사용 여부와 관계없이 같습니다.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from google import genai
+from google.genai import types
+
+from .config import get_settings
+
+
+@dataclass
+class _CacheEntry:
+    """생성된 캐시 콘텐츠"""
+    client: genai.Client
+    name: str
+    expires_at: float
+
+
+class PromptCache:
+    """배치 실행 범위의 프롬프트 캐시 관리자"""
+
+    def __init__(self, ttl_seconds: int):
+        """관리자 초기화
+
+        Args:
+            ttl_seconds: 캐시 콘텐츠 유효 시간 (초, 실행이 길어지면 연장)
+        """
+        self.ttl_seconds = ttl_seconds
+        # None 값은 캐시 생성이 불가능했던 프롬프트 (인라인 전송)
+        self._entries: dict[tuple[str, str, str], Optional[_CacheEntry]] = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.created = 0
+        self.reused = 0
+        self.unavailable = 0
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+
+    def request_config(
+        self,
+        client: genai.Client,
+        model: str,
+        system_prompt: str,
+        config: Optional[types.GenerateContentConfig]
+    ) -> Optional[types.GenerateContentConfig]:
+        """캐시 콘텐츠를 참조하는 요청 설정
+
+        캐시에는 시스템 지시문과 도구 설정이 함께 저장되므로
+        반환되는 설정에서는 tools/system_instruction이 제거됩니다.
+
+        Args:
+            client: genai 클라이언트
+            model: 모델 이름
+            system_prompt: 정적 프롬프트
+            config: 원래 요청 설정
+
+        Returns:
+            cached_content가 지정된 설정 (캐시 불가 시 None)
+        """
+        tools = config.tools if config is not None else None
+        tools_key = hashlib.sha256(
+            "".join(tool.model_dump_json(exclude_none=True) for tool in tools or []).encode("utf-8")
+        ).hexdigest()
+        key = (model, hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(), tools_key)
+
+        with self._lock:
+            if key in self._entries:
+                entry = self._entries[key]
+                if entry is None:
+                    return None
+                self._extend(entry)
+                self.reused += 1
+            else:
+                entry = self._create(client, model, system_prompt, tools)
+                self._entries[key] = entry
+                if entry is None:
+                    return None
+
+        if config is None:
+            return types.GenerateContentConfig(cached_content=entry.name)
+        return config.model_copy(update={
+            "cached_content": entry.name, "tools": None, "tool_config": None, "system_instruction": None
+        })
+
+    def _create(
+        self,
+        client: genai.Client,
+        model: str,
+        system_prompt: str,
+        tools: Optional[list[types.Tool]]
+    ) -> Optional[_CacheEntry]:
+        """캐시 콘텐츠 생성 (lock 보유 상태에서 호출)"""
+        try:
+            cached = client.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    tools=tools,
+                    ttl=f"{self.ttl_seconds}s",
+                    display_name=f"prompt-{hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()[:12]}"
+                )
+            )
+        except Exception as e:
+            self.unavailable += 1
+            print(f"  - 프롬프트 캐시 생성 불가, 시스템 지시문으로 전송합니다: {e}")
+            return None
+
+        self.created += 1
+        return _CacheEntry(client=client, name=cached.name, expires_at=time.monotonic() + self.ttl_seconds)
+
+    def _extend(self, entry: _CacheEntry):
+        """남은 유효 시간이 1/4 미만이면 TTL 연장 (lock 보유 상태에서 호출)"""
+        if entry.expires_at - time.monotonic() > self.ttl_seconds / 4:
+            return
+        try:
+            entry.client.caches.update(
+                name=entry.name,
+                config=types.UpdateCachedContentConfig(ttl=f"{self.ttl_seconds}s")
+            )
+            entry.expires_at = time.monotonic() + self.ttl_seconds
+        except Exception as e:
+            print(f"  - 프롬프트 캐시 연장 실패: {e}")
+
+    def record_usage(self, response: Any):
+        """응답의 입력 토큰 중 캐시 적중 토큰 집계"""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += getattr(usage, "prompt_token_count", None) or 0
+            self.cached_tokens += getattr(usage, "cached_content_token_count", None) or 0
+
+    def close(self):
+        """생성한 캐시 콘텐츠 삭제"""
+        with self._lock:
+            entries = [entry for entry in self._entries.values() if entry is not None]
+            self._entries.clear()
+        for entry in entries:
+            try:
+                entry.client.caches.delete(name=entry.name)
+            except Exception as e:
+                print(f"  - 프롬프트 캐시 삭제 실패 ({entry.name}): {e}")
+
+    def stats(self) -> dict:
+        """캐시 및 토큰 통계 (fresh = 캐시되지 않은 입력 토큰)"""
+        with self._lock:
+            return {
+                "caches": self.created,
+                "reused": self.reused,
+                "unavailable": self.unavailable,
+                "requests": self.requests,
+                "cached_tokens": self.cached_tokens,
+                "fresh_tokens": self.prompt_tokens - self.cached_tokens,
+            }
+
+
+# 현재 활성 세션
+_active: Optional[PromptCache] = None
+_session_lock = threading.Lock()
+
+
+@contextmanager
+def prompt_cache_session() -> Iterator[Optional[PromptCache]]:
+    """배치 실행 범위의 프롬프트 캐시 세션
+
+    중첩 호출 시 바깥 세션을 재사용합니다.
+    비활성화되었거나 live 모드가 아니면(기록/재생 요청을 일정하게 유지) None을 반환합니다.
+    """
+    global _active
+    settings = get_settings()
+    if not settings.prompt_cache_enabled or settings.model_call_mode != "live":
+        yield None
+        return
+
+    with _session_lock:
+        owner = _active is None
+        if owner:
+            _active = PromptCache(ttl_seconds=settings.prompt_cache_ttl_seconds)
+        cache = _active
+
+    try:
+        yield cache
+    finally:
+        if owner:
+            with _session_lock:
+                _active = None
+            cache.close()
+
+
+def get_active_prompt_cache() -> Optional[PromptCache]:
+    """현재 활성 세션의 프롬프트 캐시"""
+    return _active
+
+
+def system_instruction_config(
+    system_prompt: str,
+    config: Optional[types.GenerateContentConfig]
+) -> types.GenerateContentConfig:
+    """정적 프롬프트를 system_instruction으로 지정한 요청 설정 (캐시 미사용 경로)
+
+    Args:
+        system_prompt: 정적 프롬프트
+        config: 원래 요청 설정
+
+    Returns:
+        system_instruction이 지정된 설정
+    """
+    if config is None:
+        return types.GenerateContentConfig(system_instruction=system_prompt)
+    return config.model_copy(update={"system_instruction": system_prompt})
+
+
+def apply_prompt_cache(
+    client: genai.Client,
+    model: str,
+    system_prompt: str,
+    config: Optional[types.GenerateContentConfig]
+) -> types.GenerateContentConfig:
+    """정적 프롬프트를 시스템 지시문으로 적용
+
+    캐시가 적용되면 캐시 콘텐츠(시스템 지시문 + 도구)를 참조하고,
+    아니면 같은 프롬프트를 system_instruction으로 직접 전송하므로
+    두 경로에서 모델이 받는 요청 형태가 같습니다.
+
+    Args:
+        client: genai 클라이언트
+        model: 모델 이름
+        system_prompt: 정적 프롬프트
+        config: 원래 요청 설정
+
+    Returns:
+        요청 설정 (요청 콘텐츠에는 프롬프트를 넣지 않음)
+    """
+    cache = _active
+    if cache is not None:
+        cached_config = cache.request_config(client, model, system_prompt, config)
+        if cached_config is not None:
+            return cached_config
+    return system_instruction_config(system_prompt, config)
+
+
+async def apply_prompt_cache_async(
+    client: genai.Client,
+    model: str,
+    system_prompt: str,
+    config: Optional[types.GenerateContentConfig]
+) -> types.GenerateContentConfig:
+    """apply_prompt_cache() 비동기 버전 (캐시 생성 호출은 스레드에서 실행)"""
+    if _active is None:
+        return system_instruction_config(system_prompt, config)
+    return await asyncio.to_thread(apply_prompt_cache, client, model, system_prompt, config)
@@ -0,0 +1,257 @@
+"""모델별 요청/토큰 속도 제한
+
+모델마다 분당 요청 수(RPM)와 분당 토큰 수(TPM) 토큰 버킷을 두고
+모든 클라이언트가 같은 버킷을 공유합니다.
+요청 전에는 추정 토큰으로 예약하고, 응답의 usage_metadata로 실제 사용량을 보정합니다.
+응답 없이 실패한 시도의 예약은 반환합니다.
+서비스가 429를 반환하면 해당 모델의 모든 요청을 지수적으로 늦춥니다.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .config import get_settings
+
+
+# 이미지 1장당 입력 토큰 추정치
+IMAGE_TOKEN_ESTIMATE = 258
+# 응답 토큰 추정치 (실제 사용량으로 보정)
+OUTPUT_TOKEN_ESTIMATE = 512
+
+
+class TokenBucket:
+    """토큰 버킷 (예약 시 잔량이 음수가 될 수 있으며 그만큼 대기)"""
+
+    def __init__(self, capacity: float, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        """버킷 초기화
+
+        Args:
+            capacity: 최대 토큰 수
+            per_minute: 분당 충전량
+            clock: 시간 함수 (초)
+        """
+        self.capacity = float(capacity)
+        self.rate = float(per_minute) / 60.0
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float) -> float:
+        """토큰 예약
+
+        Args:
+            amount: 예약할 토큰 수 (버킷 크기로 제한)
+
+        Returns:
+            예약분이 충전될 때까지 대기할 시간 (초)
+        """
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+        if self.tokens >= 0 or self.rate <= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def adjust(self, delta: float):
+        """예약 이후 실제 사용량 보정 (양수면 추가 차감)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class ModelRateLimiter:
+    """단일 모델의 RPM/TPM 제한과 429 백오프"""
+
+    def __init__(self, rpm: int, tpm: int, clock: Callable[[], float] = time.monotonic):
+        """제한기 초기화
+
+        Args:
+            rpm: 분당 요청 수
+            tpm: 분당 토큰 수
+            clock: 시간 함수 (초)
+        """
+        self.requests = TokenBucket(rpm, rpm, clock)
+        self.tokens = TokenBucket(tpm, tpm, clock)
+        self.clock = clock
+        self.paused_until = 0.0
+        self.consecutive_429 = 0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.throttled_seconds = 0.0
+        self.rate_limited = 0
+
+    def reserve(self, estimated_tokens: int) -> float:
+        """요청 1건과 추정 토큰 예약
+
+        Returns:
+            요청 전 대기 시간 (초)
+        """
+        with self._lock:
+            wait = max(
+                self.requests.reserve(1),
+                self.tokens.reserve(estimated_tokens),
+                self.paused_until - self.clock()
+            )
+            self.total_requests += 1
+            self.throttled_seconds += max(0.0, wait)
+            return max(0.0, wait)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """실제 토큰 사용량으로 TPM 버킷 보정 및 429 연속 횟수 초기화"""
+        with self._lock:
+            self.consecutive_429 = 0
+            if actual_tokens is None:
+                self.total_tokens += estimated_tokens
+                return
+            self.total_tokens += actual_tokens
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+
+    def refund(self, estimated_tokens: int):
+        """응답 없이 실패한 시도의 TPM 예약 반환 (요청 수 예약은 유지)"""
+        with self._lock:
+            self.tokens.adjust(-min(estimated_tokens, self.tokens.capacity))
+
+    def backoff(self, retry_after: Optional[float] = None) -> float:
+        """429 응답 후 모델 전체 요청 일시 중지
+
+        Args:
+            retry_after: 서버가 지정한 대기 시간 (초)
+
+        Returns:
+            적용된 대기 시간 (초)
+        """
+        with self._lock:
+            self.rate_limited += 1
+            delay = retry_after
+            if delay is None:
+                settings = get_settings()
+                delay = min(
+                    settings.rate_limit_backoff_max,
+                    settings.rate_limit_backoff_base * (2 ** self.consecutive_429)
+                )
+            self.consecutive_429 += 1
+            self.paused_until = max(self.paused_until, self.clock() + delay)
+            return delay
+
+    def stats(self) -> dict:
+        """제한기 통계"""
+        with self._lock:
+            return {
+                "requests": self.total_requests,
+                "tokens": self.total_tokens,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "rate_limited": self.rate_limited,
+            }
+
+
+class RateLimiterRegistry:
+    """모델별 제한기 레지스트리"""
+
+    def __init__(self):
+        self._limiters: dict[str, ModelRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: str) -> ModelRateLimiter:
+        """모델 제한기 반환 (없으면 설정의 쿼터로 생성)"""
+        with self._lock:
+            limiter = self._limiters.get(model)
+            if limiter is None:
+                settings = get_settings()
+                quota = settings.model_rate_limits.get(model, {})
+                limiter = ModelRateLimiter(
+                    rpm=quota.get("rpm", settings.rate_limit_rpm),
+                    tpm=quota.get("tpm", settings.rate_limit_tpm)
+                )
+                self._limiters[model] = limiter
+            return limiter
+
+    def stats(self) -> dict[str, dict]:
+        """모델별 통계"""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {model: limiter.stats() for model, limiter in limiters.items()}
+
+
+# 프로세스 전역 레지스트리
+_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter(model: str) -> ModelRateLimiter:
+    """전역 레지스트리에서 모델 제한기 반환"""
+    return _registry.get(model)
+
+
+def get_rate_limit_stats() -> dict[str, dict]:
+    """전역 모델별 통계 반환"""
+    return _registry.stats()
+
+
+def estimate_tokens(contents: Any, config: Any = None) -> int:
+    """요청의 토큰 수 추정 (텍스트 4자당 1토큰, 이미지 1장당 고정값, 응답 추정치 포함)
+
+    Args:
+        contents: 요청 콘텐츠
+        config: GenerateContentConfig (system_instruction도 입력 토큰으로 계산)
+
+    Returns:
+        추정 토큰 수
+    """
+    chars = 0
+    images = 0
+
+    def visit(value):
+        nonlocal chars, images
+        if value is None:
+            return
+        if isinstance(value, str):
+            chars += len(value)
+        elif isinstance(value, (bytes, bytearray)):
+            images += 1
+        elif isinstance(value, (list, tuple)):
+            for element in value:
+                visit(element)
+        elif hasattr(value, "parts"):
+            visit(value.parts)
+        else:
+            text = getattr(value, "text", None)
+            inline_data = getattr(value, "inline_data", None)
+            file_data = getattr(value, "file_data", None)
+            if text:
+                chars += len(text)
+            if inline_data is not None or file_data is not None:
+                images += 1
+
+    visit(contents)
+    visit(getattr(config, "system_instruction", None))
+    return chars // 4 + images * IMAGE_TOKEN_ESTIMATE + OUTPUT_TOKEN_ESTIMATE
+
+
+def usage_tokens(response: Any) -> Optional[int]:
+    """응답의 usage_metadata에서 총 토큰 수 추출"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return None
+    return getattr(usage, "total_token_count", None)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 (초)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """429 (RESOURCE_EXHAUSTED) 오류 여부"""
+    return getattr(error, "code", None) == 429
@@ -0,0 +1,173 @@
+"""모델 호출 기록/재생
+
+settings.model_call_mode에 따라 generate_content 호출을 기록하거나 재생합니다.
+- live: 기록/재생 없이 실제 호출
+- record: 실제 호출 후 요청/응답 쌍을 recordings_dir에 저장
+- replay: 저장된 응답만 반환 (API 키, 네트워크 불필요)
+
+기록 키는 (모델, 요청 콘텐츠, 생성 설정)의 sha256 해시이며,
+이미지 등 바이트 데이터는 해시로 대체하여 비교합니다.
+"""
+
+import enum
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from google.genai import types
+from pydantic import BaseModel
+
+from .config import get_settings
+
+
+MODES = ("live", "record", "replay")
+
+
+class RecordingNotFoundError(LookupError):
+    """재생 모드에서 요청에 해당하는 기록이 없음"""
+
+
+def _canonical(value: Any) -> Any:
+    """요청 값을 비교 가능한 JSON 구조로 변환 (바이트는 해시로 대체)"""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(exclude_none=True)
+    if isinstance(value, (bytes, bytearray)):
+        return {"sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _prompt_excerpt(contents: Any, limit: int = 200) -> str:
+    """기록 파일 확인용 프롬프트 앞부분"""
+    texts: list[str] = []
+
+    def visit(value):
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                if k == "text" and isinstance(v, str):
+                    texts.append(v)
+                else:
+                    visit(v)
+        elif isinstance(value, list):
+            for v in value:
+                visit(v)
+
+    visit(_canonical(contents))
+    return " ".join(texts)[:limit]
+
+
+class CallRecorder:
+    """요청/응답 기록 저장소"""
+
+    def __init__(self, directory: Path, mode: str):
+        """저장소 초기화
+
+        Args:
+            directory: 기록 디렉토리
+            mode: "record" 또는 "replay"
+        """
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 모델 호출 모드: {mode} (live, record, replay 중 선택)")
+        self.directory = Path(directory)
+        self.mode = mode
+        self._lock = threading.Lock()
+
+        # 통계
+        self.recorded = 0
+        self.replayed = 0
+
+    @property
+    def replaying(self) -> bool:
+        """재생 모드 여부"""
+        return self.mode == "replay"
+
+    def key(self, model: str, contents: Any, config: Any = None) -> str:
+        """요청 기록 키
+
+        Args:
+            model: 모델 이름
+            contents: 요청 콘텐츠
+            config: GenerateContentConfig
+
+        Returns:
+            16진수 sha256 해시
+        """
+        request = {"model": model, "contents": _canonical(contents), "config": _canonical(config)}
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, model: str, key: str) -> Path:
+        """기록 파일 경로"""
+        return self.directory / model.replace("/", "_") / f"{key}.json"
+
+    def load(self, model: str, contents: Any, config: Any = None) -> types.GenerateContentResponse:
+        """기록된 응답 반환
+
+        Raises:
+            RecordingNotFoundError: 기록이 없는 경우
+        """
+        key = self.key(model, contents, config)
+        path = self._path(model, key)
+        if not path.exists():
+            raise RecordingNotFoundError(
+                f"기록된 응답이 없습니다: {model} {key[:12]} ({_prompt_excerpt(contents, 60)})"
+            )
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        with self._lock:
+            self.replayed += 1
+        return types.GenerateContentResponse.model_validate_json(json.dumps(data["response"]))
+
+    def save(self, model: str, contents: Any, config: Any, response: types.GenerateContentResponse) -> Path:
+        """요청/응답 쌍 저장
+
+        Returns:
+            저장된 파일 경로
+        """
+        key = self.key(model, contents, config)
+        path = self._path(model, key)
+        record = {
+            "model": model,
+            "prompt": _prompt_excerpt(contents),
+            "response": json.loads(response.model_dump_json(exclude_none=True)),
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(path)
+        with self._lock:
+            self.recorded += 1
+        return path
+
+
+# 프로세스 전역 저장소 (모드/디렉토리가 바뀌면 다시 생성)
+_recorder: Optional[CallRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder() -> Optional[CallRecorder]:
+    """설정에 따른 전역 기록 저장소 반환
+
+    Returns:
+        CallRecorder (live 모드면 None)
+    """
+    global _recorder
+    mode = get_settings().model_call_mode
+    if mode == "live":
+        return None
+
+    with _recorder_lock:
+        directory = Path(get_settings().recordings_dir)
+        if _recorder is None or _recorder.mode != mode or _recorder.directory != directory:
+            _recorder = CallRecorder(directory, mode)
+        return _recorder
@@ -0,0 +1,131 @@
+"""모델 호출 재시도 정책
+
+오류를 일시적 오류(429, 5xx, 타임아웃, 연결 오류)와 영구 오류로 구분하고,
+일시적 오류만 지수 백오프 + 지터로 재시도합니다.
+요청 1건의 모든 시도와 대기는 하나의 데드라인 안에서 끝나야 합니다.
+"""
+
+import random
+import time
+from typing import Callable, Optional
+
+import httpx
+
+from .config import get_settings
+
+
+# 재시도 대상 HTTP 상태 코드
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_transient(error: Exception) -> bool:
+    """재시도로 회복 가능한 오류 여부
+
+    Args:
+        error: 모델 호출 중 발생한 예외
+
+    Returns:
+        429/5xx 응답, 타임아웃, 연결 오류이면 True
+    """
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in TRANSIENT_STATUS_CODES
+    return isinstance(error, (
+        httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError,
+        TimeoutError, ConnectionError
+    ))
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    rng: Callable[[], float] = random.random
+) -> float:
+    """지수 백오프 대기 시간 (full jitter)
+
+    Args:
+        attempt: 실패한 시도 횟수 (1부터)
+        base_delay: 첫 재시도 최대 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+        rng: [0, 1) 난수 함수
+
+    Returns:
+        0 ~ min(max_delay, base_delay * 2^(attempt-1)) 사이의 대기 시간 (초)
+    """
+    return rng() * min(max_delay, base_delay * (2 ** (attempt - 1)))
+
+
+class RetryPolicy:
+    """요청 1건의 재시도 상태 (시도 횟수, 백오프, 데드라인)"""
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        deadline: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random
+    ):
+        """정책 초기화
+
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 시도 포함)
+            base_delay: 첫 재시도 최대 대기 시간 (초)
+            max_delay: 최대 대기 시간 (초)
+            deadline: 요청 전체 제한 시간 (초, None이면 무제한)
+            clock: 시간 함수 (초)
+            rng: [0, 1) 난수 함수
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.rng = rng
+        self.expires_at = clock() + deadline if deadline else None
+        self.attempts = 0
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        """설정값으로 정책 생성"""
+        settings = get_settings()
+        return cls(
+            max_attempts=settings.api_max_attempts,
+            base_delay=settings.api_retry_base_delay,
+            max_delay=settings.api_retry_max_delay,
+            deadline=settings.api_request_deadline or None
+        )
+
+    def remaining(self) -> Optional[float]:
+        """데드라인까지 남은 시간 (초, 데드라인이 없으면 None)"""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - self.clock()
+
+    def begin_attempt(self) -> Optional[float]:
+        """시도 시작
+
+        Returns:
+            이번 시도에 허용되는 시간 (초, 데드라인이 없으면 None)
+        """
+        self.attempts += 1
+        return self.remaining()
+
+    def next_delay(self, error: Exception) -> Optional[float]:
+        """실패한 시도 이후 재시도 대기 시간
+
+        Args:
+            error: 이번 시도의 예외
+
+        Returns:
+            대기 시간 (초). 영구 오류, 시도 횟수 소진, 데드라인 초과이면 None
+        """
+        if not is_transient(error) or self.attempts >= self.max_attempts:
+            return None
+
+        delay = backoff_delay(self.attempts, self.base_delay, self.max_delay, self.rng)
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
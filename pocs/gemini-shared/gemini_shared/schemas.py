@@ -0,0 +1,38 @@
+"""공유 데이터 스키마"""
+
+from pydantic import BaseModel, Field
+
+
+class TokenUsage(BaseModel):
+    """모델 호출 토큰 사용량과 비용 (여러 호출의 합계일 수 있음)"""
+    model: str = Field(default="", description="모델 이름 (여러 모델 합계면 \"mixed\")")
+    calls: int = Field(default=0, description="호출 수")
+    prompt_tokens: int = Field(default=0, description="입력 토큰 (캐시 토큰 포함)")
+    cached_tokens: int = Field(default=0, description="컨텍스트 캐시에서 읽은 입력 토큰")
+    output_tokens: int = Field(default=0, description="출력 토큰")
+    thinking_tokens: int = Field(default=0, description="생각(thinking) 토큰")
+    total_tokens: int = Field(default=0, description="총 토큰")
+    cost_usd: float = Field(default=0.0, description="가격표 기준 비용 (USD)")
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        """사용량 합산 (모델이 다르면 "mixed")"""
+        if not self.model or self.model == other.model:
+            model = other.model
+        else:
+            model = self.model if not other.model else "mixed"
+        return TokenUsage(
+            model=model,
+            calls=self.calls + other.calls,
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            cached_tokens=self.cached_tokens + other.cached_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            thinking_tokens=self.thinking_tokens + other.thinking_tokens,
+            total_tokens=self.total_tokens + other.total_tokens,
+            cost_usd=self.cost_usd + other.cost_usd
+        )
+
+    def summary(self) -> str:
+        """한 줄 요약 (콘솔 출력용)"""
+        return (f"토큰 {self.total_tokens:,} (입력 {self.prompt_tokens:,}, 캐시 {self.cached_tokens:,}, "
+                f"출력 {self.output_tokens:,}, 생각 {self.thinking_tokens:,}), "
+                f"{self.calls}회 호출, ${self.cost_usd:.4f}")
@@ -0,0 +1,155 @@
+"""토큰 사용량/비용 집계
+
+model_call의 모든 성공 응답은 usage_metadata를 record_usage()로 넘기고,
+사용량은 현재 열린 usage_scope() 전체(페이지, 문항, 단계, 실행)에 합산됩니다.
+- 범위는 ContextVar 스택으로 관리되므로 asyncio 태스크와 to_thread에는 이어지지만,
+  직접 만든 스레드에는 이어지지 않습니다. 작업자 스레드에서는 parent로 바깥 범위를 넘깁니다.
+- 단계 이름은 가장 안쪽의 stage가 지정된 범위를 따르며, 없으면 "미분류"로 집계합니다.
+- 비용은 settings.model_prices(USD/1M 토큰)에서 모델 이름 접두사가 가장 길게 일치하는 가격으로 계산합니다.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from .config import get_settings
+from .schemas import TokenUsage
+
+UNLABELED_STAGE = "미분류"
+
+
+def model_price(model: str) -> Optional[dict[str, float]]:
+    """모델 가격 (가장 긴 접두사 일치, 없으면 None)"""
+    name = model.split("/")[-1]
+    matches = [prefix for prefix in get_settings().model_prices if name.startswith(prefix)]
+    if not matches:
+        return None
+    return get_settings().model_prices[max(matches, key=len)]
+
+
+def usage_cost(
+    model: str,
+    prompt_tokens: int,
+    cached_tokens: int,
+    output_tokens: int,
+    thinking_tokens: int
+) -> float:
+    """토큰 수로 비용 계산 (USD, 가격표에 없는 모델은 0)"""
+    price = model_price(model)
+    if price is None:
+        return 0.0
+    input_price = price.get("input", 0.0)
+    cached_price = price.get("cached_input", input_price)
+    output_price = price.get("output", 0.0)
+    return (
+        (prompt_tokens - cached_tokens) * input_price
+        + cached_tokens * cached_price
+        + (output_tokens + thinking_tokens) * output_price
+    ) / 1_000_000
+
+
+def response_usage(model: str, response: Any, price_ratio: float = 1.0) -> TokenUsage:
+    """응답의 usage_metadata를 TokenUsage로 변환
+
+    Args:
+        model: 요청한 모델 이름
+        response: GenerateContentResponse
+        price_ratio: 가격 비율 (배치 할인 등)
+
+    Returns:
+        호출 1건의 사용량 (usage_metadata가 없으면 토큰 0)
+    """
+    usage = getattr(response, "usage_metadata", None)
+    prompt = getattr(usage, "prompt_token_count", None) or 0
+    cached = getattr(usage, "cached_content_token_count", None) or 0
+    output = getattr(usage, "candidates_token_count", None) or 0
+    thinking = getattr(usage, "thoughts_token_count", None) or 0
+    total = getattr(usage, "total_token_count", None) or prompt + output + thinking
+    return TokenUsage(
+        model=model,
+        calls=1,
+        prompt_tokens=prompt,
+        cached_tokens=cached,
+        output_tokens=output,
+        thinking_tokens=thinking,
+        total_tokens=total,
+        cost_usd=usage_cost(model, prompt, cached, output, thinking) * price_ratio
+    )
+
+
+class UsageScope:
+    """사용량 집계 범위 (페이지, 문항, 단계, 실행 등)"""
+
+    def __init__(self, stage: Optional[str] = None, parent: Optional["UsageScope"] = None):
+        """범위 초기화
+
+        Args:
+            stage: 단계 이름 (없으면 바깥 범위의 단계를 따름)
+            parent: 바깥 범위 (사용량이 함께 합산됨)
+        """
+        self.stage = stage
+        self.parent = parent
+        self.total = TokenUsage()
+        self.by_stage: dict[str, TokenUsage] = {}
+        self._lock = threading.Lock()
+
+    def stage_name(self) -> str:
+        """이 범위에서 기록되는 사용량의 단계 이름"""
+        scope = self
+        while scope is not None:
+            if scope.stage:
+                return scope.stage
+            scope = scope.parent
+        return UNLABELED_STAGE
+
+    def add(self, usage: TokenUsage, stage: str):
+        """사용량 합산"""
+        with self._lock:
+            self.total = self.total + usage
+            self.by_stage[stage] = self.by_stage.get(stage, TokenUsage()) + usage
+
+
+_current: ContextVar[Optional[UsageScope]] = ContextVar("usage_scope", default=None)
+
+
+@contextmanager
+def usage_scope(stage: Optional[str] = None, parent: Optional[UsageScope] = None) -> Iterator[UsageScope]:
+    """사용량 집계 범위
+
+    Args:
+        stage: 단계 이름 (없으면 바깥 범위의 단계를 따름)
+        parent: 바깥 범위 (없으면 현재 범위, 작업자 스레드에서 명시)
+
+    Yields:
+        범위 (블록 안에서 기록된 사용량이 total/by_stage에 합산됨)
+    """
+    scope = UsageScope(stage=stage, parent=parent if parent is not None else _current.get())
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+
+
+def current_usage_scope() -> Optional[UsageScope]:
+    """현재 범위 (없으면 None)"""
+    return _current.get()
+
+
+def add_usage(usage: TokenUsage):
+    """계산된 사용량을 현재 범위와 모든 바깥 범위에 합산"""
+    scope = _current.get()
+    if scope is None:
+        return
+    stage = scope.stage_name()
+    while scope is not None:
+        scope.add(usage, stage)
+        scope = scope.parent
+
+
+def record_usage(model: str, response: Any):
+    """응답 사용량을 현재 범위에 합산 (model_call에서 호출)"""
+    if _current.get() is None:
+        return
+    add_usage(response_usage(model, response))
@@ -0,0 +1 @@
+"""Tests for shared Gemini modules"""
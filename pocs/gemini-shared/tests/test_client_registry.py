@@ -0,0 +1,95 @@
+"""클라이언트 레지스트리 테스트"""
+
+import asyncio
+
+import pytest
+
+from gemini_shared import client_registry, model_call
+from gemini_shared.client_registry import ClientRegistry
+from gemini_shared.config import settings
+from gemini_shared.gemini_standin import StandInConfig, StandInServer
+
+
+@pytest.fixture
+def registry():
+    registry = ClientRegistry(max_connections=4, keepalive_expiry=5.0)
+    yield registry
+    registry.close()
+
+
+def test_same_key_reuses_client(registry):
+    """같은 API 키는 모델과 관계없이 같은 클라이언트 반환"""
+    first = registry.get("test-key")
+    second = registry.get("test-key")
+
+    assert first is second
+    stats = registry.stats()
+    assert stats["clients"] == 1
+    assert stats["created"] == 1
+    assert stats["reused"] == 1
+
+
+def test_different_key_gets_new_client_sharing_pools(registry):
+    """API 키가 다르면 별도 클라이언트, 동기/비동기 HTTP 연결 풀은 공유"""
+    first = registry.get("key-a")
+    second = registry.get("key-b")
+
+    assert first is not second
+    assert first._api_client._httpx_client is second._api_client._httpx_client
+    assert first._api_client._async_httpx_client is second._api_client._async_httpx_client
+    assert registry.stats()["max_connections"] == 4
+
+
+def test_base_url_change_gets_new_client(registry, monkeypatch):
+    """엔드포인트가 바뀌면 새 클라이언트 생성"""
+    first = registry.get("test-key")
+    monkeypatch.setattr(settings, "gemini_base_url", "http://127.0.0.1:1")
+
+    assert registry.get("test-key") is not first
+
+
+def test_shared_clients_have_explicit_timeout(registry):
+    """공유 HTTP 클라이언트는 설정의 제한 시간을 사용 (무제한 아님)"""
+    client = registry.get("test-key")
+
+    for http_client in (client._api_client._httpx_client, client._api_client._async_httpx_client):
+        assert http_client.timeout.read == settings.http_timeout
+        assert http_client.timeout.connect == settings.http_connect_timeout
+
+
+def test_async_pool_per_event_loop(registry, monkeypatch):
+    """asyncio.run을 반복해도 닫힌 루프의 연결을 재사용하지 않음"""
+    server = StandInServer(config=StandInConfig(seed=0)).start()
+    monkeypatch.setattr(settings, "gemini_base_url", server.base_url)
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    try:
+        client = registry.get("dummy-key")
+
+        transport = client._api_client._async_httpx_client._transport
+
+        async def call():
+            response = await model_call.generate_content_async(client, "test-model", "is_valid 여부를 판단하세요")
+            return response, transport._current()
+
+        first_response, first_pool = asyncio.run(call())
+        second_response, second_pool = asyncio.run(call())
+
+        assert first_response.text and second_response.text
+        assert first_pool is not second_pool
+        assert transport.pool_count() == 0  # 두 루프 모두 닫혀 연결 풀이 정리됨
+        assert server.snapshot()["errors"] == 0
+    finally:
+        server.stop()
+
+
+def test_global_registry_created_lazily(monkeypatch):
+    """전역 레지스트리는 첫 사용 시점의 설정(configure 이후)을 반영"""
+    monkeypatch.setattr(client_registry, "_registry", None)
+    monkeypatch.setattr(settings, "http_max_connections", 7)
+
+    registry = client_registry.get_registry()
+    try:
+        assert registry.max_connections == 7
+        assert client_registry.get_registry() is registry
+    finally:
+        registry.close()
@@ -0,0 +1,116 @@
+"""이미지 업로드 관리자 테스트 (로컬 대체 서버 사용)"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from gemini_shared import model_call
+from gemini_shared.client_registry import ClientRegistry
+from gemini_shared.file_uploads import FileUploadManager
+from gemini_shared.gemini_standin import StandInConfig, StandInServer
+from gemini_shared.config import settings
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    """Files API 업로드를 지원하는 대체 서버"""
+    server = StandInServer(config=StandInConfig(seed=0, file_ttl_seconds=3600)).start()
+    monkeypatch.setattr(settings, "gemini_base_url", server.base_url)
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(standin):
+    registry = ClientRegistry()
+    yield registry.get("dummy-key")
+    registry.close()
+
+
+def validate_with_image(client, image: types.Part):
+    """이미지 파트와 검증 프롬프트로 모델 호출"""
+    contents = [types.Content(role="user", parts=[image, types.Part.from_text(text="is_valid 여부를 판단하세요")])]
+    return model_call.generate_content(client, "test-model", contents)
+
+
+def test_same_image_uploaded_once(client, standin):
+    """첫 요청은 인라인, 두 번째 요청에서 한 번만 업로드하고 이후 단계는 파일 참조로 전송"""
+    manager = FileUploadManager(min_bytes=1024, expiry_margin_seconds=60)
+    image = os.urandom(64 * 1024)
+
+    first = manager.image_part(client, image, "image/png")
+    assert first.inline_data.data == image
+    validate_with_image(client, first)
+
+    for _ in range(3):
+        part = manager.image_part(client, image, "image/png")
+        assert part.inline_data is None
+        validate_with_image(client, part)
+
+    stats = manager.stats()
+    assert stats["inline"] == 1
+    assert stats["uploads"] == 1
+    assert stats["reused"] == 2
+    assert stats["bytes_saved"] == 2 * len(image)
+    assert standin.snapshot()["uploads"] == 1
+    assert standin.snapshot()["file_refs"] == 3
+
+
+def test_single_use_image_not_uploaded(client, standin):
+    """한 번만 쓰이는 이미지는 업로드 없이 인라인 전송"""
+    manager = FileUploadManager(min_bytes=1024, expiry_margin_seconds=60)
+
+    for _ in range(3):
+        part = manager.image_part(client, os.urandom(4096), "image/png")
+        assert part.inline_data is not None
+
+    assert manager.stats()["inline"] == 3
+    assert "uploads" not in standin.snapshot()
+
+
+def test_file_near_expiry_is_uploaded_again(client, standin):
+    """만료가 가까운 파일은 다시 업로드"""
+    standin.config.file_ttl_seconds = 30
+    manager = FileUploadManager(min_bytes=1024, expiry_margin_seconds=60)
+    image = os.urandom(4096)
+
+    manager.image_part(client, image, "image/png")
+    first = manager.image_part(client, image, "image/png")
+    second = manager.image_part(client, image, "image/png")
+
+    assert first.file_data.file_uri != second.file_data.file_uri
+    assert manager.stats()["expired"] == 1
+    assert standin.snapshot()["uploads"] == 2
+
+
+def test_small_image_sent_inline(client, standin):
+    """최소 크기 미만 이미지는 업로드하지 않음"""
+    manager = FileUploadManager(min_bytes=1024, expiry_margin_seconds=60)
+
+    part = manager.image_part(client, b"\x89PNG small", "image/png")
+
+    assert part.inline_data.data == b"\x89PNG small"
+    assert manager.stats()["inline"] == 1
+    assert "uploads" not in standin.snapshot()
+
+
+def test_upload_failure_falls_back_inline():
+    """업로드가 불가능한 클라이언트는 이후 요청도 인라인 전송"""
+    calls = []
+
+    def upload(file, config):
+        calls.append(config)
+        raise RuntimeError("404 files API not supported")
+
+    client = SimpleNamespace(files=SimpleNamespace(upload=upload))
+    manager = FileUploadManager(min_bytes=0, expiry_margin_seconds=60)
+
+    for image in (b"first image", b"first image", b"second image", b"second image"):
+        part = manager.image_part(client, image, "image/png")
+        assert part.inline_data.data == image
+
+    assert len(calls) == 1
+    assert manager.stats()["failures"] == 1
@@ -0,0 +1,87 @@
+"""모델 요청 이미지 인코더 테스트"""
+
+import io
+import os
+
+import pytest
+from PIL import Image, ImageDraw
+
+from gemini_shared.image_encoder import (
+    encode_for_model, estimate_image_tokens, original_image, target_size
+)
+
+
+def test_estimate_image_tokens():
+    assert estimate_image_tokens(384, 384) == 258
+    assert estimate_image_tokens(385, 100) == 258
+    assert estimate_image_tokens(1536, 1537) == 258 * 2 * 3
+
+
+def test_target_size_meets_token_budget():
+    """토큰 예산에 맞춰 종횡비를 유지하며 축소 (확대 없음)"""
+    width, height = target_size(1654, 2339, token_budget=1548, max_pixels=0)
+
+    assert estimate_image_tokens(width, height) <= 1548
+    assert abs(width / height - 1654 / 2339) < 0.002
+    assert target_size(300, 200, token_budget=258, max_pixels=0) == (300, 200)
+
+
+def test_target_size_meets_pixel_budget():
+    width, height = target_size(2000, 1000, token_budget=0, max_pixels=500_000)
+
+    assert width * height <= 500_000
+    assert width == 2 * height
+
+
+def test_grayscale_palette_png():
+    """그레이스케일 이미지는 palette_colors 단계로 양자화한 PNG"""
+    image = Image.new("RGB", (1600, 2200), "white")
+    ImageDraw.Draw(image).rectangle((100, 100, 800, 400), fill=(40, 40, 40))
+
+    encoded = encode_for_model(image, token_budget=1548, palette_colors=8)
+
+    assert encoded.mime_type == "image/png"
+    assert encoded.grayscale
+    assert encoded.colors == 8
+    assert encoded.estimated_tokens <= 1548
+    assert encoded.describe()["source_size"] == [1600, 2200]
+
+
+@pytest.mark.parametrize("fmt, quality, mime_type", [("jpeg", 60, "image/jpeg"), ("webp", 60, "image/webp")])
+def test_format_and_quality_parameters(fmt, quality, mime_type):
+    """포맷과 품질은 호출한 쪽(각 POC 설정)에서 인자로 지정"""
+    image = Image.frombytes("RGB", (256, 256), os.urandom(256 * 256 * 3))
+
+    low = encode_for_model(image, fmt=fmt, quality=quality)
+    high = encode_for_model(image, fmt=fmt, quality=95)
+
+    assert low.mime_type == mime_type
+    assert len(low.data) < len(high.data)
+
+
+def test_unknown_format_rejected():
+    with pytest.raises(ValueError):
+        encode_for_model(Image.new("RGB", (10, 10)), fmt="gif")
+
+
+def test_smaller_source_bytes_kept():
+    """크기 변화가 없고 원본 인코딩이 더 작으면 원본 바이트 사용"""
+    image = Image.frombytes("RGB", (128, 128), os.urandom(128 * 128 * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="WEBP", quality=10)
+    source = buffer.getvalue()
+
+    encoded = encode_for_model(image, fmt="png", source_bytes=source, source_mime_type="image/webp")
+
+    assert encoded.data == source
+    assert encoded.mime_type == "image/webp"
+
+
+def test_original_image():
+    image = Image.new("RGB", (500, 400), "white")
+
+    encoded = original_image(image)
+    with Image.open(io.BytesIO(encoded.data)) as decoded:
+        assert decoded.size == (500, 400)
+    assert encoded.mime_type == "image/png"
+    assert original_image(image, b"jpeg-bytes", "image/jpeg").data == b"jpeg-bytes"
@@ -0,0 +1,103 @@
+"""모델 호출 공통 모듈 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from gemini_shared import model_call
+from gemini_shared.usage_tracker import usage_scope
+from gemini_shared.config import settings
+
+
+class FakeAsyncModels:
+    """동시 실행 수를 기록하는 가짜 aio.models"""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    async def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(text=f"{model}:{contents}")
+
+
+@pytest.fixture
+def fake_client():
+    models = FakeAsyncModels()
+    return SimpleNamespace(aio=SimpleNamespace(models=models))
+
+
+async def test_async_calls_share_concurrency_limit(fake_client, monkeypatch):
+    """비동기 호출은 공유 동시 실행 제한을 넘지 않음"""
+    monkeypatch.setattr(settings, "async_max_concurrency", 3)
+    monkeypatch.setattr(model_call, "_async_limiters", type(model_call._async_limiters)())
+
+    responses = await asyncio.gather(*(
+        model_call.generate_content_async(fake_client, "test-model", f"req-{i}")
+        for i in range(10)
+    ))
+
+    models = fake_client.aio.models
+    assert models.calls == 10
+    assert models.max_active == 3
+    assert responses[4].text == "test-model:req-4"
+
+
+def test_sync_call_uses_models_surface():
+    """동기 호출은 client.models.generate_content 사용"""
+    calls = []
+    client = SimpleNamespace(models=SimpleNamespace(
+        generate_content=lambda **kwargs: calls.append(kwargs) or "ok"
+    ))
+
+    assert model_call.generate_content(client, "test-model", "hello") == "ok"
+    assert len(calls) == 1
+    assert calls[0]["model"] == "test-model"
+    assert calls[0]["contents"] == "hello"
+    # 요청 데드라인이 시도별 HTTP 타임아웃으로 전달됨
+    assert 0 < calls[0]["config"].http_options.timeout <= settings.api_request_deadline * 1000
+
+
+def test_stream_error_after_first_chunk_is_not_retried(monkeypatch):
+    """청크를 내보낸 뒤의 스트리밍 오류는 재시도하지 않고 ModelCallError 발생"""
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    calls = []
+
+    def generate_content_stream(**kwargs):
+        calls.append(kwargs)
+        yield SimpleNamespace(text='{"items": [')
+        raise TimeoutError("stream interrupted")
+
+    client = SimpleNamespace(models=SimpleNamespace(generate_content_stream=generate_content_stream))
+    received = []
+
+    with pytest.raises(model_call.ModelCallError):
+        for chunk in model_call.generate_content_stream(client, "test-model", "hello"):
+            received.append(chunk.text)
+
+    assert received == ['{"items": [']
+    assert len(calls) == 1
+
+
+def test_successful_call_recorded_in_usage_scope(monkeypatch):
+    """성공한 호출의 토큰 사용량은 현재 범위에 합산"""
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    response = types.GenerateContentResponse(usage_metadata=types.GenerateContentResponseUsageMetadata(
+        prompt_token_count=100, candidates_token_count=20, total_token_count=120
+    ))
+    client = SimpleNamespace(models=SimpleNamespace(generate_content=lambda **kwargs: response))
+
+    with usage_scope("P3-GENERATE") as usage:
+        model_call.generate_content(client, "gemini-3-flash-preview", "hello")
+        model_call.generate_content(client, "gemini-3-flash-preview", "hello")
+
+    assert usage.total.calls == 2
+    assert usage.total.total_tokens == 240
+    assert usage.by_stage["P3-GENERATE"].cost_usd > 0
@@ -0,0 +1,99 @@
+"""정적 프롬프트 캐시 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from gemini_shared.prompt_cache import apply_prompt_cache, prompt_cache_session
+from gemini_shared.config import settings
+
+
+class FakeCaches:
+    """client.caches 대체"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.created = []
+        self.deleted = []
+
+    def create(self, model, config):
+        if self.fail:
+            raise RuntimeError("400 cached content is too small")
+        self.created.append(config)
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+    def delete(self, name):
+        self.deleted.append(name)
+
+
+@pytest.fixture(autouse=True)
+def live_mode(monkeypatch):
+    monkeypatch.setattr(settings, "prompt_cache_enabled", True)
+    monkeypatch.setattr(settings, "model_call_mode", "live")
+
+
+def code_execution_config():
+    return types.GenerateContentConfig(
+        tools=[types.Tool(code_execution=types.ToolCodeExecution())],
+        temperature=0.7,
+    )
+
+
+def test_prompt_sent_as_system_instruction_without_session():
+    """세션 밖에서는 캐시 경로와 같은 형태(system_instruction)로 프롬프트 전송"""
+    client = SimpleNamespace(caches=FakeCaches())
+    config = code_execution_config()
+
+    request_config = apply_prompt_cache(client, "m", "정적 프롬프트", config)
+
+    assert request_config.system_instruction == "정적 프롬프트"
+    assert request_config.tools == config.tools
+    assert config.system_instruction is None
+    assert client.caches.created == []
+
+
+def test_cache_created_once_and_deleted_with_session():
+    """세션 동안 프롬프트별 캐시를 한 번 생성해 재사용하고 종료 시 삭제"""
+    client = SimpleNamespace(caches=FakeCaches())
+
+    with prompt_cache_session() as cache:
+        for _ in range(3):
+            request_config = apply_prompt_cache(client, "m", "정적 프롬프트", code_execution_config())
+            assert request_config.system_instruction is None
+            assert request_config.cached_content == "cachedContents/1"
+            assert request_config.tools is None
+            assert request_config.temperature == 0.7
+
+        cache.record_usage(SimpleNamespace(usage_metadata=SimpleNamespace(
+            prompt_token_count=1300, cached_content_token_count=1000
+        )))
+        stats = cache.stats()
+
+    assert len(client.caches.created) == 1
+    assert client.caches.created[0].tools[0].code_execution is not None
+    assert client.caches.deleted == ["cachedContents/1"]
+    assert stats["reused"] == 2
+    assert stats["cached_tokens"] == 1000
+    assert stats["fresh_tokens"] == 300
+
+
+def test_unavailable_cache_falls_back_inline():
+    """캐시 생성이 불가능하면 인라인 전송하고 다시 시도하지 않음"""
+    client = SimpleNamespace(caches=FakeCaches(fail=True))
+
+    with prompt_cache_session() as cache:
+        for _ in range(2):
+            request_config = apply_prompt_cache(client, "m", "짧은 프롬프트", None)
+            assert request_config.system_instruction == "짧은 프롬프트"
+            assert request_config.cached_content is None
+
+    assert cache.stats()["unavailable"] == 1
+
+
+def test_session_disabled_outside_live_mode(monkeypatch):
+    """기록/재생 모드에서는 요청을 일정하게 유지하도록 캐시 미사용"""
+    monkeypatch.setattr(settings, "model_call_mode", "replay")
+
+    with prompt_cache_session() as cache:
+        assert cache is None
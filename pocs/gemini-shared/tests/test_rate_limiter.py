@@ -0,0 +1,198 @@
+"""모델별 속도 제한 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from gemini_shared import model_call, rate_limiter
+from gemini_shared.rate_limiter import (
+    OUTPUT_TOKEN_ESTIMATE, ModelRateLimiter, RateLimiterRegistry, TokenBucket, estimate_tokens
+)
+from gemini_shared.config import settings
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_bucket_waits_for_refill(clock):
+    """버킷이 비면 충전 시간만큼 대기"""
+    bucket = TokenBucket(capacity=2, per_minute=60, clock=clock)
+
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+    clock.now = 3.0
+    assert bucket.reserve(1) == 0.0
+
+
+def test_usage_adjusts_token_bucket(clock):
+    """실제 토큰 사용량이 추정치보다 크면 TPM 버킷에서 추가 차감"""
+    limiter = ModelRateLimiter(rpm=100, tpm=600, clock=clock)
+
+    assert limiter.reserve(100) == 0.0
+    limiter.record_usage(100, 600)
+
+    # 잔량 0 → 60토큰은 6초(10토큰/초) 후 충전
+    assert limiter.reserve(60) == pytest.approx(6.0)
+    assert limiter.stats()["tokens"] == 600
+
+
+def test_refund_returns_reservation(clock):
+    """응답 없이 실패한 시도의 TPM 예약은 반환, 요청 수는 유지"""
+    limiter = ModelRateLimiter(rpm=1, tpm=600, clock=clock)
+
+    assert limiter.reserve(600) == 0.0
+    limiter.refund(600)
+
+    assert limiter.tokens.reserve(600) == 0.0
+    assert limiter.requests.reserve(1) == pytest.approx(60.0)
+
+
+def test_estimate_includes_system_instruction():
+    """config.system_instruction의 프롬프트도 입력 토큰으로 추정"""
+    prompt = "지시문" * 400
+    config = types.GenerateContentConfig(system_instruction=prompt)
+
+    assert estimate_tokens("hi") == OUTPUT_TOKEN_ESTIMATE
+    assert estimate_tokens("hi", config) == len(prompt) // 4 + OUTPUT_TOKEN_ESTIMATE
+
+
+def test_backoff_grows_and_resets(clock, monkeypatch):
+    """연속 429는 대기 시간을 늘리고 성공 시 초기화"""
+    monkeypatch.setattr(settings, "rate_limit_backoff_base", 1.0)
+    monkeypatch.setattr(settings, "rate_limit_backoff_max", 3.0)
+    limiter = ModelRateLimiter(rpm=100, tpm=10_000, clock=clock)
+
+    assert [limiter.backoff() for _ in range(3)] == [1.0, 2.0, 3.0]
+    assert limiter.reserve(10) == pytest.approx(3.0)
+    assert limiter.backoff(retry_after=0.5) == 0.5
+
+    limiter.record_usage(10, None)
+    assert limiter.backoff() == 1.0
+
+
+def test_registry_uses_model_quota(monkeypatch):
+    """설정의 모델별 쿼터 적용"""
+    monkeypatch.setattr(settings, "model_rate_limits", {"slow-model": {"rpm": 5}})
+    registry = RateLimiterRegistry()
+
+    slow = registry.get("slow-model")
+    assert slow.requests.capacity == 5
+    assert slow.tokens.capacity == settings.rate_limit_tpm
+    assert registry.get("slow-model") is slow
+    assert registry.get("other-model").requests.capacity == settings.rate_limit_rpm
+
+
+def test_sync_call_retries_after_429(monkeypatch):
+    """429 응답은 백오프 후 재요청"""
+    monkeypatch.setattr(rate_limiter, "_registry", RateLimiterRegistry())
+    monkeypatch.setattr(model_call.time, "sleep", lambda seconds: None)
+
+    class RateLimited(Exception):
+        code = 429
+
+    attempts = []
+
+    def generate_content(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise RateLimited()
+        return SimpleNamespace(usage_metadata=SimpleNamespace(total_token_count=42))
+
+    client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    model_call.generate_content(client, "retry-model", "hello")
+
+    stats = rate_limiter.get_rate_limit_stats()["retry-model"]
+    assert len(attempts) == 3
+    assert stats["rate_limited"] == 2
+    assert stats["tokens"] == 42
+
+
+def test_failed_attempts_do_not_hold_tpm(monkeypatch):
+    """실패한 시도의 예약은 반환되어 성공한 시도의 사용량만 남음"""
+    monkeypatch.setattr(rate_limiter, "_registry", RateLimiterRegistry())
+    monkeypatch.setattr(settings, "rate_limit_tpm", 2_000)
+    monkeypatch.setattr(model_call.time, "sleep", lambda seconds: None)
+
+    class ServerError(Exception):
+        code = 503
+
+    attempts = []
+
+    def generate_content(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise ServerError()
+        return SimpleNamespace(usage_metadata=SimpleNamespace(total_token_count=100))
+
+    client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    model_call.generate_content(client, "refund-model", "x" * 2_000)
+
+    limiter = rate_limiter.get_rate_limiter("refund-model")
+    assert len(attempts) == 3
+    assert limiter.tokens.tokens == pytest.approx(1_900, abs=1)
+
+
+def test_async_failed_attempts_do_not_hold_tpm(monkeypatch):
+    """비동기 호출도 실패한 시도의 예약을 반환"""
+    monkeypatch.setattr(rate_limiter, "_registry", RateLimiterRegistry())
+    monkeypatch.setattr(settings, "rate_limit_tpm", 2_000)
+
+    async def no_sleep(seconds):
+        return None
+
+    monkeypatch.setattr(model_call.asyncio, "sleep", no_sleep)
+
+    class ServerError(Exception):
+        code = 503
+
+    attempts = []
+
+    async def generate_content(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise ServerError()
+        return SimpleNamespace(usage_metadata=SimpleNamespace(total_token_count=100))
+
+    client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+    asyncio.run(model_call.generate_content_async(client, "async-refund-model", "x" * 2_000))
+
+    limiter = rate_limiter.get_rate_limiter("async-refund-model")
+    assert len(attempts) == 3
+    assert limiter.tokens.tokens == pytest.approx(1_900, abs=1)
+
+
+def test_stream_failure_reconciles_partial_usage(monkeypatch):
+    """스트리밍 도중 실패하면 받은 청크의 사용량으로 보정"""
+    monkeypatch.setattr(rate_limiter, "_registry", RateLimiterRegistry())
+    monkeypatch.setattr(settings, "rate_limit_tpm", 2_000)
+
+    def generate_content_stream(**kwargs):
+        yield types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=[types.Part(text="부분")]))],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(total_token_count=50)
+        )
+        raise ConnectionError("끊김")
+
+    client = SimpleNamespace(models=SimpleNamespace(generate_content_stream=generate_content_stream))
+    with pytest.raises(model_call.ModelCallError):
+        list(model_call.generate_content_stream(client, "stream-model", "hello"))
+
+    limiter = rate_limiter.get_rate_limiter("stream-model")
+    assert limiter.tokens.tokens == pytest.approx(1_950, abs=1)
+    assert limiter.stats()["tokens"] == 50
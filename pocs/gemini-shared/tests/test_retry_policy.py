@@ -0,0 +1,131 @@
+"""모델 호출 재시도 정책 테스트"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from gemini_shared import model_call
+from gemini_shared.model_call import ModelCallError, find_model_call_error
+from gemini_shared.retry_policy import RetryPolicy, backoff_delay, is_transient
+from gemini_shared.config import settings
+
+
+class APIError(Exception):
+    """상태 코드를 가진 가짜 API 오류"""
+
+    def __init__(self, code: int):
+        super().__init__(f"{code} error")
+        self.code = code
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """재시도 대기 생략 및 속도 제한 비활성화"""
+    sleeps = []
+    monkeypatch.setattr(model_call.time, "sleep", sleeps.append)
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    return sleeps
+
+
+def flaky_client(errors: list[Exception]):
+    """주어진 예외를 차례로 발생시킨 뒤 성공하는 가짜 클라이언트"""
+    calls = []
+
+    def generate_content(**kwargs):
+        calls.append(kwargs)
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    return SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)), calls
+
+
+def test_error_classification():
+    """429/5xx/타임아웃은 일시적 오류, 4xx와 기타 예외는 영구 오류"""
+    assert is_transient(APIError(429))
+    assert is_transient(APIError(503))
+    assert is_transient(httpx.ReadTimeout("timeout"))
+    assert is_transient(httpx.ConnectError("refused"))
+    assert not is_transient(APIError(400))
+    assert not is_transient(APIError(403))
+    assert not is_transient(ValueError("bad json"))
+
+
+def test_backoff_is_jittered_and_capped():
+    """대기 시간은 지수적으로 증가하는 상한 안에서 무작위"""
+    assert backoff_delay(1, 1.0, 10.0, rng=lambda: 0.5) == 0.5
+    assert backoff_delay(3, 1.0, 10.0, rng=lambda: 0.5) == 2.0
+    assert backoff_delay(10, 1.0, 10.0, rng=lambda: 0.99) == pytest.approx(9.9)
+
+
+def test_policy_stops_at_deadline():
+    """남은 데드라인보다 긴 대기는 재시도하지 않음"""
+    clock = FakeClock()
+    policy = RetryPolicy(max_attempts=5, base_delay=4.0, max_delay=60.0,
+                         deadline=10.0, clock=clock, rng=lambda: 1.0)
+
+    assert policy.begin_attempt() == 10.0
+    assert policy.next_delay(APIError(503)) == 4.0
+
+    clock.now = 5.0
+    policy.begin_attempt()
+    assert policy.next_delay(APIError(503)) is None
+
+
+def test_transient_error_costs_one_call(no_sleep):
+    """일시적 오류는 해당 호출만 재시도"""
+    client, calls = flaky_client([APIError(503), httpx.ReadTimeout("timeout")])
+
+    assert model_call.generate_content(client, "retry-model", "hello") == "ok"
+    assert len(calls) == 3
+    assert len(no_sleep) == 2
+
+
+def test_permanent_error_is_not_retried(no_sleep):
+    """영구 오류는 재시도 없이 ModelCallError로 전달"""
+    client, calls = flaky_client([APIError(400)])
+
+    with pytest.raises(ModelCallError) as exc_info:
+        model_call.generate_content(client, "retry-model", "hello")
+
+    assert len(calls) == 1
+    assert not exc_info.value.transient
+    assert exc_info.value.__cause__.code == 400
+
+
+def test_attempts_are_limited(no_sleep, monkeypatch):
+    """시도 횟수를 소진하면 ModelCallError 발생"""
+    monkeypatch.setattr(settings, "api_max_attempts", 2)
+    client, calls = flaky_client([APIError(500)] * 5)
+
+    with pytest.raises(ModelCallError) as exc_info:
+        model_call.generate_content(client, "retry-model", "hello")
+
+    assert len(calls) == 2
+    assert exc_info.value.transient
+    assert exc_info.value.attempts == 2
+
+
+def test_find_model_call_error_follows_cause():
+    """래핑된 예외에서도 ModelCallError 검색"""
+    error = ModelCallError(APIError(503), attempts=4)
+    try:
+        try:
+            raise error
+        except ModelCallError as e:
+            raise RuntimeError("문항 생성 실패") from e
+    except RuntimeError as wrapped:
+        assert find_model_call_error(wrapped) is error
+
+    assert find_model_call_error(RuntimeError("other")) is None
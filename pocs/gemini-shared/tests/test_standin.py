@@ -0,0 +1,106 @@
+"""로컬 대체 서버 및 기록/재생 테스트"""
+
+import json
+
+import pytest
+
+from gemini_shared import model_call
+from gemini_shared.client_registry import ClientRegistry
+from gemini_shared.gemini_standin import LatencyModel, StandInConfig, StandInServer
+from gemini_shared.recorder import RecordingNotFoundError
+from gemini_shared.config import settings
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    """임의 포트의 대체 서버와 이를 가리키는 설정"""
+    server = StandInServer(config=StandInConfig(seed=0)).start()
+    monkeypatch.setattr(settings, "gemini_base_url", server.base_url)
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    monkeypatch.setattr(model_call.time, "sleep", lambda seconds: None)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(standin):
+    registry = ClientRegistry()
+    yield registry.get("dummy-key")
+    registry.close()
+
+
+def test_standin_serves_canned_json(client, standin):
+    """프롬프트 종류에 맞는 고정 JSON 응답"""
+    response = model_call.generate_content(client, "test-model", "is_valid 여부를 판단하세요")
+
+    assert json.loads(response.text)["is_valid"] is True
+    assert response.usage_metadata.total_token_count > 0
+    assert standin.snapshot()["validation"] == 1
+
+
+def test_injected_errors_are_retried(client, standin):
+    """주입된 일시적 오류는 호출 단위 재시도로 회복"""
+    standin.config.error_rate = 0.5
+
+    for _ in range(5):
+        response = model_call.generate_content(client, "test-model", "evidence_facts를 포함하세요")
+        assert "stem" in json.loads(response.text)
+
+    stats = standin.snapshot()
+    assert stats["generation"] == 5
+    assert stats["requests"] == 5 + stats["errors"]
+
+
+def test_record_then_replay(client, standin, monkeypatch, tmp_path):
+    """기록 모드로 저장한 응답을 재생 모드에서 서버 없이 반환"""
+    monkeypatch.setattr(settings, "recordings_dir", tmp_path)
+    monkeypatch.setattr(settings, "model_call_mode", "record")
+    recorded = model_call.generate_content(client, "test-model", "passages를 찾으세요")
+    assert len(list(tmp_path.rglob("*.json"))) == 1
+
+    monkeypatch.setattr(settings, "model_call_mode", "replay")
+    standin.config.error_rate = 1.0
+    replayed = model_call.generate_content(client, "test-model", "passages를 찾으세요")
+
+    assert replayed.text == recorded.text
+    assert standin.snapshot()["requests"] == 1
+    with pytest.raises(RecordingNotFoundError):
+        model_call.generate_content(client, "test-model", "기록되지 않은 요청")
+
+
+def test_stream_returns_chunks(client, standin):
+    """스트리밍 응답은 여러 청크로 나뉘며 이어 붙이면 고정 응답과 같음"""
+    standin.config.stream_chunk_chars = 16
+    expected = model_call.generate_content(client, "test-model", "is_valid 여부를 판단하세요").text
+
+    chunks = list(model_call.generate_content_stream(client, "test-model", "is_valid 여부를 판단하세요"))
+
+    assert len(chunks) > 1
+    assert "".join(chunk.text for chunk in chunks) == expected
+    assert chunks[-1].usage_metadata.total_token_count > 0
+    assert standin.snapshot()["streams"] == 1
+
+
+def test_record_stream_then_replay(client, standin, monkeypatch, tmp_path):
+    """기록된 스트리밍 응답은 병합된 응답 하나로 재생"""
+    monkeypatch.setattr(settings, "recordings_dir", tmp_path)
+    monkeypatch.setattr(settings, "model_call_mode", "record")
+    standin.config.stream_chunk_chars = 16
+    recorded = "".join(
+        chunk.text for chunk in model_call.generate_content_stream(client, "test-model", "passages를 찾으세요")
+    )
+
+    monkeypatch.setattr(settings, "model_call_mode", "replay")
+    replayed = list(model_call.generate_content_stream(client, "test-model", "passages를 찾으세요"))
+
+    assert len(replayed) == 1
+    assert replayed[0].text == recorded
+    assert standin.snapshot()["requests"] == 1
+
+
+def test_latency_model_parse():
+    """지연 분포 문자열 파싱"""
+    assert LatencyModel.parse("fixed:200").params == (200.0,)
+    assert LatencyModel.parse("uniform:100,300").kind == "uniform"
+    with pytest.raises(ValueError):
+        LatencyModel.parse("gamma:1")
@@ -0,0 +1,127 @@
+"""토큰 사용량/비용 집계 테스트"""
+
+import asyncio
+import threading
+
+import pytest
+from google.genai import types
+
+from gemini_shared.usage_tracker import (
+    UNLABELED_STAGE, model_price, record_usage, response_usage, usage_scope
+)
+from gemini_shared.config import settings
+from gemini_shared.schemas import TokenUsage
+
+
+@pytest.fixture(autouse=True)
+def price_table(monkeypatch):
+    monkeypatch.setattr(settings, "model_prices", {
+        "gemini-3-flash": {"input": 1.0, "cached_input": 0.1, "output": 10.0},
+        "gemini-3-pro": {"input": 2.0, "output": 20.0},
+        "gemini-3-pro-image": {"input": 2.0, "output": 100.0},
+    })
+
+
+def make_response(prompt=1000, cached=0, output=100, thinking=0) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse(usage_metadata=types.GenerateContentResponseUsageMetadata(
+        prompt_token_count=prompt,
+        cached_content_token_count=cached,
+        candidates_token_count=output,
+        thoughts_token_count=thinking,
+        total_token_count=prompt + output + thinking,
+    ))
+
+
+def test_price_uses_longest_prefix():
+    """가장 길게 일치하는 접두사의 가격 적용 (models/ 접두사 무시)"""
+    assert model_price("gemini-3-pro-image-preview")["output"] == 100.0
+    assert model_price("models/gemini-3-pro-preview")["output"] == 20.0
+    assert model_price("unknown-model") is None
+
+
+def test_response_usage_cost():
+    """캐시 토큰은 캐시 가격, 생각 토큰은 출력 가격으로 계산"""
+    usage = response_usage("gemini-3-flash-preview", make_response(
+        prompt=1_000_000, cached=400_000, output=100_000, thinking=50_000
+    ))
+
+    assert usage.calls == 1
+    assert usage.total_tokens == 1_150_000
+    # 신규 입력 0.6M * 1.0 + 캐시 0.4M * 0.1 + (출력+생각) 0.15M * 10.0
+    assert usage.cost_usd == pytest.approx(0.6 + 0.04 + 1.5)
+    # 가격표에 없는 모델은 비용 0
+    assert response_usage("unknown", make_response()).cost_usd == 0.0
+
+
+def test_response_without_usage_metadata():
+    """usage_metadata가 없으면 호출 수만 집계"""
+    usage = response_usage("gemini-3-flash", types.GenerateContentResponse())
+    assert usage.calls == 1
+    assert usage.total_tokens == 0
+
+
+def test_token_usage_add_keeps_model_or_mixed():
+    """합계의 모델 이름은 같으면 유지, 다르면 mixed"""
+    flash = TokenUsage(model="gemini-3-flash", calls=1, total_tokens=10, cost_usd=0.5)
+    assert (TokenUsage() + flash).model == "gemini-3-flash"
+    assert (flash + flash).total_tokens == 20
+    assert (flash + TokenUsage(model="gemini-3-pro", calls=1)).model == "mixed"
+
+
+def test_nested_scopes_aggregate_by_stage():
+    """바깥 범위에 합산되고 단계는 가장 안쪽의 지정된 이름을 따름"""
+    with usage_scope() as run:
+        record_usage("gemini-3-flash", make_response())
+        with usage_scope("P3-GENERATE") as generate:
+            with usage_scope() as item:
+                record_usage("gemini-3-flash", make_response())
+        with usage_scope("P4-VALIDATE"):
+            record_usage("gemini-3-pro", make_response())
+
+    assert run.total.calls == 3
+    assert run.total.model == "mixed"
+    assert set(run.by_stage) == {UNLABELED_STAGE, "P3-GENERATE", "P4-VALIDATE"}
+    assert generate.total.calls == 1
+    assert item.by_stage["P3-GENERATE"].calls == 1
+    assert run.total.cost_usd == pytest.approx(sum(u.cost_usd for u in run.by_stage.values()))
+
+
+def test_record_outside_scope_is_ignored():
+    """범위 밖의 호출은 집계하지 않음"""
+    record_usage("gemini-3-flash", make_response())
+    with usage_scope() as run:
+        pass
+    assert run.total.calls == 0
+
+
+def test_worker_thread_uses_explicit_parent():
+    """직접 만든 스레드에서는 parent로 넘긴 범위에 합산"""
+    with usage_scope("RUN") as run:
+        def worker():
+            with usage_scope("P2-SEGMENT", parent=run):
+                record_usage("gemini-3-flash", make_response())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert run.total.calls == 4
+    assert run.by_stage["P2-SEGMENT"].calls == 4
+
+
+async def test_concurrent_tasks_keep_separate_scopes():
+    """동시 실행 태스크는 각자의 범위에 집계하고 바깥 범위에 함께 합산"""
+    async def generate(count: int):
+        with usage_scope() as item:
+            for _ in range(count):
+                await asyncio.sleep(0)
+                record_usage("gemini-3-flash", make_response())
+        return item
+
+    with usage_scope() as run:
+        items = await asyncio.gather(generate(1), generate(2), generate(3))
+
+    assert [item.total.calls for item in items] == [1, 2, 3]
+    assert run.total.calls == 6
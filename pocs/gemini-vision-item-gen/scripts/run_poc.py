@@ -165,6 +165,13 @@ def main():
     for status, count in stats['status_distribution'].items():
         print(f"  {status}: {count}개")
 
+    usage = stats['usage']
+    print(f"\n토큰 사용량: {usage['total_tokens']:,} (입력 {usage['prompt_tokens']:,}, "
+          f"캐시 {usage['cached_tokens']:,}, 출력 {usage['output_tokens']:,}, 생각 {usage['thinking_tokens']:,})")
+    print(f"비용: ${usage['cost_usd']:.4f} (성공 문항당 ${stats['cost_per_success_usd']:.4f})")
+    for stage, stage_usage in stats['usage_by_stage'].items():
+        print(f"  {stage}: {stage_usage['calls']}회, 토큰 {stage_usage['total_tokens']:,}, ${stage_usage['cost_usd']:.4f}")
+
     # P5 이미지 생성 결과
     if args.generate_image:
         generated_images = [
@@ -5,6 +5,7 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from gemini_shared.usage_tracker import UsageScope, usage_scope
 
 from ..core.config import settings
 from ..core.schemas import (
@@ -132,52 +133,22 @@ class ItemGeneratorAgent:
         Returns:
             (생성된 문항, 생성 로그) 튜플
         """
-        session_id = str(uuid.uuid4())[:8]
         image_path = Path(image_path)
-
-        # 생성 로그 초기화
-        gen_log = GenerationLog(
-            session_id=session_id,
-            source_image=str(image_path),
-            item_type=item_type,
-        )
+        gen_log = self._new_generation_log(image_path, item_type)
 
         try:
-            # 프롬프트 선택
-            prompt = custom_prompt or self.PROMPTS.get(item_type, self.PROMPTS[ItemType.GRAPH])
-
-            # 난이도 지시 추가
-            difficulty_instruction = self._get_difficulty_instruction(difficulty)
-            full_prompt = f"{prompt}\n\n{difficulty_instruction}"
-
             # Agentic Vision으로 이미지 분석 및 문항 생성
-            result = self.vision_client.analyze_image_with_agentic_vision(
-                image_path=image_path,
-                prompt=full_prompt,
-                enable_code_execution=True
-            )
-
-            # 단계 로그 추가
-            gen_log.phases = self.vision_client.get_phase_logs()
-            gen_log.total_duration_ms = result.get("total_duration_ms", 0)
-
-            # 응답에서 문항 파싱
-            item = self._parse_item_from_response(
-                response_text=result.get("text", ""),
-                item_type=item_type,
-                difficulty=difficulty,
-                image_path=str(image_path),
-                evidence=self.vision_client.extract_evidence(result)
-            )
-
-            if item:
-                gen_log.success = True
-                gen_log.final_item_id = item.item_id
-            else:
-                gen_log.success = False
-
-            self.generation_logs.append(gen_log)
-            return item, gen_log
+            with usage_scope("P3-GENERATE") as usage:
+                try:
+                    result = self.vision_client.analyze_image_with_agentic_vision(
+                        image_path=image_path,
+                        prompt=self._get_difficulty_instruction(difficulty),
+                        enable_code_execution=True,
+                        system_prompt=self._build_prompt(item_type, custom_prompt)
+                    )
+                finally:
+                    self._record_usage(gen_log, usage)
+            return self._complete_generation(result, gen_log, item_type, difficulty, image_path)
 
         except Exception as e:
             gen_log.success = False
@@ -188,6 +159,95 @@ class ItemGeneratorAgent:
             self.generation_logs.append(gen_log)
             raise RuntimeError(f"문항 생성 실패: {e}") from e
 
+    async def generate_item_async(
+        self,
+        image_path: str | Path,
+        item_type: ItemType,
+        difficulty: DifficultyLevel = DifficultyLevel.MEDIUM,
+        custom_prompt: Optional[str] = None
+    ) -> tuple[Optional[ItemQuestion], GenerationLog]:
+        """
+        이미지에서 문항 생성 (비동기)
+
+        Args:
+            image_path: 이미지 경로
+            item_type: 문항 유형
+            difficulty: 난이도
+            custom_prompt: 커스텀 프롬프트 (선택)
+
+        Returns:
+            (생성된 문항, 생성 로그) 튜플
+        """
+        image_path = Path(image_path)
+        gen_log = self._new_generation_log(image_path, item_type)
+
+        try:
+            with usage_scope("P3-GENERATE") as usage:
+                try:
+                    result = await self.vision_client.analyze_image_with_agentic_vision_async(
+                        image_path=image_path,
+                        prompt=self._get_difficulty_instruction(difficulty),
+                        enable_code_execution=True,
+                        system_prompt=self._build_prompt(item_type, custom_prompt)
+                    )
+                finally:
+                    self._record_usage(gen_log, usage)
+            return self._complete_generation(result, gen_log, item_type, difficulty, image_path)
+
+        except Exception as e:
+            gen_log.success = False
+            self.generation_logs.append(gen_log)
+            raise RuntimeError(f"문항 생성 실패: {e}") from e
+
+    def _new_generation_log(self, image_path: Path, item_type: ItemType) -> GenerationLog:
+        """생성 로그 초기화"""
+        return GenerationLog(
+            session_id=str(uuid.uuid4())[:8],
+            source_image=str(image_path),
+            item_type=item_type,
+        )
+
+    @staticmethod
+    def _record_usage(gen_log: GenerationLog, usage: UsageScope):
+        """생성 호출의 토큰 사용량을 생성 로그에 기록"""
+        gen_log.usage = usage.total
+        gen_log.usage_by_stage = dict(usage.by_stage)
+
+    def _build_prompt(self, item_type: ItemType, custom_prompt: Optional[str] = None) -> str:
+        """문항 유형 프롬프트 (정적 부분, 난이도 지시문은 요청별로 뒤에 붙음)"""
+        return custom_prompt or self.PROMPTS.get(item_type, self.PROMPTS[ItemType.GRAPH])
+
+    def _complete_generation(
+        self,
+        result: dict,
+        gen_log: GenerationLog,
+        item_type: ItemType,
+        difficulty: DifficultyLevel,
+        image_path: Path
+    ) -> tuple[Optional[ItemQuestion], GenerationLog]:
+        """분석 결과에서 문항 파싱 및 생성 로그 완료"""
+        # 단계 로그 추가
+        gen_log.phases = list(result.get("phase_logs", []))
+        gen_log.total_duration_ms = result.get("total_duration_ms", 0)
+
+        # 응답에서 문항 파싱
+        item = self._parse_item_from_response(
+            response_text=result.get("text", ""),
+            item_type=item_type,
+            difficulty=difficulty,
+            image_path=str(image_path),
+            evidence=self.vision_client.extract_evidence(result)
+        )
+
+        if item:
+            gen_log.success = True
+            gen_log.final_item_id = item.item_id
+        else:
+            gen_log.success = False
+
+        self.generation_logs.append(gen_log)
+        return item, gen_log
+
     def _get_difficulty_instruction(self, difficulty: DifficultyLevel) -> str:
         """난이도별 추가 지시문"""
         instructions = {
@@ -10,8 +10,9 @@ from pathlib import Path
 from typing import Optional
 import base64
 
-from google import genai
 from google.genai import types
+from gemini_shared.client_registry import get_client
+from gemini_shared.model_call import generate_content, generate_content_async
 
 from ..core.config import settings
 
@@ -29,8 +30,8 @@ class NanoBananaClient:
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
-        self.client = genai.Client(api_key=self.api_key)
         self.model_name = settings.nano_banana_model
+        self.client = get_client(self.api_key)
 
     def generate_chart(
         self,
@@ -142,6 +143,32 @@ class NanoBananaClient:
         Returns:
             이미지 바이트
         """
+        prompt, aspect_ratio = self._build_specification_prompt(visual_spec)
+        return self._generate_image(prompt, size, aspect_ratio, thinking_level="HIGH")
+
+    async def generate_from_specification_async(
+        self,
+        visual_spec: dict,
+        size: str = "2K"
+    ) -> bytes:
+        """시각화 사양에서 이미지 생성 (비동기)
+
+        Args:
+            visual_spec: 시각화 사양 딕셔너리
+            size: 이미지 크기
+
+        Returns:
+            이미지 바이트
+        """
+        prompt, aspect_ratio = self._build_specification_prompt(visual_spec)
+        return await self._generate_image_async(prompt, size, aspect_ratio, thinking_level="HIGH")
+
+    def _build_specification_prompt(self, visual_spec: dict) -> tuple[str, str]:
+        """시각화 사양 프롬프트 구성
+
+        Returns:
+            (프롬프트, 비율) 튜플
+        """
         vis_type = visual_spec.get("type", "그래프")
         description = visual_spec.get("description", "")
         instructions = visual_spec.get("rendering_instructions", "")
@@ -167,7 +194,7 @@ class NanoBananaClient:
         # 그래프 유형에 따라 비율 조정
         aspect_ratio = "16:9" if "그래프" in vis_type else "1:1"
 
-        return self._generate_image(prompt, size, aspect_ratio, thinking_level="HIGH")
+        return prompt, aspect_ratio
 
     def generate_function_graph(
         self,
@@ -242,8 +269,35 @@ class NanoBananaClient:
         Returns:
             이미지 바이트
         """
-        # 이미지 생성 설정
-        config = types.GenerateContentConfig(
+        config = self._image_config(size, aspect_ratio)
+        response = generate_content(self.client, self.model_name, prompt, config)
+        return self._extract_image(response)
+
+    async def _generate_image_async(
+        self,
+        prompt: str,
+        size: str = "2K",
+        aspect_ratio: str = "16:9",
+        thinking_level: str = "MEDIUM"
+    ) -> bytes:
+        """이미지 생성 공통 로직 (비동기)
+
+        Args:
+            prompt: 이미지 생성 프롬프트
+            size: 이미지 크기 (1K, 2K, 4K)
+            aspect_ratio: 비율 (16:9, 4:3, 1:1 등)
+            thinking_level: Thinking 모드 레벨 (현재 미사용)
+
+        Returns:
+            이미지 바이트
+        """
+        config = self._image_config(size, aspect_ratio)
+        response = await generate_content_async(self.client, self.model_name, prompt, config)
+        return self._extract_image(response)
+
+    def _image_config(self, size: str, aspect_ratio: str) -> types.GenerateContentConfig:
+        """이미지 생성 설정"""
+        return types.GenerateContentConfig(
             response_modalities=['TEXT', 'IMAGE'],
             image_config=types.ImageConfig(
                 aspect_ratio=aspect_ratio,
@@ -251,14 +305,6 @@ class NanoBananaClient:
             )
         )
 
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config=config
-        )
-
-        return self._extract_image(response)
-
     def _extract_image(self, response) -> bytes:
         """응답에서 이미지 추출
 
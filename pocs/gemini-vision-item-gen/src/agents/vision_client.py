@@ -3,14 +3,18 @@
 import time
 from pathlib import Path
 from typing import Optional
-from PIL import Image
-import io
 
-from google import genai
 from google.genai import types
+from gemini_shared.client_registry import get_client
+from gemini_shared.file_uploads import image_part, image_part_async
+from gemini_shared.image_encoder import EncodedImage
+from gemini_shared.model_call import generate_content, generate_content_async
+from gemini_shared.prompt_cache import apply_prompt_cache, apply_prompt_cache_async
+from gemini_shared.usage_tracker import response_usage
 
 from ..core.config import settings
-from ..core.schemas import PhaseLog, PhaseType, EvidencePack
+from ..core.schemas import PhaseLog, PhaseType, EvidencePack, TokenUsage
+from ..utils.image_utils import ImageProcessor
 
 
 class GeminiVisionClient:
@@ -21,27 +25,18 @@ class GeminiVisionClient:
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.")
 
-        self.client = genai.Client(api_key=self.api_key)
         self.model_name = settings.gemini_model
+        self.client = get_client(self.api_key)
         self.phase_logs: list[PhaseLog] = []
+        self.image_processor = ImageProcessor()
 
-    def _load_image(self, image_path: str | Path) -> tuple[bytes, str]:
-        """이미지 로드 및 바이트 변환"""
+    def _load_image(self, image_path: str | Path) -> EncodedImage:
+        """이미지 로드 및 모델 요청용 인코딩 (토큰/픽셀 예산 적용)"""
         path = Path(image_path)
         if not path.exists():
             raise FileNotFoundError(f"이미지를 찾을 수 없습니다: {path}")
 
-        with Image.open(path) as img:
-            # 이미지 포맷 확인
-            img_format = img.format or "PNG"
-            mime_type = f"image/{img_format.lower()}"
-
-            # 바이트로 변환
-            buffer = io.BytesIO()
-            img.save(buffer, format=img_format)
-            image_bytes = buffer.getvalue()
-
-        return image_bytes, mime_type
+        return self.image_processor.encode_for_model(path)
 
     def _log_phase(
         self,
@@ -49,113 +44,215 @@ class GeminiVisionClient:
         input_data: dict,
         output_data: dict,
         code_executed: Optional[str] = None,
-        duration_ms: int = 0
+        duration_ms: int = 0,
+        logs: Optional[list[PhaseLog]] = None,
+        usage: Optional[TokenUsage] = None
     ) -> PhaseLog:
-        """단계별 로그 기록"""
+        """단계별 로그 기록
+
+        logs를 지정하면 해당 목록에 기록합니다 (비동기 호출별 로그).
+        """
         log = PhaseLog(
             phase=phase,
             input_data=input_data,
             output_data=output_data,
             code_executed=code_executed,
-            duration_ms=duration_ms
+            duration_ms=duration_ms,
+            usage=usage
         )
-        self.phase_logs.append(log)
+        (self.phase_logs if logs is None else logs).append(log)
         return log
 
     def analyze_image_with_agentic_vision(
         self,
         image_path: str | Path,
         prompt: str,
-        enable_code_execution: bool = True
+        enable_code_execution: bool = True,
+        system_prompt: Optional[str] = None
     ) -> dict:
         """
         Agentic Vision을 사용한 이미지 분석
 
         Args:
             image_path: 분석할 이미지 경로
-            prompt: 분석 프롬프트
+            prompt: 분석 프롬프트 (요청마다 달라지는 부분)
             enable_code_execution: 코드 실행 활성화 (Agentic Vision)
+            system_prompt: 정적 프롬프트 (시스템 지시문으로 전송, 프롬프트 캐시 세션 중에는 캐시 콘텐츠 참조)
 
         Returns:
             분석 결과 딕셔너리
         """
         self.phase_logs = []  # 로그 초기화
+        logs = self.phase_logs
 
-        # 이미지 로드
-        image_bytes, mime_type = self._load_image(image_path)
+        start_time = time.time()
+        config = self._analysis_config(enable_code_execution)
+        if system_prompt:
+            config = apply_prompt_cache(self.client, self.model_name, system_prompt, config)
+        image = self._load_image(image_path)
+        contents = self._prepare_analysis(
+            image_path, image, image_part(self.client, image.data, image.mime_type), prompt, logs
+        )
+
+        # Act 단계 - API 호출
+        act_start = time.time()
+        try:
+            response = generate_content(self.client, self.model_name, contents, config)
+        except Exception as e:
+            self._log_act_error(e, logs)
+            raise
+
+        return self._complete_analysis(
+            response, enable_code_execution, start_time, act_start, logs
+        )
+
+    async def analyze_image_with_agentic_vision_async(
+        self,
+        image_path: str | Path,
+        prompt: str,
+        enable_code_execution: bool = True,
+        system_prompt: Optional[str] = None
+    ) -> dict:
+        """
+        Agentic Vision 이미지 분석 (비동기)
+
+        여러 분석을 동시에 실행할 수 있도록 단계 로그는 호출별로 분리되며
+        결과의 "phase_logs"로만 반환됩니다.
+
+        Args:
+            image_path: 분석할 이미지 경로
+            prompt: 분석 프롬프트 (요청마다 달라지는 부분)
+            enable_code_execution: 코드 실행 활성화 (Agentic Vision)
+            system_prompt: 정적 프롬프트 (시스템 지시문으로 전송, 프롬프트 캐시 세션 중에는 캐시 콘텐츠 참조)
+
+        Returns:
+            분석 결과 딕셔너리
+        """
+        logs: list[PhaseLog] = []
 
-        # Think 단계 로깅
         start_time = time.time()
-        self._log_phase(
-            phase=PhaseType.THINK,
-            input_data={"image_path": str(image_path), "prompt": prompt[:100]},
-            output_data={"status": "planning"}
+        config = self._analysis_config(enable_code_execution)
+        if system_prompt:
+            config = await apply_prompt_cache_async(self.client, self.model_name, system_prompt, config)
+        image = self._load_image(image_path)
+        contents = self._prepare_analysis(
+            image_path, image, await image_part_async(self.client, image.data, image.mime_type), prompt, logs
         )
 
-        # API 호출 설정
+        # Act 단계 - API 호출
+        act_start = time.time()
+        try:
+            response = await generate_content_async(self.client, self.model_name, contents, config)
+        except Exception as e:
+            self._log_act_error(e, logs)
+            raise
+
+        return self._complete_analysis(
+            response, enable_code_execution, start_time, act_start, logs
+        )
+
+    def _analysis_config(self, enable_code_execution: bool) -> types.GenerateContentConfig:
+        """분석 요청 설정"""
         tools = []
         if enable_code_execution:
             tools.append(types.Tool(code_execution=types.ToolCodeExecution()))
 
-        config = types.GenerateContentConfig(
+        return types.GenerateContentConfig(
             tools=tools if tools else None,
             temperature=0.7,
         )
 
+    def _prepare_analysis(
+        self,
+        image_path: str | Path,
+        encoded: EncodedImage,
+        image: types.Part,
+        prompt: str,
+        logs: list[PhaseLog]
+    ) -> list[types.Content]:
+        """Think 단계 로깅 및 요청 콘텐츠 구성
+
+        Args:
+            image_path: 분석할 이미지 경로
+            encoded: 모델 요청용 인코딩 이미지 (선택한 인코딩을 로그에 기록)
+            image: 이미지 파트 (업로드된 파일 참조 또는 인라인 바이트)
+            prompt: 요청에 포함할 프롬프트
+            logs: 단계 로그 목록
+
+        Returns:
+            요청 콘텐츠
+        """
+        # Think 단계 로깅
+        self._log_phase(
+            phase=PhaseType.THINK,
+            input_data={
+                "image_path": str(image_path),
+                "prompt": prompt[:100],
+                "image_encoding": encoded.describe()
+            },
+            output_data={"status": "planning"},
+            logs=logs
+        )
+
         # 컨텐츠 구성
-        contents = [
+        return [
             types.Content(
                 role="user",
                 parts=[
-                    types.Part.from_bytes(data=image_bytes, mime_type=mime_type),
+                    image,
                     types.Part.from_text(text=prompt)
                 ]
             )
         ]
 
-        # Act 단계 - API 호출
-        act_start = time.time()
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=contents,
-                config=config
-            )
-            act_duration = int((time.time() - act_start) * 1000)
-
-            # 응답 파싱
-            result = self._parse_response(response)
-
-            # Act 단계 로깅
-            self._log_phase(
-                phase=PhaseType.ACT,
-                input_data={"model": self.model_name, "code_execution": enable_code_execution},
-                output_data={"response_length": len(result.get("text", ""))},
-                code_executed=result.get("code_executed"),
-                duration_ms=act_duration
-            )
+    def _complete_analysis(
+        self,
+        response,
+        enable_code_execution: bool,
+        start_time: float,
+        act_start: float,
+        logs: list[PhaseLog]
+    ) -> dict:
+        """응답 파싱 및 Act/Observe 단계 로깅"""
+        act_duration = int((time.time() - act_start) * 1000)
 
-            # Observe 단계 로깅
-            total_duration = int((time.time() - start_time) * 1000)
-            self._log_phase(
-                phase=PhaseType.OBSERVE,
-                input_data={"raw_response": result.get("text", "")[:200]},
-                output_data={"parsed": True, "total_duration_ms": total_duration},
-                duration_ms=total_duration - act_duration
-            )
+        # 응답 파싱
+        result = self._parse_response(response)
 
-            result["phase_logs"] = self.phase_logs
-            result["total_duration_ms"] = total_duration
+        # Act 단계 로깅
+        self._log_phase(
+            phase=PhaseType.ACT,
+            input_data={"model": self.model_name, "code_execution": enable_code_execution},
+            output_data={"response_length": len(result.get("text", ""))},
+            code_executed=result.get("code_executed"),
+            duration_ms=act_duration,
+            logs=logs,
+            usage=response_usage(self.model_name, response)
+        )
 
-            return result
+        # Observe 단계 로깅
+        total_duration = int((time.time() - start_time) * 1000)
+        self._log_phase(
+            phase=PhaseType.OBSERVE,
+            input_data={"raw_response": result.get("text", "")[:200]},
+            output_data={"parsed": True, "total_duration_ms": total_duration},
+            duration_ms=total_duration - act_duration,
+            logs=logs
+        )
 
-        except Exception as e:
-            self._log_phase(
-                phase=PhaseType.ACT,
-                input_data={"error": True},
-                output_data={"error_message": str(e)}
-            )
-            raise
+        result["phase_logs"] = logs
+        result["total_duration_ms"] = total_duration
+
+        return result
+
+    def _log_act_error(self, error: Exception, logs: list[PhaseLog]):
+        """Act 단계 오류 로깅"""
+        self._log_phase(
+            phase=PhaseType.ACT,
+            input_data={"error": True},
+            output_data={"error_message": str(error)},
+            logs=logs
+        )
 
     def _parse_response(self, response) -> dict:
         """API 응답 파싱"""
@@ -8,6 +8,9 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from gemini_shared.client_registry import get_registry
+from gemini_shared.prompt_cache import prompt_cache_session
+from gemini_shared.rate_limiter import get_rate_limit_stats
 
 from .core.config import settings
 from .core.schemas import ItemType, DifficultyLevel, ValidationStatus
@@ -202,31 +205,50 @@ def batch(
 
     results = {"success": 0, "fail": 0}
 
-    for img in images:
-        console.print(f"\n처리 중: {img.name}")
-        try:
-            # generate 명령 로직 재사용
-            generator = ItemGeneratorAgent()
-            item, gen_log = generator.generate_item(
-                image_path=img,
-                item_type=ItemType(item_type),
-            )
-
-            if item:
-                save_dir = output_dir or settings.output_dir / "items"
-                generator.save_item(item, save_dir)
-                results["success"] += 1
-                console.print(f"  [green]성공:[/green] {item.item_id}")
-            else:
+    # 에이전트(및 공유 클라이언트)는 모든 이미지에 재사용
+    generator = ItemGeneratorAgent()
+
+    # 정적 프롬프트는 배치 동안 프롬프트 캐시로 전송
+    with prompt_cache_session() as prompt_cache:
+        for img in images:
+            console.print(f"\n처리 중: {img.name}")
+            try:
+                item, gen_log = generator.generate_item(
+                    image_path=img,
+                    item_type=ItemType(item_type),
+                )
+
+                if item:
+                    save_dir = output_dir or settings.output_dir / "items"
+                    generator.save_item(item, save_dir)
+                    results["success"] += 1
+                    console.print(f"  [green]성공:[/green] {item.item_id}")
+                else:
+                    results["fail"] += 1
+                    console.print(f"  [red]실패:[/red] 파싱 오류")
+
+            except Exception as e:
                 results["fail"] += 1
-                console.print(f"  [red]실패:[/red] 파싱 오류")
-
-        except Exception as e:
-            results["fail"] += 1
-            console.print(f"  [red]실패:[/red] {e}")
-
+                console.print(f"  [red]실패:[/red] {e}")
+
+        cache_stats = prompt_cache.stats() if prompt_cache else None
+
+    pool_stats = get_registry().stats()
+    rate_lines = "".join(
+        f"\n{model}: 요청 {s['requests']}건, 토큰 {s['tokens']:,}, "
+        f"대기 {s['throttled_seconds']:.1f}초, 429 {s['rate_limited']}회"
+        for model, s in get_rate_limit_stats().items()
+    )
+    cache_line = ""
+    if cache_stats:
+        cache_line = (f"\n프롬프트 캐시: 입력 토큰 캐시 {cache_stats['cached_tokens']:,} / "
+                      f"신규 {cache_stats['fresh_tokens']:,}")
     console.print(Panel(
-        f"성공: {results['success']}개\n실패: {results['fail']}개",
+        f"성공: {results['success']}개\n실패: {results['fail']}개\n"
+        f"클라이언트: {pool_stats['clients']}개 (재사용 {pool_stats['reused']}회), "
+        f"HTTP 연결 풀: 최대 {pool_stats['max_connections']}개"
+        f"{rate_lines}"
+        f"{cache_line}",
         title="[blue]일괄 처리 결과[/blue]",
         border_style="blue"
     ))
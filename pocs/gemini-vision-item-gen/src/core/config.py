@@ -3,14 +3,17 @@
 from functools import lru_cache
 from pathlib import Path
 from pydantic import Field
-from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
+from gemini_shared.config import SharedSettings, configure
 
 load_dotenv()
 
 
-class Settings(BaseSettings):
-    """애플리케이션 설정"""
+class Settings(SharedSettings):
+    """애플리케이션 설정
+
+    모델 호출 공통 설정(엔드포인트, 속도 제한, 재시도, 캐시, 업로드, 가격표)은 SharedSettings에 있습니다.
+    """
 
     # API 설정
     google_api_key: str = Field(default="", description="Google AI API Key")
@@ -29,6 +32,14 @@ class Settings(BaseSettings):
     max_vision_actions: int = Field(default=5, description="최대 Vision 탐색 횟수")
     max_regenerations: int = Field(default=3, description="최대 재생성 횟수")
 
+    # 모델 요청 이미지 인코딩 설정 (토큰/픽셀 예산)
+    image_encoding_enabled: bool = Field(default=True, description="모델 요청 이미지를 예산에 맞춰 재인코딩할지 여부 (끄면 원본 PNG 전송)")
+    image_token_budget: int = Field(default=1548, description="요청 이미지 1장의 입력 토큰 예산 (768px 타일당 258토큰, 0이면 제한 없음)")
+    image_max_pixels: int = Field(default=0, description="요청 이미지 최대 픽셀 수 (0이면 제한 없음)")
+    image_encoding_format: str = Field(default="auto", description="요청 이미지 포맷 (auto, png, jpeg, webp)")
+    image_quality: int = Field(default=85, description="JPEG/WebP 인코딩 품질")
+    image_palette_colors: int = Field(default=16, description="그레이스케일 이미지 팔레트 양자화 단계 수 (0이면 양자화 안함)")
+
     # 검수 설정
     min_confidence: float = Field(default=0.7, description="최소 신뢰도")
 
@@ -77,8 +88,8 @@ class Settings(BaseSettings):
         (self.output_dir / "logs").mkdir(exist_ok=True)
 
 
-# 전역 설정 인스턴스
-settings = Settings()
+# 전역 설정 인스턴스 (공유 모델 호출 모듈도 이 인스턴스를 사용)
+settings = configure(Settings())
 
 
 @lru_cache()
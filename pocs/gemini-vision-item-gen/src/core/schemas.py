@@ -4,6 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
+from gemini_shared.schemas import TokenUsage  # noqa: F401 (POC 스키마에서 함께 사용)
 
 
 class ItemType(str, Enum):
@@ -127,6 +128,7 @@ class PhaseLog(BaseModel):
     output_data: dict = Field(default_factory=dict, description="출력 데이터")
     code_executed: Optional[str] = Field(None, description="실행된 코드")
     duration_ms: int = Field(default=0, description="소요 시간(ms)")
+    usage: Optional[TokenUsage] = Field(None, description="모델 호출 토큰 사용량/비용 (Act 단계)")
     timestamp: datetime = Field(default_factory=datetime.now, description="타임스탬프")
 
 
@@ -139,4 +141,6 @@ class GenerationLog(BaseModel):
     total_duration_ms: int = Field(default=0, description="총 소요 시간")
     success: bool = Field(default=False, description="성공 여부")
     final_item_id: Optional[str] = Field(None, description="최종 문항 ID")
+    usage: TokenUsage = Field(default_factory=TokenUsage, description="토큰 사용량/비용 합계")
+    usage_by_stage: dict[str, TokenUsage] = Field(default_factory=dict, description="단계별 토큰 사용량/비용")
     created_at: datetime = Field(default_factory=datetime.now, description="생성 시각")
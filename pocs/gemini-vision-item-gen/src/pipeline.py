@@ -8,11 +8,16 @@
 - P5-OUTPUT: 이미지 생성 (Nano Banana Pro) + 출력
 """
 
+import asyncio
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from gemini_shared.model_call import ModelCallError, find_model_call_error
+from gemini_shared.file_uploads import get_upload_manager
+from gemini_shared.prompt_cache import prompt_cache_session
+from gemini_shared.usage_tracker import UsageScope, usage_scope
 
 from .core.config import settings
 from .core.schemas import (
@@ -24,6 +29,7 @@ from .core.schemas import (
     GenerationLog,
     VisualSpec,
     GeneratedImage,
+    TokenUsage,
 )
 from .agents.item_generator import ItemGeneratorAgent
 from .agents.nano_banana_client import NanoBananaClient
@@ -43,6 +49,8 @@ class PipelineResult:
     consistency_report: Optional[ValidationReport]
     final_status: str
     error_message: Optional[str] = None
+    usage: TokenUsage = field(default_factory=TokenUsage)  # 재시도 포함 토큰 사용량/비용
+    usage_by_stage: dict[str, TokenUsage] = field(default_factory=dict)
 
 
 class ItemGenerationPipeline:
@@ -98,32 +106,34 @@ class ItemGenerationPipeline:
         Returns:
             PipelineResult
         """
+        with usage_scope() as usage:
+            result = self._run(
+                image_path, item_type, difficulty, auto_retry, max_retries, save_results, generate_new_image
+            )
+        return self._complete_usage(result, usage)
+
+    def _run(
+        self,
+        image_path: str | Path,
+        item_type: ItemType,
+        difficulty: DifficultyLevel,
+        auto_retry: bool,
+        max_retries: int,
+        save_results: bool,
+        generate_new_image: bool
+    ) -> PipelineResult:
+        """run() 본문 (토큰 사용량은 호출한 쪽의 범위에 집계)"""
         image_path = Path(image_path)
 
         # P1-INPUT: 입력 검증
-        is_valid, issues = self.image_processor.validate_image(image_path)
-        if not is_valid:
-            return PipelineResult(
-                success=False,
-                item=None,
-                generation_log=None,
-                quality_report=None,
-                consistency_report=None,
-                final_status="INPUT_INVALID",
-                error_message="; ".join(issues)
-            )
+        invalid = self._check_input(image_path)
+        if invalid:
+            return invalid
 
         # 재시도 루프
-        attempts = 0
         last_error = None
-
-        while attempts < max_retries:
-            attempts += 1
-            self.logger.log_generation_start(
-                session_id=f"attempt-{attempts}",
-                image_path=str(image_path),
-                item_type=item_type.value
-            )
+        for attempt in range(1, max_retries + 1):
+            self._log_attempt_start(attempt, image_path, item_type)
 
             try:
                 # P2-ANALYZE & P3-GENERATE: 시각 분석 및 문항 생성 (Gemini 3 Flash)
@@ -133,79 +143,261 @@ class ItemGenerationPipeline:
                     difficulty=difficulty
                 )
 
-                if not item:
-                    last_error = "문항 파싱 실패"
-                    if not auto_retry:
-                        break
-                    continue
+                if item:
+                    # P4-VALIDATE: 자동 검수
+                    quality_report = self._check_quality(item, gen_log)
+                    with usage_scope("P4-VALIDATE"):
+                        consistency_report = self.consistency_validator.validate(item)
+                    final_status = self._judge(quality_report, consistency_report)
 
-                self.logger.log_generation_complete(gen_log)
+                    # P5-OUTPUT: 이미지 생성 (Nano Banana Pro)
+                    if self._needs_item_image(final_status, generate_new_image):
+                        with usage_scope("P5-OUTPUT"):
+                            item = self._generate_item_image(item, item_type)
 
-                # P4-VALIDATE: 자동 검수
-                quality_report = self.quality_checker.check(item)
-                consistency_report = self.consistency_validator.validate(item)
+                    result = self._attempt_result(
+                        item, gen_log, quality_report, consistency_report,
+                        final_status, auto_retry, save_results
+                    )
+                    if result:
+                        return result
+                last_error = self._retry_reason(item)
 
-                self.logger.log_validation(quality_report)
-                self.logger.log_validation(consistency_report)
+            except Exception as e:
+                result, last_error = self._attempt_error(e)
+                if result:
+                    return result
 
-                # 품질 판정
-                final_status = self._determine_final_status(quality_report, consistency_report)
+            if not auto_retry:
+                break
 
-                if final_status == "PASS":
-                    # P5-OUTPUT: 이미지 생성 (Nano Banana Pro)
-                    if generate_new_image and self.enable_image_generation:
-                        item = self._generate_item_image(item, item_type)
-
-                    # 결과 저장
-                    if save_results:
-                        self.item_generator.save_item(item)
-                        self.item_generator.save_log(gen_log)
-
-                    return PipelineResult(
-                        success=True,
-                        item=item,
-                        generation_log=gen_log,
-                        quality_report=quality_report,
-                        consistency_report=consistency_report,
-                        final_status=final_status
-                    )
+        return self._max_retries_result(last_error)
 
-                elif final_status == "REJECT":
-                    # 폐기
-                    return PipelineResult(
-                        success=False,
-                        item=item,
-                        generation_log=gen_log,
-                        quality_report=quality_report,
-                        consistency_report=consistency_report,
-                        final_status=final_status,
-                        error_message="검수 기준 미달"
-                    )
+    async def run_async(
+        self,
+        image_path: str | Path,
+        item_type: ItemType,
+        difficulty: DifficultyLevel = DifficultyLevel.MEDIUM,
+        auto_retry: bool = True,
+        max_retries: int = 3,
+        save_results: bool = True,
+        generate_new_image: bool = False
+    ) -> PipelineResult:
+        """
+        파이프라인 실행 (비동기)
+
+        run()과 동일한 단계를 비동기 클라이언트로 실행하므로
+        여러 이미지를 하나의 이벤트 루프에서 동시에 처리할 수 있습니다.
+
+        Args:
+            image_path: 입력 이미지 경로
+            item_type: 문항 유형
+            difficulty: 난이도
+            auto_retry: 검수 실패 시 자동 재생성
+            max_retries: 최대 재시도 횟수
+            save_results: 결과 파일 저장 여부
+            generate_new_image: P5에서 새 이미지 생성 여부
+
+        Returns:
+            PipelineResult
+        """
+        with usage_scope() as usage:
+            result = await self._run_async(
+                image_path, item_type, difficulty, auto_retry, max_retries, save_results, generate_new_image
+            )
+        return self._complete_usage(result, usage)
 
-                else:  # RETRY
-                    last_error = "검수 미통과, 재생성 필요"
-                    if not auto_retry:
-                        # 재시도 비활성화 시 REVIEW로 반환
-                        if save_results:
-                            self.item_generator.save_item(item)
-                            self.item_generator.save_log(gen_log)
-
-                        return PipelineResult(
-                            success=False,
-                            item=item,
-                            generation_log=gen_log,
-                            quality_report=quality_report,
-                            consistency_report=consistency_report,
-                            final_status="REVIEW"
-                        )
+    async def _run_async(
+        self,
+        image_path: str | Path,
+        item_type: ItemType,
+        difficulty: DifficultyLevel,
+        auto_retry: bool,
+        max_retries: int,
+        save_results: bool,
+        generate_new_image: bool
+    ) -> PipelineResult:
+        """run_async() 본문 (_run()과 같은 단계, 모델 호출만 await)"""
+        image_path = Path(image_path)
+
+        invalid = self._check_input(image_path)
+        if invalid:
+            return invalid
+
+        last_error = None
+        for attempt in range(1, max_retries + 1):
+            self._log_attempt_start(attempt, image_path, item_type)
+
+            try:
+                item, gen_log = await self.item_generator.generate_item_async(
+                    image_path=image_path,
+                    item_type=item_type,
+                    difficulty=difficulty
+                )
+
+                if item:
+                    quality_report = self._check_quality(item, gen_log)
+                    with usage_scope("P4-VALIDATE"):
+                        consistency_report = await self.consistency_validator.validate_async(item)
+                    final_status = self._judge(quality_report, consistency_report)
+
+                    if self._needs_item_image(final_status, generate_new_image):
+                        with usage_scope("P5-OUTPUT"):
+                            item = await self._generate_item_image_async(item, item_type)
+
+                    result = self._attempt_result(
+                        item, gen_log, quality_report, consistency_report,
+                        final_status, auto_retry, save_results
+                    )
+                    if result:
+                        return result
+                last_error = self._retry_reason(item)
 
             except Exception as e:
-                last_error = str(e)
-                self.logger.log_error("pipeline", e)
-                if not auto_retry:
-                    break
+                result, last_error = self._attempt_error(e)
+                if result:
+                    return result
+
+            if not auto_retry:
+                break
+
+        return self._max_retries_result(last_error)
 
-        # 모든 재시도 실패
+    def _check_input(self, image_path: Path) -> Optional[PipelineResult]:
+        """P1-INPUT: 입력 이미지 검증
+
+        Returns:
+            검증 실패 결과 (유효하면 None)
+        """
+        is_valid, issues = self.image_processor.validate_image(image_path)
+        if is_valid:
+            return None
+        return PipelineResult(
+            success=False,
+            item=None,
+            generation_log=None,
+            quality_report=None,
+            consistency_report=None,
+            final_status="INPUT_INVALID",
+            error_message="; ".join(issues)
+        )
+
+    def _log_attempt_start(self, attempt: int, image_path: Path, item_type: ItemType):
+        """시도 시작 로깅"""
+        self.logger.log_generation_start(
+            session_id=f"attempt-{attempt}",
+            image_path=str(image_path),
+            item_type=item_type.value
+        )
+
+    def _check_quality(self, item: ItemQuestion, gen_log: GenerationLog) -> ValidationReport:
+        """생성 완료 로깅 후 규칙 기반 품질 검수"""
+        self.logger.log_generation_complete(gen_log)
+        return self.quality_checker.check(item)
+
+    def _needs_item_image(self, final_status: str, generate_new_image: bool) -> bool:
+        """P5-OUTPUT 이미지 생성 여부"""
+        return final_status == "PASS" and generate_new_image and self.enable_image_generation
+
+    def _retry_reason(self, item: Optional[ItemQuestion]) -> str:
+        """재생성이 필요한 시도의 사유"""
+        return "검수 미통과, 재생성 필요" if item else "문항 파싱 실패"
+
+    def _attempt_error(self, error: Exception) -> tuple[Optional[PipelineResult], str]:
+        """시도 중 예외 처리
+
+        모델 호출 오류는 호출 단위에서 이미 재시도되었으므로 전체 사이클을 반복하지 않습니다.
+
+        Returns:
+            (API_ERROR 결과 또는 None, 마지막 오류 메시지)
+        """
+        self.logger.log_error("pipeline", error)
+        api_error = find_model_call_error(error)
+        if api_error:
+            return self._api_error_result(api_error), str(api_error)
+        return None, str(error)
+
+    def _complete_usage(self, result: PipelineResult, usage: UsageScope) -> PipelineResult:
+        """실행 1회(재시도 포함)의 토큰 사용량을 결과에 기록하고 감사 로그에 남김"""
+        result.usage = usage.total
+        result.usage_by_stage = dict(usage.by_stage)
+        if usage.total.calls:
+            session_id = result.generation_log.session_id if result.generation_log else str(uuid.uuid4())[:8]
+            self.logger.log_usage(session_id, result.final_status, usage.total, result.usage_by_stage)
+        return result
+
+    def _judge(
+        self,
+        quality_report: ValidationReport,
+        consistency_report: ValidationReport
+    ) -> str:
+        """검수 결과 로깅 및 품질 판정"""
+        self.logger.log_validation(quality_report)
+        self.logger.log_validation(consistency_report)
+        return self._determine_final_status(quality_report, consistency_report)
+
+    def _attempt_result(
+        self,
+        item: ItemQuestion,
+        gen_log: GenerationLog,
+        quality_report: ValidationReport,
+        consistency_report: ValidationReport,
+        final_status: str,
+        auto_retry: bool,
+        save_results: bool
+    ) -> Optional[PipelineResult]:
+        """판정 결과에 따른 PipelineResult 생성
+
+        Returns:
+            PipelineResult (재생성이 필요하면 None)
+        """
+        if final_status == "PASS":
+            # 결과 저장
+            if save_results:
+                self.item_generator.save_item(item)
+                self.item_generator.save_log(gen_log)
+
+            return PipelineResult(
+                success=True,
+                item=item,
+                generation_log=gen_log,
+                quality_report=quality_report,
+                consistency_report=consistency_report,
+                final_status=final_status
+            )
+
+        if final_status == "REJECT":
+            # 폐기
+            return PipelineResult(
+                success=False,
+                item=item,
+                generation_log=gen_log,
+                quality_report=quality_report,
+                consistency_report=consistency_report,
+                final_status=final_status,
+                error_message="검수 기준 미달"
+            )
+
+        # RETRY
+        if not auto_retry:
+            # 재시도 비활성화 시 REVIEW로 반환
+            if save_results:
+                self.item_generator.save_item(item)
+                self.item_generator.save_log(gen_log)
+
+            return PipelineResult(
+                success=False,
+                item=item,
+                generation_log=gen_log,
+                quality_report=quality_report,
+                consistency_report=consistency_report,
+                final_status="REVIEW"
+            )
+
+        return None
+
+    def _max_retries_result(self, last_error: Optional[str]) -> PipelineResult:
+        """모든 재시도 실패 결과"""
         return PipelineResult(
             success=False,
             item=None,
@@ -216,6 +408,17 @@ class ItemGenerationPipeline:
             error_message=last_error
         )
 
+    def _api_error_result(self, error: ModelCallError) -> PipelineResult:
+        """모델 호출 실패 결과"""
+        return PipelineResult(
+            success=False,
+            item=None,
+            generation_log=None,
+            quality_report=None,
+            consistency_report=None,
+            final_status="API_ERROR",
+            error_message=str(error)
+        )
 
     def _generate_item_image(self, item: ItemQuestion, item_type: ItemType) -> ItemQuestion:
         """P5-OUTPUT: Nano Banana Pro로 이미지 생성
@@ -227,51 +430,85 @@ class ItemGenerationPipeline:
         Returns:
             이미지가 추가된 문항 객체
         """
-        if not self.nano_banana_client:
-            return item
-
         try:
-            # 시각 사양 생성
-            visual_spec = self._create_visual_spec(item, item_type)
-            item.visual_spec = visual_spec
-
-            if not visual_spec.required:
+            visual_spec = self._prepare_visual_spec(item, item_type)
+            if visual_spec is None:
                 return item
 
-            # 이미지 생성
-            self.logger.log_info(f"[P5-OUTPUT] Nano Banana Pro 이미지 생성 시작: {item.item_id}")
-
             image_bytes = self.nano_banana_client.generate_from_specification(
                 visual_spec=visual_spec.model_dump(),
                 size="2K"
             )
+            self._attach_generated_image(item, visual_spec, image_bytes)
 
-            # 이미지 저장
-            image_id = f"IMG-{uuid.uuid4().hex[:8].upper()}"
-            output_path = settings.output_dir / "nano_banana" / f"{image_id}.png"
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            self.nano_banana_client.save_image(image_bytes, output_path)
-
-            # GeneratedImage 객체 생성
-            generated_image = GeneratedImage(
-                image_id=image_id,
-                path=str(output_path),
-                format="PNG",
-                resolution="2K",
-                visual_spec=visual_spec,
-                generation_model=settings.nano_banana_model,
-            )
-            item.generated_image = generated_image
+        except Exception as e:
+            self.logger.log_error("P5-OUTPUT", e)
+            # 이미지 생성 실패해도 문항은 유지
 
-            self.logger.log_info(f"[P5-OUTPUT] 이미지 생성 완료: {output_path}")
+        return item
+
+    async def _generate_item_image_async(self, item: ItemQuestion, item_type: ItemType) -> ItemQuestion:
+        """P5-OUTPUT: Nano Banana Pro로 이미지 생성 (비동기)"""
+        try:
+            visual_spec = self._prepare_visual_spec(item, item_type)
+            if visual_spec is None:
+                return item
+
+            image_bytes = await self.nano_banana_client.generate_from_specification_async(
+                visual_spec=visual_spec.model_dump(),
+                size="2K"
+            )
+            self._attach_generated_image(item, visual_spec, image_bytes)
 
         except Exception as e:
             self.logger.log_error("P5-OUTPUT", e)
-            # 이미지 생성 실패해도 문항은 유지
 
         return item
 
+    def _prepare_visual_spec(self, item: ItemQuestion, item_type: ItemType) -> Optional[VisualSpec]:
+        """시각 사양을 문항에 연결하고 이미지 생성이 필요하면 반환
+
+        Returns:
+            생성할 시각 사양 (클라이언트가 없거나 이미지가 필요 없으면 None)
+        """
+        if not self.nano_banana_client:
+            return None
+
+        visual_spec = self._create_visual_spec(item, item_type)
+        item.visual_spec = visual_spec
+        if not visual_spec.required:
+            return None
+
+        self.logger.log_info(f"[P5-OUTPUT] Nano Banana Pro 이미지 생성 시작: {item.item_id}")
+        return visual_spec
+
+    def _attach_generated_image(
+        self,
+        item: ItemQuestion,
+        visual_spec: VisualSpec,
+        image_bytes: bytes
+    ):
+        """생성된 이미지 저장 후 문항에 연결"""
+        # 이미지 저장
+        image_id = f"IMG-{uuid.uuid4().hex[:8].upper()}"
+        output_path = settings.output_dir / "nano_banana" / f"{image_id}.png"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.nano_banana_client.save_image(image_bytes, output_path)
+
+        # GeneratedImage 객체 생성
+        generated_image = GeneratedImage(
+            image_id=image_id,
+            path=str(output_path),
+            format="PNG",
+            resolution="2K",
+            visual_spec=visual_spec,
+            generation_model=settings.nano_banana_model,
+        )
+        item.generated_image = generated_image
+
+        self.logger.log_info(f"[P5-OUTPUT] 이미지 생성 완료: {output_path}")
+
     def _create_visual_spec(self, item: ItemQuestion, item_type: ItemType) -> VisualSpec:
         """문항 유형에 맞는 시각 사양 생성"""
         visual_type_map = {
@@ -343,22 +580,71 @@ class ItemGenerationPipeline:
     ) -> list[PipelineResult]:
         """
         디렉토리 내 이미지 일괄 처리
+
+        정적 프롬프트는 배치 동안 프롬프트 캐시로 한 번만 전송됩니다.
         """
-        image_dir = Path(image_dir)
-        extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
-        images = [f for f in image_dir.iterdir() if f.suffix.lower() in extensions]
+        images = self._list_images(image_dir)
 
         results = []
-        for image_path in images:
-            result = self.run(
-                image_path=image_path,
-                item_type=item_type,
-                difficulty=difficulty
-            )
-            results.append(result)
+        with prompt_cache_session() as prompt_cache:
+            for image_path in images:
+                result = self.run(
+                    image_path=image_path,
+                    item_type=item_type,
+                    difficulty=difficulty
+                )
+                results.append(result)
+            self._print_prompt_cache_stats(prompt_cache)
+            self._print_upload_stats()
+
+        return results
+
+    async def run_batch_async(
+        self,
+        image_dir: str | Path,
+        item_type: ItemType,
+        difficulty: DifficultyLevel = DifficultyLevel.MEDIUM
+    ) -> list[PipelineResult]:
+        """
+        디렉토리 내 이미지 동시 처리 (비동기)
+
+        동시 모델 호출 수는 settings.async_max_concurrency로 제한되며,
+        정적 프롬프트는 배치 동안 프롬프트 캐시로 한 번만 전송됩니다.
+        """
+        images = self._list_images(image_dir)
+
+        with prompt_cache_session() as prompt_cache:
+            results = list(await asyncio.gather(*(
+                self.run_async(image_path=image_path, item_type=item_type, difficulty=difficulty)
+                for image_path in images
+            )))
+            self._print_prompt_cache_stats(prompt_cache)
+            self._print_upload_stats()
 
         return results
 
+    def _list_images(self, image_dir: str | Path) -> list[Path]:
+        """디렉토리 내 입력 이미지 목록"""
+        extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+        return [f for f in Path(image_dir).iterdir() if f.suffix.lower() in extensions]
+
+    def _print_prompt_cache_stats(self, prompt_cache):
+        """프롬프트 캐시 토큰 통계 출력"""
+        if prompt_cache is None:
+            return
+        stats = prompt_cache.stats()
+        print(f"프롬프트 캐시: 캐시 {stats['caches']}개, "
+              f"입력 토큰 캐시 {stats['cached_tokens']:,} / 신규 {stats['fresh_tokens']:,}")
+
+    def _print_upload_stats(self):
+        """이미지 업로드 재사용 통계 출력"""
+        upload_manager = get_upload_manager()
+        if upload_manager is None:
+            return
+        stats = upload_manager.stats()
+        print(f"이미지 업로드: {stats['uploads']}건, 재사용 {stats['reused']}건 "
+              f"(인라인 전송 절감 {stats['bytes_saved'] / 1024 / 1024:.1f}MB)")
+
     def get_statistics(self, results: list[PipelineResult]) -> dict:
         """결과 통계"""
         total = len(results)
@@ -369,10 +655,20 @@ class ItemGenerationPipeline:
         for r in results:
             status_counts[r.final_status] = status_counts.get(r.final_status, 0) + 1
 
+        usage = TokenUsage()
+        usage_by_stage: dict[str, TokenUsage] = {}
+        for r in results:
+            usage = usage + r.usage
+            for stage, stage_usage in r.usage_by_stage.items():
+                usage_by_stage[stage] = usage_by_stage.get(stage, TokenUsage()) + stage_usage
+
         return {
             "total": total,
             "success": success,
             "fail": fail,
             "success_rate": success / total * 100 if total > 0 else 0,
-            "status_distribution": status_counts
+            "status_distribution": status_counts,
+            "usage": usage.model_dump(),
+            "usage_by_stage": {stage: u.model_dump() for stage, u in sorted(usage_by_stage.items())},
+            "cost_per_success_usd": usage.cost_usd / success if success else 0.0
         }
@@ -3,6 +3,9 @@
 from pathlib import Path
 from typing import Optional, Tuple
 from PIL import Image
+from gemini_shared.image_encoder import EncodedImage, encode_for_model, original_image
+
+from ..core.config import settings
 
 
 class ImageProcessor:
@@ -121,6 +124,48 @@ class ImageProcessor:
 
             return out_path
 
+    def encode_for_model(
+        self,
+        image_path: str | Path,
+        token_budget: Optional[int] = None,
+        max_pixels: Optional[int] = None,
+        fmt: Optional[str] = None
+    ) -> EncodedImage:
+        """
+        모델 요청용 이미지 인코딩
+
+        토큰/픽셀 예산에 맞춰 해상도, 그레이스케일, 팔레트 양자화, 포맷을 고릅니다.
+        종횡비를 유지한 축소만 하므로 0-1000 정규화 좌표는 원본 이미지에 그대로 대응합니다.
+        settings.image_encoding_enabled가 꺼져 있으면 원본 파일 바이트를 그대로 사용합니다.
+
+        Args:
+            image_path: 원본 이미지 경로
+            token_budget: 이미지 토큰 예산 (없으면 settings.image_token_budget)
+            max_pixels: 최대 픽셀 수 (없으면 settings.image_max_pixels)
+            fmt: 인코딩 포맷 (없으면 settings.image_encoding_format)
+
+        Returns:
+            인코딩된 이미지
+        """
+        path = Path(image_path)
+        source_bytes = path.read_bytes()
+
+        with Image.open(path) as img:
+            mime_type = Image.MIME.get(img.format or "PNG", "image/png")
+            if not settings.image_encoding_enabled:
+                return original_image(img, source_bytes, mime_type)
+
+            return encode_for_model(
+                img,
+                token_budget=settings.image_token_budget if token_budget is None else token_budget,
+                max_pixels=settings.image_max_pixels if max_pixels is None else max_pixels,
+                fmt=fmt or settings.image_encoding_format,
+                quality=settings.image_quality,
+                palette_colors=settings.image_palette_colors,
+                source_bytes=source_bytes,
+                source_mime_type=mime_type
+            )
+
     def convert_to_png(self, image_path: str | Path) -> Path:
         """이미지를 PNG로 변환"""
         path = Path(image_path)
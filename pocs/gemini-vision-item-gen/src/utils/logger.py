@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ..core.config import settings
-from ..core.schemas import GenerationLog, ValidationReport, ItemQuestion
+from ..core.schemas import GenerationLog, ValidationReport, ItemQuestion, TokenUsage
 
 
 class AuditLogger:
@@ -49,7 +49,9 @@ class AuditLogger:
             f"[GEN_{status}] session={log.session_id}, "
             f"item_id={log.final_item_id or 'N/A'}, "
             f"duration={log.total_duration_ms}ms, "
-            f"phases={len(log.phases)}"
+            f"phases={len(log.phases)}, "
+            f"tokens={log.usage.total_tokens}, "
+            f"cost=${log.usage.cost_usd:.4f}"
         )
 
         # 상세 로그 파일 저장
@@ -66,6 +68,29 @@ class AuditLogger:
         # 상세 로그 파일 저장
         self._save_json_log(f"val-{report.item_id}", report.model_dump(mode="json"))
 
+    def log_usage(
+        self,
+        session_id: str,
+        final_status: str,
+        usage: TokenUsage,
+        usage_by_stage: dict[str, TokenUsage]
+    ):
+        """파이프라인 실행 1회(재시도 포함)의 토큰 사용량/비용 로깅"""
+        stages = ", ".join(f"{stage}=${u.cost_usd:.4f}" for stage, u in sorted(usage_by_stage.items()))
+        self.logger.info(
+            f"[USAGE] session={session_id}, status={final_status}, "
+            f"calls={usage.calls}, tokens={usage.total_tokens}, "
+            f"cost=${usage.cost_usd:.4f} ({stages})"
+        )
+
+        # 상세 로그 파일 저장
+        self._save_json_log(f"usage-{session_id}", {
+            "session_id": session_id,
+            "final_status": final_status,
+            "usage": usage.model_dump(mode="json"),
+            "usage_by_stage": {stage: u.model_dump(mode="json") for stage, u in usage_by_stage.items()},
+        })
+
     def log_item_saved(self, item: ItemQuestion, filepath: Path):
         """문항 저장 로깅"""
         self.logger.info(
@@ -120,6 +145,16 @@ class AuditLogger:
                     fail_count += 1
                 total_duration += data.get("total_duration_ms", 0)
 
+        # 토큰 사용량은 실행 단위 usage 로그에서 집계 (검수/이미지 생성 단계 포함)
+        usage = TokenUsage()
+        usage_by_stage: dict[str, TokenUsage] = {}
+        for log_path in self.log_dir.glob(f"usage-*-{date}*.json"):
+            with open(log_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            usage = usage + TokenUsage.model_validate(data.get("usage", {}))
+            for stage, stage_usage in data.get("usage_by_stage", {}).items():
+                usage_by_stage[stage] = usage_by_stage.get(stage, TokenUsage()) + TokenUsage.model_validate(stage_usage)
+
         return {
             "date": date,
             "total_generations": len(gen_logs),
@@ -127,5 +162,7 @@ class AuditLogger:
             "fail_count": fail_count,
             "validation_count": len(val_logs),
             "total_duration_ms": total_duration,
-            "avg_duration_ms": total_duration // len(gen_logs) if gen_logs else 0
+            "avg_duration_ms": total_duration // len(gen_logs) if gen_logs else 0,
+            "usage": usage.model_dump(),
+            "usage_by_stage": {stage: u.model_dump() for stage, u in sorted(usage_by_stage.items())}
         }
@@ -1,8 +1,10 @@
 """문항-이미지 정합성 검증 모듈"""
 
+import asyncio
 import json
 from typing import Optional
 from pathlib import Path
+from gemini_shared.model_call import ModelCallError
 
 from ..core.schemas import (
     ItemQuestion,
@@ -17,16 +19,10 @@ from ..utils.json_utils import extract_json_from_text
 class ConsistencyValidator:
     """문항-이미지 정합성 검증기"""
 
+    # 정적 검증 지시문 (프롬프트 캐시 대상)
     VALIDATION_PROMPT = """당신은 교육 문항 검수 전문가입니다.
 
-아래 문항이 이 이미지를 기반으로 올바르게 출제되었는지 검증하세요.
-
-**문항 정보:**
-- 질문: {stem}
-- 선지:
-{choices}
-- 정답: {correct_answer}
-- 해설: {explanation}
+문항 정보로 주어진 문항이 이 이미지를 기반으로 올바르게 출제되었는지 검증하세요.
 
 **검증 기준:**
 1. 문항의 질문이 이미지에서 확인 가능한 정보를 묻고 있는가?
@@ -38,16 +34,24 @@ class ConsistencyValidator:
 **응답 형식:**
 반드시 다음 JSON 형식으로만 응답하세요:
 ```json
-{{
+{
     "is_valid": true/false,
     "failure_codes": ["AMBIGUOUS_READ", "NO_VISUAL_EVIDENCE", "MULTI_CORRECT", "OPTION_OVERLAP", "OUT_OF_SCOPE"],
     "details": ["상세 설명1", "상세 설명2"],
     "recommendations": ["개선 권고1", "개선 권고2"]
-}}
+}
 ```
 
 failure_codes는 해당하는 것만 포함하세요. 문제가 없으면 빈 배열입니다."""
 
+    # 문항별 정보 (요청마다 전송)
+    ITEM_INFO_TEMPLATE = """**문항 정보:**
+- 질문: {stem}
+- 선지:
+{choices}
+- 정답: {correct_answer}
+- 해설: {explanation}"""
+
     def __init__(self, vision_client: Optional[GeminiVisionClient] = None):
         self.vision_client = vision_client or GeminiVisionClient()
 
@@ -61,40 +65,84 @@ failure_codes는 해당하는 것만 포함하세요. 문제가 없으면 빈 
 
         Returns:
             ValidationReport
+
+        Raises:
+            ModelCallError: 호출 단위 재시도로 회복하지 못한 모델 호출 오류
         """
         image_path = image_path or item.source_image
 
-        # 선지 포맷팅
-        choices_text = "\n".join([f"  {c.label}. {c.text}" for c in item.choices])
-
-        # 검증 프롬프트 생성
-        prompt = self.VALIDATION_PROMPT.format(
-            stem=item.stem,
-            choices=choices_text,
-            correct_answer=item.correct_answer,
-            explanation=item.explanation
-        )
-
         try:
             # Agentic Vision으로 검증
             result = self.vision_client.analyze_image_with_agentic_vision(
                 image_path=image_path,
-                prompt=prompt,
-                enable_code_execution=True
+                prompt=self._build_prompt(item),
+                enable_code_execution=True,
+                system_prompt=self.VALIDATION_PROMPT
             )
 
             # 응답 파싱
             return self._parse_validation_result(item.item_id, result.get("text", ""))
 
+        except ModelCallError:
+            raise
         except Exception as e:
-            # 검증 실패 시 기본 리포트
-            return ValidationReport(
-                item_id=item.item_id,
-                status=ValidationStatus.FAIL,
-                failure_codes=[FailureCode.INVALID_FORMAT],
-                details=[f"검증 중 오류 발생: {str(e)}"],
-                recommendations=["문항을 다시 생성하세요."]
+            return self._error_report(item.item_id, e)
+
+    async def validate_async(
+        self,
+        item: ItemQuestion,
+        image_path: Optional[str | Path] = None
+    ) -> ValidationReport:
+        """
+        문항과 이미지 정합성 검증 (비동기)
+
+        Args:
+            item: 검증할 문항
+            image_path: 이미지 경로 (없으면 item.source_image 사용)
+
+        Returns:
+            ValidationReport
+
+        Raises:
+            ModelCallError: 호출 단위 재시도로 회복하지 못한 모델 호출 오류
+        """
+        image_path = image_path or item.source_image
+
+        try:
+            result = await self.vision_client.analyze_image_with_agentic_vision_async(
+                image_path=image_path,
+                prompt=self._build_prompt(item),
+                enable_code_execution=True,
+                system_prompt=self.VALIDATION_PROMPT
             )
+            return self._parse_validation_result(item.item_id, result.get("text", ""))
+
+        except ModelCallError:
+            raise
+        except Exception as e:
+            return self._error_report(item.item_id, e)
+
+    def _build_prompt(self, item: ItemQuestion) -> str:
+        """문항 정보 프롬프트 생성"""
+        # 선지 포맷팅
+        choices_text = "\n".join([f"  {c.label}. {c.text}" for c in item.choices])
+
+        return self.ITEM_INFO_TEMPLATE.format(
+            stem=item.stem,
+            choices=choices_text,
+            correct_answer=item.correct_answer,
+            explanation=item.explanation
+        )
+
+    def _error_report(self, item_id: str, error: Exception) -> ValidationReport:
+        """검증 실패 시 기본 리포트"""
+        return ValidationReport(
+            item_id=item_id,
+            status=ValidationStatus.FAIL,
+            failure_codes=[FailureCode.INVALID_FORMAT],
+            details=[f"검증 중 오류 발생: {str(error)}"],
+            recommendations=["문항을 다시 생성하세요."]
+        )
 
     def _parse_validation_result(self, item_id: str, response_text: str) -> ValidationReport:
         """검증 응답 파싱"""
@@ -151,3 +199,14 @@ failure_codes는 해당하는 것만 포함하세요. 문제가 없으면 빈 
             report = self.validate(item)
             reports.append(report)
         return reports
+
+    async def validate_batch_async(self, items: list[ItemQuestion]) -> list[ValidationReport]:
+        """여러 문항 동시 검증 (동시 실행 수는 settings.async_max_concurrency로 제한)"""
+        results = await asyncio.gather(
+            *(self.validate_async(item) for item in items),
+            return_exceptions=True
+        )
+        return [
+            self._error_report(item.item_id, result) if isinstance(result, Exception) else result
+            for item, result in zip(items, results)
+        ]
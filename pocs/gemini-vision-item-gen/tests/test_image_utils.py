@@ -1,10 +1,13 @@
 """이미지 유틸리티 테스트"""
 
+import io
+import os
 import pytest
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageDraw
 import tempfile
 
+from src.core.config import settings
 from src.utils.image_utils import ImageProcessor
 
 
@@ -88,3 +91,47 @@ def test_resize_needed(image_processor):
         temp_path.unlink(missing_ok=True)
         if result != temp_path:
             result.unlink(missing_ok=True)
+
+
+def test_encode_grayscale_document(image_processor, monkeypatch, tmp_path):
+    """그레이스케일 이미지는 팔레트 양자화 PNG로 인코딩하고 로그용 정보 기록"""
+    monkeypatch.setattr(settings, "image_encoding_enabled", True)
+    monkeypatch.setattr(settings, "image_encoding_format", "auto")
+    path = tmp_path / "page.png"
+    img = Image.new("RGB", (1600, 2200), color="white")
+    ImageDraw.Draw(img).rectangle((100, 100, 800, 400), fill=(40, 40, 40))
+    img.save(path)
+
+    encoded = image_processor.encode_for_model(path, token_budget=1548)
+
+    assert encoded.mime_type == "image/png"
+    assert encoded.grayscale
+    assert encoded.colors == settings.image_palette_colors
+    assert encoded.estimated_tokens <= 1548
+    with Image.open(io.BytesIO(encoded.data)) as decoded:
+        assert decoded.mode == "P"
+        assert decoded.size == (encoded.width, encoded.height)
+    assert encoded.describe()["source_size"] == [1600, 2200]
+
+
+def test_encode_photo_uses_lossy_format(image_processor, monkeypatch, tmp_path):
+    """색이 많은 이미지는 WebP로 인코딩"""
+    monkeypatch.setattr(settings, "image_encoding_enabled", True)
+    monkeypatch.setattr(settings, "image_encoding_format", "auto")
+    path = tmp_path / "photo.png"
+    Image.frombytes("RGB", (256, 256), os.urandom(256 * 256 * 3)).save(path)
+
+    encoded = image_processor.encode_for_model(path)
+
+    assert encoded.mime_type == "image/webp"
+    assert not encoded.grayscale
+
+
+def test_encode_disabled_keeps_source(image_processor, monkeypatch, temp_image):
+    """인코딩을 끄면 원본 파일 바이트를 그대로 사용"""
+    monkeypatch.setattr(settings, "image_encoding_enabled", False)
+
+    encoded = image_processor.encode_for_model(temp_image)
+
+    assert encoded.data == temp_image.read_bytes()
+    assert encoded.mime_type == "image/png"
@@ -0,0 +1,149 @@
+"""출제-검수 파이프라인 테스트 (가짜 모델 클라이언트)"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+from PIL import Image
+
+from src.agents.item_generator import ItemGeneratorAgent
+from src.agents.vision_client import GeminiVisionClient
+from src.core.config import settings
+from src.core.schemas import ItemType
+from src.pipeline import ItemGenerationPipeline
+from src.utils.logger import AuditLogger
+from src.validators.consistency_validator import ConsistencyValidator
+from src.validators.quality_checker import QualityChecker
+
+
+ITEM_TEXT = "```json\n" + json.dumps({
+    "stem": "그래프에서 가장 높은 값을 가진 월은 언제인가요?",
+    "choices": [
+        {"label": "A", "text": "1월"}, {"label": "B", "text": "2월"},
+        {"label": "C", "text": "3월"}, {"label": "D", "text": "4월"},
+    ],
+    "correct_answer": "C",
+    "explanation": "그래프를 보면 3월의 막대가 가장 높으므로 정답은 C입니다.",
+    "evidence_facts": ["3월 값: 85", "1월 값: 45"],
+}, ensure_ascii=False) + "\n```"
+
+VALIDATION_TEXT = json.dumps({"is_valid": True, "failure_codes": [], "details": [], "recommendations": []})
+
+
+def fake_response(config) -> types.GenerateContentResponse:
+    """검수 요청이면 통과 응답, 아니면 문항 응답"""
+    instruction = config.system_instruction if config is not None else None
+    is_validation = instruction == ConsistencyValidator.VALIDATION_PROMPT
+    return types.GenerateContentResponse(candidates=[types.Candidate(
+        content=types.Content(role="model", parts=[
+            types.Part.from_text(text=VALIDATION_TEXT if is_validation else ITEM_TEXT)
+        ])
+    )])
+
+
+class FakeModels:
+    """client.models 대체"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        return fake_response(config)
+
+
+class FakeAsyncModels:
+    """client.aio.models 대체 (코루틴 반환)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return fake_response(config)
+
+
+@pytest.fixture
+def fake_client():
+    return SimpleNamespace(models=FakeModels(), aio=SimpleNamespace(models=FakeAsyncModels()))
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch, fake_client):
+    """가짜 클라이언트와 임시 출력 디렉토리를 쓰는 파이프라인"""
+    monkeypatch.setattr(settings, "output_dir", tmp_path / "output")
+    monkeypatch.setattr(settings, "prompt_cache_enabled", False)
+    vision_client = GeminiVisionClient(api_key="test-key")
+    vision_client.client = fake_client
+
+    pipeline = ItemGenerationPipeline.__new__(ItemGenerationPipeline)
+    pipeline.image_processor = vision_client.image_processor
+    pipeline.item_generator = ItemGeneratorAgent(vision_client)
+    pipeline.quality_checker = QualityChecker()
+    pipeline.consistency_validator = ConsistencyValidator(vision_client)
+    pipeline.logger = AuditLogger(log_dir=tmp_path / "output" / "logs")
+    pipeline.enable_image_generation = False
+    pipeline.nano_banana_client = None
+    return pipeline
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    directory = tmp_path / "images"
+    directory.mkdir()
+    for index in range(3):
+        Image.new("RGB", (400, 300), "white").save(directory / f"img{index}.png")
+    return directory
+
+
+class TestItemGenerationPipeline:
+    """동기/비동기 실행 경로 테스트"""
+
+    def test_run(self, pipeline, image_dir, fake_client, tmp_path):
+        result = pipeline.run(image_dir / "img0.png", ItemType.GRAPH)
+
+        assert result.final_status == "PASS", result.error_message
+        assert result.item.correct_answer == "C"
+        assert fake_client.models.calls == 2
+        assert (tmp_path / "output" / "items" / f"{result.item.item_id}.json").exists()
+
+    def test_run_async(self, pipeline, image_dir, fake_client):
+        result = asyncio.run(pipeline.run_async(image_dir / "img0.png", ItemType.GRAPH))
+
+        assert result.final_status == "PASS", result.error_message
+        assert fake_client.aio.models.calls == 2
+        assert fake_client.models.calls == 0
+
+    def test_run_batch_async(self, pipeline, image_dir, fake_client):
+        results = asyncio.run(pipeline.run_batch_async(image_dir, ItemType.GRAPH))
+
+        assert [r.final_status for r in results] == ["PASS"] * 3
+        assert all(r.generation_log.phases for r in results)
+        assert fake_client.aio.models.calls == 6
+
+    def test_invalid_input(self, pipeline, tmp_path):
+        result = pipeline.run(tmp_path / "missing.png", ItemType.GRAPH)
+
+        assert result.final_status == "INPUT_INVALID"
+
+    @pytest.mark.parametrize("mode", ["sync", "async"])
+    @pytest.mark.parametrize("auto_retry, expected_calls", [(True, 2), (False, 1)])
+    def test_parse_failure_retries_match(self, pipeline, image_dir, fake_client, monkeypatch,
+                                         mode, auto_retry, expected_calls):
+        """파싱 실패 시 동기/비동기 경로의 재시도 동작이 같음"""
+        monkeypatch.setitem(globals(), "ITEM_TEXT", "문항 아님")
+        kwargs = dict(auto_retry=auto_retry, max_retries=2)
+
+        if mode == "sync":
+            result = pipeline.run(image_dir / "img0.png", ItemType.GRAPH, **kwargs)
+            calls = fake_client.models.calls
+        else:
+            result = asyncio.run(pipeline.run_async(image_dir / "img0.png", ItemType.GRAPH, **kwargs))
+            calls = fake_client.aio.models.calls
+
+        assert result.final_status == "MAX_RETRIES_EXCEEDED"
+        assert result.error_message == "문항 파싱 실패"
+        assert calls == expected_calls
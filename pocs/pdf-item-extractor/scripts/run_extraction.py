@@ -11,7 +11,11 @@ Agentic Vision을 사용하여 PDF에서 문항을 추출합니다.
     --pages         처리할 페이지 범위 (예: 1-3)
     --crop          문항/지문 개별 이미지 크롭
     --no-save       시각화 이미지 저장 안함
-    --force         기존 결과 무시하고 재실행
+    --force         기존 결과 및 페이지 저널 무시하고 재실행
+    --max-in-flight 동시 세그멘테이션 요청 수
+    --batch         배치 예측 작업으로 세그멘테이션 (대량 오프라인 처리)
+    --stream        스트리밍 응답으로 완성된 문항/지문부터 크롭
+    --column-tiles  2단 페이지를 단별 타일 요청으로 나누어 동시에 세그멘테이션
 """
 
 import argparse
@@ -59,13 +63,61 @@ def main():
         default=None,
         help="PDF 렌더링 DPI (기본: 100)"
     )
+    parser.add_argument(
+        "--segment-dpi",
+        type=int,
+        default=None,
+        help="세그멘테이션 요청용 페이지 렌더링 DPI (기본: 150, 0이면 --dpi와 동일)"
+    )
     parser.add_argument(
         "--force",
         action="store_true",
         help="기존 결과 무시하고 재실행"
     )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="동시 세그멘테이션 요청 수 (기본: 4)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="모델 응답 캐시를 조회하지 않고 새로 호출 (결과로 캐시 갱신)"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Agentic Vision 세그멘테이션을 배치 예측 작업으로 실행 (완료까지 대기)"
+    )
+    parser.add_argument(
+        "--batch-backend",
+        choices=["gemini", "local"],
+        default=None,
+        help="배치 작업 백엔드 (local: 로컬 대체 백엔드)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="세그멘테이션 응답을 스트리밍으로 받아 완성된 문항/지문부터 보정/크롭"
+    )
+    parser.add_argument(
+        "--column-tiles",
+        action="store_true",
+        help="단 구분선이 있는 페이지를 단별 타일 요청으로 나누어 동시에 세그멘테이션"
+    )
     args = parser.parse_args()
 
+    if args.stream:
+        settings.stream_responses = True
+    if args.column_tiles:
+        settings.column_tiles = True
+
+    if args.no_cache:
+        settings.response_cache_bypass = True
+    if args.batch_backend:
+        settings.batch_backend = args.batch_backend
+
     print("=" * 60)
     print("Agentic Vision PDF 문항 추출 POC")
     print("=" * 60)
@@ -73,11 +125,16 @@ def main():
     # DPI 설정 (CLI 옵션 우선)
     if args.dpi:
         settings.pdf_dpi = args.dpi
+    if args.segment_dpi is not None:
+        settings.segment_dpi = args.segment_dpi
+    if args.max_in_flight:
+        settings.segment_max_in_flight = args.max_in_flight
 
     # 모델 정보
     print(f"\n[사용 모델]")
     print(f"  Agentic Vision: {settings.gemini_model}")
-    print(f"  PDF DPI: {settings.pdf_dpi}")
+    print(f"  PDF DPI: {settings.pdf_dpi} (세그멘테이션 {settings.segment_dpi or settings.pdf_dpi})")
+    print(f"  동시 세그멘테이션 요청: {settings.segment_max_in_flight}")
 
     # PDF 파일 결정
     if args.pdf:
@@ -151,11 +208,14 @@ def main():
         pipeline = ItemExtractionPipeline()
 
         try:
+            # --force가 없으면 페이지 저널에서 완료된 페이지부터 이어서 실행
             result = pipeline.run(
                 pdf_path=pdf_path,
                 page_range=page_range,
                 save_images=not args.no_save,
-                crop_items=args.crop
+                crop_items=args.crop,
+                resume=not args.force,
+                batch=args.batch
             )
 
             # 결과 저장
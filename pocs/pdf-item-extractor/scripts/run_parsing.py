@@ -10,6 +10,8 @@
     --input, -i     추출 결과 JSON 파일 경로
     --items-dir     문항 이미지 디렉토리 (선택)
     --output, -o    파싱 결과 출력 경로
+    --batch         배치 예측 작업으로 파싱 (대량 오프라인 처리)
+    --stream        스트리밍 응답으로 파싱
 """
 
 import argparse
@@ -21,7 +23,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from gemini_shared.prompt_cache import prompt_cache_session
+from gemini_shared.usage_tracker import usage_scope
 from src.core.config import settings
+from src.agents.response_cache import get_response_cache
 from src.core.schemas import ExtractedItem
 from src.parsers.item_parser import ItemParser
 from src.parsers.html_report import HTMLReportGenerator
@@ -66,8 +71,45 @@ def main():
         action="store_true",
         help="콘텐츠 블록 bbox 시각화 이미지 생성"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="모델 응답 캐시를 조회하지 않고 새로 호출 (결과로 캐시 갱신)"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="배치 예측 작업으로 파싱 (완료까지 대기)"
+    )
+    parser.add_argument(
+        "--batch-backend",
+        choices=["gemini", "local"],
+        default=None,
+        help="배치 작업 백엔드 (local: 로컬 대체 백엔드)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="파싱 응답을 스트리밍으로 받기"
+    )
+    parser.add_argument(
+        "--pack",
+        choices=["mosaic", "parts"],
+        default=None,
+        help="작은 문항 크롭을 묶음 요청으로 파싱 (mosaic: 라벨 모자이크 이미지, parts: 라벨별 이미지 파트)"
+    )
     args = parser.parse_args()
 
+    if args.stream:
+        settings.stream_responses = True
+    if args.pack:
+        settings.parse_pack_mode = args.pack
+
+    if args.no_cache:
+        settings.response_cache_bypass = True
+    if args.batch_backend:
+        settings.batch_backend = args.batch_backend
+
     print("=" * 60)
     print("P6-PARSE: 문항 콘텐츠 파싱")
     print("=" * 60)
@@ -106,7 +148,9 @@ def main():
     item_parser = ItemParser()
 
     print(f"\n[P6-PARSE] 문항 콘텐츠 파싱 중...")
-    parsed_items = item_parser.parse_items(items)
+    with prompt_cache_session() as prompt_cache, usage_scope() as usage:
+        parsed_items = item_parser.parse_items(items, batch=args.batch)
+        prompt_stats = prompt_cache.stats() if prompt_cache else None
 
     print(f"\n[결과]")
     print(f"  파싱 완료: {len(parsed_items)}개")
@@ -129,6 +173,25 @@ def main():
     print(f"  총 수식 블록: {total_math}개")
     print(f"  총 이미지 블록: {total_image}개")
 
+    response_cache = get_response_cache()
+    if response_cache:
+        cache_stats = response_cache.stats()
+        print(f"  응답 캐시: 적중 {cache_stats['hits']}회, 미스 {cache_stats['misses']}회 "
+              f"(적중률 {cache_stats['hit_rate']:.0%})")
+    if prompt_stats:
+        print(f"  프롬프트 캐시: 입력 토큰 캐시 {prompt_stats['cached_tokens']:,} / "
+              f"신규 {prompt_stats['fresh_tokens']:,}")
+    if item_parser.image_encodings:
+        encodings = item_parser.image_encodings
+        source_kb = sum(e["source_bytes"] or 0 for e in encodings) / 1024
+        sent_kb = sum(e["bytes"] for e in encodings) / 1024
+        print(f"  이미지 인코딩: {len(encodings)}건, {source_kb:.0f}KB → {sent_kb:.0f}KB, "
+              f"예상 이미지 토큰 {sum(e['estimated_tokens'] for e in encodings):,}")
+    if usage.total.calls:
+        print(f"  {usage.total.summary()}")
+        if parsed_items:
+            print(f"  문항당 평균 비용: ${usage.total.cost_usd / len(parsed_items):.4f}")
+
     # 결과 저장
     if args.output:
         output_path = Path(args.output)
@@ -4,21 +4,42 @@ Gemini의 code_execution 기능을 활용한 동적 이미지 분석
 Think-Act-Observe 프레임워크 구현
 """
 
-import base64
+import bisect
+import contextvars
 import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from google import genai
 from google.genai import types
+from gemini_shared.client_registry import get_client
+from gemini_shared.file_uploads import image_part, image_part_async
+from gemini_shared.model_call import generate_content, generate_content_async, generate_content_stream
+from gemini_shared.prompt_cache import apply_prompt_cache, apply_prompt_cache_async, system_instruction_config
+from gemini_shared.usage_tracker import add_usage
 
 from ..core.config import settings
+from ..core.json_stream import IncrementalJSONParser
 from ..core.schemas import (
     AgenticLog, AgenticStep, BoundingBox,
-    ExtractedItem, ItemType, PageLayout, PassageInfo
+    ExtractedItem, ItemType, PageLayout, PassageInfo, TokenUsage
 )
+from .batch_jobs import BatchJobRunner, BatchRequest
+from .response_cache import get_response_cache, response_cache_key
+
+
+class TileCollisionError(RuntimeError):
+    """같은 문항 번호가 여러 타일에서 검출됨 (단 분할이 문항을 가른 경우, 페이지 전체로 다시 요청)"""
+
+    def __init__(self, page_number: int, item_numbers: list[str]):
+        self.page_number = page_number
+        self.item_numbers = item_numbers
+        super().__init__(
+            f"페이지 {page_number} 단 타일 간 문항 번호 중복: {', '.join(item_numbers)}"
+        )
 
 
 class AgenticVisionClient:
@@ -28,20 +49,45 @@ class AgenticVisionClient:
     모델이 스스로 Python 코드를 작성하여 zoom, crop 등을 수행합니다.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    LAYOUT_PROMPT = """
+이 시험지 페이지의 레이아웃을 분석하세요.
+
+분석 항목:
+1. 단 구성 (1단 또는 2단)
+2. 문항 번호 패턴 (예: "1.", "[1]", "문1" 등)
+3. 페이지 크기 (픽셀)
+
+필요하다면 특정 영역을 확대(zoom)하여 정확히 파악하세요.
+
+JSON 형식으로 응답:
+{
+    "columns": 2,
+    "item_number_pattern": "숫자.",
+    "width": 1654,
+    "height": 2339
+}
+"""
+
+    def __init__(self, api_key: Optional[str] = None, max_in_flight: Optional[int] = None):
         """클라이언트 초기화
 
         Args:
             api_key: Google API 키 (없으면 설정에서 로드)
+            max_in_flight: 동시 세그멘테이션 요청 수 제한 (없으면 설정에서 로드)
         """
         self.api_key = api_key or settings.google_api_key
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
-        # Gemini 클라이언트 초기화
-        self.client = genai.Client(api_key=self.api_key)
+        # Gemini 클라이언트 (프로세스 전역 레지스트리에서 공유)
         self.model_name = settings.gemini_model
+        self.client = get_client(self.api_key)
         self.agentic_logs: list[AgenticLog] = []
+        self._logs_lock = threading.Lock()
+
+        # 동시 요청 수 제한 (여러 스레드에서 호출 시)
+        self.max_in_flight = max(1, max_in_flight or settings.segment_max_in_flight)
+        self._in_flight = threading.BoundedSemaphore(self.max_in_flight)
 
         # 프롬프트 캐시
         self._prompt_cache: dict[str, str] = {}
@@ -82,27 +128,28 @@ class AgenticVisionClient:
         Returns:
             페이지 레이아웃 정보
         """
-        prompt = """
-이 시험지 페이지의 레이아웃을 분석하세요.
+        response = self._call_with_code_execution(self.LAYOUT_PROMPT, page_image)
+        return self._build_layout(page_number, response)
 
-분석 항목:
-1. 단 구성 (1단 또는 2단)
-2. 문항 번호 패턴 (예: "1.", "[1]", "문1" 등)
-3. 페이지 크기 (픽셀)
-
-필요하다면 특정 영역을 확대(zoom)하여 정확히 파악하세요.
+    async def analyze_page_layout_async(
+        self,
+        page_image: bytes,
+        page_number: int
+    ) -> PageLayout:
+        """페이지 레이아웃 분석 (비동기)
 
-JSON 형식으로 응답:
-{
-    "columns": 2,
-    "item_number_pattern": "숫자.",
-    "width": 1654,
-    "height": 2339
-}
-"""
+        Args:
+            page_image: 페이지 이미지 바이트
+            page_number: 페이지 번호
 
-        response = self._call_with_code_execution(prompt, page_image)
+        Returns:
+            페이지 레이아웃 정보
+        """
+        response = await self._call_with_code_execution_async(self.LAYOUT_PROMPT, page_image)
+        return self._build_layout(page_number, response)
 
+    def _build_layout(self, page_number: int, response: str) -> PageLayout:
+        """레이아웃 응답에서 PageLayout 생성"""
         # JSON 추출
         json_data = self._extract_json(response)
 
@@ -119,15 +166,17 @@ JSON 형식으로 응답:
         page_image: bytes,
         page_number: int,
         width: int,
-        height: int
+        height: int,
+        mime_type: str = "image/png"
     ) -> tuple[list[ExtractedItem], list[PassageInfo]]:
         """페이지에서 지문과 문항 추출
 
         Args:
-            page_image: 페이지 이미지 바이트
+            page_image: 페이지 이미지 바이트 (모델 요청용으로 축소될 수 있음)
             page_number: 페이지 번호
-            width: 이미지 너비
-            height: 이미지 높이
+            width: 원본 이미지 너비 (정규화 좌표 변환 기준)
+            height: 원본 이미지 높이 (정규화 좌표 변환 기준)
+            mime_type: 페이지 이미지 MIME 타입
 
         Returns:
             (추출된 문항 목록, 공유 지문 목록)
@@ -135,59 +184,286 @@ JSON 형식으로 응답:
         # 외부 프롬프트 파일 로드
         prompt = self._load_prompt("item_extraction")
 
-        response = self._call_vision_detection(prompt, page_image)
+        with self._in_flight:
+            response = self._call_vision_detection(prompt, page_image, mime_type)
+
+        return self._parse_page_response(response, page_number, width, height)
+
+    async def extract_items_from_page_async(
+        self,
+        page_image: bytes,
+        page_number: int,
+        width: int,
+        height: int,
+        mime_type: str = "image/png"
+    ) -> tuple[list[ExtractedItem], list[PassageInfo]]:
+        """페이지에서 지문과 문항 추출 (비동기)
+
+        동시 실행 수는 settings.async_max_concurrency로 제한됩니다.
+
+        Args:
+            page_image: 페이지 이미지 바이트 (모델 요청용으로 축소될 수 있음)
+            page_number: 페이지 번호
+            width: 원본 이미지 너비 (정규화 좌표 변환 기준)
+            height: 원본 이미지 높이 (정규화 좌표 변환 기준)
+            mime_type: 페이지 이미지 MIME 타입
+
+        Returns:
+            (추출된 문항 목록, 공유 지문 목록)
+        """
+        prompt = self._load_prompt("item_extraction")
+        response = await self._call_vision_detection_async(prompt, page_image, mime_type)
+        return self._parse_page_response(response, page_number, width, height)
+
+    def extract_items_from_page_stream(
+        self,
+        page_image: bytes,
+        page_number: int,
+        width: int,
+        height: int,
+        mime_type: str = "image/png"
+    ) -> Iterator[ExtractedItem | PassageInfo]:
+        """페이지에서 지문과 문항을 스트리밍으로 추출
+
+        응답 JSON의 문항/지문 객체가 닫히는 즉시 변환해 반환하므로
+        전체 응답을 기다리지 않고 후속 처리(bbox 보정, 크롭)를 시작할 수 있습니다.
+        증분 파싱으로 객체를 찾지 못한 응답은 끝난 뒤 extract_items_from_page()와 같이 파싱합니다.
+
+        Args:
+            page_image: 페이지 이미지 바이트 (모델 요청용으로 축소될 수 있음)
+            page_number: 페이지 번호
+            width: 원본 이미지 너비 (정규화 좌표 변환 기준)
+            height: 원본 이미지 높이 (정규화 좌표 변환 기준)
+            mime_type: 페이지 이미지 MIME 타입
+
+        Yields:
+            응답 순서대로 추출된 문항(ExtractedItem) 또는 공유 지문(PassageInfo)
+        """
+        prompt = self._load_prompt("item_extraction")
+        parser = IncrementalJSONParser()
+        emitted = 0
+
+        with self._in_flight:
+            for text in self._call_vision_detection_stream(prompt, page_image, mime_type):
+                for key, data in parser.feed(text):
+                    if key in (None, "items"):
+                        emitted += 1
+                        yield self._build_item(data, page_number, width, height)
+                    elif key == "passages":
+                        emitted += 1
+                        yield self._build_passage(data, page_number, width, height)
+
+        if emitted:
+            self._record_agentic_log(page_number, parser.text)
+            return
+
+        items, passages = self._parse_page_response(parser.text, page_number, width, height)
+        yield from items
+        yield from passages
+
+    def extract_items_from_tiles(
+        self,
+        tiles: list[tuple[bytes, str, BoundingBox]],
+        page_number: int
+    ) -> tuple[list[ExtractedItem], list[PassageInfo]]:
+        """페이지를 나눈 타일(단)별로 지문과 문항을 동시에 추출하고 페이지 좌표로 병합
+
+        타일 요청은 extract_items_from_page()와 같은 프롬프트/설정/응답 캐시를 사용하며,
+        동시 실행 수는 페이지 요청과 같은 max_in_flight 제한을 공유합니다.
+        여러 타일에 걸친 지문(같은 passage_id)은 하나로 합치고 영역을 bbox_list로 이어 붙입니다.
+        같은 문항 번호가 여러 타일에서 검출되면 어느 영역이 맞는지 알 수 없으므로
+        병합하지 않고 TileCollisionError를 발생시킵니다 (호출한 쪽에서 페이지 전체로 요청).
+
+        Args:
+            tiles: (타일 이미지 바이트, MIME 타입, 페이지 내 타일 영역) 목록 (읽기 순서)
+            page_number: 페이지 번호
+
+        Returns:
+            (추출된 문항 목록, 공유 지문 목록) - 원본 페이지 픽셀 좌표
+
+        Raises:
+            TileCollisionError: 같은 문항 번호가 여러 타일에서 검출된 경우
+        """
+        prompt = self._load_prompt("item_extraction")
+
+        def detect(image_bytes: bytes, mime_type: str) -> str:
+            with self._in_flight:
+                return self._call_vision_detection(prompt, image_bytes, mime_type)
+
+        # 작업자 스레드에도 호출한 쪽의 컨텍스트(토큰 사용량 범위 등)를 이어 줌
+        with ThreadPoolExecutor(max_workers=len(tiles)) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, detect, image_bytes, mime_type)
+                for image_bytes, mime_type, _ in tiles
+            ]
+            responses = [future.result() for future in futures]
+
+        items: list[ExtractedItem] = []
+        passages: dict[str, PassageInfo] = {}
+        tile_numbers: dict[str, int] = {}
+        collisions: list[str] = []
+        for tile_index, ((_, _, region), response) in enumerate(zip(tiles, responses)):
+            json_data = self._extract_json(response)
+            width, height = int(region.width), int(region.height)
+            for item_data in json_data.get("items", []):
+                item = self._build_item(item_data, page_number, width, height)
+                item.bbox = self._offset_bbox(item.bbox, region)
+                items.append(item)
+                if not item.item_number:
+                    continue
+                first_tile = tile_numbers.setdefault(item.item_number, tile_index)
+                if first_tile != tile_index and item.item_number not in collisions:
+                    collisions.append(item.item_number)
+            for passage_data in json_data.get("passages", []):
+                passage = self._build_passage(passage_data, page_number, width, height)
+                passage.bbox = self._offset_bbox(passage.bbox, region)
+                passage.bbox_list = [self._offset_bbox(bbox, region) for bbox in passage.bbox_list]
+                merged = passages.get(passage.passage_id) if passage.passage_id else None
+                if merged is None:
+                    passages[passage.passage_id or f"tile-{len(passages)}"] = passage
+                else:
+                    merged.bbox_list.extend(passage.bbox_list)
+                    merged.item_range = merged.item_range or passage.item_range
+
+        if collisions:
+            raise TileCollisionError(page_number, collisions)
+
+        self._record_agentic_log(page_number, "\n".join(responses))
+        return items, list(passages.values())
+
+    @staticmethod
+    def _offset_bbox(bbox: BoundingBox, region: BoundingBox) -> BoundingBox:
+        """타일 좌표 bbox를 페이지 좌표로 이동"""
+        return BoundingBox(
+            x1=bbox.x1 + region.x1, y1=bbox.y1 + region.y1,
+            x2=bbox.x2 + region.x1, y2=bbox.y2 + region.y1
+        )
+
+    def extract_items_from_pages_batch(
+        self,
+        pages: list[tuple[int, bytes, str, int, int]],
+        display_name: str
+    ) -> dict[int, tuple[list[ExtractedItem], list[PassageInfo]] | Exception]:
+        """여러 페이지의 지문과 문항을 배치 예측 작업으로 추출
+
+        요청/응답 처리(프롬프트, 설정, 응답 캐시, 응답 파싱)는 extract_items_from_page()와 같습니다.
+
+        Args:
+            pages: (페이지 번호, 페이지 이미지 바이트, MIME 타입, 원본 이미지 너비, 원본 이미지 높이) 목록
+            display_name: 배치 작업 표시 이름
+
+        Returns:
+            페이지 번호별 (추출된 문항 목록, 공유 지문 목록) 또는 페이지 실패 예외
+
+        Raises:
+            BatchJobError: 배치 작업 자체가 실패한 경우
+        """
+        prompt = self._load_prompt("item_extraction")
+        config = self._detection_config()
+
+        requests = [
+            BatchRequest(
+                key=f"page-{page_number}",
+                # 이미지는 인라인으로 구성 (업로드는 BatchJobRunner가 제출할 요청에만 적용)
+                contents=self._build_contents(types.Part.from_bytes(data=page_image, mime_type=mime_type)),
+                config=system_instruction_config(prompt, config),
+                cache_key=response_cache_key(self.model_name, prompt, page_image, config)
+            )
+            for page_number, page_image, mime_type, _, _ in pages
+        ]
+        runner = BatchJobRunner(self.client, self.model_name)
+        results = runner.run(requests, self._extract_response_text, display_name)
+
+        extracted = {}
+        for page_number, _, _, width, height in pages:
+            result = results[f"page-{page_number}"]
+            if result.usage is not None:
+                # 배치 결과는 model_call을 거치지 않으므로 사용량을 직접 합산
+                add_usage(result.usage)
+            if result.error is not None:
+                extracted[page_number] = RuntimeError(result.error)
+            else:
+                extracted[page_number] = self._parse_page_response(result.text, page_number, width, height)
+                self.get_log(page_number).usage = result.usage or TokenUsage()
+        return extracted
+
+    def _parse_page_response(
+        self,
+        response: str,
+        page_number: int,
+        width: int,
+        height: int
+    ) -> tuple[list[ExtractedItem], list[PassageInfo]]:
+        """모델 응답에서 문항/지문 파싱
+
+        Args:
+            response: 모델 응답 텍스트
+            page_number: 페이지 번호
+            width: 이미지 너비
+            height: 이미지 높이
 
+        Returns:
+            (추출된 문항 목록, 공유 지문 목록)
+        """
         # 로그 기록
         self._record_agentic_log(page_number, response)
 
         # JSON 추출
         json_data = self._extract_json(response)
 
-        # 문항 파싱 (정규화 좌표 → 실제 픽셀 변환)
-        items = []
-        for item_data in json_data.get("items", []):
-            box_2d = item_data.get("box_2d", item_data.get("bbox", [0, 0, 1000, 1000]))
-            item_num = str(item_data.get("item_number", ""))
-
-            # 정규화 좌표를 실제 픽셀로 변환
-            bbox = self._convert_box_2d(box_2d, width, height)
-
-            # passage_ref 처리
-            passage_ref = item_data.get("passage_ref")
-            item_type = ItemType.PASSAGE_GROUP if passage_ref else ItemType.STANDALONE
-
-            items.append(ExtractedItem(
-                item_number=item_num,
-                page_number=page_number,
-                bbox=bbox,
-                item_type=item_type,
-                passage_ref=passage_ref,
-                confidence=1.0
-            ))
-
-        # 지문 파싱
-        passages = []
-        for passage_data in json_data.get("passages", []):
-            # 메인 bbox
-            box_2d = passage_data.get("box_2d", passage_data.get("bbox", [0, 0, 1000, 1000]))
-            main_bbox = self._convert_box_2d(box_2d, width, height)
-
-            # 다중 bbox (단 넘김 시)
-            bbox_list = []
-            box_2d_list = passage_data.get("box_2d_list", [])
-            for box in box_2d_list:
-                bbox_list.append(self._convert_box_2d(box, width, height))
-
-            passages.append(PassageInfo(
-                passage_id=passage_data.get("passage_id", ""),
-                page_number=page_number,
-                bbox=main_bbox,
-                bbox_list=bbox_list if bbox_list else [main_bbox],
-                item_range=passage_data.get("item_range", "")
-            ))
+        # 문항/지문 파싱 (정규화 좌표 → 실제 픽셀 변환)
+        items = [
+            self._build_item(item_data, page_number, width, height)
+            for item_data in json_data.get("items", [])
+        ]
+        passages = [
+            self._build_passage(passage_data, page_number, width, height)
+            for passage_data in json_data.get("passages", [])
+        ]
 
         return items, passages
 
+    def _build_item(self, item_data: dict, page_number: int, width: int, height: int) -> ExtractedItem:
+        """응답의 문항 객체를 ExtractedItem으로 변환 (정규화 좌표 → 실제 픽셀)"""
+        box_2d = item_data.get("box_2d", item_data.get("bbox", [0, 0, 1000, 1000]))
+        item_num = str(item_data.get("item_number", ""))
+
+        # 정규화 좌표를 실제 픽셀로 변환
+        bbox = self._convert_box_2d(box_2d, width, height)
+
+        # passage_ref 처리
+        passage_ref = item_data.get("passage_ref")
+        item_type = ItemType.PASSAGE_GROUP if passage_ref else ItemType.STANDALONE
+
+        return ExtractedItem(
+            item_number=item_num,
+            page_number=page_number,
+            bbox=bbox,
+            item_type=item_type,
+            passage_ref=passage_ref,
+            confidence=1.0
+        )
+
+    def _build_passage(self, passage_data: dict, page_number: int, width: int, height: int) -> PassageInfo:
+        """응답의 지문 객체를 PassageInfo로 변환"""
+        # 메인 bbox
+        box_2d = passage_data.get("box_2d", passage_data.get("bbox", [0, 0, 1000, 1000]))
+        main_bbox = self._convert_box_2d(box_2d, width, height)
+
+        # 다중 bbox (단 넘김 시)
+        bbox_list = []
+        box_2d_list = passage_data.get("box_2d_list", [])
+        for box in box_2d_list:
+            bbox_list.append(self._convert_box_2d(box, width, height))
+
+        return PassageInfo(
+            passage_id=passage_data.get("passage_id", ""),
+            page_number=page_number,
+            bbox=main_bbox,
+            bbox_list=bbox_list if bbox_list else [main_bbox],
+            item_range=passage_data.get("item_range", "")
+        )
+
     def _convert_box_2d(
         self,
         box_2d: list,
@@ -213,47 +489,107 @@ JSON 형식으로 응답:
     def _call_vision_detection(
         self,
         prompt: str,
-        image_bytes: bytes
+        image_bytes: bytes,
+        mime_type: str = "image/png"
     ) -> str:
         """Gemini Vision API로 객체 감지 호출
 
         Args:
             prompt: 프롬프트
             image_bytes: 이미지 바이트
+            mime_type: 이미지 MIME 타입
 
         Returns:
             모델 응답 텍스트
         """
-        # JSON 응답 형식 지정
-        config = types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.1,
-        )
+        config = self._detection_config()
 
-        # 이미지와 프롬프트 구성
-        contents = [
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part(
-                        inline_data=types.Blob(
-                            mime_type="image/png",
-                            data=image_bytes
-                        )
-                    ),
-                    types.Part(text=prompt)
-                ]
-            )
-        ]
+        # 동일 입력의 응답 캐시 조회
+        cache = get_response_cache()
+        key = response_cache_key(self.model_name, prompt, image_bytes, config)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return cached
 
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=contents,
-            config=config
-        )
+        # 정적 프롬프트는 시스템 지시문으로 전송 (프롬프트 캐시 세션 중에는 캐시 콘텐츠 참조)
+        request_config = apply_prompt_cache(self.client, self.model_name, prompt, config)
+        contents = self._build_contents(image_part(self.client, image_bytes, mime_type))
+        response = generate_content(self.client, self.model_name, contents, request_config)
 
         # 응답 텍스트 추출
-        return self._extract_response_text(response)
+        text = self._extract_response_text(response)
+        if cache:
+            cache.put(key, self.model_name, text)
+        return text
+
+    async def _call_vision_detection_async(
+        self,
+        prompt: str,
+        image_bytes: bytes,
+        mime_type: str = "image/png"
+    ) -> str:
+        """Gemini Vision API로 객체 감지 호출 (비동기)"""
+        config = self._detection_config()
+
+        cache = get_response_cache()
+        key = response_cache_key(self.model_name, prompt, image_bytes, config)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return cached
+
+        request_config = await apply_prompt_cache_async(self.client, self.model_name, prompt, config)
+        contents = self._build_contents(await image_part_async(self.client, image_bytes, mime_type))
+        response = await generate_content_async(self.client, self.model_name, contents, request_config)
+        text = self._extract_response_text(response)
+        if cache:
+            cache.put(key, self.model_name, text)
+        return text
+
+    def _call_vision_detection_stream(
+        self,
+        prompt: str,
+        image_bytes: bytes,
+        mime_type: str = "image/png"
+    ) -> Iterator[str]:
+        """Gemini Vision API로 객체 감지 스트리밍 호출
+
+        스트림이 끝나면 이어 붙인 전체 텍스트를 응답 캐시에 저장합니다.
+
+        Args:
+            prompt: 프롬프트
+            image_bytes: 이미지 바이트
+            mime_type: 이미지 MIME 타입
+
+        Yields:
+            응답 텍스트 조각 (응답 캐시 적중 시 전체 텍스트 하나)
+        """
+        config = self._detection_config()
+
+        cache = get_response_cache()
+        key = response_cache_key(self.model_name, prompt, image_bytes, config)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            yield cached
+            return
+
+        request_config = apply_prompt_cache(self.client, self.model_name, prompt, config)
+        contents = self._build_contents(image_part(self.client, image_bytes, mime_type))
+        texts = []
+        for chunk in generate_content_stream(self.client, self.model_name, contents, request_config):
+            text = self._chunk_text(chunk)
+            if text:
+                texts.append(text)
+                yield text
+
+        if cache:
+            cache.put(key, self.model_name, "".join(texts))
+
+    def _detection_config(self) -> types.GenerateContentConfig:
+        """객체 감지 요청 설정 (JSON 응답 형식 지정)"""
+        return types.GenerateContentConfig(
+            response_mime_type="application/json",
+            temperature=0.1,
+        )
 
     def _call_with_code_execution(
         self,
@@ -269,40 +605,44 @@ JSON 형식으로 응답:
         Returns:
             모델 응답 텍스트
         """
-        # 이미지를 base64로 인코딩
-        image_b64 = base64.b64encode(image_bytes).decode('utf-8')
-
         # Agentic Vision: code_execution으로 이미지 분석
         config = types.GenerateContentConfig(
             tools=[types.Tool(code_execution=types.ToolCodeExecution())],
             temperature=0.1,
         )
+        config = apply_prompt_cache(self.client, self.model_name, prompt, config)
+        contents = self._build_contents(image_part(self.client, image_bytes, "image/png"))
+        response = generate_content(self.client, self.model_name, contents, config)
 
-        # 이미지와 프롬프트 구성
-        contents = [
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part(
-                        inline_data=types.Blob(
-                            mime_type="image/png",
-                            data=image_bytes
-                        )
-                    ),
-                    types.Part(text=prompt)
-                ]
-            )
-        ]
+        # 응답 텍스트 추출
+        return self._extract_response_text(response)
 
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=contents,
-            config=config
+    async def _call_with_code_execution_async(
+        self,
+        prompt: str,
+        image_bytes: bytes
+    ) -> str:
+        """code_execution 도구와 함께 모델 호출 (비동기)"""
+        config = types.GenerateContentConfig(
+            tools=[types.Tool(code_execution=types.ToolCodeExecution())],
+            temperature=0.1,
         )
-
-        # 응답 텍스트 추출
+        config = await apply_prompt_cache_async(self.client, self.model_name, prompt, config)
+        contents = self._build_contents(await image_part_async(self.client, image_bytes, "image/png"))
+        response = await generate_content_async(self.client, self.model_name, contents, config)
         return self._extract_response_text(response)
 
+    def _build_contents(self, image: types.Part) -> list[types.Content]:
+        """이미지로 요청 콘텐츠 구성 (프롬프트는 시스템 지시문으로 전송)
+
+        Args:
+            image: 이미지 파트 (업로드된 파일 참조 또는 인라인 바이트)
+
+        Returns:
+            요청 콘텐츠
+        """
+        return [types.Content(role="user", parts=[image])]
+
     def _extract_response_text(self, response) -> str:
         """응답에서 텍스트 추출"""
         if not response.candidates:
@@ -325,6 +665,15 @@ JSON 형식으로 응답:
 
         return "\n".join(text_parts)
 
+    def _chunk_text(self, chunk) -> str:
+        """스트리밍 청크의 텍스트 (청크 경계가 JSON 문자열 안일 수 있으므로 구분자 없이 연결)"""
+        if not chunk.candidates or not chunk.candidates[0].content:
+            return ""
+        return "".join(
+            part.text for part in chunk.candidates[0].content.parts or []
+            if part.text and not part.thought
+        )
+
     def _extract_json(self, text: str) -> dict:
         """텍스트에서 JSON 추출
 
@@ -433,12 +782,32 @@ JSON 형식으로 응답:
             total_iterations=len(code_matches),
             success=True
         )
-        self.agentic_logs.append(log)
+
+        self.add_log(log)
+
+    def add_log(self, log: AgenticLog):
+        """로그 추가
+
+        페이지 완료 순서와 무관하게 페이지 순으로 유지합니다.
+        """
+        with self._logs_lock:
+            keys = [l.page_number for l in self.agentic_logs]
+            self.agentic_logs.insert(bisect.bisect_right(keys, log.page_number), log)
+
+    def get_log(self, page_number: int) -> Optional[AgenticLog]:
+        """특정 페이지의 마지막 실행 로그 반환"""
+        with self._logs_lock:
+            for log in reversed(self.agentic_logs):
+                if log.page_number == page_number:
+                    return log
+        return None
 
     def get_logs(self) -> list[AgenticLog]:
-        """실행 로그 반환"""
-        return self.agentic_logs
+        """실행 로그 반환 (페이지 순)"""
+        with self._logs_lock:
+            return list(self.agentic_logs)
 
     def clear_logs(self):
         """로그 초기화"""
-        self.agentic_logs = []
+        with self._logs_lock:
+            self.agentic_logs = []
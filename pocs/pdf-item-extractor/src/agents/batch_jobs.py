@@ -0,0 +1,429 @@
+"""배치 예측 작업
+
+응답 지연이 중요하지 않은 대량 처리(야간 코퍼스 작업 등)의 요청을 배치 예측 작업으로 제출합니다.
+요청을 JSONL 작업 파일({"key", "request"} 줄)로 직렬화해 제출하고, 완료될 때까지 폴링한 뒤
+결과 파일({"key", "response" 또는 "error"} 줄)을 요청 키 기준으로 돌려줍니다.
+
+백엔드 (settings.batch_backend):
+- gemini: 작업 파일을 Files API로 업로드하고 client.batches로 제출
+- local: 작업 파일의 요청을 현재 클라이언트로 순차 호출하는 로컬 대체 백엔드
+  (GEMINI_BASE_URL 대체 서버나 replay 모드와 함께 오프라인 실행용)
+
+같은 요청 집합의 작업 파일 이름은 항상 같으므로, 제출 후 프로세스가 중단되어도
+다시 실행하면 새로 제출하지 않고 기존 작업을 이어서 폴링합니다.
+작업 파일 이름은 인라인 이미지 기준으로 계산하며, Files API 업로드는 이름을 정한 뒤
+실제로 제출할 요청에만 적용합니다 (업로드 URI는 실행마다 달라지므로).
+"""
+
+import hashlib
+import itertools
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from google import genai
+from google.genai import types
+from gemini_shared.file_uploads import image_part
+from gemini_shared.model_call import generate_content
+from gemini_shared.usage_tracker import response_usage
+
+from ..core.config import settings
+from ..core.schemas import TokenUsage
+from .response_cache import get_response_cache
+
+
+# generationConfig로 전송하는 GenerateContentConfig 필드
+GENERATION_CONFIG_FIELDS = frozenset({
+    "temperature", "top_p", "top_k", "candidate_count", "max_output_tokens",
+    "stop_sequences", "seed", "response_mime_type", "response_schema",
+    "response_json_schema", "response_modalities", "thinking_config", "media_resolution",
+})
+
+# 작업 종료 상태
+SUCCEEDED_STATES = frozenset({"JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"})
+TERMINAL_STATES = SUCCEEDED_STATES | {"JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+
+class BatchJobError(RuntimeError):
+    """배치 작업 실패, 취소, 만료 또는 대기 시간 초과"""
+
+
+@dataclass
+class BatchRequest:
+    """배치 작업에 포함할 요청 1건"""
+    key: str
+    contents: list[types.Content]
+    config: Optional[types.GenerateContentConfig] = None
+    cache_key: Optional[str] = None  # 응답 캐시 키 (온라인 호출과 공유)
+
+
+@dataclass
+class BatchResult:
+    """요청 1건의 결과 (text 또는 error 중 하나)"""
+    key: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+    cached: bool = False
+    usage: Optional[TokenUsage] = None  # 배치 가격 비율(settings.batch_price_ratio)을 적용한 사용량
+
+
+def request_payload(
+    contents: list[types.Content],
+    config: Optional[types.GenerateContentConfig] = None
+) -> dict:
+    """GenerateContentRequest JSON 구성 (작업 파일 "request" 필드)
+
+    Args:
+        contents: 요청 콘텐츠
+        config: 생성 설정
+
+    Returns:
+        REST 형식(camelCase) 요청 딕셔너리
+    """
+    payload: dict = {
+        "contents": [content.model_dump(mode="json", by_alias=True, exclude_none=True) for content in contents]
+    }
+    if config is None:
+        return payload
+
+    generation_config = config.model_dump(
+        mode="json", by_alias=True, exclude_none=True, include=set(GENERATION_CONFIG_FIELDS)
+    )
+    if generation_config:
+        payload["generationConfig"] = generation_config
+    if config.tools:
+        payload["tools"] = [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in config.tools]
+    if config.system_instruction:
+        instruction = config.system_instruction
+        if isinstance(instruction, str):
+            instruction = types.Content(parts=[types.Part.from_text(text=instruction)])
+        payload["systemInstruction"] = instruction.model_dump(mode="json", by_alias=True, exclude_none=True)
+    if config.cached_content:
+        payload["cachedContent"] = config.cached_content
+    return payload
+
+
+def parse_request_payload(payload: dict) -> tuple[list[types.Content], types.GenerateContentConfig]:
+    """request_payload()의 역변환 (로컬 백엔드용)"""
+    contents = [types.Content.model_validate(content) for content in payload.get("contents", [])]
+    config = dict(payload.get("generationConfig") or {})
+    for field in ("tools", "systemInstruction", "cachedContent"):
+        if field in payload:
+            config[field] = payload[field]
+    return contents, types.GenerateContentConfig.model_validate(config)
+
+
+class GeminiBatchBackend:
+    """Gemini 배치 API 백엔드 (Files API 작업 파일)"""
+
+    def __init__(self, client: genai.Client):
+        self.client = client
+
+    def submit(self, model: str, requests_path: Path, display_name: str) -> str:
+        """작업 파일 업로드 후 배치 작업 생성
+
+        Returns:
+            작업 이름
+        """
+        uploaded = self.client.files.upload(
+            file=str(requests_path),
+            config=types.UploadFileConfig(mime_type="jsonl", display_name=display_name)
+        )
+        job = self.client.batches.create(
+            model=model,
+            src=uploaded.name,
+            config=types.CreateBatchJobConfig(display_name=display_name)
+        )
+        return job.name
+
+    def state(self, job_name: str) -> tuple[str, Optional[str]]:
+        """작업 상태 (상태 이름, 오류 메시지)"""
+        job = self.client.batches.get(name=job_name)
+        error = job.error.message if job.error else None
+        return job.state.value if job.state else "JOB_STATE_UNSPECIFIED", error
+
+    def download(self, job_name: str, output_path: Path) -> Path:
+        """결과 파일 다운로드"""
+        job = self.client.batches.get(name=job_name)
+        if not job.dest or not job.dest.file_name:
+            raise BatchJobError(f"배치 작업 결과 파일이 없습니다: {job_name}")
+        output_path.write_bytes(self.client.files.download(file=job.dest.file_name))
+        return output_path
+
+
+class LocalBatchBackend:
+    """로컬 대체 백엔드
+
+    작업 파일의 요청을 백그라운드 스레드에서 generate_content()로 순차 호출하고
+    Gemini 배치 API와 같은 형식의 결과 파일을 작성합니다.
+    작업 상태는 프로세스 메모리에만 유지됩니다.
+    """
+
+    def __init__(self, client: genai.Client):
+        self.client = client
+        self._jobs: dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, model: str, requests_path: Path, display_name: str) -> str:
+        """작업 시작
+
+        Returns:
+            작업 이름
+        """
+        job_name = f"batches/local-{next(self._ids)}"
+        output_path = requests_path.with_name(f"{requests_path.stem}.local-output.jsonl")
+        with self._lock:
+            self._jobs[job_name] = {"state": "JOB_STATE_RUNNING", "error": None, "output": output_path}
+        threading.Thread(
+            target=self._run, args=(job_name, model, requests_path, output_path), daemon=True
+        ).start()
+        return job_name
+
+    def _run(self, job_name: str, model: str, requests_path: Path, output_path: Path):
+        """작업 파일의 요청을 순차 호출해 결과 파일 작성"""
+        try:
+            with open(requests_path, "r", encoding="utf-8") as src, \
+                    open(output_path, "w", encoding="utf-8") as dst:
+                for line in src:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    result: dict = {"key": record["key"]}
+                    try:
+                        contents, config = parse_request_payload(record["request"])
+                        response = generate_content(self.client, model, contents, config)
+                        result["response"] = response.model_dump(mode="json", by_alias=True, exclude_none=True)
+                    except Exception as e:
+                        result["error"] = {"code": getattr(e, "code", None) or 500, "message": str(e)}
+                    dst.write(json.dumps(result, ensure_ascii=False) + "\n")
+            state, error = "JOB_STATE_SUCCEEDED", None
+        except Exception as e:
+            state, error = "JOB_STATE_FAILED", str(e)
+
+        with self._lock:
+            self._jobs[job_name].update(state=state, error=error)
+
+    def state(self, job_name: str) -> tuple[str, Optional[str]]:
+        """작업 상태 (상태 이름, 오류 메시지)
+
+        Raises:
+            KeyError: 다른 프로세스에서 제출된 작업
+        """
+        with self._lock:
+            job = self._jobs[job_name]
+            return job["state"], job["error"]
+
+    def download(self, job_name: str, output_path: Path) -> Path:
+        """결과 파일 복사"""
+        with self._lock:
+            source = self._jobs[job_name]["output"]
+        output_path.write_bytes(source.read_bytes())
+        return output_path
+
+
+BACKENDS = {"gemini": GeminiBatchBackend, "local": LocalBatchBackend}
+
+
+class BatchJobRunner:
+    """요청 목록을 배치 작업으로 실행하고 결과를 요청 키별로 반환"""
+
+    def __init__(
+        self,
+        client: genai.Client,
+        model: str,
+        backend: Optional[str] = None,
+        work_dir: Optional[Path] = None,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None
+    ):
+        """실행기 초기화
+
+        Args:
+            client: genai 클라이언트
+            model: 모델 이름
+            backend: 백엔드 이름 (gemini, local - 없으면 설정에서 로드)
+            work_dir: 작업/결과 파일 디렉토리 (없으면 설정에서 로드)
+            poll_interval: 상태 확인 간격 (초)
+            timeout: 작업 완료 대기 제한 시간 (초)
+        """
+        backend = backend or settings.batch_backend
+        if backend not in BACKENDS:
+            raise ValueError(f"알 수 없는 배치 백엔드: {backend} ({', '.join(BACKENDS)} 중 선택)")
+        self.backend = BACKENDS[backend](client)
+        self.client = client
+        self.model = model
+        self.work_dir = Path(work_dir or settings.batch_dir)
+        self.poll_interval = poll_interval if poll_interval is not None else settings.batch_poll_interval
+        self.timeout = timeout if timeout is not None else settings.batch_timeout_hours * 3600
+
+    def run(
+        self,
+        requests: list[BatchRequest],
+        extract_text: Callable[[types.GenerateContentResponse], str],
+        display_name: str
+    ) -> dict[str, BatchResult]:
+        """배치 작업 실행
+
+        응답 캐시에 있는 요청은 제출하지 않으며, 새 응답은 캐시에 저장합니다.
+
+        Args:
+            requests: 요청 목록 (key는 목록 안에서 고유, 이미지는 인라인 파트)
+            extract_text: 응답에서 텍스트를 추출하는 함수 (온라인 호출과 동일하게 적용)
+            display_name: 작업 표시 이름
+
+        Returns:
+            요청 키별 결과
+
+        Raises:
+            BatchJobError: 작업 실패, 취소, 만료 또는 대기 시간 초과
+        """
+        cache = get_response_cache()
+        results: dict[str, BatchResult] = {}
+        pending: list[BatchRequest] = []
+        for request in requests:
+            cached = cache.get(request.cache_key) if cache and request.cache_key else None
+            if cached is not None:
+                results[request.key] = BatchResult(key=request.key, text=cached, cached=True)
+            else:
+                pending.append(request)
+
+        if results:
+            print(f"  응답 캐시 적중 {len(results)}건은 배치 작업에서 제외")
+        if not pending:
+            return results
+
+        requests_path = self._requests_path(pending, display_name)
+        job_name = self._resume(requests_path)
+        if job_name is None:
+            self._write_requests(self._attach_uploads(pending), requests_path)
+            job_name = self._submit(requests_path, display_name, len(pending))
+        self._wait(job_name)
+
+        output_path = self.backend.download(job_name, requests_path.with_name(f"{requests_path.stem}.output.jsonl"))
+        by_key = {request.key: request for request in pending}
+        for key, response, error in self._read_output(output_path):
+            request = by_key.get(key)
+            if request is None:
+                continue
+            if error is not None:
+                results[key] = BatchResult(key=key, error=error)
+                continue
+            text = extract_text(response)
+            usage = response_usage(self.model, response, price_ratio=settings.batch_price_ratio)
+            results[key] = BatchResult(key=key, text=text, usage=usage)
+            if cache and request.cache_key:
+                cache.put(request.cache_key, self.model, text)
+
+        for key in by_key.keys() - results.keys():
+            results[key] = BatchResult(key=key, error="배치 결과에 응답이 없습니다")
+
+        requests_path.with_suffix(".job").unlink(missing_ok=True)
+        return results
+
+    @staticmethod
+    def _requests_data(requests: list[BatchRequest]) -> bytes:
+        """작업 파일 내용 (JSONL)"""
+        lines = [
+            json.dumps({"key": request.key, "request": request_payload(request.contents, request.config)},
+                       ensure_ascii=False, sort_keys=True)
+            for request in requests
+        ]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _requests_path(self, requests: list[BatchRequest], display_name: str) -> Path:
+        """작업 파일 경로 (같은 요청 집합이면 같은 파일 이름, 인라인 이미지 기준)"""
+        digest = hashlib.sha256(self.model.encode("utf-8") + self._requests_data(requests)).hexdigest()[:16]
+        return self.work_dir / f"{display_name}-{digest}.jsonl"
+
+    def _attach_uploads(self, requests: list[BatchRequest]) -> list[BatchRequest]:
+        """제출할 요청의 인라인 이미지를 업로드 파일 참조로 교체 (업로드 대상이 아니면 그대로)"""
+        attached = []
+        for request in requests:
+            contents = []
+            for content in request.contents:
+                parts = [
+                    image_part(self.client, part.inline_data.data, part.inline_data.mime_type)
+                    if part.inline_data is not None and part.inline_data.data else part
+                    for part in content.parts or []
+                ]
+                contents.append(content.model_copy(update={"parts": parts}))
+            attached.append(BatchRequest(
+                key=request.key, contents=contents, config=request.config, cache_key=request.cache_key
+            ))
+        return attached
+
+    def _write_requests(self, requests: list[BatchRequest], requests_path: Path):
+        """작업 파일 작성 (업로드 URI가 바뀔 수 있으므로 제출할 때마다 다시 작성)"""
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = requests_path.with_name(f"{requests_path.name}.tmp")
+        tmp_path.write_bytes(self._requests_data(requests))
+        tmp_path.replace(requests_path)
+
+    def _resume(self, requests_path: Path) -> Optional[str]:
+        """같은 작업 파일로 제출된 작업이 진행 중이거나 성공했으면 작업 이름 반환"""
+        job_path = requests_path.with_suffix(".job")
+        if not job_path.exists():
+            return None
+        job_name = job_path.read_text(encoding="utf-8").strip()
+        try:
+            state, _ = self.backend.state(job_name)
+        except Exception:
+            return None
+        if state is None or state in TERMINAL_STATES - SUCCEEDED_STATES:
+            return None
+        print(f"  기존 배치 작업 재사용: {job_name} ({state})")
+        return job_name
+
+    def _submit(self, requests_path: Path, display_name: str, count: int) -> str:
+        """작업 파일 제출"""
+        job_path = requests_path.with_suffix(".job")
+        job_name = self.backend.submit(self.model, requests_path, display_name)
+        job_path.write_text(job_name, encoding="utf-8")
+        size_mb = requests_path.stat().st_size / 1024 / 1024
+        print(f"  배치 작업 제출: {job_name} (요청 {count}건, 작업 파일 {size_mb:.1f}MB)")
+        return job_name
+
+    def _wait(self, job_name: str):
+        """작업 종료까지 폴링
+
+        Raises:
+            BatchJobError: 성공 이외의 종료 상태 또는 대기 시간 초과
+        """
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        last_state = None
+        while True:
+            state, error = self.backend.state(job_name)
+            if state != last_state:
+                print(f"  배치 작업 상태: {state}")
+                last_state = state
+            if state in SUCCEEDED_STATES:
+                return
+            if state in TERMINAL_STATES:
+                raise BatchJobError(f"배치 작업 종료 ({state}): {error or job_name}")
+            if deadline is not None and time.monotonic() > deadline:
+                raise BatchJobError(f"배치 작업 대기 시간 초과: {job_name} ({state})")
+            time.sleep(self.poll_interval)
+
+    @staticmethod
+    def _read_output(output_path: Path):
+        """결과 파일 읽기
+
+        Yields:
+            (요청 키, 응답 또는 None, 오류 메시지 또는 None)
+        """
+        with open(output_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = record.get("key", "")
+                if record.get("response") is None:
+                    error = record.get("error") or record.get("status") or "응답 없음"
+                    message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                    yield key, None, message
+                else:
+                    yield key, types.GenerateContentResponse.model_validate(record["response"]), None
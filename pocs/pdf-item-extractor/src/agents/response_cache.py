@@ -0,0 +1,252 @@
+"""모델 응답 캐시
+
+결정적(temperature 고정, 동일 입력) 모델 호출의 응답 텍스트를 SQLite에 저장합니다.
+캐시 키는 (모델, 프롬프트, 이미지 바이트, 생성 설정)의 sha256 해시이므로
+같은 페이지/크롭 이미지를 다시 처리하면 모델을 호출하지 않습니다.
+항목은 TTL이 지나면 만료되고, 전체 크기가 예산을 넘으면 오래 사용되지 않은 순으로 제거됩니다.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from ..core.config import settings
+
+
+def response_cache_key(model: str, prompt: str, image_bytes: bytes, config: Any = None) -> str:
+    """요청 콘텐츠 해시 키
+
+    Args:
+        model: 모델 이름
+        prompt: 프롬프트 텍스트
+        image_bytes: 이미지 바이트
+        config: GenerateContentConfig (None 가능)
+
+    Returns:
+        16진수 sha256 해시
+    """
+    digest = hashlib.sha256()
+    for part in (
+        model.encode("utf-8"),
+        prompt.encode("utf-8"),
+        hashlib.sha256(image_bytes).digest(),
+        config.model_dump_json(exclude_none=True).encode("utf-8") if config is not None else b"",
+    ):
+        # 필드 경계를 구분하기 위해 길이를 함께 기록
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def parts_digest(parts: Iterable[bytes]) -> bytes:
+    """여러 파트로 된 요청 입력의 결합 해시 (response_cache_key의 image_bytes로 사용)
+
+    파트마다 sha256 다이제스트를 길이와 함께 기록하므로
+    파트 경계만 다른 입력(b"ab" + b"c"와 b"a" + b"bc")이 같은 키가 되지 않습니다.
+
+    Args:
+        parts: 요청 순서대로의 파트 바이트
+
+    Returns:
+        sha256 다이제스트
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        part_digest = hashlib.sha256(part).digest()
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part_digest)
+    return digest.digest()
+
+
+class ResponseCache:
+    """SQLite 기반 응답 캐시 (TTL + 크기 기반 LRU 제거)"""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float,
+        max_bytes: int,
+        bypass: bool = False
+    ):
+        """캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            ttl_seconds: 항목 유효 시간 (초, 0이면 무제한)
+            max_bytes: 응답 텍스트 총 크기 예산 (byte)
+            bypass: True면 조회하지 않고 새 응답으로 덮어씀
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.bypassed = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회
+
+        Args:
+            key: response_cache_key() 결과
+
+        Returns:
+            캐시된 응답 텍스트 (없거나 만료/우회 시 None)
+        """
+        with self._lock:
+            if self.bypass:
+                self.bypassed += 1
+                return None
+
+            row = self._conn.execute(
+                "SELECT text, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            text, created_at = row
+            now = time.time()
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return text
+
+    def put(self, key: str, model: str, text: str):
+        """응답 저장 후 예산 초과분 제거
+
+        Args:
+            key: response_cache_key() 결과
+            model: 모델 이름
+            text: 응답 텍스트 (빈 응답은 저장하지 않음)
+        """
+        if not text:
+            return
+
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, text, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, text, size, now, now)
+            )
+            self.writes += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """만료 항목과 예산 초과분 제거 (lock 보유 상태에서 호출)"""
+        if self.ttl_seconds:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self.expired += cursor.rowcount
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # 오래 사용되지 않은 순으로 제거
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """캐시 통계 반환"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "bypassed": self.bypassed,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 프로세스 전역 캐시 (최초 사용 시 생성)
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """설정에 따른 전역 응답 캐시 반환
+
+    Returns:
+        ResponseCache (settings.response_cache_enabled가 False면 None)
+    """
+    global _cache
+    if not settings.response_cache_enabled:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                path=settings.response_cache_path,
+                ttl_seconds=settings.response_cache_ttl_hours * 3600,
+                max_bytes=settings.response_cache_max_mb * 1024 * 1024,
+                bypass=settings.response_cache_bypass
+            )
+        return _cache
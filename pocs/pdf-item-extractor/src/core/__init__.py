@@ -1,3 +1,5 @@
 """Core modules"""
 from .config import settings
 from .schemas import *
+from .stage_runner import Stage, StagedRunner
+from .journal import PageJournal
@@ -1,12 +1,16 @@
 """설정 관리"""
 
+import os
 from pathlib import Path
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from gemini_shared.config import SharedSettings, configure
 
 
-class Settings(BaseSettings):
-    """애플리케이션 설정"""
+class Settings(SharedSettings):
+    """애플리케이션 설정
+
+    모델 호출 공통 설정(엔드포인트, 속도 제한, 재시도, 캐시, 업로드, 가격표)은 SharedSettings에 있습니다.
+    """
 
     # API 키
     google_api_key: str = Field(default="", description="Google API Key")
@@ -18,7 +22,102 @@ class Settings(BaseSettings):
     )
 
     # PDF 처리 설정
-    pdf_dpi: int = Field(default=200, description="PDF 렌더링 DPI")
+    pdf_dpi: int = Field(default=200, description="PDF 렌더링 DPI (문항/지문 크롭, bbox 픽셀 좌표 기준)")
+    segment_dpi: int = Field(
+        default=150,
+        description="세그멘테이션 요청/시각화용 페이지 렌더링 DPI (box_2d는 정규화 좌표, 0이면 pdf_dpi 사용)"
+    )
+    render_workers: int = Field(
+        default=min(os.cpu_count() or 1, 8),
+        description="페이지 렌더링 워커 프로세스 수"
+    )
+
+    # 모델 호출 기록 위치 (POC 출력 디렉토리 기준)
+    recordings_dir: Path = Field(
+        default=Path(__file__).parent.parent.parent / "output" / "recordings",
+        description="record/replay 모드의 요청/응답 기록 디렉토리"
+    )
+
+    # 모델 요청 이미지 인코딩 설정 (토큰/픽셀 예산)
+    image_encoding_enabled: bool = Field(default=True, description="모델 요청 이미지를 예산에 맞춰 재인코딩할지 여부 (끄면 원본 PNG 전송)")
+    image_token_budget: int = Field(default=1548, description="요청 이미지 1장의 입력 토큰 예산 (768px 타일당 258토큰, 0이면 제한 없음)")
+    image_max_pixels: int = Field(default=0, description="요청 이미지 최대 픽셀 수 (0이면 제한 없음)")
+    image_encoding_format: str = Field(default="auto", description="요청 이미지 포맷 (auto, png, jpeg, webp)")
+    image_quality: int = Field(default=85, description="JPEG/WebP 인코딩 품질")
+    image_palette_colors: int = Field(default=16, description="그레이스케일 이미지 팔레트 양자화 단계 수 (0이면 양자화 안함)")
+
+    # 배치 작업 비용 설정 (모델별 가격표는 SharedSettings.model_prices)
+    batch_price_ratio: float = Field(default=0.5, description="배치 작업 결과에 적용할 가격 비율 (배치 할인)")
+
+    # 배치 예측 작업 설정 (대량 오프라인 처리)
+    batch_backend: str = Field(default="gemini", description="배치 작업 백엔드 (gemini, local)")
+    batch_poll_interval: float = Field(default=30.0, description="배치 작업 상태 확인 간격 (초)")
+    batch_timeout_hours: float = Field(default=24.0, description="배치 작업 완료 대기 제한 시간 (시간, 0이면 무제한)")
+    batch_dir: Path = Field(
+        default=Path(__file__).parent.parent.parent / "output" / "batches",
+        description="배치 작업/결과 파일 디렉토리"
+    )
+
+    # 문항 파싱 묶음 요청 설정 (작은 문항 크롭 여러 개를 요청 1건으로 파싱)
+    parse_pack_mode: str = Field(
+        default="off", description="문항 파싱 묶음 방식 (off, mosaic: 라벨 모자이크 이미지 1장, parts: 라벨별 이미지 파트)"
+    )
+    parse_pack_max_items: int = Field(default=6, description="묶음 요청 1건에 넣을 최대 문항 수")
+    parse_pack_token_budget: int = Field(default=2064, description="묶음 요청 1건의 이미지 입력 토큰 예산")
+    parse_pack_max_crop_tokens: int = Field(
+        default=516, description="묶음 대상 크롭의 최대 예상 토큰 (초과하는 크롭은 단독 요청)"
+    )
+    parse_mosaic_width: int = Field(default=1536, description="모자이크 이미지 최대 너비 (px)")
+
+    # 스트리밍 응답 설정
+    stream_responses: bool = Field(
+        default=False, description="세그멘테이션/파싱 응답을 스트리밍으로 받아 완성된 문항/지문부터 처리할지 여부"
+    )
+
+    # 텍스트 레이어 분할 설정
+    text_segmentation: bool = Field(default=True, description="텍스트 레이어 기반 문항 분할 사용 여부")
+    text_segment_min_confidence: float = Field(
+        default=0.8,
+        description="텍스트 레이어 분할 결과 채택 최소 신뢰도 (미만이면 Agentic Vision 사용)"
+    )
+
+    # 단 타일 세그멘테이션 설정 (2단 페이지를 단별 요청으로 분할)
+    column_tiles: bool = Field(
+        default=False, description="단 구분선이 있는 페이지를 단별 타일로 나누어 동시에 세그멘테이션할지 여부"
+    )
+    column_tile_margin: float = Field(default=6.0, description="단 타일에 포함할 단 경계 바깥 여백 (pt)")
+    column_tile_token_budget: int = Field(
+        default=774, description="단 타일 1장의 입력 토큰 예산 (0이면 image_token_budget 사용)"
+    )
+
+    # bbox 보정 설정
+    bbox_snap: bool = Field(default=True, description="모델 bbox를 PDF 텍스트/도형 경계에 맞춰 보정")
+
+    # 단계별 실행 설정
+    segment_max_in_flight: int = Field(default=4, description="P2-SEGMENT 동시 모델 요청 수")
+    output_workers: int = Field(default=2, description="P3-CROP/P4-VISUALIZE 동시 실행 수")
+    stage_queue_size: int = Field(default=4, description="단계 사이 큐 최대 크기")
+
+    # 페이지 캐시 설정
+    page_cache_max_mb: int = Field(default=512, description="페이지 메모리 캐시 최대 크기 (MB)")
+    page_cache_persist: bool = Field(default=True, description="페이지 디스크 캐시 사용 여부")
+    page_cache_disk_max_mb: int = Field(
+        default=2048, description="페이지 디스크 캐시 최대 크기 (MB, 초과 시 오래 사용하지 않은 파일부터 삭제, 0이면 제한 없음)"
+    )
+    page_cache_dir: Path = Field(
+        default=Path(__file__).parent.parent.parent / "output" / ".page_cache",
+        description="페이지 디스크 캐시 디렉토리"
+    )
+
+    # 모델 응답 캐시 설정 (결정적 호출)
+    response_cache_enabled: bool = Field(default=True, description="모델 응답 캐시 사용 여부")
+    response_cache_bypass: bool = Field(default=False, description="캐시를 조회하지 않고 새 응답으로 갱신")
+    response_cache_ttl_hours: float = Field(default=168.0, description="응답 캐시 유효 시간 (시간, 0이면 무제한)")
+    response_cache_max_mb: int = Field(default=256, description="응답 캐시 최대 크기 (MB)")
+    response_cache_path: Path = Field(
+        default=Path(__file__).parent.parent.parent / "output" / ".response_cache.sqlite3",
+        description="응답 캐시 SQLite 파일 경로"
+    )
 
     # 출력 설정
     output_dir: Path = Field(
@@ -38,4 +137,5 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
-settings = Settings()
+# 공유 모델 호출 모듈도 이 인스턴스를 사용
+settings = configure(Settings())
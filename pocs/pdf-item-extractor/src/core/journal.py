@@ -0,0 +1,125 @@
+"""페이지 단위 체크포인트 저널
+
+페이지 세그멘테이션이 끝날 때마다 결과를 JSONL 파일에 한 줄씩 추가합니다.
+중단 후 재실행 시 완료된 페이지는 모델을 다시 호출하지 않고 재사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from .schemas import PageRecord
+
+
+class PageJournal:
+    """추가 전용(append-only) 페이지 저널"""
+
+    def __init__(self, journal_path: Path):
+        """저널 초기화
+
+        Args:
+            journal_path: 저널 파일 경로 (.jsonl)
+        """
+        self.journal_path = Path(journal_path)
+        self._lock = threading.Lock()
+        # 중단으로 잘린 마지막 줄 확인 여부 (첫 추가 시 1회)
+        self._tail_checked = False
+
+    def load(
+        self,
+        pdf_hash: str,
+        dpi: int,
+        model_version: str,
+        settings_hash: str = ""
+    ) -> dict[int, PageRecord]:
+        """완료된 페이지 기록 로드
+
+        PDF 내용, DPI, 세그멘테이션 설정이 현재 실행과 같은 기록만 반환합니다.
+        모델은 Agentic Vision으로 분할한 페이지에만 비교합니다 (텍스트 레이어 분할은 모델과 무관).
+        같은 페이지가 여러 번 기록된 경우 마지막 기록을 사용합니다.
+
+        Args:
+            pdf_hash: PDF 콘텐츠 해시
+            dpi: 렌더링 DPI (bbox 픽셀 좌표의 기준)
+            model_version: 모델 이름
+            settings_hash: 세그멘테이션 설정 해시 (segmentation_settings_hash())
+
+        Returns:
+            {페이지 번호: 페이지 기록}
+        """
+        records: dict[int, PageRecord] = {}
+        if not self.journal_path.exists():
+            return records
+
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = PageRecord.model_validate_json(line)
+                except ValidationError:
+                    # 중단으로 잘린 마지막 줄 등은 무시
+                    continue
+
+                if (record.pdf_hash == pdf_hash
+                        and record.dpi == dpi
+                        and record.settings_hash == settings_hash
+                        and (record.segmenter == "text_layer" or record.model_version == model_version)):
+                    records[record.page_number] = record
+
+        return records
+
+    def append(self, record: PageRecord):
+        """페이지 기록 추가 (즉시 디스크에 반영)
+
+        Args:
+            record: 페이지 기록
+        """
+        line = record.model_dump_json() + "\n"
+        with self._lock:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._tail_checked:
+                # 잘린 마지막 줄에 이어 쓰지 않도록 새 줄에서 시작
+                if not self._ends_with_newline():
+                    line = "\n" + line
+                self._tail_checked = True
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self):
+        """저널 삭제"""
+        with self._lock:
+            self.journal_path.unlink(missing_ok=True)
+            self._tail_checked = True
+
+    def _ends_with_newline(self) -> bool:
+        """저널이 비어 있거나 줄바꿈으로 끝나는지 여부"""
+        try:
+            with open(self.journal_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+
+def segmentation_settings_hash(values: dict) -> str:
+    """세그멘테이션 결과에 영향을 주는 설정값 해시
+
+    Args:
+        values: {설정 이름: 값} (JSON 직렬화 가능한 값)
+
+    Returns:
+        16자리 16진수 해시
+    """
+    data = json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:16]
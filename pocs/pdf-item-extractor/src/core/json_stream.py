@@ -0,0 +1,108 @@
+"""증분 JSON 파서
+
+스트리밍 응답 텍스트를 청크 단위로 받아, 배열 원소인 객체가 닫히는 즉시 반환합니다.
+대상 배열은 최상위 배열(키 None)과 최상위 객체의 배열 값(예: "items", "passages")입니다.
+첫 '{' 또는 '[' 이전의 텍스트(```json 펜스 등)와 최상위 값 이후의 텍스트는 무시합니다.
+"""
+
+import json
+from typing import Optional
+
+
+class IncrementalJSONParser:
+    """배열 원소 객체 단위 증분 JSON 파서"""
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._array_key: Optional[str] = None
+        self._object_start: Optional[int] = None
+        self._done = False
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트"""
+        return self._text
+
+    @property
+    def done(self) -> bool:
+        """최상위 값이 닫혔는지 여부"""
+        return self._done
+
+    def feed(self, chunk: str) -> list[tuple[Optional[str], dict]]:
+        """텍스트 청크 추가
+
+        Args:
+            chunk: 응답 텍스트 조각
+
+        Returns:
+            이번 청크에서 닫힌 (배열 키, 객체) 목록 (최상위 배열이면 키는 None)
+        """
+        self._text += chunk
+        completed = []
+        text = self._text
+
+        while self._pos < len(text) and not self._done:
+            char = text[self._pos]
+            index = self._pos
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._stack == ["{"]:
+                        self._last_key = self._decode_string(self._string_start, index + 1)
+                continue
+
+            if not self._stack:
+                # 최상위 값 이전의 펜스/설명 텍스트 건너뛰기
+                if char in "{[":
+                    self._stack.append(char)
+                    self._array_key = None
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = index
+            elif char in "{[":
+                if char == "[" and self._stack == ["{"]:
+                    self._array_key = self._last_key
+                if char == "{" and self._is_target_array():
+                    self._object_start = index
+                self._stack.append(char)
+            elif char in "}]":
+                self._stack.pop()
+                if char == "}" and self._object_start is not None and self._is_target_array():
+                    value = self._decode(self._object_start, index + 1)
+                    self._object_start = None
+                    if isinstance(value, dict):
+                        completed.append((self._array_key, value))
+                if not self._stack:
+                    self._done = True
+
+        return completed
+
+    def _is_target_array(self) -> bool:
+        """현재 위치가 원소를 내보낼 배열 바로 안인지 여부"""
+        return self._stack == ["["] or self._stack == ["{", "["]
+
+    def _decode(self, start: int, end: int):
+        """텍스트 구간을 JSON 값으로 변환 (실패 시 None)"""
+        try:
+            return json.loads(self._text[start:end])
+        except json.JSONDecodeError:
+            return None
+
+    def _decode_string(self, start: int, end: int) -> Optional[str]:
+        """JSON 문자열 구간 변환"""
+        value = self._decode(start, end)
+        return value if isinstance(value, str) else None
@@ -5,6 +5,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel, Field
+from gemini_shared.schemas import TokenUsage  # noqa: F401 (POC 스키마에서 함께 사용)
 
 
 class ItemType(str, Enum):
@@ -47,6 +48,7 @@ class ParsedItem(BaseModel):
     boxed_content: list[ContentBlock] = Field(default_factory=list, description="보기 박스 내용")
     boxed_area: Optional[list[int]] = Field(None, description="보기 박스 전체 bbox")
     source_image: Optional[str] = Field(None, description="원본 크롭 이미지 경로")
+    usage: Optional[TokenUsage] = Field(None, description="파싱 호출 토큰 사용량/비용")
 
 
 class BoundingBox(BaseModel):
@@ -111,6 +113,8 @@ class ExtractionResult(BaseModel):
     layouts: list[PageLayout] = Field(default_factory=list, description="페이지 레이아웃")
     extracted_at: datetime = Field(default_factory=datetime.now, description="추출 시각")
     model_version: str = Field(default="", description="사용된 모델")
+    usage: TokenUsage = Field(default_factory=TokenUsage, description="실행 전체 토큰 사용량/비용")
+    usage_by_stage: dict[str, TokenUsage] = Field(default_factory=dict, description="단계별 토큰 사용량/비용")
 
 
 class AgenticStep(BaseModel):
@@ -126,3 +130,19 @@ class AgenticLog(BaseModel):
     steps: list[AgenticStep] = Field(default_factory=list, description="실행 단계")
     total_iterations: int = Field(default=0, description="총 반복 횟수")
     success: bool = Field(default=False, description="성공 여부")
+    image_encoding: Optional[dict] = Field(None, description="요청 이미지 인코딩 (포맷, 크기, 예상 토큰)")
+    usage: Optional[TokenUsage] = Field(None, description="페이지 세그멘테이션 토큰 사용량/비용")
+
+
+class PageRecord(BaseModel):
+    """페이지 처리 결과 기록 (체크포인트 저널용)"""
+    page_number: int = Field(..., description="페이지 번호")
+    pdf_hash: str = Field(..., description="PDF 콘텐츠 해시")
+    dpi: int = Field(..., description="렌더링 DPI")
+    model_version: str = Field(..., description="사용된 모델 (텍스트 레이어 분할 페이지는 빈 문자열)")
+    segmenter: str = Field(default="agentic_vision", description="사용된 분할 방식 (text_layer, agentic_vision)")
+    settings_hash: str = Field(default="", description="세그멘테이션 설정 해시")
+    items: list[ExtractedItem] = Field(default_factory=list, description="추출된 문항 목록")
+    passages: list[PassageInfo] = Field(default_factory=list, description="공유 지문 목록")
+    agentic_log: Optional[AgenticLog] = Field(None, description="Agentic Vision 실행 로그")
+    completed_at: datetime = Field(default_factory=datetime.now, description="완료 시각")
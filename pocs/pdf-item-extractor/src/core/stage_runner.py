@@ -0,0 +1,138 @@
+"""단계별 생산자/소비자 실행기
+
+각 단계(stage)를 스레드 워커로 실행하고 단계 사이를 크기 제한 큐로 연결합니다.
+앞 단계가 다음 작업을 처리하는 동안 뒷 단계가 이전 작업을 처리하므로
+렌더링, 모델 호출, 파일 저장이 서로 겹쳐서 실행됩니다.
+"""
+
+import queue
+import threading
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+
+# 단계 종료 표시
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """파이프라인 단계 정의
+
+    func가 None을 반환하면 해당 작업은 다음 단계로 전달되지 않습니다.
+    expand=True이면 func의 반환값(iterable)의 각 원소를 개별 작업으로 전달합니다.
+    """
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    expand: bool = False
+
+
+@dataclass
+class StageError:
+    """단계 실행 중 발생한 오류"""
+    stage: str
+    task: Any
+    error: Exception
+    traceback: str = field(default="", repr=False)
+
+
+class StagedRunner:
+    """크기 제한 큐로 연결된 단계별 실행기"""
+
+    def __init__(self, stages: list[Stage], queue_size: int = 4):
+        """실행기 초기화
+
+        Args:
+            stages: 실행 순서대로 나열된 단계 목록
+            queue_size: 단계 사이 큐의 최대 크기
+        """
+        if not stages:
+            raise ValueError("최소 1개 이상의 단계가 필요합니다.")
+
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.errors: list[StageError] = []
+        self._errors_lock = threading.Lock()
+
+    def run(self, inputs: Iterable[Any]) -> list[Any]:
+        """모든 입력을 단계별로 처리
+
+        Args:
+            inputs: 첫 단계에 전달할 입력
+
+        Returns:
+            마지막 단계의 결과 목록 (완료 순서)
+        """
+        self.errors = []
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results: list[Any] = []
+        results_lock = threading.Lock()
+
+        threads: list[threading.Thread] = []
+        for idx, stage in enumerate(self.stages):
+            in_q = queues[idx]
+            out_q = queues[idx + 1] if idx + 1 < len(self.stages) else None
+            workers = max(1, stage.workers)
+            remaining = [workers]
+            remaining_lock = threading.Lock()
+
+            def emit(value, out_q=out_q):
+                if out_q is not None:
+                    out_q.put(value)
+                else:
+                    with results_lock:
+                        results.append(value)
+
+            def worker(stage=stage, in_q=in_q, out_q=out_q, emit=emit,
+                       remaining=remaining, remaining_lock=remaining_lock):
+                while True:
+                    task = in_q.get()
+                    if task is _DONE:
+                        # 다른 워커도 종료할 수 있도록 재전달
+                        in_q.put(_DONE)
+                        break
+                    try:
+                        output = stage.func(task)
+                        if output is None:
+                            continue
+                        if stage.expand:
+                            for value in output:
+                                emit(value)
+                        else:
+                            emit(output)
+                    except Exception as e:
+                        with self._errors_lock:
+                            self.errors.append(StageError(
+                                stage=stage.name,
+                                task=task,
+                                error=e,
+                                traceback=traceback.format_exc()
+                            ))
+
+                # 마지막 워커가 다음 단계에 종료 전달
+                with remaining_lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last and out_q is not None:
+                    out_q.put(_DONE)
+
+            for n in range(workers):
+                thread = threading.Thread(
+                    target=worker,
+                    name=f"stage-{stage.name}-{n}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        # 첫 단계에 입력 공급 (큐가 가득 차면 대기)
+        for task in inputs:
+            queues[0].put(task)
+        queues[0].put(_DONE)
+
+        for thread in threads:
+            thread.join()
+
+        return results
@@ -1,2 +1,5 @@
 """Extractor modules"""
 from .pdf_extractor import PDFExtractor
+from .page_cache import PageCache
+from .text_segmenter import TextLayerSegmenter
+from .bbox_refiner import BBoxRefiner
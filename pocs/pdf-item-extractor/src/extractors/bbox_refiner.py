@@ -0,0 +1,156 @@
+"""bbox 보정기
+
+모델이 반환한 문항/지문 bbox를 PDF 텍스트 라인, 이미지, 벡터 도형 경계에 맞춰
+보정(snap)합니다. 느슨하거나 조금 잘린 bbox를 재호출 없이 바로잡고,
+텍스트 라인을 가로지르는 bbox는 표시합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..core.schemas import BoundingBox, ExtractedItem, PassageInfo
+from .pdf_extractor import PDFExtractor
+
+
+Rect = tuple[float, float, float, float]
+
+
+@dataclass
+class RefineResult:
+    """bbox 보정 결과"""
+    bbox: BoundingBox
+    snapped: bool = False
+    cut_lines: list[str] = field(default_factory=list)
+
+
+def _overlap_ratio(element: Rect, box: Rect) -> float:
+    """element 면적 중 box와 겹치는 비율"""
+    width = min(element[2], box[2]) - max(element[0], box[0])
+    height = min(element[3], box[3]) - max(element[1], box[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    area = (element[2] - element[0]) * (element[3] - element[1])
+    return width * height / area if area > 0 else 0.0
+
+
+class BBoxRefiner:
+    """PDF 요소 경계 기반 bbox 보정기"""
+
+    # 라인 면적의 이 비율 이상이 bbox 안에 있으면 해당 라인을 포함
+    INCLUDE_RATIO = 0.5
+    # 이 비율 이상 걸친 라인을 제외하면 "라인 절단"으로 표시
+    CUT_RATIO = 0.2
+    # 보정 bbox 여백 (pt)
+    PADDING = 2.0
+
+    def __init__(self, extractor: PDFExtractor):
+        """보정기 초기화
+
+        Args:
+            extractor: 페이지 요소를 제공할 PDF 추출기
+        """
+        self.extractor = extractor
+        self.zoom = extractor.dpi / 72.0
+
+    def refine_bbox(
+        self,
+        bbox: BoundingBox,
+        elements: dict
+    ) -> RefineResult:
+        """bbox를 내부 요소 경계에 맞춤
+
+        Args:
+            bbox: 픽셀 좌표 bbox
+            elements: get_page_elements() 결과
+
+        Returns:
+            보정 결과 (포함 요소가 없으면 원본 bbox 유지)
+        """
+        box = (
+            bbox.x1 / self.zoom, bbox.y1 / self.zoom,
+            bbox.x2 / self.zoom, bbox.y2 / self.zoom
+        )
+
+        included: list[Rect] = []
+        cut_lines: list[str] = []
+        for line in elements["lines"]:
+            ratio = _overlap_ratio(line["bbox"], box)
+            if ratio >= self.INCLUDE_RATIO:
+                included.append(line["bbox"])
+            elif ratio >= self.CUT_RATIO:
+                cut_lines.append(line["text"].strip())
+
+        # 이미지/도형은 bbox 안에 대부분 들어온 경우만 포함 (단 구분선, 테두리 제외)
+        for rect in elements["images"] + elements["drawings"]:
+            if _overlap_ratio(rect, box) >= 0.9:
+                included.append(rect)
+
+        if not included:
+            return RefineResult(bbox=bbox, cut_lines=cut_lines)
+
+        width, height = elements["rect"]
+        snapped = (
+            max(0.0, min(r[0] for r in included) - self.PADDING),
+            max(0.0, min(r[1] for r in included) - self.PADDING),
+            min(width, max(r[2] for r in included) + self.PADDING),
+            min(height, max(r[3] for r in included) + self.PADDING),
+        )
+
+        # 보정 후에도 일부만 걸치는 라인 (다른 요소와 겹쳐 배치된 경우)
+        for line in elements["lines"]:
+            ratio = _overlap_ratio(line["bbox"], snapped)
+            text = line["text"].strip()
+            if 0.05 < ratio < 0.95 and text not in cut_lines:
+                cut_lines.append(text)
+
+        return RefineResult(
+            bbox=BoundingBox(
+                x1=int(snapped[0] * self.zoom), y1=int(snapped[1] * self.zoom),
+                x2=int(snapped[2] * self.zoom + 1), y2=int(snapped[3] * self.zoom + 1)
+            ),
+            snapped=True,
+            cut_lines=cut_lines
+        )
+
+    def refine_page(
+        self,
+        page_number: int,
+        items: list[ExtractedItem],
+        passages: Optional[list[PassageInfo]] = None,
+        elements: Optional[dict] = None
+    ) -> list[str]:
+        """페이지의 문항/지문 bbox 일괄 보정
+
+        라인을 절단하는 문항은 confidence를 절반으로 낮춥니다.
+
+        Args:
+            page_number: 페이지 번호
+            items: 문항 목록 (bbox가 보정됨)
+            passages: 지문 목록 (bbox, bbox_list가 보정됨)
+            elements: 미리 추출한 페이지 요소 (없으면 새로 추출, 같은 페이지를 나눠 보정할 때 재사용)
+
+        Returns:
+            라인 절단 경고 메시지 목록
+        """
+        if elements is None:
+            elements = self.extractor.get_page_elements(page_number)
+        warnings: list[str] = []
+
+        for item in items:
+            result = self.refine_bbox(item.bbox, elements)
+            item.bbox = result.bbox
+            if result.cut_lines:
+                item.confidence = round(item.confidence * 0.5, 3)
+                warnings.append(f"문항 {item.item_number}: 텍스트 라인 절단 "
+                                f"{len(result.cut_lines)}개 ({result.cut_lines[0][:20]})")
+
+        for passage in passages or []:
+            main = self.refine_bbox(passage.bbox, elements)
+            refined = [self.refine_bbox(bbox, elements) for bbox in passage.bbox_list]
+            passage.bbox = main.bbox
+            passage.bbox_list = [r.bbox for r in refined]
+            cut_count = sum(len(r.cut_lines) for r in refined) or len(main.cut_lines)
+            if cut_count:
+                warnings.append(f"지문 [{passage.item_range}]: 텍스트 라인 절단 {cut_count}개")
+
+        return warnings
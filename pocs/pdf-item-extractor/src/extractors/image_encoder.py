@@ -0,0 +1,46 @@
+"""모델 요청 이미지 인코딩 (설정 적용)
+
+인코더 본체는 gemini_shared.image_encoder에 있으며, 여기서는 이 POC의
+settings.image_* 값(예산, 포맷, 품질, 팔레트)을 인자로 넘깁니다.
+"""
+
+from typing import Optional
+
+from PIL import Image
+from gemini_shared.image_encoder import EncodedImage, encode_for_model, original_image
+
+from ..core.config import settings
+
+
+def encode_for_request(
+    image: Image.Image,
+    source_bytes: Optional[bytes] = None,
+    source_mime_type: Optional[str] = None,
+    token_budget: Optional[int] = None
+) -> EncodedImage:
+    """설정(settings.image_*)에 따라 모델 요청용 이미지 인코딩
+
+    settings.image_encoding_enabled가 꺼져 있으면 원본 크기 PNG(또는 원본 바이트)를 그대로 사용합니다.
+
+    Args:
+        image: 원본 이미지
+        source_bytes: 원본 인코딩 바이트
+        source_mime_type: 원본 인코딩 MIME 타입
+        token_budget: 이미지 토큰 예산 (없으면 settings.image_token_budget)
+
+    Returns:
+        인코딩된 이미지
+    """
+    if not settings.image_encoding_enabled:
+        return original_image(image, source_bytes, source_mime_type)
+
+    return encode_for_model(
+        image,
+        token_budget=token_budget or settings.image_token_budget,
+        max_pixels=settings.image_max_pixels,
+        fmt=settings.image_encoding_format,
+        quality=settings.image_quality,
+        palette_colors=settings.image_palette_colors,
+        source_bytes=source_bytes,
+        source_mime_type=source_mime_type
+    )
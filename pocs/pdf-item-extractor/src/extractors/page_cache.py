@@ -0,0 +1,297 @@
+"""페이지 래스터 캐시
+
+메모리 예산(byte) 기반 LRU 캐시와 선택적 디스크 캐시를 제공합니다.
+디스크 캐시도 크기 제한이 있으며, 초과하면 오래 사용하지 않은 파일(mtime 기준)부터 삭제합니다.
+캐시 키는 (PDF 콘텐츠 해시, 페이지 번호, DPI, 포맷)입니다.
+포맷이 "raw"인 항목은 인코딩되지 않은 PageRaster이며 메모리에만 저장합니다.
+디스크에는 같은 페이지를 PNG("png" 포맷 키)로 저장하고, 다음 실행에서 디코딩해 래스터로 씁니다.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from .page_renderer import PageRaster
+
+
+PageKey = tuple[str, int, int, str]
+CacheValue = Union[bytes, PageRaster]
+
+
+def _sizeof(data: CacheValue) -> int:
+    """캐시 항목 크기 (byte)"""
+    return data.nbytes if isinstance(data, PageRaster) else len(data)
+
+
+def hash_pdf(pdf_path: Path) -> str:
+    """PDF 파일 콘텐츠 해시 (sha256)
+
+    Args:
+        pdf_path: PDF 파일 경로
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PageCache:
+    """페이지 래스터 캐시 (메모리 LRU + 디스크)"""
+
+    def __init__(self, max_bytes: int, disk_dir: Optional[Path] = None, disk_max_bytes: int = 0):
+        """캐시 초기화
+
+        Args:
+            max_bytes: 메모리 캐시 최대 크기 (byte)
+            disk_dir: 디스크 캐시 디렉토리 (None이면 메모리만 사용)
+            disk_max_bytes: 디스크 캐시 최대 크기 (byte, 0이면 제한 없음)
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+
+        self._entries: OrderedDict[PageKey, CacheValue] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # 디스크 캐시 사용량 (첫 쓰기 때 디렉토리를 스캔해 초기화)
+        self._disk_size: Optional[int] = None
+        self._disk_lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+    def get(self, key: PageKey) -> Optional[CacheValue]:
+        """캐시 조회 (메모리 → 디스크 순)
+
+        Args:
+            key: (pdf_hash, page_number, dpi, format)
+
+        Returns:
+            캐시된 바이트 또는 PageRaster (없으면 None)
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._read_disk(key) if key[3] != "raw" else None
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(key, data)
+        return data
+
+    def get_raster(self, key: PageKey) -> Optional[PageRaster]:
+        """페이지 래스터 조회 (메모리 → 디스크의 PNG 페이지 순)
+
+        디스크에서 읽은 PNG는 디코딩한 래스터로만 메모리에 올립니다.
+
+        Args:
+            key: (pdf_hash, page_number, dpi, "raw")
+
+        Returns:
+            페이지 래스터 (없으면 None)
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        encoded = self._read_disk(self._encoded_key(key))
+        raster = PageRaster.from_encoded(encoded) if encoded is not None else None
+        with self._lock:
+            if raster is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(key, raster)
+        return raster
+
+    def put_raster(self, key: PageKey, raster: PageRaster, encoded: Optional[bytes] = None):
+        """페이지 래스터 저장
+
+        Args:
+            key: (pdf_hash, page_number, dpi, "raw")
+            raster: 페이지 래스터 (메모리에 저장)
+            encoded: 같은 페이지의 PNG 바이트 (있으면 디스크에만 저장)
+        """
+        with self._lock:
+            self._insert(key, raster)
+
+        if encoded is not None:
+            self._write_disk(self._encoded_key(key), encoded)
+
+    @property
+    def persistent(self) -> bool:
+        """디스크 캐시 사용 여부"""
+        return self.disk_dir is not None
+
+    def peek(self, key: PageKey) -> Optional[CacheValue]:
+        """메모리 캐시만 조회 (통계/LRU 순서 변경 없음)"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: PageKey, data: CacheValue, persist: bool = True):
+        """캐시 저장
+
+        Args:
+            key: (pdf_hash, page_number, dpi, format)
+            data: 저장할 바이트 또는 PageRaster
+            persist: 디스크 캐시에도 저장할지 여부 (PageRaster는 저장하지 않음)
+        """
+        with self._lock:
+            self._insert(key, data)
+
+        if persist and isinstance(data, bytes):
+            self._write_disk(key, data)
+
+    def discard(self, key: PageKey):
+        """메모리 캐시에서 항목 제거"""
+        with self._lock:
+            data = self._entries.pop(key, None)
+            if data is not None:
+                self._size -= _sizeof(data)
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 캐시는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """현재 메모리 사용량 (byte)"""
+        return self._size
+
+    def stats(self) -> dict:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_evictions": self.disk_evictions,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def _insert(self, key: PageKey, data: CacheValue):
+        """LRU 삽입 및 예산 초과분 제거 (lock 보유 상태에서 호출)"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= _sizeof(old)
+
+        # 예산보다 큰 항목은 메모리에 두지 않음
+        size = _sizeof(data)
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = data
+        self._size += size
+
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= _sizeof(evicted)
+            self.evictions += 1
+
+    @staticmethod
+    def _encoded_key(key: PageKey) -> PageKey:
+        """래스터 키에 대응하는 디스크 PNG 키"""
+        pdf_hash, page_number, dpi, _ = key
+        return (pdf_hash, page_number, dpi, "png")
+
+    def _disk_path(self, key: PageKey) -> Optional[Path]:
+        """디스크 캐시 파일 경로"""
+        if self.disk_dir is None:
+            return None
+        pdf_hash, page_number, dpi, fmt = key
+        return self.disk_dir / pdf_hash[:16] / f"p{page_number}_d{dpi}.{fmt}"
+
+    def _read_disk(self, key: PageKey) -> Optional[bytes]:
+        """디스크 캐시 읽기"""
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            data = path.read_bytes()
+            # 사용 시각을 갱신해 크기 초과 시 삭제 순서(LRU)에 반영
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def _write_disk(self, key: PageKey, data: bytes):
+        """디스크 캐시 쓰기 (임시 파일 후 교체)"""
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"  페이지 캐시 저장 실패: {e}")
+            return
+
+        if self.disk_max_bytes:
+            self._account_disk(len(data) - old_size)
+
+    def _account_disk(self, delta: int):
+        """디스크 사용량 반영 후 최대 크기를 넘으면 오래된 파일부터 삭제"""
+        with self._disk_lock:
+            if self._disk_size is None:
+                self._disk_size = sum(size for _, size, _ in self._disk_files())
+            else:
+                self._disk_size += delta
+            if self._disk_size <= self.disk_max_bytes:
+                return
+
+            # 사용 시각(mtime)이 오래된 파일부터 삭제
+            for mtime, size, path in sorted(self._disk_files()):
+                if self._disk_size <= self.disk_max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                self._disk_size -= size
+                self.disk_evictions += 1
+                try:
+                    path.parent.rmdir()  # 비어 있는 PDF 디렉토리 정리
+                except OSError:
+                    pass
+
+    def _disk_files(self) -> list[tuple[float, int, Path]]:
+        """디스크 캐시 파일 목록 (mtime, 크기, 경로) - 쓰는 중인 임시 파일 제외"""
+        files = []
+        for path in self.disk_dir.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
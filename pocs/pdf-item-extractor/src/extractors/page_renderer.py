@@ -0,0 +1,150 @@
+"""멀티 프로세스 페이지 렌더링
+
+fitz 문서 핸들은 프로세스 간 공유할 수 없으므로
+각 워커 프로세스가 PDF를 직접 열어 렌더링합니다.
+풀(RenderPool)은 추출기마다 하나를 만들어 실행 동안 재사용하므로 워커는 PDF를 한 번만 엽니다.
+렌더링 결과는 PNG로 인코딩하지 않은 원본 샘플 버퍼(PageRaster)로 전달하며,
+인코딩은 파일 저장이나 모델 요청 직전에만 수행합니다.
+페이지 디스크 캐시를 쓰는 경우에는 워커가 PNG로 인코딩해 전달하고(전송량도 줄어듦),
+부모 프로세스가 디스크에 저장한 뒤 래스터로 디코딩합니다.
+"""
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class PageRaster:
+    """인코딩되지 않은 페이지 래스터 (행 단위 연속 샘플)"""
+    width: int
+    height: int
+    mode: str
+    samples: bytes
+
+    @classmethod
+    def from_pixmap(cls, pix: fitz.Pixmap) -> "PageRaster":
+        """fitz 픽스맵에서 생성 (샘플 버퍼 1회 복사)"""
+        mode = {1: "L", 3: "RGB", 4: "RGBA"}[pix.n]
+        return cls(width=pix.width, height=pix.height, mode=mode, samples=pix.samples)
+
+    @classmethod
+    def from_encoded(cls, data: bytes) -> "PageRaster":
+        """PNG/JPEG 바이트에서 생성"""
+        img = Image.open(io.BytesIO(data))
+        if img.mode not in ("L", "RGB", "RGBA"):
+            img = img.convert("RGB")
+        return cls(width=img.width, height=img.height, mode=img.mode, samples=img.tobytes())
+
+    @property
+    def nbytes(self) -> int:
+        """샘플 버퍼 크기 (byte)"""
+        return len(self.samples)
+
+    def to_image(self) -> Image.Image:
+        """샘플 버퍼를 공유하는 읽기 전용 PIL 이미지 (복사 없음)"""
+        return Image.frombuffer(
+            self.mode, (self.width, self.height), self.samples, "raw", self.mode, 0, 1
+        )
+
+    def encode(self, fmt: str = "png") -> bytes:
+        """PNG/JPEG 바이트로 인코딩
+
+        Args:
+            fmt: 이미지 포맷 (png, jpeg)
+
+        Returns:
+            인코딩된 이미지 바이트
+        """
+        buffer = io.BytesIO()
+        self.to_image().save(buffer, format=fmt.upper())
+        return buffer.getvalue()
+
+
+# 워커 프로세스별 문서 핸들
+_worker_doc: Optional[fitz.Document] = None
+
+
+def _init_worker(pdf_path: str):
+    """워커 프로세스 초기화 - PDF 문서 열기"""
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+
+
+def _render_page(args: tuple[int, int, bool]) -> tuple[int, Union[PageRaster, bytes]]:
+    """워커에서 페이지 렌더링
+
+    Args:
+        args: (페이지 번호, DPI, PNG 인코딩 여부)
+
+    Returns:
+        (페이지 번호, 페이지 래스터 또는 PNG 바이트)
+    """
+    page_number, dpi, encode = args
+    page = _worker_doc[page_number - 1]
+
+    zoom = dpi / 72.0
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    if encode:
+        return page_number, pix.tobytes("png")
+    return page_number, PageRaster.from_pixmap(pix)
+
+
+class RenderPool:
+    """PDF 1개에 대한 페이지 렌더링 프로세스 풀
+
+    여러 번 render()를 호출해도 같은 워커 프로세스를 재사용하므로
+    워커는 PDF를 시작할 때 한 번만 엽니다. 사용이 끝나면 close()로 종료합니다.
+    """
+
+    def __init__(self, pdf_path: Path, workers: int):
+        """풀 초기화 (워커 프로세스는 첫 작업 때 시작)
+
+        Args:
+            pdf_path: PDF 파일 경로
+            workers: 최대 워커 프로세스 수
+        """
+        self.workers = max(1, workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(str(pdf_path),)
+        )
+
+    def render(
+        self,
+        page_numbers: list[int],
+        dpi: int,
+        encode: bool = False
+    ) -> dict[int, tuple[PageRaster, Optional[bytes]]]:
+        """여러 페이지 렌더링
+
+        Args:
+            page_numbers: 렌더링할 페이지 번호 목록
+            dpi: 렌더링 DPI
+            encode: 워커에서 PNG로 인코딩해 전달할지 여부 (디스크 캐시 저장용)
+
+        Returns:
+            {페이지 번호: (페이지 래스터, PNG 바이트 또는 None)}
+        """
+        tasks = [(page_number, dpi, encode) for page_number in page_numbers]
+        return {
+            page_number: _decode(result)
+            for page_number, result in self._executor.map(_render_page, tasks)
+        }
+
+    def close(self):
+        """워커 프로세스 종료"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _decode(result: Union[PageRaster, bytes]) -> tuple[PageRaster, Optional[bytes]]:
+    """워커 결과를 (래스터, PNG 바이트) 쌍으로 변환"""
+    if isinstance(result, bytes):
+        return PageRaster.from_encoded(result), result
+    return result, None
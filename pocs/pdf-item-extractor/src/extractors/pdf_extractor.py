@@ -4,30 +4,51 @@ PyMuPDF를 사용하여 PDF를 이미지로 변환하고 문항을 crop합니다
 """
 
 import io
+import threading
 from pathlib import Path
 from typing import Optional
 
 import fitz  # PyMuPDF
-from PIL import Image, ImageDraw, ImageFont
 
 from ..core.config import settings
 from ..core.schemas import BoundingBox, ExtractedItem, PassageInfo
+from .page_cache import PageCache, hash_pdf
+from .page_renderer import PageRaster, RenderPool
+from .visualizer import save_segmentation, save_segmentations_parallel
 
 
 class PDFExtractor:
     """PDF 추출기"""
 
-    def __init__(self, pdf_path: Path, dpi: int = None):
+    def __init__(
+        self,
+        pdf_path: Path,
+        dpi: int = None,
+        page_cache: Optional[PageCache] = None,
+        segment_dpi: int = None
+    ):
         """PDF 추출기 초기화
 
         Args:
             pdf_path: PDF 파일 경로
-            dpi: 렌더링 DPI (기본값: 설정에서 로드)
+            dpi: 크롭 렌더링 DPI, bbox 픽셀 좌표 기준 (기본값: 설정에서 로드)
+            page_cache: 페이지 래스터 캐시 (기본값: 설정 기반으로 생성)
+            segment_dpi: 세그멘테이션 요청/시각화용 페이지 렌더링 DPI (기본값: 설정, 0이면 dpi)
         """
         self.pdf_path = Path(pdf_path)
         self.dpi = dpi or settings.pdf_dpi
+        self.segment_dpi = segment_dpi or settings.segment_dpi or self.dpi
         self.doc = fitz.open(str(self.pdf_path))
-        self._page_images: dict[int, bytes] = {}
+        self.pdf_hash = hash_pdf(self.pdf_path)
+        # fitz 문서는 스레드 안전하지 않으므로 문서 접근을 직렬화
+        self._doc_lock = threading.RLock()
+        self.page_cache = page_cache or PageCache(
+            max_bytes=settings.page_cache_max_mb * 1024 * 1024,
+            disk_dir=settings.page_cache_dir if settings.page_cache_persist else None,
+            disk_max_bytes=settings.page_cache_disk_max_mb * 1024 * 1024
+        )
+        # 페이지 렌더링 프로세스 풀 (첫 병렬 렌더링 때 생성, close()에서 종료)
+        self._render_pool: Optional[RenderPool] = None
 
     def __enter__(self):
         return self
@@ -36,7 +57,10 @@ class PDFExtractor:
         self.close()
 
     def close(self):
-        """문서 닫기"""
+        """렌더링 프로세스 풀 종료 및 문서 닫기"""
+        if self._render_pool is not None:
+            self._render_pool.close()
+            self._render_pool = None
         if self.doc:
             self.doc.close()
 
@@ -45,56 +69,117 @@ class PDFExtractor:
         """총 페이지 수"""
         return len(self.doc)
 
-    def get_page_image(self, page_number: int, force_reload: bool = False) -> bytes:
-        """페이지를 이미지로 변환
+    def get_page_raster(
+        self,
+        page_number: int,
+        force_reload: bool = False,
+        dpi: int = None
+    ) -> PageRaster:
+        """페이지를 인코딩되지 않은 래스터로 변환
+
+        디스크 캐시를 사용하면 렌더링한 페이지를 PNG로도 저장해
+        다음 실행에서 다시 렌더링하지 않습니다.
 
         Args:
             page_number: 페이지 번호 (1부터 시작)
             force_reload: 캐시 무시하고 재생성
+            dpi: 렌더링 DPI (기본값: self.dpi, 캐시는 DPI별로 구분)
 
         Returns:
-            PNG 이미지 바이트
+            페이지 래스터 (원본 샘플 버퍼)
         """
-        if not force_reload and page_number in self._page_images:
-            return self._page_images[page_number]
+        dpi = dpi or self.dpi
+        raw_key = (self.pdf_hash, page_number, dpi, "raw")
+        if not force_reload:
+            cached = self.page_cache.get_raster(raw_key)
+            if cached is not None:
+                return cached
 
         # 페이지 인덱스 (0부터 시작)
         page_idx = page_number - 1
         if page_idx < 0 or page_idx >= len(self.doc):
             raise ValueError(f"유효하지 않은 페이지 번호: {page_number}")
 
-        page = self.doc[page_idx]
-
         # DPI에 따른 변환 행렬
-        zoom = self.dpi / 72.0
+        zoom = dpi / 72.0
         mat = fitz.Matrix(zoom, zoom)
 
         # 페이지를 픽스맵으로 렌더링
-        pix = page.get_pixmap(matrix=mat)
+        with self._doc_lock:
+            pix = self.doc[page_idx].get_pixmap(matrix=mat)
+
+        raster = PageRaster.from_pixmap(pix)
+        encoded = pix.tobytes("png") if self.page_cache.persistent else None
+        self.page_cache.put_raster(raw_key, raster, encoded)
+        return raster
 
-        # PNG 바이트로 변환
-        img_bytes = pix.tobytes("png")
+    def render_pages(
+        self,
+        page_numbers: list[int],
+        workers: int = None,
+        dpi: int = None
+    ) -> list[PageRaster]:
+        """여러 페이지를 프로세스 풀로 렌더링
 
-        # 캐시에 저장
-        self._page_images[page_number] = img_bytes
+        메모리/디스크 캐시에 없는 페이지만 워커 프로세스에서 렌더링합니다.
+        프로세스 풀은 첫 호출 때 workers 크기로 만들어 close()까지 재사용하며,
+        각 워커는 PDF 문서를 한 번만 엽니다.
+        디스크 캐시를 사용하면 워커가 PNG로 인코딩해 전달하고, 이를 디스크에 저장한 뒤 래스터로 디코딩합니다.
 
-        return img_bytes
+        Args:
+            page_numbers: 페이지 번호 목록 (1부터 시작)
+            workers: 워커 프로세스 수 (기본값: 설정에서 로드, 1이면 순차 처리)
+            dpi: 렌더링 DPI (기본값: self.dpi)
 
-    def get_page_size(self, page_number: int) -> tuple[int, int]:
+        Returns:
+            page_numbers 순서의 페이지 래스터 목록
+        """
+        workers = workers or settings.render_workers
+        dpi = dpi or self.dpi
+
+        for page_number in page_numbers:
+            if page_number < 1 or page_number > len(self.doc):
+                raise ValueError(f"유효하지 않은 페이지 번호: {page_number}")
+
+        rasters: dict[int, PageRaster] = {}
+        missing = []
+        for page_number in dict.fromkeys(page_numbers):
+            cached = self.page_cache.get_raster((self.pdf_hash, page_number, dpi, "raw"))
+            if cached is not None:
+                rasters[page_number] = cached
+            else:
+                missing.append(page_number)
+
+        if workers <= 1 or len(missing) <= 1:
+            for page_number in missing:
+                rasters[page_number] = self.get_page_raster(page_number, force_reload=True, dpi=dpi)
+        else:
+            if self._render_pool is None:
+                self._render_pool = RenderPool(self.pdf_path, workers)
+            rendered = self._render_pool.render(missing, dpi, encode=self.page_cache.persistent)
+            for page_number, (raster, encoded) in rendered.items():
+                self.page_cache.put_raster((self.pdf_hash, page_number, dpi, "raw"), raster, encoded)
+                rasters[page_number] = raster
+
+        return [rasters[page_number] for page_number in page_numbers]
+
+    def get_page_size(self, page_number: int, dpi: int = None) -> tuple[int, int]:
         """페이지 크기 반환 (렌더링 후 픽셀)
 
         Args:
             page_number: 페이지 번호
+            dpi: 렌더링 DPI (기본값: self.dpi)
 
         Returns:
             (width, height) 픽셀
         """
         page_idx = page_number - 1
-        page = self.doc[page_idx]
+        with self._doc_lock:
+            rect = self.doc[page_idx].rect
 
-        zoom = self.dpi / 72.0
-        width = int(page.rect.width * zoom)
-        height = int(page.rect.height * zoom)
+        zoom = (dpi or self.dpi) / 72.0
+        width = int(rect.width * zoom)
+        height = int(rect.height * zoom)
 
         return width, height
 
@@ -106,33 +191,73 @@ class PDFExtractor:
     ) -> bytes:
         """페이지에서 특정 영역 crop
 
+        메모리 캐시에 크롭 DPI(self.dpi) 페이지 래스터가 있으면 버퍼에서 바로 잘라내고,
+        없으면 (세그멘테이션 페이지를 segment_dpi로만 렌더링한 경우 등)
+        PDF에서 clip 영역만 크롭 DPI로 직접 렌더링합니다.
+
         Args:
             page_number: 페이지 번호
-            bbox: 바운딩 박스
+            bbox: 바운딩 박스 (렌더링 DPI 기준 픽셀)
             padding: 여백 (픽셀)
 
         Returns:
             크롭된 PNG 이미지 바이트
         """
-        # 페이지 이미지 로드
-        page_img_bytes = self.get_page_image(page_number)
+        raster = self.page_cache.peek((self.pdf_hash, page_number, self.dpi, "raw"))
+        if raster is None:
+            return self._render_clip(page_number, bbox, padding).tobytes("png")
+
+        x1, y1, x2, y2 = self._clamp_bbox(raster.width, raster.height, bbox, padding)
+        buffer = io.BytesIO()
+        raster.to_image().crop((x1, y1, x2, y2)).save(buffer, format="PNG")
+        return buffer.getvalue()
 
-        # PIL 이미지로 변환
-        img = Image.open(io.BytesIO(page_img_bytes))
+    def _clamp_bbox(
+        self,
+        width: int,
+        height: int,
+        bbox: BoundingBox,
+        padding: int
+    ) -> tuple[int, int, int, int]:
+        """여백 적용 및 페이지 경계로 제한한 픽셀 좌표"""
+        return (
+            max(0, int(bbox.x1) - padding),
+            max(0, int(bbox.y1) - padding),
+            min(width, int(bbox.x2) + padding),
+            min(height, int(bbox.y2) + padding),
+        )
+
+    def _render_clip(
+        self,
+        page_number: int,
+        bbox: BoundingBox,
+        padding: int = 5
+    ) -> fitz.Pixmap:
+        """bbox 영역만 렌더링한 픽스맵 반환
 
-        # 여백 적용 및 경계 조정
-        x1 = max(0, int(bbox.x1) - padding)
-        y1 = max(0, int(bbox.y1) - padding)
-        x2 = min(img.width, int(bbox.x2) + padding)
-        y2 = min(img.height, int(bbox.y2) + padding)
+        Args:
+            page_number: 페이지 번호
+            bbox: 바운딩 박스 (렌더링 DPI 기준 픽셀)
+            padding: 여백 (픽셀)
 
-        # 크롭
-        cropped = img.crop((x1, y1, x2, y2))
+        Returns:
+            clip 영역 픽스맵
+        """
+        page_idx = page_number - 1
+        if page_idx < 0 or page_idx >= len(self.doc):
+            raise ValueError(f"유효하지 않은 페이지 번호: {page_number}")
 
-        # PNG 바이트로 변환
-        buffer = io.BytesIO()
-        cropped.save(buffer, format="PNG")
-        return buffer.getvalue()
+        width, height = self.get_page_size(page_number)
+
+        # 여백 적용 및 경계 조정 (픽셀 좌표)
+        x1, y1, x2, y2 = self._clamp_bbox(width, height, bbox, padding)
+
+        # 픽셀 좌표 → PDF 좌표 (pt)
+        zoom = self.dpi / 72.0
+        with self._doc_lock:
+            page = self.doc[page_idx]
+            clip = fitz.Rect(x1 / zoom, y1 / zoom, x2 / zoom, y2 / zoom) & page.rect
+            return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip)
 
     def save_item_image(
         self,
@@ -170,7 +295,8 @@ class PDFExtractor:
         self,
         items: list[ExtractedItem],
         output_dir: Path,
-        padding: int = 10
+        padding: int = 10,
+        lines: Optional[list[str]] = None
     ) -> list[Path]:
         """모든 문항 이미지 저장
 
@@ -178,17 +304,21 @@ class PDFExtractor:
             items: 추출된 문항 목록
             output_dir: 출력 디렉토리
             padding: 여백 (픽셀)
+            lines: 저장 결과 출력 줄을 모을 목록 (없으면 바로 출력)
 
         Returns:
             저장된 파일 경로 목록
         """
         saved_paths = []
+        output = [] if lines is None else lines
         for item in items:
             path = self.save_item_image(item, output_dir, padding)
             item.image_path = str(path)
             saved_paths.append(path)
-            print(f"  문항 {item.item_number}: {path.name}")
+            output.append(f"  문항 {item.item_number}: {path.name}")
 
+        if lines is None and output:
+            print("\n".join(output))
         return saved_paths
 
     def save_passage_image(
@@ -238,7 +368,8 @@ class PDFExtractor:
         self,
         passages: list[PassageInfo],
         output_dir: Path,
-        padding: int = 10
+        padding: int = 10,
+        lines: Optional[list[str]] = None
     ) -> list[Path]:
         """모든 지문 이미지 저장
 
@@ -246,11 +377,13 @@ class PDFExtractor:
             passages: 지문 목록
             output_dir: 출력 디렉토리
             padding: 여백 (픽셀)
+            lines: 저장 결과 출력 줄을 모을 목록 (없으면 바로 출력)
 
         Returns:
             저장된 파일 경로 목록
         """
         saved_paths = []
+        output = [] if lines is None else lines
         for passage in passages:
             paths = self.save_passage_image(passage, output_dir, padding)
             # 첫 번째 경로를 대표 이미지로 저장
@@ -259,12 +392,13 @@ class PDFExtractor:
 
             # 저장 결과 출력
             if len(paths) > 1:
-                print(f"  지문 [{passage.item_range}]: {len(paths)}개 영역")
-                for p in paths:
-                    print(f"    - {p.name}")
+                output.append(f"  지문 [{passage.item_range}]: {len(paths)}개 영역")
+                output.extend(f"    - {p.name}" for p in paths)
             else:
-                print(f"  지문 [{passage.item_range}]: {paths[0].name}")
+                output.append(f"  지문 [{passage.item_range}]: {paths[0].name}")
 
+        if lines is None and output:
+            print("\n".join(output))
         return saved_paths
 
     def save_page_with_boxes(
@@ -272,7 +406,8 @@ class PDFExtractor:
         page_number: int,
         items: list[ExtractedItem],
         output_dir: Path,
-        passages: list[PassageInfo] = None
+        passages: list[PassageInfo] = None,
+        dpi: int = None
     ) -> Path:
         """페이지 이미지에 bbox를 표시하여 저장
 
@@ -281,6 +416,7 @@ class PDFExtractor:
             items: 해당 페이지의 문항 목록
             output_dir: 출력 디렉토리
             passages: 해당 페이지의 지문 목록
+            dpi: 시각화 페이지 렌더링 DPI (기본값: self.dpi, bbox는 이 DPI로 축척)
 
         Returns:
             저장된 파일 경로
@@ -288,82 +424,18 @@ class PDFExtractor:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 페이지 이미지 로드
-        page_img_bytes = self.get_page_image(page_number)
-        img = Image.open(io.BytesIO(page_img_bytes)).convert("RGB")
-        draw = ImageDraw.Draw(img)
-
-        # 색상 팔레트 - 문항용
-        item_colors = ["#FF0000", "#00FF00", "#0000FF", "#FF00FF", "#00FFFF", "#FFFF00"]
-        # 지문용 색상 (주황색 계열)
-        passage_color = "#FFA500"
-
-        # 지문 bbox 그리기 (반투명 배경)
-        if passages:
-            for passage in passages:
-                # 모든 bbox 그리기 (단 넘김 시 여러 개)
-                bboxes = passage.bbox_list if passage.bbox_list else [passage.bbox]
-                for bbox in bboxes:
-                    # 반투명 배경
-                    overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-                    overlay_draw = ImageDraw.Draw(overlay)
-                    overlay_draw.rectangle(
-                        [bbox.x1, bbox.y1, bbox.x2, bbox.y2],
-                        fill=(255, 165, 0, 50)  # 주황색 반투명
-                    )
-                    img = Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
-                    draw = ImageDraw.Draw(img)
-
-                    # 테두리 (점선 효과)
-                    for offset in range(2):
-                        draw.rectangle(
-                            [bbox.x1 - offset, bbox.y1 - offset, bbox.x2 + offset, bbox.y2 + offset],
-                            outline=passage_color
-                        )
-
-                # 지문 라벨 (첫 번째 bbox에만)
-                first_bbox = bboxes[0]
-                label = f"[{passage.item_range}]"
-                draw.rectangle(
-                    [first_bbox.x1, first_bbox.y1 - 25, first_bbox.x1 + 80, first_bbox.y1],
-                    fill=passage_color
-                )
-                draw.text((first_bbox.x1 + 5, first_bbox.y1 - 22), label, fill="white")
-
-        # 문항 bbox 그리기
-        for idx, item in enumerate(items):
-            color = item_colors[idx % len(item_colors)]
-            bbox = item.bbox
-
-            # 박스 그리기 (두꺼운 선)
-            for offset in range(3):
-                draw.rectangle(
-                    [bbox.x1 - offset, bbox.y1 - offset, bbox.x2 + offset, bbox.y2 + offset],
-                    outline=color
-                )
-
-            # 문항 번호 라벨
-            label = f"#{item.item_number}"
-            if item.passage_ref:
-                label += "*"  # 지문 참조 표시
-            draw.rectangle(
-                [bbox.x1, bbox.y1 - 25, bbox.x1 + 60, bbox.y1],
-                fill=color
-            )
-            draw.text((bbox.x1 + 5, bbox.y1 - 22), label, fill="white")
-
-        # 저장
-        filename = f"page_{page_number}_segmented.png"
-        output_path = output_dir / filename
-
-        img.save(output_path, "PNG")
-        return output_path
+        dpi = dpi or self.dpi
+        output_path = output_dir / f"page_{page_number}_segmented.png"
+        return save_segmentation(
+            self.get_page_raster(page_number, dpi=dpi), items, passages, output_path, scale=dpi / self.dpi
+        )
 
     def save_all_pages_with_boxes(
         self,
         items: list[ExtractedItem],
         output_dir: Path,
-        passages: list[PassageInfo] = None
+        passages: list[PassageInfo] = None,
+        workers: int = None
     ) -> list[Path]:
         """모든 페이지에 bbox를 표시하여 저장
 
@@ -371,6 +443,7 @@ class PDFExtractor:
             items: 추출된 문항 목록
             output_dir: 출력 디렉토리
             passages: 공유 지문 목록
+            workers: 렌더링 워커 프로세스/그리기 스레드 수 (기본값: 설정에서 로드, 1이면 순차 처리)
 
         Returns:
             저장된 파일 경로 목록
@@ -388,18 +461,76 @@ class PDFExtractor:
             for passage in passages:
                 page_passages[passage.page_number].append(passage)
 
-        saved_paths = []
-        for page_num in sorted(page_items.keys()):
-            page_passage_list = page_passages.get(page_num, [])
-            path = self.save_page_with_boxes(
-                page_num, page_items[page_num], output_dir, page_passage_list
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 렌더링은 워커 프로세스, 그리기/PNG 인코딩은 래스터를 복사하지 않도록 스레드에서 병렬 처리
+        page_numbers = sorted(page_items.keys())
+        rasters = self.render_pages(page_numbers, workers=workers)
+        tasks = [
+            (
+                raster,
+                page_items[page_num],
+                page_passages.get(page_num, []),
+                output_dir / f"page_{page_num}_segmented.png"
             )
-            saved_paths.append(path)
+            for page_num, raster in zip(page_numbers, rasters)
+        ]
+        saved_paths = save_segmentations_parallel(tasks, workers or settings.render_workers)
+
+        for page_num, path in zip(page_numbers, saved_paths):
+            page_passage_list = page_passages.get(page_num, [])
             passage_info = f", {len(page_passage_list)}개 지문" if page_passage_list else ""
             print(f"  저장: {path.name} ({len(page_items[page_num])}개 문항{passage_info})")
 
         return saved_paths
 
+    def get_page_elements(self, page_number: int) -> dict:
+        """페이지의 텍스트 라인, 이미지, 벡터 도형 좌표 추출
+
+        좌표는 PDF 좌표(pt)로 반환합니다.
+
+        Args:
+            page_number: 페이지 번호
+
+        Returns:
+            {"rect": (width, height),
+             "lines": [{"bbox", "text", "size"(첫 글자 크기)}],
+             "images": [bbox], "drawings": [bbox]}
+        """
+        page_idx = page_number - 1
+        with self._doc_lock:
+            page = self.doc[page_idx]
+            rect = page.rect
+            blocks = page.get_text("dict")["blocks"]
+            drawings = page.get_drawings()
+
+        lines = []
+        images = []
+        for block in blocks:
+            if block.get("type") == 1:  # 이미지 블록
+                images.append(tuple(block["bbox"]))
+                continue
+            for line in block.get("lines", []):
+                spans = line.get("spans", [])
+                text = "".join(span.get("text", "") for span in spans)
+                if not text.strip():
+                    continue
+                # 줄 첫 글자(문항 번호 등)의 글자 크기
+                first_span = next(span for span in spans if span.get("text", "").strip())
+                lines.append({
+                    "bbox": tuple(line["bbox"]),
+                    "text": text,
+                    "size": first_span.get("size", 0)
+                })
+
+        return {
+            "rect": (rect.width, rect.height),
+            "lines": lines,
+            "images": images,
+            "drawings": [tuple(d["rect"]) for d in drawings],
+        }
+
     def get_text_blocks(self, page_number: int) -> list[dict]:
         """페이지의 텍스트 블록 추출 (참고용)
 
@@ -410,10 +541,10 @@ class PDFExtractor:
             텍스트 블록 목록
         """
         page_idx = page_number - 1
-        page = self.doc[page_idx]
 
         zoom = self.dpi / 72.0
-        blocks = page.get_text("dict")["blocks"]
+        with self._doc_lock:
+            blocks = self.doc[page_idx].get_text("dict")["blocks"]
 
         result = []
         for block in blocks:
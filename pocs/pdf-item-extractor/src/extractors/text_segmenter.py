@@ -0,0 +1,406 @@
+"""텍스트 레이어 기반 문항 분할기
+
+텍스트 레이어가 있는(born-digital) 시험지 PDF에서
+문항 번호("12."), 지문 범위("[4 ~ 6]"), 단 구분선을 찾아
+모델 호출 없이 문항/지문 bbox를 구성합니다.
+분할 결과의 신뢰도가 낮은 페이지만 Agentic Vision으로 처리합니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..core.schemas import BoundingBox, ExtractedItem, ItemType, PassageInfo
+from .pdf_extractor import PDFExtractor
+
+
+# 문항 번호: "12. 다음 ..." (소수점 숫자 제외)
+ITEM_ANCHOR = re.compile(r"^\s*(\d{1,2})\s*\.(?!\d)")
+# 지문 범위: "[4 ~ 6] 다음 글을 읽고 ..."
+PASSAGE_ANCHOR = re.compile(r"^\s*\[\s*(\d{1,2})\s*[~～∼\-–]\s*(\d{1,2})\s*\]")
+# 분할 종료: "※ 확인 사항" 등
+STOP_ANCHOR = re.compile(r"^\s*※")
+# 문항 영역에 포함하지 않는 유형 제목
+SECTION_HEADER = re.compile(r"^\s*(5지선다형|단답형|서답형)\s*$")
+
+Rect = tuple[float, float, float, float]
+
+
+@dataclass
+class Anchor:
+    """문항/지문 시작 위치"""
+    kind: str  # item / passage / stop
+    y: float
+    rect: Rect
+    number: str = ""
+    range_end: str = ""
+
+
+@dataclass
+class Region:
+    """단(column) 내 하나의 문항/지문 영역"""
+    anchor: Anchor
+    column: int
+    rects: list[Rect] = field(default_factory=list)
+    # 다음 단으로 이어진 영역 (지문)
+    continuations: list[Rect] = field(default_factory=list)
+
+    def union(self) -> Optional[Rect]:
+        if not self.rects:
+            return None
+        return _union(self.rects)
+
+
+@dataclass
+class PageColumns:
+    """페이지 본문 영역과 단 구성 (PDF 좌표, pt)"""
+    content: Rect
+    columns: list[tuple[float, float]]
+    has_separator: bool
+
+
+@dataclass
+class TextSegmentation:
+    """텍스트 레이어 분할 결과"""
+    page_number: int
+    items: list[ExtractedItem] = field(default_factory=list)
+    passages: list[PassageInfo] = field(default_factory=list)
+    confidence: float = 0.0
+    notes: list[str] = field(default_factory=list)
+
+
+def _union(rects: list[Rect]) -> Rect:
+    return (
+        min(r[0] for r in rects),
+        min(r[1] for r in rects),
+        max(r[2] for r in rects),
+        max(r[3] for r in rects),
+    )
+
+
+def _center(rect: Rect) -> tuple[float, float]:
+    return (rect[0] + rect[2]) / 2, (rect[1] + rect[3]) / 2
+
+
+def _overlaps(a: Rect, b: Rect, margin: float = 0.0) -> bool:
+    return (a[0] <= b[2] + margin and b[0] - margin <= a[2]
+            and a[1] <= b[3] + margin and b[1] - margin <= a[3])
+
+
+class TextLayerSegmenter:
+    """텍스트 레이어 기반 문항 분할기"""
+
+    # 문항 번호가 단 왼쪽 끝에서 벗어날 수 있는 허용 오차 (pt)
+    ANCHOR_INDENT_TOLERANCE = 8.0
+
+    def __init__(self, extractor: PDFExtractor):
+        """분할기 초기화
+
+        Args:
+            extractor: PDF 추출기 (좌표는 extractor.dpi 기준 픽셀로 변환)
+        """
+        self.extractor = extractor
+
+    def detect_columns(self, page_number: int, elements: Optional[dict] = None) -> PageColumns:
+        """단 구분선과 본문 영역 검출
+
+        Args:
+            page_number: 페이지 번호
+            elements: get_page_elements 결과 (없으면 새로 추출)
+
+        Returns:
+            본문 영역과 단 x 범위 (pt)
+        """
+        elements = elements or self.extractor.get_page_elements(page_number)
+        width, height = elements["rect"]
+        drawings = elements["drawings"]
+
+        # 세로 구분선: 페이지 중앙 부근의 긴 세로선
+        separators = [
+            d for d in drawings
+            if d[2] - d[0] <= 2
+            and d[3] - d[1] >= height * 0.4
+            and width * 0.3 <= d[0] <= width * 0.7
+        ]
+        separator = min(separators, key=lambda d: abs(d[0] - width / 2)) if separators else None
+
+        if separator:
+            top, bottom = separator[1], separator[3]
+        else:
+            # 상단 머리글 아래 가로선 ~ 하단 쪽번호 상자 위
+            rules = [
+                d for d in drawings
+                if d[3] - d[1] <= 2 and d[2] - d[0] >= width * 0.5 and d[1] < height * 0.25
+            ]
+            top = max((d[3] for d in rules), default=0.0)
+            footers = [d for d in drawings if d[1] > height * 0.88]
+            bottom = min((d[1] for d in footers), default=height)
+
+        body_lines = [
+            line["bbox"] for line in elements["lines"]
+            if top - 2 <= _center(line["bbox"])[1] <= bottom + 2
+        ]
+        left = min((r[0] for r in body_lines), default=0.0)
+        right = max((r[2] for r in body_lines), default=width)
+
+        if separator:
+            sep_x = separator[0]
+            columns = [(left, sep_x), (sep_x, right)]
+        else:
+            columns = [(left, right)]
+
+        return PageColumns(
+            content=(left, top, right, bottom),
+            columns=columns,
+            has_separator=separator is not None
+        )
+
+    def column_tiles(self, page_number: int, margin: float = 6.0) -> list[BoundingBox]:
+        """단별 세그멘테이션 타일 영역
+
+        단 구분선이 있는 페이지의 본문 영역을 단 단위로 나눕니다.
+
+        Args:
+            page_number: 페이지 번호
+            margin: 단 경계 바깥으로 포함할 여백 (pt)
+
+        Returns:
+            단 순서(왼쪽 → 오른쪽)의 타일 영역 (extractor.dpi 기준 픽셀, 단이 하나면 빈 목록)
+        """
+        elements = self.extractor.get_page_elements(page_number)
+        width, height = elements["rect"]
+        layout = self.detect_columns(page_number, elements)
+        if not layout.has_separator or len(layout.columns) < 2:
+            return []
+
+        zoom = self.extractor.dpi / 72.0
+        _, top, _, bottom = layout.content
+        return [
+            BoundingBox(
+                x1=int(max(0.0, x0 - margin) * zoom),
+                y1=int(max(0.0, top - margin) * zoom),
+                x2=int(min(width, x1 + margin) * zoom),
+                y2=int(min(height, bottom + margin) * zoom)
+            )
+            for x0, x1 in layout.columns
+        ]
+
+    def segment(self, page_number: int) -> TextSegmentation:
+        """페이지 문항/지문 분할
+
+        Args:
+            page_number: 페이지 번호
+
+        Returns:
+            분할 결과 (confidence 0.0~1.0)
+        """
+        result = TextSegmentation(page_number=page_number)
+        elements = self.extractor.get_page_elements(page_number)
+        width, height = elements["rect"]
+        layout = self.detect_columns(page_number, elements)
+        left, top, right, bottom = layout.content
+        confidence = 1.0
+
+        if not layout.has_separator:
+            confidence *= 0.8
+            result.notes.append("단 구분선 없음")
+
+        def in_body(rect: Rect) -> bool:
+            cy = _center(rect)[1]
+            return top - 2 <= cy <= bottom + 2
+
+        def column_of(rect: Rect) -> int:
+            cx = _center(rect)[0]
+            for idx, (x0, x1) in enumerate(layout.columns):
+                if x0 - 2 <= cx <= x1 + 2:
+                    return idx
+            return -1
+
+        # 본문 콘텐츠 요소 (구분선/머리글 가로선/유형 제목 제외)
+        contents: list[tuple[int, Rect]] = []
+        lines_by_column: dict[int, list[dict]] = {}
+        headers: list[Rect] = []
+        for line in elements["lines"]:
+            rect = line["bbox"]
+            if SECTION_HEADER.match(line["text"]):
+                headers.append(rect)
+                continue
+            if not in_body(rect):
+                continue
+            col = column_of(rect)
+            if col < 0:
+                continue
+            lines_by_column.setdefault(col, []).append(line)
+            contents.append((col, rect))
+
+        for rect in elements["images"] + elements["drawings"]:
+            is_rule = rect[2] - rect[0] >= width * 0.6 or rect[3] - rect[1] >= height * 0.4
+            if is_rule or not in_body(rect):
+                continue
+            # 유형 제목("단답형")을 둘러싼 상자
+            if any(_overlaps(rect, header, margin=20) for header in headers):
+                continue
+            col = column_of(rect)
+            if col >= 0:
+                contents.append((col, rect))
+
+        # 문항/지문 시작 위치 검출
+        anchors_by_column: dict[int, list[Anchor]] = {}
+        item_sizes = []
+        candidates: list[tuple[int, Anchor, float]] = []
+        for col, lines in lines_by_column.items():
+            col_left = min(line["bbox"][0] for line in lines)
+            for line in lines:
+                rect = line["bbox"]
+                if rect[0] > col_left + self.ANCHOR_INDENT_TOLERANCE:
+                    continue
+                text = line["text"]
+                if match := PASSAGE_ANCHOR.match(text):
+                    candidates.append((col, Anchor(
+                        "passage", rect[1], rect, match.group(1), match.group(2)
+                    ), line["size"]))
+                elif match := ITEM_ANCHOR.match(text):
+                    candidates.append((col, Anchor("item", rect[1], rect, match.group(1)), line["size"]))
+                    item_sizes.append(line["size"])
+                elif STOP_ANCHOR.match(text):
+                    candidates.append((col, Anchor("stop", rect[1], rect), line["size"]))
+
+        # 본문 중 번호 목록("1. ...")은 문항 번호보다 글자가 작음
+        max_item_size = max(item_sizes, default=0.0)
+        for col, anchor, size in candidates:
+            if anchor.kind == "item" and size < max_item_size * 0.85:
+                continue
+            anchors_by_column.setdefault(col, []).append(anchor)
+
+        if not any(a.kind == "item" for anchors in anchors_by_column.values() for a in anchors):
+            result.notes.append("문항 번호 없음")
+            return result
+
+        # 단별 영역 구성
+        regions: list[Region] = []
+        orphans: dict[int, list[Rect]] = {}
+        for col in range(len(layout.columns)):
+            anchors = sorted(anchors_by_column.get(col, []), key=lambda a: a.y)
+            col_contents = [rect for c, rect in contents if c == col]
+            col_regions = [Region(anchor=a, column=col) for a in anchors]
+
+            for rect in col_contents:
+                cy = _center(rect)[1]
+                owner = None
+                for region in col_regions:
+                    if region.anchor.y - 1 <= cy:
+                        owner = region
+                    else:
+                        break
+                if owner is None:
+                    orphans.setdefault(col, []).append(rect)
+                else:
+                    owner.rects.append(rect)
+
+            regions.extend(col_regions)
+
+        # 이전 페이지에서 시작된 지문이 첫 단 상단에 이어지는 경우
+        first_item = next((r.anchor for r in regions if r.anchor.kind == "item"), None)
+        if orphans.get(0) and first_item:
+            carried = self._find_carried_passage(page_number, int(first_item.number))
+            if carried:
+                rect = _union(orphans.pop(0))
+                regions.insert(0, Region(
+                    anchor=Anchor("passage", rect[1], rect, carried[0], carried[1]),
+                    column=0,
+                    rects=[rect]
+                ))
+
+        # 단 상단의 앞 영역 이어짐 처리
+        for col, rects in sorted(orphans.items()):
+            previous = [r for r in regions if r.column == col - 1 and r.anchor.kind != "stop"]
+            if col > 0 and previous and previous[-1].anchor.kind == "passage":
+                previous[-1].continuations.append(_union(rects))
+                continue
+            confidence *= 0.5
+            if col > 0 and previous:
+                result.notes.append(f"{previous[-1].anchor.number}번 영역이 다음 단으로 이어짐")
+            else:
+                result.notes.append("이전 페이지에서 이어진 내용")
+
+        # 문항 번호 연속성 검사 (읽기 순서)
+        numbers = [int(r.anchor.number) for r in regions if r.anchor.kind == "item"]
+        if any(b != a + 1 for a, b in zip(numbers, numbers[1:])):
+            confidence *= 0.5
+            result.notes.append(f"문항 번호 불연속: {numbers}")
+
+        zoom = self.extractor.dpi / 72.0
+
+        def to_bbox(rect: Rect) -> BoundingBox:
+            return BoundingBox(
+                x1=rect[0] * zoom, y1=rect[1] * zoom,
+                x2=rect[2] * zoom, y2=rect[3] * zoom
+            )
+
+        # 지문 생성
+        passage_ranges: list[tuple[int, int, str]] = []
+        for region in regions:
+            if region.anchor.kind != "passage":
+                continue
+            rect = region.union()
+            if rect is None:
+                continue
+            bboxes = [to_bbox(rect)] + [to_bbox(r) for r in region.continuations]
+            start, end = region.anchor.number, region.anchor.range_end
+            passage_id = f"{start}-{end}"
+            result.passages.append(PassageInfo(
+                passage_id=passage_id,
+                page_number=page_number,
+                bbox=bboxes[0],
+                bbox_list=bboxes,
+                item_range=f"{start}~{end}"
+            ))
+            passage_ranges.append((int(start), int(end), passage_id))
+
+        # 문항 생성
+        for region in regions:
+            if region.anchor.kind != "item":
+                continue
+            rect = region.union()
+            if rect is None:
+                continue
+            number = int(region.anchor.number)
+            passage_ref = next(
+                (pid for start, end, pid in passage_ranges if start <= number <= end),
+                None
+            )
+            result.items.append(ExtractedItem(
+                item_number=region.anchor.number,
+                page_number=page_number,
+                bbox=to_bbox(rect),
+                item_type=ItemType.PASSAGE_GROUP if passage_ref else ItemType.STANDALONE,
+                passage_ref=passage_ref,
+                confidence=round(confidence, 3)
+            ))
+
+        result.confidence = round(confidence, 3)
+        return result
+
+    def _find_carried_passage(
+        self,
+        page_number: int,
+        item_number: int,
+        lookback: int = 2
+    ) -> Optional[tuple[str, str]]:
+        """이전 페이지에서 item_number를 포함하는 지문 범위 검색
+
+        Args:
+            page_number: 현재 페이지 번호
+            item_number: 현재 페이지 첫 문항 번호
+            lookback: 검색할 이전 페이지 수
+
+        Returns:
+            (시작 번호, 끝 번호) 또는 None
+        """
+        for prev in range(page_number - 1, max(0, page_number - 1 - lookback), -1):
+            elements = self.extractor.get_page_elements(prev)
+            for line in reversed(elements["lines"]):
+                match = PASSAGE_ANCHOR.match(line["text"])
+                if match and int(match.group(1)) <= item_number <= int(match.group(2)):
+                    return match.group(1), match.group(2)
+        return None
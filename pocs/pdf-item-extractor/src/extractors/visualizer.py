@@ -0,0 +1,169 @@
+"""세그멘테이션 시각화
+
+페이지 이미지에 문항/지문 bbox를 그립니다.
+지문 반투명 배경은 하나의 오버레이에 모두 그린 뒤 페이지당 한 번만 합성하며,
+여러 페이지는 스레드 풀에서 병렬로 그리고 저장합니다.
+(래스터는 이미 렌더링 풀에서 받아온 상태이므로 프로세스로 다시 보내지 않으며,
+Pillow의 합성/PNG 인코딩은 GIL을 해제합니다)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image, ImageDraw
+
+from ..core.schemas import BoundingBox, ExtractedItem, PassageInfo
+from .page_renderer import PageRaster
+
+
+# 색상 팔레트 - 문항용
+ITEM_COLORS = ["#FF0000", "#00FF00", "#0000FF", "#FF00FF", "#00FFFF", "#FFFF00"]
+# 지문용 색상 (주황색 계열)
+PASSAGE_COLOR = "#FFA500"
+PASSAGE_FILL = (255, 165, 0, 50)  # 주황색 반투명
+
+
+def _scale_bbox(bbox: BoundingBox, scale: float) -> BoundingBox:
+    """bbox 좌표 축척"""
+    return BoundingBox(x1=bbox.x1 * scale, y1=bbox.y1 * scale, x2=bbox.x2 * scale, y2=bbox.y2 * scale)
+
+
+def draw_segmentation(
+    raster: PageRaster,
+    items: list[ExtractedItem],
+    passages: Optional[list[PassageInfo]] = None,
+    scale: float = 1.0
+) -> Image.Image:
+    """페이지 이미지에 문항/지문 bbox 표시
+
+    Args:
+        raster: 페이지 래스터
+        items: 해당 페이지의 문항 목록
+        passages: 해당 페이지의 지문 목록
+        scale: bbox 좌표 → 래스터 픽셀 배율 (래스터 DPI / bbox 기준 DPI)
+
+    Returns:
+        bbox가 표시된 RGB 이미지
+    """
+    if scale != 1.0:
+        items = [item.model_copy(update={"bbox": _scale_bbox(item.bbox, scale)}) for item in items]
+        passages = [
+            passage.model_copy(update={
+                "bbox": _scale_bbox(passage.bbox, scale),
+                "bbox_list": [_scale_bbox(bbox, scale) for bbox in passage.bbox_list]
+            })
+            for passage in passages or []
+        ]
+
+    # 캐시된 버퍼를 공유하지 않도록 그리기용 사본 생성 (1회)
+    img = raster.to_image().convert("RGB")
+
+    # 지문 반투명 배경 (단일 오버레이, 1회 합성)
+    passage_boxes = [
+        (passage, passage.bbox_list if passage.bbox_list else [passage.bbox])
+        for passage in passages or []
+    ]
+    if passage_boxes:
+        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
+        overlay_draw = ImageDraw.Draw(overlay, "RGBA")
+        for _, bboxes in passage_boxes:
+            for bbox in bboxes:
+                overlay_draw.rectangle([bbox.x1, bbox.y1, bbox.x2, bbox.y2], fill=PASSAGE_FILL)
+        img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
+
+    draw = ImageDraw.Draw(img)
+
+    # 지문 테두리 및 라벨
+    for passage, bboxes in passage_boxes:
+        for bbox in bboxes:
+            # 테두리 (점선 효과)
+            for offset in range(2):
+                draw.rectangle(
+                    [bbox.x1 - offset, bbox.y1 - offset, bbox.x2 + offset, bbox.y2 + offset],
+                    outline=PASSAGE_COLOR
+                )
+
+        # 지문 라벨 (첫 번째 bbox에만)
+        first_bbox = bboxes[0]
+        draw.rectangle(
+            [first_bbox.x1, first_bbox.y1 - 25, first_bbox.x1 + 80, first_bbox.y1],
+            fill=PASSAGE_COLOR
+        )
+        draw.text((first_bbox.x1 + 5, first_bbox.y1 - 22), f"[{passage.item_range}]", fill="white")
+
+    # 문항 bbox 그리기
+    for idx, item in enumerate(items):
+        color = ITEM_COLORS[idx % len(ITEM_COLORS)]
+        bbox = item.bbox
+
+        # 박스 그리기 (두꺼운 선)
+        for offset in range(3):
+            draw.rectangle(
+                [bbox.x1 - offset, bbox.y1 - offset, bbox.x2 + offset, bbox.y2 + offset],
+                outline=color
+            )
+
+        # 문항 번호 라벨
+        label = f"#{item.item_number}"
+        if item.passage_ref:
+            label += "*"  # 지문 참조 표시
+        draw.rectangle([bbox.x1, bbox.y1 - 25, bbox.x1 + 60, bbox.y1], fill=color)
+        draw.text((bbox.x1 + 5, bbox.y1 - 22), label, fill="white")
+
+    return img
+
+
+def save_segmentation(
+    raster: PageRaster,
+    items: list[ExtractedItem],
+    passages: Optional[list[PassageInfo]],
+    output_path: Path,
+    scale: float = 1.0
+) -> Path:
+    """bbox가 표시된 페이지 이미지 저장
+
+    Args:
+        raster: 페이지 래스터
+        items: 해당 페이지의 문항 목록
+        passages: 해당 페이지의 지문 목록
+        output_path: 저장 경로
+        scale: bbox 좌표 → 래스터 픽셀 배율
+
+    Returns:
+        저장된 파일 경로
+    """
+    img = draw_segmentation(raster, items, passages, scale)
+    img.save(output_path, "PNG")
+    return output_path
+
+
+def _save_segmentation_task(
+    args: tuple[PageRaster, list[ExtractedItem], list[PassageInfo], Path]
+) -> Path:
+    """워커 스레드에서 시각화 이미지 저장"""
+    return save_segmentation(*args)
+
+
+def save_segmentations_parallel(
+    tasks: list[tuple[PageRaster, list[ExtractedItem], list[PassageInfo], Path]],
+    workers: int
+) -> list[Path]:
+    """여러 페이지 시각화를 스레드 풀로 저장
+
+    Args:
+        tasks: (페이지 래스터, 문항 목록, 지문 목록, 저장 경로) 목록
+        workers: 워커 스레드 수 (1이면 순차 처리)
+
+    Returns:
+        tasks 순서의 저장된 파일 경로 목록
+    """
+    if not tasks:
+        return []
+
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        return [_save_segmentation_task(task) for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_save_segmentation_task, tasks))
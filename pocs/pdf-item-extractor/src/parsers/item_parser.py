@@ -3,18 +3,30 @@
 크롭된 문항 이미지에서 구조화된 콘텐츠를 추출합니다.
 """
 
+import asyncio
+import io
 import json
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
-from google import genai
 from google.genai import types
+from PIL import Image
+from gemini_shared.client_registry import get_client
+from gemini_shared.image_encoder import EncodedImage
+from gemini_shared.model_call import generate_content, generate_content_async, generate_content_stream
+from gemini_shared.prompt_cache import apply_prompt_cache, apply_prompt_cache_async, system_instruction_config
+from gemini_shared.usage_tracker import add_usage, usage_scope
 
 from ..core.config import settings
+from ..core.json_stream import IncrementalJSONParser
 from ..core.schemas import (
-    ContentBlock, ContentType, Choice, ParsedItem, ExtractedItem
+    ContentBlock, ContentType, Choice, ParsedItem, ExtractedItem, TokenUsage
 )
+from ..agents.batch_jobs import BatchJobRunner, BatchRequest
+from ..agents.response_cache import get_response_cache, parts_digest, response_cache_key
+from ..extractors.image_encoder import encode_for_request
+from .mosaic import PACK_MODES, Mosaic, build_mosaic, pack_groups, pack_label
 
 
 class ItemParser:
@@ -34,9 +46,10 @@ class ItemParser:
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
-        self.client = genai.Client(api_key=self.api_key)
         self.model_name = settings.gemini_model
+        self.client = get_client(self.api_key)
         self._prompt_cache: dict[str, str] = {}
+        self.image_encodings: list[dict] = []
 
     def _load_prompt(self, prompt_name: str) -> str:
         """프롬프트 파일 로드"""
@@ -53,44 +66,89 @@ class ItemParser:
         self._prompt_cache[prompt_name] = prompt
         return prompt
 
-    def parse_item(self, image_path: Path) -> ParsedItem:
+    def parse_item(
+        self,
+        image_path: Path,
+        on_block: Optional[Callable[[str, ContentBlock | Choice], None]] = None
+    ) -> ParsedItem:
         """문항 이미지 파싱
 
+        settings.stream_responses가 켜져 있으면 응답을 스트리밍으로 받아
+        질문/선택지/보기 블록이 닫히는 즉시 on_block으로 전달합니다.
+
         Args:
             image_path: 크롭된 문항 이미지 경로
+            on_block: (필드 이름, 블록) 콜백 - 필드는 question, choices, boxed_content (스트리밍 시)
 
         Returns:
             파싱된 문항 구조
         """
-        image_path = Path(image_path)
-        if not image_path.exists():
-            raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
-
-        # 이미지 로드
-        with open(image_path, "rb") as f:
-            image_bytes = f.read()
+        image_path, image = self._read_image(image_path)
 
         # 프롬프트 로드
         prompt = self._load_prompt("item_parsing")
 
-        # Gemini Vision 호출
-        response = self._call_vision(prompt, image_bytes)
+        # Gemini Vision 호출 (토큰 사용량은 문항별로 기록)
+        with usage_scope("P6-PARSE") as usage:
+            if settings.stream_responses:
+                response = self._read_stream(self._call_vision_stream(prompt, image), on_block)
+            else:
+                response = self._call_vision(prompt, image)
 
         # JSON 파싱
         parsed_data = self._extract_json(response)
 
         # ParsedItem 생성
-        return self._build_parsed_item(parsed_data, str(image_path))
+        parsed = self._build_parsed_item(parsed_data, str(image_path))
+        parsed.usage = usage.total
+        return parsed
+
+    async def parse_item_async(self, image_path: Path) -> ParsedItem:
+        """문항 이미지 파싱 (비동기)
+
+        Args:
+            image_path: 크롭된 문항 이미지 경로
+
+        Returns:
+            파싱된 문항 구조
+        """
+        image_path, image = self._read_image(image_path)
+        prompt = self._load_prompt("item_parsing")
+        with usage_scope("P6-PARSE") as usage:
+            response = await self._call_vision_async(prompt, image)
+        parsed = self._build_parsed_item(self._extract_json(response), str(image_path))
+        parsed.usage = usage.total
+        return parsed
+
+    def _read_image(self, image_path: Path) -> tuple[Path, EncodedImage]:
+        """문항 이미지 읽기 및 모델 요청용 인코딩 (선택한 인코딩은 image_encodings에 기록)"""
+        image_path = Path(image_path)
+        if not image_path.exists():
+            raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
+
+        with open(image_path, "rb") as f:
+            image_bytes = f.read()
 
-    def parse_items(self, items: list[ExtractedItem]) -> list[ParsedItem]:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            image = encode_for_request(img, image_bytes, Image.MIME.get(img.format, "image/png"))
+        self.image_encodings.append({"image": str(image_path), **image.describe()})
+        return image_path, image
+
+    def parse_items(self, items: list[ExtractedItem], batch: bool = False) -> list[ParsedItem]:
         """여러 문항 이미지 파싱
 
         Args:
             items: 추출된 문항 목록 (image_path 포함)
+            batch: 배치 예측 작업으로 한 번에 파싱 (완료까지 대기, 응답 처리는 동일)
 
         Returns:
             파싱된 문항 목록
         """
+        if batch:
+            return self._parse_items_batch(items)
+        if settings.parse_pack_mode != "off":
+            return self._parse_items_packed(items, settings.parse_pack_mode)
+
         parsed_items = []
 
         for item in items:
@@ -101,46 +159,431 @@ class ItemParser:
             try:
                 parsed = self.parse_item(Path(item.image_path))
                 parsed_items.append(parsed)
+                self._print_summary(item, parsed)
+
+            except Exception as e:
+                print(f"  문항 {item.item_number}: 파싱 실패 - {e}")
+
+        return parsed_items
 
-                # 콘텐츠 요약 출력
-                text_count = sum(1 for b in parsed.question if b.type == ContentType.TEXT)
-                math_count = sum(1 for b in parsed.question if b.type == ContentType.MATH)
-                image_count = sum(1 for b in parsed.question if b.type == ContentType.IMAGE)
+    async def parse_items_async(self, items: list[ExtractedItem]) -> list[ParsedItem]:
+        """여러 문항 이미지 동시 파싱 (비동기)
 
-                print(f"  문항 {item.item_number}: "
-                      f"텍스트 {text_count}, 수식 {math_count}, 이미지 {image_count}, "
-                      f"선택지 {len(parsed.choices)}개")
+        동시 실행 수는 settings.async_max_concurrency로 제한되며,
+        결과는 입력 순서를 유지합니다.
 
+        Args:
+            items: 추출된 문항 목록 (image_path 포함)
+
+        Returns:
+            파싱된 문항 목록
+        """
+        targets = []
+        for item in items:
+            if not item.image_path:
+                print(f"  문항 {item.item_number}: 이미지 경로 없음, 스킵")
+                continue
+            targets.append(item)
+
+        results = await asyncio.gather(
+            *(self.parse_item_async(Path(item.image_path)) for item in targets),
+            return_exceptions=True
+        )
+
+        parsed_items = []
+        for item, result in zip(targets, results):
+            if isinstance(result, Exception):
+                print(f"  문항 {item.item_number}: 파싱 실패 - {result}")
+                continue
+            parsed_items.append(result)
+            self._print_summary(item, result)
+
+        return parsed_items
+
+    def _parse_items_batch(self, items: list[ExtractedItem]) -> list[ParsedItem]:
+        """여러 문항 이미지를 배치 예측 작업으로 파싱
+
+        요청/응답 처리(프롬프트, 설정, 응답 캐시, JSON 파싱)는 parse_item()과 같습니다.
+
+        Args:
+            items: 추출된 문항 목록 (image_path 포함)
+
+        Returns:
+            파싱된 문항 목록 (입력 순서 유지)
+        """
+        prompt = self._load_prompt("item_parsing")
+        config = self._build_config()
+
+        targets = []
+        requests = []
+        for index, item in enumerate(items):
+            if not item.image_path:
+                print(f"  문항 {item.item_number}: 이미지 경로 없음, 스킵")
+                continue
+            try:
+                image_path, image = self._read_image(Path(item.image_path))
             except Exception as e:
                 print(f"  문항 {item.item_number}: 파싱 실패 - {e}")
+                continue
+
+            key = f"item-{index}"
+            requests.append(BatchRequest(
+                key=key,
+                contents=self._build_contents(image),
+                config=system_instruction_config(prompt, config),
+                cache_key=response_cache_key(self.model_name, prompt, image.data, config)
+            ))
+            targets.append((key, item, image_path))
+
+        if not requests:
+            return []
+
+        try:
+            runner = BatchJobRunner(self.client, self.model_name)
+            results = runner.run(requests, lambda response: response.text, display_name="parse-items")
+        except Exception as e:
+            print(f"  배치 작업 실패: {e}")
+            return []
+
+        parsed_items = []
+        for key, item, image_path in targets:
+            result = results[key]
+            if result.usage is not None:
+                # 배치 결과는 model_call을 거치지 않으므로 사용량을 직접 합산
+                with usage_scope("P6-PARSE"):
+                    add_usage(result.usage)
+            if result.error is not None:
+                print(f"  문항 {item.item_number}: 파싱 실패 - {result.error}")
+                continue
+            try:
+                parsed = self._build_parsed_item(self._extract_json(result.text), str(image_path))
+                parsed.usage = result.usage or TokenUsage()
+            except Exception as e:
+                print(f"  문항 {item.item_number}: 파싱 실패 - {e}")
+                continue
+            parsed_items.append(parsed)
+            self._print_summary(item, parsed)
 
         return parsed_items
 
-    def _call_vision(self, prompt: str, image_bytes: bytes) -> str:
-        """Gemini Vision API 호출"""
-        config = types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.1,
+    def _parse_items_packed(self, items: list[ExtractedItem], mode: str) -> list[ParsedItem]:
+        """작은 문항 크롭을 묶음 요청으로 파싱
+
+        크롭을 입력 순서대로 settings.parse_pack_* 예산에 맞춰 묶고, 묶음마다 요청 1건으로
+        라벨(A, B, ...)별 응답 배열을 받아 문항별 ParsedItem으로 나눕니다.
+        - mosaic: 라벨 모자이크 이미지 1장 (box_2d는 각 크롭 기준으로 변환)
+        - parts: 라벨 텍스트 + 크롭 이미지 파트 나열
+        단독 그룹과 응답에서 빠진 문항은 parse_item()으로 개별 파싱합니다.
+
+        Args:
+            items: 추출된 문항 목록 (image_path 포함)
+            mode: 묶음 방식 (mosaic, parts)
+
+        Returns:
+            파싱된 문항 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 묶음 방식
+        """
+        if mode not in PACK_MODES or mode == "off":
+            raise ValueError(f"지원하지 않는 묶음 방식입니다: {mode} (mosaic, parts)")
+
+        targets = []
+        sizes = []
+        for item in items:
+            if not item.image_path:
+                print(f"  문항 {item.item_number}: 이미지 경로 없음, 스킵")
+                continue
+            image_path = Path(item.image_path)
+            try:
+                with Image.open(image_path) as img:
+                    sizes.append(img.size)
+            except Exception as e:
+                print(f"  문항 {item.item_number}: 파싱 실패 - {e}")
+                continue
+            targets.append((item, image_path))
+
+        groups = pack_groups(
+            sizes, mode,
+            max_items=settings.parse_pack_max_items,
+            token_budget=settings.parse_pack_token_budget,
+            max_crop_tokens=settings.parse_pack_max_crop_tokens,
+            max_width=settings.parse_mosaic_width
         )
+        packed_count = sum(len(group) for group in groups if len(group) > 1)
+        print(f"  묶음 파싱 ({mode}): 문항 {len(targets)}개 → 요청 {len(groups)}건 (묶음 문항 {packed_count}개)")
+
+        parsed_by_index: dict[int, ParsedItem] = {}
+        for group in groups:
+            if len(group) < 2:
+                continue
+            members = [targets[index] for index in group]
+            try:
+                results = self._parse_group(members, mode)
+            except Exception as e:
+                print(f"  묶음 {', '.join(item.item_number for item, _ in members)}: "
+                      f"파싱 실패 - {e}, 개별 파싱으로 재시도")
+                continue
+            for index, parsed in zip(group, results):
+                if parsed is not None:
+                    parsed_by_index[index] = parsed
+
+        parsed_items = []
+        for index, (item, image_path) in enumerate(targets):
+            parsed = parsed_by_index.get(index)
+            if parsed is None:
+                try:
+                    parsed = self.parse_item(image_path)
+                except Exception as e:
+                    print(f"  문항 {item.item_number}: 파싱 실패 - {e}")
+                    continue
+            parsed_items.append(parsed)
+            self._print_summary(item, parsed)
+
+        return parsed_items
+
+    def _parse_group(
+        self,
+        members: list[tuple[ExtractedItem, Path]],
+        mode: str
+    ) -> list[Optional[ParsedItem]]:
+        """문항 묶음 1건 파싱
+
+        Args:
+            members: (문항, 이미지 경로) 목록 (순서대로 라벨 A, B, ...)
+            mode: 묶음 방식 (mosaic, parts)
 
-        contents = [
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part.from_bytes(data=image_bytes, mime_type="image/png"),
-                    types.Part.from_text(text=prompt),
-                ],
+        Returns:
+            문항별 파싱 결과 (응답에 없는 라벨은 None)
+        """
+        labels = [pack_label(index) for index in range(len(members))]
+        prompt = self._load_prompt("item_parsing") + "\n\n" + self._load_prompt(f"item_parsing_{mode}")
+
+        mosaic: Optional[Mosaic] = None
+        if mode == "mosaic":
+            crops = []
+            for _, image_path in members:
+                with Image.open(image_path) as img:
+                    crops.append(img.convert("RGB"))
+            mosaic = build_mosaic(crops, settings.parse_mosaic_width)
+            image = encode_for_request(mosaic.image, token_budget=settings.parse_pack_token_budget)
+            self.image_encodings.append({
+                "image": "mosaic",
+                "items": [str(image_path) for _, image_path in members],
+                **image.describe()
+            })
+            images = [image]
+        else:
+            images = [self._read_image(image_path)[1] for _, image_path in members]
+
+        if mosaic is not None:
+            cache_data = images[0].data
+        else:
+            # 라벨/형식/이미지를 파트별로 구분해 해시 (단순 연결은 경계가 다른 묶음끼리 충돌)
+            cache_data = parts_digest(
+                field
+                for label, image in zip(labels, images)
+                for field in (label.encode("utf-8"), image.mime_type.encode("utf-8"), image.data)
             )
-        ]
 
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=contents,
-            config=config,
+        def build_contents() -> list[types.Content]:
+            if mosaic is not None:
+                return self._build_contents(images[0])
+            parts = []
+            for label, image in zip(labels, images):
+                parts.append(types.Part.from_text(text=f"[{label}]"))
+                parts.append(types.Part.from_bytes(data=image.data, mime_type=image.mime_type))
+            return [types.Content(role="user", parts=parts)]
+
+        with usage_scope("P6-PARSE") as usage:
+            response = self._call_vision_contents(prompt, cache_data, build_contents)
+        entries = self._extract_packed(response)
+
+        results: list[Optional[ParsedItem]] = []
+        shares = self._split_usage(usage.total, len(members))
+        for label, (_, image_path), share in zip(labels, members, shares):
+            data = entries.get(label)
+            if data is None:
+                results.append(None)
+                continue
+            if mosaic is not None:
+                cell = mosaic.cell(label)
+                data = self._remap_boxes(data, lambda box: mosaic.to_crop_box(cell, box))
+            parsed = self._build_parsed_item(data, str(image_path))
+            parsed.usage = share
+            results.append(parsed)
+        return results
+
+    def _extract_packed(self, response_text: str) -> dict[str, dict]:
+        """묶음 응답에서 라벨별 문항 JSON 추출 (배열 또는 {"items": [...]})"""
+        data = self._extract_json(response_text)
+        entries = data.get("items", []) if isinstance(data, dict) else data
+        result = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            key = str(entry.get("key", "")).strip().strip("[]").strip().upper()
+            if key:
+                result.setdefault(key, entry)
+        return result
+
+    def _remap_boxes(self, data: dict, remap: Callable[[list], list]) -> dict:
+        """문항 JSON의 box_2d/boxed_area 좌표 변환 (사본 반환)"""
+        def blocks(values: list) -> list:
+            return [
+                {**block, "box_2d": remap(block.get("box_2d"))} if isinstance(block, dict) else block
+                for block in values
+            ]
+
+        data = dict(data)
+        data["question"] = blocks(data.get("question", []))
+        data["boxed_content"] = blocks(data.get("boxed_content", []))
+        data["choices"] = [
+            {**choice, "box_2d": remap(choice.get("box_2d")), "content": blocks(choice.get("content", []))}
+            if isinstance(choice, dict) else choice
+            for choice in data.get("choices", [])
+        ]
+        if data.get("boxed_area") is not None:
+            data["boxed_area"] = remap(data["boxed_area"])
+        return data
+
+    def _split_usage(self, usage: TokenUsage, count: int) -> list[TokenUsage]:
+        """묶음 요청 사용량을 문항 수로 나눔 (호출 수와 나머지 토큰은 첫 문항에 기록)"""
+        token_fields = ("prompt_tokens", "cached_tokens", "output_tokens", "thinking_tokens", "total_tokens")
+        shares = []
+        for index in range(count):
+            values = {}
+            for name in token_fields:
+                share, rest = divmod(getattr(usage, name), count)
+                values[name] = share + (rest if index == 0 else 0)
+            shares.append(TokenUsage(
+                model=usage.model,
+                calls=usage.calls if index == 0 else 0,
+                cost_usd=usage.cost_usd / count,
+                **values
+            ))
+        return shares
+
+    def _print_summary(self, item: ExtractedItem, parsed: ParsedItem):
+        """콘텐츠 요약 출력"""
+        text_count = sum(1 for b in parsed.question if b.type == ContentType.TEXT)
+        math_count = sum(1 for b in parsed.question if b.type == ContentType.MATH)
+        image_count = sum(1 for b in parsed.question if b.type == ContentType.IMAGE)
+
+        print(f"  문항 {item.item_number}: "
+              f"텍스트 {text_count}, 수식 {math_count}, 이미지 {image_count}, "
+              f"선택지 {len(parsed.choices)}개")
+
+    def _call_vision(self, prompt: str, image: EncodedImage) -> str:
+        """Gemini Vision API 호출 (동일 입력은 응답 캐시 사용)"""
+        return self._call_vision_contents(
+            prompt, image.data, lambda: self._build_contents(image)
         )
 
+    def _call_vision_contents(
+        self,
+        prompt: str,
+        cache_data: bytes,
+        build_contents: Callable[[], list[types.Content]]
+    ) -> str:
+        """Gemini Vision API 호출 (요청 콘텐츠 구성 함수 지정, 동일 입력은 응답 캐시 사용)
+
+        Args:
+            prompt: 정적 프롬프트
+            cache_data: 응답 캐시 키에 사용할 이미지 데이터
+            build_contents: 요청 콘텐츠 구성 함수 (응답 캐시 미적중 시 호출, 프롬프트 제외)
+
+        Returns:
+            응답 텍스트
+        """
+        config = self._build_config()
+
+        cache = get_response_cache()
+        key = response_cache_key(self.model_name, prompt, cache_data, config)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return cached
+
+        # 정적 프롬프트는 시스템 지시문으로 전송 (프롬프트 캐시 세션 중에는 캐시 콘텐츠 참조)
+        request_config = apply_prompt_cache(self.client, self.model_name, prompt, config)
+        contents = build_contents()
+        response = generate_content(self.client, self.model_name, contents, request_config)
+        if cache:
+            cache.put(key, self.model_name, response.text)
         return response.text
 
+    def _call_vision_stream(self, prompt: str, image: EncodedImage) -> Iterator[str]:
+        """Gemini Vision API 스트리밍 호출 (동일 입력은 응답 캐시 사용)
+
+        Yields:
+            응답 텍스트 조각 (응답 캐시 적중 시 전체 텍스트 하나)
+        """
+        config = self._build_config()
+
+        cache = get_response_cache()
+        key = response_cache_key(self.model_name, prompt, image.data, config)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            yield cached
+            return
+
+        request_config = apply_prompt_cache(self.client, self.model_name, prompt, config)
+        contents = self._build_contents(image)
+        texts = []
+        for chunk in generate_content_stream(self.client, self.model_name, contents, request_config):
+            if chunk.text:
+                texts.append(chunk.text)
+                yield chunk.text
+
+        if cache:
+            cache.put(key, self.model_name, "".join(texts))
+
+    def _read_stream(
+        self,
+        texts: Iterator[str],
+        on_block: Optional[Callable[[str, ContentBlock | Choice], None]]
+    ) -> str:
+        """스트리밍 응답을 읽으며 닫힌 블록을 콜백으로 전달하고 전체 텍스트 반환"""
+        parser = IncrementalJSONParser()
+        for text in texts:
+            for key, data in parser.feed(text):
+                if on_block is None:
+                    continue
+                if key in ("question", "boxed_content"):
+                    on_block(key, self._build_block(data))
+                elif key == "choices":
+                    on_block(key, self._build_choice(data))
+        return parser.text
+
+    async def _call_vision_async(self, prompt: str, image: EncodedImage) -> str:
+        """Gemini Vision API 호출 (비동기, 동일 입력은 응답 캐시 사용)"""
+        config = self._build_config()
+
+        cache = get_response_cache()
+        key = response_cache_key(self.model_name, prompt, image.data, config)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return cached
+
+        request_config = await apply_prompt_cache_async(self.client, self.model_name, prompt, config)
+        contents = self._build_contents(image)
+        response = await generate_content_async(self.client, self.model_name, contents, request_config)
+        if cache:
+            cache.put(key, self.model_name, response.text)
+        return response.text
+
+    def _build_config(self) -> types.GenerateContentConfig:
+        """요청 설정 구성"""
+        return types.GenerateContentConfig(
+            response_mime_type="application/json",
+            temperature=0.1,
+        )
+
+    def _build_contents(self, image: EncodedImage) -> list[types.Content]:
+        """요청 콘텐츠 구성 (프롬프트는 시스템 지시문으로 전송하므로 이미지만)"""
+        image_part = types.Part.from_bytes(data=image.data, mime_type=image.mime_type)
+        return [types.Content(role="user", parts=[image_part])]
+
     def _extract_json(self, response_text: str) -> dict:
         """응답에서 JSON 추출"""
         # JSON 블록 추출 시도
@@ -159,42 +602,9 @@ class ItemParser:
 
     def _build_parsed_item(self, data: dict, source_image: str) -> ParsedItem:
         """딕셔너리에서 ParsedItem 생성"""
-        # 질문 콘텐츠 블록
-        question_blocks = []
-        for block in data.get("question", []):
-            question_blocks.append(ContentBlock(
-                type=ContentType(block.get("type", "text")),
-                value=block.get("value", ""),
-                description=block.get("description"),
-                box_2d=block.get("box_2d")
-            ))
-
-        # 선택지
-        choices = []
-        for choice_data in data.get("choices", []):
-            choice_content = []
-            for block in choice_data.get("content", []):
-                choice_content.append(ContentBlock(
-                    type=ContentType(block.get("type", "text")),
-                    value=block.get("value", ""),
-                    description=block.get("description"),
-                    box_2d=block.get("box_2d")
-                ))
-            choices.append(Choice(
-                label=choice_data.get("label", ""),
-                content=choice_content,
-                box_2d=choice_data.get("box_2d")
-            ))
-
-        # 보기 박스 콘텐츠
-        boxed_content = []
-        for block in data.get("boxed_content", []):
-            boxed_content.append(ContentBlock(
-                type=ContentType(block.get("type", "text")),
-                value=block.get("value", ""),
-                description=block.get("description"),
-                box_2d=block.get("box_2d")
-            ))
+        question_blocks = [self._build_block(block) for block in data.get("question", [])]
+        choices = [self._build_choice(choice_data) for choice_data in data.get("choices", [])]
+        boxed_content = [self._build_block(block) for block in data.get("boxed_content", [])]
 
         return ParsedItem(
             item_number=data.get("item_number", ""),
@@ -206,6 +616,23 @@ class ItemParser:
             source_image=source_image
         )
 
+    def _build_block(self, block: dict) -> ContentBlock:
+        """딕셔너리에서 ContentBlock 생성"""
+        return ContentBlock(
+            type=ContentType(block.get("type", "text")),
+            value=block.get("value", ""),
+            description=block.get("description"),
+            box_2d=block.get("box_2d")
+        )
+
+    def _build_choice(self, choice_data: dict) -> Choice:
+        """딕셔너리에서 선택지 생성"""
+        return Choice(
+            label=choice_data.get("label", ""),
+            content=[self._build_block(block) for block in choice_data.get("content", [])],
+            box_2d=choice_data.get("box_2d")
+        )
+
     def save_parsed_items(
         self,
         parsed_items: list[ParsedItem],
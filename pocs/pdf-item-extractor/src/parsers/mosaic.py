@@ -0,0 +1,188 @@
+"""문항 이미지 묶음 요청 구성
+
+작은 문항 크롭 여러 개를 요청 1건으로 묶습니다.
+- mosaic: 라벨([A], [B], ...)을 붙인 크롭을 한 장의 모자이크 이미지로 배치
+  (응답 box_2d는 모자이크 기준이므로 각 크롭 기준으로 다시 변환)
+- parts: 라벨 텍스트와 크롭 이미지를 요청 파트로 나열 (box_2d는 각 이미지 기준)
+"""
+
+import string
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+from gemini_shared.image_encoder import estimate_image_tokens
+
+PACK_MODES = ("off", "mosaic", "parts")
+
+# 모자이크 배치 간격과 라벨 띠 높이 (px)
+MOSAIC_GAP = 16
+LABEL_HEIGHT = 36
+
+
+def pack_label(index: int) -> str:
+    """묶음 안 순서의 라벨 (A, B, ..., Z, AA, AB, ...)"""
+    letters = string.ascii_uppercase
+    label = ""
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, len(letters))
+        label = letters[rest] + label
+    return label
+
+
+@dataclass
+class MosaicCell:
+    """모자이크 안의 크롭 위치 (px, 라벨 띠 제외)"""
+    label: str
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass
+class Mosaic:
+    """라벨을 붙인 크롭 모자이크"""
+    image: Image.Image
+    cells: list[MosaicCell]
+
+    def cell(self, label: str) -> Optional[MosaicCell]:
+        """라벨의 크롭 위치"""
+        for cell in self.cells:
+            if cell.label == label:
+                return cell
+        return None
+
+    def to_crop_box(self, cell: MosaicCell, box_2d: Optional[list]) -> Optional[list[int]]:
+        """모자이크 기준 box_2d(0-1000)를 크롭 기준 box_2d로 변환 (크롭 밖은 경계로 제한)
+
+        Args:
+            cell: 크롭 위치
+            box_2d: [ymin, xmin, ymax, xmax] 모자이크 정규화 좌표
+
+        Returns:
+            크롭 정규화 좌표 (형식이 맞지 않으면 그대로 반환)
+        """
+        if not isinstance(box_2d, list) or len(box_2d) != 4:
+            return box_2d
+        try:
+            ymin, xmin, ymax, xmax = (float(v) for v in box_2d)
+        except (TypeError, ValueError):
+            return box_2d
+
+        def remap(value: float, size: int, offset: int, length: int) -> int:
+            pixel = value / 1000 * size - offset
+            return int(round(min(max(pixel / length * 1000, 0), 1000)))
+
+        width, height = self.image.size
+        return [
+            remap(ymin, height, cell.y, cell.height),
+            remap(xmin, width, cell.x, cell.width),
+            remap(ymax, height, cell.y, cell.height),
+            remap(xmax, width, cell.x, cell.width),
+        ]
+
+
+def mosaic_layout(sizes: list[tuple[int, int]], max_width: int) -> tuple[list[tuple[int, int]], int, int]:
+    """크롭 배치 계산 (입력 순서대로 왼쪽 → 오른쪽, 넘치면 다음 줄)
+
+    Args:
+        sizes: 크롭 (너비, 높이) 목록
+        max_width: 모자이크 최대 너비 (가장 넓은 크롭보다 좁으면 크롭 너비 사용)
+
+    Returns:
+        (크롭별 라벨 띠 왼쪽 위 좌표 목록, 모자이크 너비, 모자이크 높이)
+    """
+    limit = max([max_width] + [w + 2 * MOSAIC_GAP for w, _ in sizes])
+    positions = []
+    x = y = MOSAIC_GAP
+    row_height = 0
+    width = 0
+    for w, h in sizes:
+        if x > MOSAIC_GAP and x + w + MOSAIC_GAP > limit:
+            x = MOSAIC_GAP
+            y += row_height + MOSAIC_GAP
+            row_height = 0
+        positions.append((x, y))
+        x += w + MOSAIC_GAP
+        width = max(width, x)
+        row_height = max(row_height, LABEL_HEIGHT + h)
+    return positions, width, y + row_height + MOSAIC_GAP
+
+
+def mosaic_tokens(sizes: list[tuple[int, int]], max_width: int) -> int:
+    """모자이크의 예상 이미지 토큰"""
+    _, width, height = mosaic_layout(sizes, max_width)
+    return estimate_image_tokens(width, height)
+
+
+def build_mosaic(crops: list[Image.Image], max_width: int) -> Mosaic:
+    """라벨을 붙인 크롭 모자이크 생성
+
+    Args:
+        crops: 크롭 이미지 목록 (순서대로 라벨 A, B, ...)
+        max_width: 모자이크 최대 너비 (px)
+
+    Returns:
+        모자이크 (흰 배경, 크롭 위 라벨 띠에 "[A]" 형식 라벨)
+    """
+    positions, width, height = mosaic_layout([crop.size for crop in crops], max_width)
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=LABEL_HEIGHT - 8)
+
+    cells = []
+    for index, (crop, (x, y)) in enumerate(zip(crops, positions)):
+        label = pack_label(index)
+        draw.text((x, y + 2), f"[{label}]", fill="black", font=font)
+        top = y + LABEL_HEIGHT
+        image.paste(crop.convert("RGB"), (x, top))
+        # 크롭 경계를 구분하는 테두리 (크롭 영역 바깥)
+        draw.rectangle((x - 2, top - 2, x + crop.width + 1, top + crop.height + 1), outline="gray")
+        cells.append(MosaicCell(label=label, x=x, y=top, width=crop.width, height=crop.height))
+    return Mosaic(image=image, cells=cells)
+
+
+def pack_groups(
+    sizes: list[tuple[int, int]],
+    mode: str,
+    max_items: int,
+    token_budget: int,
+    max_crop_tokens: int,
+    max_width: int
+) -> list[list[int]]:
+    """크롭을 입력 순서대로 묶음 요청 그룹으로 나눔
+
+    예상 토큰이 max_crop_tokens를 넘는 크롭은 단독 그룹이 됩니다.
+
+    Args:
+        sizes: 크롭 (너비, 높이) 목록
+        mode: 묶음 방식 (mosaic, parts)
+        max_items: 그룹당 최대 크롭 수
+        token_budget: 그룹당 이미지 토큰 예산 (mosaic는 모자이크, parts는 크롭별 합계)
+        max_crop_tokens: 묶음 대상 크롭의 최대 예상 토큰
+        max_width: 모자이크 최대 너비 (px)
+
+    Returns:
+        크롭 인덱스 그룹 목록
+    """
+    def group_tokens(group: list[int]) -> int:
+        if mode == "mosaic":
+            return mosaic_tokens([sizes[i] for i in group], max_width)
+        return sum(estimate_image_tokens(*sizes[i]) for i in group)
+
+    groups: list[list[int]] = []
+    current: list[int] = []
+    for index, size in enumerate(sizes):
+        if estimate_image_tokens(*size) > max_crop_tokens:
+            groups.append([index])
+            continue
+        if current and (len(current) >= max_items or group_tokens(current + [index]) > token_budget):
+            groups.append(current)
+            current = []
+        current.append(index)
+    if current:
+        groups.append(current)
+    return groups
@@ -1,26 +1,71 @@
 """PDF 문항 추출 파이프라인
 
-P1-LOAD: PDF 로드 및 이미지 변환
-P2-SEGMENT: 문항/지문 경계 추출 (Agentic Vision)
-P3-CROP: 문항/지문 이미지 크롭
+P1-LOAD: PDF 로드 및 이미지 변환 (세그멘테이션용 segment_dpi)
+P2-SEGMENT: 문항/지문 경계 추출 (텍스트 레이어 → Agentic Vision)
+P3-CROP: 문항/지문 이미지 크롭 (문항/지문 영역만 pdf_dpi로 렌더링)
 P4-VISUALIZE: 세그멘테이션 결과 시각화
 P5-VERIFY: 추출 검증
+
+배치 모드에서는 Agentic Vision 세그멘테이션 요청을 하나의 배치 예측 작업으로 제출합니다.
+단 타일 모드(settings.column_tiles)에서는 2단 페이지를 단별 요청으로 나누어 동시에 보내고
+결과를 페이지 좌표로 병합합니다 (스트리밍/배치 모드는 페이지 전체로 요청).
+스트리밍 모드(settings.stream_responses)에서는 응답에서 문항/지문 객체가 닫히는 즉시
+bbox 보정과 크롭을 진행합니다.
 """
 
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+from gemini_shared.file_uploads import get_upload_manager
+from gemini_shared.image_encoder import EncodedImage
+from gemini_shared.prompt_cache import prompt_cache_session
+from gemini_shared.usage_tracker import UsageScope, usage_scope
 
 from .core.config import settings
 from .core.schemas import (
-    ExtractionResult, ExtractedItem, PageLayout, PassageInfo
+    BoundingBox, ExtractionResult, ExtractedItem, PageLayout, PageRecord, PassageInfo
 )
-from .agents.agentic_vision_client import AgenticVisionClient
+from .core.journal import PageJournal, segmentation_settings_hash
+from .core.stage_runner import Stage, StagedRunner
+from .agents.agentic_vision_client import AgenticVisionClient, TileCollisionError
+from .agents.response_cache import get_response_cache
+from .extractors.bbox_refiner import BBoxRefiner
+from .extractors.image_encoder import encode_for_request
+from .extractors.page_renderer import PageRaster
 from .extractors.pdf_extractor import PDFExtractor
+from .extractors.text_segmenter import TextLayerSegmenter
+
+
+@dataclass
+class PageTask:
+    """단계 사이를 이동하는 페이지 단위 작업"""
+    page_number: int
+    raster: Optional[PageRaster] = None
+    width: int = 0
+    height: int = 0
+    items: list[ExtractedItem] = field(default_factory=list)
+    passages: list[PassageInfo] = field(default_factory=list)
+    segmenter: str = "agentic_vision"  # 실제 사용된 분할 방식 (text_layer, agentic_vision)
+    error: Optional[str] = None
+
+
+def _is_cropped(target: ExtractedItem | PassageInfo) -> bool:
+    """크롭 이미지가 이미 저장되었는지 여부 (스트리밍 중 크롭된 문항/지문)"""
+    return bool(target.image_path) and Path(target.image_path).exists()
 
 
 class ItemExtractionPipeline:
-    """문항 추출 파이프라인"""
+    """문항 추출 파이프라인
+
+    P1-LOAD → P2-SEGMENT → P3-CROP/P4-VISUALIZE 단계가 크기 제한 큐로 연결되어
+    페이지 N이 모델 호출 중인 동안 페이지 N+1을 렌더링하고,
+    페이지 N의 bbox가 도착하는 즉시 크롭/시각화 이미지를 저장합니다.
+    P2-SEGMENT는 최대 segment_max_in_flight개의 요청을 동시에 처리하며,
+    결과는 페이지 완료 순서와 무관하게 페이지 순으로 재조립됩니다.
+    텍스트 레이어 분할 신뢰도가 충분한 페이지는 모델을 호출하지 않습니다.
+    """
 
     def __init__(self):
         """파이프라인 초기화"""
@@ -32,7 +77,9 @@ class ItemExtractionPipeline:
         pdf_path: Path,
         page_range: Optional[tuple[int, int]] = None,
         save_images: bool = True,
-        crop_items: bool = False
+        crop_items: bool = False,
+        resume: bool = True,
+        batch: bool = False
     ) -> ExtractionResult:
         """파이프라인 실행
 
@@ -41,6 +88,9 @@ class ItemExtractionPipeline:
             page_range: 처리할 페이지 범위 (시작, 끝) - None이면 전체
             save_images: 시각화 이미지 저장 여부
             crop_items: 문항/지문 개별 이미지 크롭 여부
+            resume: 페이지 저널에서 완료된 페이지 재사용 (False면 저널 초기화)
+            batch: Agentic Vision 세그멘테이션을 배치 예측 작업으로 실행
+                (모든 페이지 요청을 한 번에 제출하고 완료 후 결과를 병합, 단계 파이프라이닝 없음)
 
         Returns:
             추출 결과
@@ -54,7 +104,18 @@ class ItemExtractionPipeline:
         all_passages: list[PassageInfo] = []
         all_layouts: list[PageLayout] = []
 
-        with PDFExtractor(pdf_path) as extractor:
+        items_dir = self.output_dir / "items" / pdf_path.stem
+        passages_dir = self.output_dir / "passages" / pdf_path.stem
+        segmented_dir = self.output_dir / "segmented" / pdf_path.stem
+
+        journal = self.get_journal(pdf_path)
+        if not resume:
+            journal.reset()
+
+        # 정적 프롬프트는 실행 동안 프롬프트 캐시로 전송 (종료 시 삭제)
+        # 모델 호출 토큰 사용량/비용은 run_usage에 단계별로 집계
+        with PDFExtractor(pdf_path) as extractor, prompt_cache_session() as prompt_cache, \
+                usage_scope() as run_usage:
             total_pages = extractor.page_count
 
             # 페이지 범위 결정
@@ -63,69 +124,222 @@ class ItemExtractionPipeline:
 
             print(f"\n총 페이지: {total_pages}, 처리 범위: {start_page}-{end_page}")
 
-            for page_num in range(start_page, end_page + 1):
-                print(f"\n[P1-LOAD] 페이지 {page_num}/{end_page} 로드 중...")
-
-                # P1: 페이지 이미지 변환
-                page_image = extractor.get_page_image(page_num)
-                width, height = extractor.get_page_size(page_num)
-                print(f"  이미지 크기: {width}x{height} 픽셀")
+            segmenter = TextLayerSegmenter(extractor) if settings.text_segmentation else None
+            # 단 타일 분할은 텍스트 레이어 분할 사용 여부와 무관하게 단 구분선만 사용
+            column_detector = (segmenter or TextLayerSegmenter(extractor)) if settings.column_tiles else None
+            refiner = BBoxRefiner(extractor) if settings.bbox_snap else None
+
+            # 저널에서 완료된 페이지 로드
+            # (분할 방식/보정/타일/DPI 설정이 바뀌면 이전 기록은 재사용하지 않음)
+            settings_hash = self._segmentation_settings_hash(extractor)
+            finished = journal.load(extractor.pdf_hash, extractor.dpi, settings.gemini_model, settings_hash)
+
+            def render_stage(page_numbers: list[int]) -> list[PageTask]:
+                # P1: 세그멘테이션용 페이지 이미지 변환 (프로세스 풀 병렬 렌더링)
+                # box_2d는 정규화 좌표이므로 낮은 DPI로 렌더링하고,
+                # bbox는 크롭 DPI 페이지 크기(width/height) 기준 픽셀로 변환
+                rasters = extractor.render_pages(
+                    page_numbers, workers=settings.render_workers, dpi=extractor.segment_dpi
+                )
+                tasks = []
+                for page_num, raster in zip(page_numbers, rasters):
+                    width, height = extractor.get_page_size(page_num)
+                    print(f"\n[P1-LOAD] 페이지 {page_num}/{end_page} 로드 완료 "
+                          f"({raster.width}x{raster.height} 픽셀, {extractor.segment_dpi} DPI)")
+                    tasks.append(PageTask(
+                        page_number=page_num,
+                        raster=raster,
+                        width=width,
+                        height=height
+                    ))
+                return tasks
+
+            def record_page(task: PageTask) -> PageTask:
+                # 성공한 페이지를 저널에 기록
+                if not task.error:
+                    journal.append(PageRecord(
+                        page_number=task.page_number,
+                        pdf_hash=extractor.pdf_hash,
+                        dpi=extractor.dpi,
+                        model_version=settings.gemini_model if task.segmenter == "agentic_vision" else "",
+                        segmenter=task.segmenter,
+                        settings_hash=settings_hash,
+                        items=task.items,
+                        passages=task.passages,
+                        agentic_log=self.vision_client.get_log(task.page_number)
+                    ))
+                return task
+
+            def stream_handler(task: PageTask) -> Callable[[ExtractedItem | PassageInfo], list[str]]:
+                # P2 + P3: 스트리밍 응답에서 닫힌 문항/지문을 바로 보정하고 크롭
+                elements = extractor.get_page_elements(task.page_number) if refiner else None
+
+                def handle(result: ExtractedItem | PassageInfo) -> list[str]:
+                    is_item = isinstance(result, ExtractedItem)
+                    warnings = []
+                    if refiner:
+                        warnings = refiner.refine_page(
+                            task.page_number,
+                            [result] if is_item else [],
+                            [] if is_item else [result],
+                            elements=elements
+                        )
+                    if crop_items and is_item:
+                        result.image_path = str(extractor.save_item_image(result, items_dir))
+                    elif crop_items:
+                        paths = extractor.save_passage_image(result, passages_dir)
+                        result.image_path = str(paths[0]) if paths else None
+                    return warnings
+
+                return handle
+
+            def segment_stage(task: PageTask) -> PageTask:
+                # P2: 문항 경계 추출 (텍스트 레이어 우선, 실패 시 Agentic Vision)
+                if not (segmenter and self._segment_page_text(task, segmenter)):
+                    # 작업자 스레드에는 실행 범위가 이어지지 않으므로 parent로 지정
+                    with usage_scope("P2-SEGMENT", parent=run_usage) as page_usage:
+                        if settings.stream_responses:
+                            self._segment_page_stream(task, stream_handler(task))
+                        else:
+                            self._segment_page(task, self._column_tiles(task, column_detector))
+                    self._record_usage(task.page_number, page_usage)
+                    # 모델 bbox를 PDF 요소 경계에 맞춰 보정 (스트리밍은 객체별로 보정 완료)
+                    if refiner and not task.error and not settings.stream_responses:
+                        self._refine_page(task, refiner)
+                return record_page(task)
+
+            def batch_segment_stage(page_chunks: list[list[int]]) -> list[PageTask]:
+                # P1 + P2: 텍스트 레이어로 분할되지 않은 페이지를 하나의 배치 작업으로 세그멘테이션
+                tasks = []
+                pending = []
+                for chunk in page_chunks:
+                    for task in render_stage(chunk):
+                        tasks.append(task)
+                        if not (segmenter and self._segment_page_text(task, segmenter)):
+                            # 요청용 인코딩 이미지만 유지하고 래스터는 바로 해제
+                            pending.append((task, encode_for_request(task.raster.to_image())))
+                            task.raster = None
+
+                with usage_scope("P2-SEGMENT"):
+                    self._segment_pages_batch(pending, display_name=f"segment-{pdf_path.stem}")
+                for task, _ in pending:
+                    if refiner and not task.error:
+                        self._refine_page(task, refiner)
+                return [output_stage(record_page(task)) for task in tasks]
+
+            def output_stage(task: PageTask) -> PageTask:
+                if task.error or not task.items:
+                    return task
+
+                # P3: 문항/지문 이미지 크롭
+                # (스트리밍 중 이미 크롭된 문항/지문은 제외)
+                # 여러 output_workers 스레드의 출력이 섞이지 않도록 페이지 단위로 모아서 출력
+                items = [item for item in task.items if not _is_cropped(item)]
+                passages = [passage for passage in task.passages if not _is_cropped(passage)]
+                lines = []
+                if crop_items and (items or passages):
+                    lines.append(f"\n[P3-CROP] 페이지 {task.page_number} 문항/지문 이미지 크롭")
+                    extractor.save_all_items(items, items_dir, lines=lines)
+                    if passages:
+                        extractor.save_all_passages(passages, passages_dir, lines=lines)
 
-                # P2: 문항 경계 추출 (Agentic Vision)
-                print(f"\n[P2-SEGMENT] 문항 경계 추출 중 (Agentic Vision)...")
-                try:
-                    items, passages = self.vision_client.extract_items_from_page(
-                        page_image, page_num, width, height
+                # P4: 세그멘테이션 결과 시각화
+                if save_images:
+                    path = extractor.save_page_with_boxes(
+                        task.page_number, task.items, segmented_dir, task.passages,
+                        dpi=extractor.segment_dpi
                     )
-                    print(f"  발견된 문항: {len(items)}개")
-                    if passages:
-                        print(f"  공유 지문: {len(passages)}개")
-
-                    for item in items:
-                        ref_info = f" [→{item.passage_ref}]" if item.passage_ref else ""
-                        print(f"    - 문항 {item.item_number}: "
-                              f"({item.bbox.x1:.0f}, {item.bbox.y1:.0f}) - "
-                              f"({item.bbox.x2:.0f}, {item.bbox.y2:.0f}){ref_info}")
-
-                    for passage in passages:
-                        bbox_count = len(passage.bbox_list) if passage.bbox_list else 1
-                        print(f"    - 지문 [{passage.item_range}]: "
-                              f"({passage.bbox.x1:.0f}, {passage.bbox.y1:.0f}) - "
-                              f"({passage.bbox.x2:.0f}, {passage.bbox.y2:.0f})"
-                              f" ({bbox_count}개 영역)")
-
-                    all_items.extend(items)
-                    all_passages.extend(passages)
-
-                except Exception as e:
-                    print(f"  문항 추출 실패: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-            # P3: 문항/지문 이미지 크롭
-            if crop_items and all_items:
-                print(f"\n[P3-CROP] 문항/지문 이미지 크롭 중...")
-                items_dir = self.output_dir / "items" / pdf_path.stem
-                extractor.save_all_items(all_items, items_dir)
-                print(f"  문항 저장 위치: {items_dir}")
+                    lines.append(f"\n[P4-VISUALIZE] 저장: {path.name}")
+                if lines:
+                    print("\n".join(lines))
+                return task
+
+            # 저널에 기록된 페이지는 모델 호출 없이 재사용
+            page_numbers = list(range(start_page, end_page + 1))
+            resumed = []
+            for page_num in page_numbers:
+                record = finished.get(page_num)
+                if record is None:
+                    continue
+                if record.agentic_log:
+                    self.vision_client.add_log(record.agentic_log)
+                resumed.append(PageTask(
+                    page_number=page_num,
+                    items=record.items,
+                    passages=record.passages
+                ))
+            if resumed:
+                print(f"\n[RESUME] 저널에서 {len(resumed)}개 페이지 재사용: "
+                      f"{', '.join(str(t.page_number) for t in resumed)}")
+                page_numbers = [p for p in page_numbers if p not in finished]
+
+            # 렌더링 워커 수만큼 페이지를 묶어 렌더링 단계에 전달
+            chunk_size = max(1, settings.render_workers)
+            chunks = [
+                page_numbers[i:i + chunk_size]
+                for i in range(0, len(page_numbers), chunk_size)
+            ]
+
+            completed = [output_stage(task) for task in resumed]
+            if batch:
+                completed += batch_segment_stage(chunks)
+            else:
+                runner = StagedRunner(
+                    stages=[
+                        Stage("P1-LOAD", render_stage, workers=1, expand=True),
+                        Stage("P2-SEGMENT", segment_stage,
+                              workers=self.vision_client.max_in_flight),
+                        Stage("P3-OUTPUT", output_stage, workers=settings.output_workers),
+                    ],
+                    queue_size=settings.stage_queue_size
+                )
+                completed += runner.run(chunks)
+
+                for error in runner.errors:
+                    print(f"\n[{error.stage}] 처리 실패: {error.error}")
+                    print(error.traceback)
+
+            # 페이지 순서대로 결과 재조립
+            for task in sorted(completed, key=lambda t: t.page_number):
+                all_items.extend(task.items)
+                all_passages.extend(task.passages)
 
+            if crop_items and all_items:
+                print(f"\n  문항 저장 위치: {items_dir}")
                 if all_passages:
-                    passages_dir = self.output_dir / "passages" / pdf_path.stem
-                    extractor.save_all_passages(all_passages, passages_dir)
                     print(f"  지문 저장 위치: {passages_dir}")
-
-            # P4: 세그멘테이션 결과 시각화
             if save_images and all_items:
-                print(f"\n[P4-VISUALIZE] 세그멘테이션 결과 저장 중...")
-                output_subdir = self.output_dir / "segmented" / pdf_path.stem
-                extractor.save_all_pages_with_boxes(all_items, output_subdir, all_passages)
-                print(f"  저장 위치: {output_subdir}")
+                print(f"  시각화 저장 위치: {segmented_dir}")
 
             # P5: 검증
             print(f"\n[P5-VERIFY] 추출 검증...")
             print(f"  총 추출 문항: {len(all_items)}개")
             print(f"  총 공유 지문: {len(all_passages)}개")
 
+            cache_stats = extractor.page_cache.stats()
+            print(f"  페이지 캐시: 적중 {cache_stats['hits']}회, "
+                  f"디스크 적중 {cache_stats['disk_hits']}회, "
+                  f"미스 {cache_stats['misses']}회, "
+                  f"메모리 {cache_stats['size_bytes'] / 1024 / 1024:.1f}MB")
+
+            response_cache = get_response_cache()
+            if response_cache:
+                response_stats = response_cache.stats()
+                print(f"  응답 캐시: 적중 {response_stats['hits']}회, "
+                      f"미스 {response_stats['misses']}회 "
+                      f"(적중률 {response_stats['hit_rate']:.0%}), "
+                      f"{response_stats['entries']}개 항목")
+            if prompt_cache:
+                prompt_stats = prompt_cache.stats()
+                print(f"  프롬프트 캐시: 캐시 {prompt_stats['caches']}개, "
+                      f"입력 토큰 캐시 {prompt_stats['cached_tokens']:,} / "
+                      f"신규 {prompt_stats['fresh_tokens']:,}")
+            upload_manager = get_upload_manager()
+            if upload_manager:
+                upload_stats = upload_manager.stats()
+                print(f"  이미지 업로드: {upload_stats['uploads']}건, 재사용 {upload_stats['reused']}건 "
+                      f"(인라인 전송 절감 {upload_stats['bytes_saved'] / 1024 / 1024:.1f}MB)")
+
         # 결과 생성
         result = ExtractionResult(
             source_pdf=str(pdf_path),
@@ -135,16 +349,305 @@ class ItemExtractionPipeline:
             passages=all_passages,
             layouts=all_layouts,
             extracted_at=datetime.now(),
-            model_version=settings.gemini_model
+            model_version=settings.gemini_model,
+            usage=run_usage.total,
+            usage_by_stage=dict(run_usage.by_stage)
         )
 
         # Agentic 로그 출력
-        self._print_agentic_summary()
+        self._print_agentic_summary(run_usage)
 
         return result
 
-    def _print_agentic_summary(self):
-        """Agentic Vision 실행 요약 출력"""
+    def get_journal(self, pdf_path: Path) -> PageJournal:
+        """PDF별 페이지 저널 반환"""
+        return PageJournal(self.output_dir / "journal" / f"{Path(pdf_path).stem}.jsonl")
+
+    @staticmethod
+    def _segmentation_settings_hash(extractor: PDFExtractor) -> str:
+        """저널 재사용 조건에 포함할 세그멘테이션 설정 해시"""
+        return segmentation_settings_hash({
+            "text_segmentation": settings.text_segmentation,
+            "text_segment_min_confidence": settings.text_segment_min_confidence,
+            "bbox_snap": settings.bbox_snap,
+            "column_tiles": settings.column_tiles,
+            "column_tile_margin": settings.column_tile_margin,
+            "column_tile_token_budget": settings.column_tile_token_budget,
+            "segment_dpi": extractor.segment_dpi,
+        })
+
+    def _segment_page_text(self, task: PageTask, segmenter: TextLayerSegmenter) -> bool:
+        """P2: 텍스트 레이어로 문항/지문 경계 추출
+
+        Args:
+            task: 페이지 작업 (채택 시 items/passages가 채워짐)
+            segmenter: 텍스트 레이어 분할기
+
+        Returns:
+            분할 결과 채택 여부 (False면 Agentic Vision으로 처리)
+        """
+        try:
+            segmentation = segmenter.segment(task.page_number)
+        except Exception as e:
+            print(f"\n[P2-SEGMENT] 페이지 {task.page_number} 텍스트 레이어 분할 실패: {e}")
+            return False
+
+        if segmentation.confidence < settings.text_segment_min_confidence:
+            notes = ", ".join(segmentation.notes) or "-"
+            print(f"\n[P2-SEGMENT] 페이지 {task.page_number} 텍스트 레이어 신뢰도 "
+                  f"{segmentation.confidence:.2f} ({notes}) → Agentic Vision 사용")
+            return False
+
+        lines = [
+            f"\n[P2-SEGMENT] 페이지 {task.page_number} 문항 경계 추출 (텍스트 레이어, "
+            f"신뢰도 {segmentation.confidence:.2f})",
+            f"  발견된 문항: {len(segmentation.items)}개",
+        ]
+        if segmentation.passages:
+            lines.append(f"  공유 지문: {len(segmentation.passages)}개")
+        print("\n".join(lines))
+
+        task.items = segmentation.items
+        task.passages = segmentation.passages
+        task.segmenter = "text_layer"
+        task.raster = None
+        return True
+
+    def _refine_page(self, task: PageTask, refiner: BBoxRefiner):
+        """P2: 모델 bbox를 텍스트 라인/도형 경계에 맞춰 보정
+
+        Args:
+            task: 페이지 작업 (items/passages의 bbox가 보정됨)
+            refiner: bbox 보정기
+        """
+        try:
+            warnings = refiner.refine_page(task.page_number, task.items, task.passages)
+        except Exception as e:
+            print(f"\n[P2-SEGMENT] 페이지 {task.page_number} bbox 보정 실패: {e}")
+            return
+
+        lines = [f"\n[P2-SEGMENT] 페이지 {task.page_number} bbox 보정 완료"]
+        lines.extend(f"  - 경고: {warning}" for warning in warnings)
+        print("\n".join(lines))
+
+    def _column_tiles(self, task: PageTask, detector: Optional[TextLayerSegmenter]) -> list[BoundingBox]:
+        """단 타일 세그멘테이션 영역 (비활성화되었거나 단이 하나면 빈 목록)"""
+        if detector is None:
+            return []
+        try:
+            return detector.column_tiles(task.page_number, margin=settings.column_tile_margin)
+        except Exception as e:
+            print(f"\n[P2-SEGMENT] 페이지 {task.page_number} 단 검출 실패, 페이지 전체로 요청: {e}")
+            return []
+
+    def _segment_page(self, task: PageTask, tiles: Optional[list[BoundingBox]] = None):
+        """P2: 페이지 문항/지문 경계 추출
+
+        Args:
+            task: 페이지 작업 (items/passages가 채워짐)
+            tiles: 단 타일 영역 (있으면 단별 요청을 동시에 보내고 페이지 좌표로 병합)
+        """
+        mode = f"Agentic Vision, 단 타일 {len(tiles)}개" if tiles else "Agentic Vision"
+        lines = [f"\n[P2-SEGMENT] 페이지 {task.page_number} 문항 경계 추출 중 ({mode})..."]
+        try:
+            # 모델 요청 직전에만 인코딩 (box_2d는 원본 크기 기준으로 변환)
+            images = []
+            result = None
+            if tiles:
+                images = self._encode_tiles(task, tiles, lines)
+                try:
+                    result = self.vision_client.extract_items_from_tiles(
+                        [(image.data, image.mime_type, tile) for image, tile in zip(images, tiles)],
+                        task.page_number
+                    )
+                except TileCollisionError as e:
+                    # 단 분할이 문항을 가른 페이지는 타일 결과를 버리고 페이지 전체로 요청
+                    lines.append(f"  {e} → 페이지 전체로 다시 요청")
+            if result is None:
+                page_image = self._encode_page(task, lines)
+                images.append(page_image)
+                result = self.vision_client.extract_items_from_page(
+                    page_image.data, task.page_number, task.width, task.height, page_image.mime_type
+                )
+            items, passages = result
+            self._set_segmentation(task, items, passages, lines)
+            self._record_encoding(task.page_number, *images)
+
+        except Exception as e:
+            import traceback
+            lines.append(f"  문항 추출 실패: {e}")
+            lines.append(traceback.format_exc())
+            task.error = str(e)
+
+        finally:
+            # 모델 호출 후 페이지 래스터는 더 이상 필요 없음
+            task.raster = None
+
+        print("\n".join(lines))
+
+    def _segment_page_stream(
+        self,
+        task: PageTask,
+        on_result: Callable[[ExtractedItem | PassageInfo], list[str]]
+    ):
+        """P2: 스트리밍 응답으로 페이지 문항/지문 경계 추출
+
+        응답에서 문항/지문 객체가 닫힐 때마다 on_result(보정/크롭)를 호출하므로
+        나머지 응답을 기다리지 않고 후속 처리를 시작합니다.
+
+        Args:
+            task: 페이지 작업 (items/passages가 채워짐)
+            on_result: 문항/지문 하나를 처리하고 경고 메시지 목록을 반환하는 콜백
+        """
+        lines = [f"\n[P2-SEGMENT] 페이지 {task.page_number} 문항 경계 추출 중 (Agentic Vision, 스트리밍)..."]
+        items: list[ExtractedItem] = []
+        passages: list[PassageInfo] = []
+        warnings: list[str] = []
+        started = time.monotonic()
+        first_result = None
+        try:
+            image = self._encode_page(task, lines)
+            results = self.vision_client.extract_items_from_page_stream(
+                image.data, task.page_number, task.width, task.height, image.mime_type
+            )
+            for result in results:
+                if first_result is None:
+                    first_result = time.monotonic() - started
+                warnings.extend(on_result(result))
+                if isinstance(result, ExtractedItem):
+                    items.append(result)
+                else:
+                    passages.append(result)
+
+            if first_result is not None:
+                lines.append(f"  첫 객체 수신: {first_result:.1f}초, "
+                             f"응답 완료: {time.monotonic() - started:.1f}초")
+            self._set_segmentation(task, items, passages, lines)
+            self._record_encoding(task.page_number, image)
+            lines.extend(f"  - 경고: {warning}" for warning in warnings)
+
+        except Exception as e:
+            import traceback
+            lines.append(f"  문항 추출 실패: {e}")
+            lines.append(traceback.format_exc())
+            task.error = str(e)
+
+        finally:
+            task.raster = None
+
+        print("\n".join(lines))
+
+    def _segment_pages_batch(self, pending: list[tuple[PageTask, EncodedImage]], display_name: str):
+        """P2: 여러 페이지의 문항/지문 경계를 배치 예측 작업으로 추출
+
+        Args:
+            pending: (페이지 작업, 요청용 인코딩 이미지) 목록 (items/passages 또는 error가 채워짐)
+            display_name: 배치 작업 표시 이름
+        """
+        if not pending:
+            return
+
+        print(f"\n[P2-SEGMENT] {len(pending)}개 페이지 문항 경계 추출 배치 작업 (Agentic Vision)...")
+        pages = [
+            (task.page_number, image.data, image.mime_type, task.width, task.height)
+            for task, image in pending
+        ]
+        try:
+            extracted = self.vision_client.extract_items_from_pages_batch(pages, display_name)
+        except Exception as e:
+            print(f"  배치 작업 실패: {e}")
+            for task, _ in pending:
+                task.error = str(e)
+            return
+
+        for task, image in pending:
+            lines = [f"\n[P2-SEGMENT] 페이지 {task.page_number} 문항 경계 추출 (배치 작업)",
+                     f"  이미지 인코딩: {image.summary()}"]
+            result = extracted[task.page_number]
+            if isinstance(result, Exception):
+                lines.append(f"  문항 추출 실패: {result}")
+                task.error = str(result)
+            else:
+                self._set_segmentation(task, *result, lines)
+                self._record_encoding(task.page_number, image)
+            print("\n".join(lines))
+
+    def _encode_page(self, task: PageTask, lines: list[str]) -> EncodedImage:
+        """모델 요청용 페이지 이미지 인코딩 (토큰/픽셀 예산, 선택한 인코딩 출력)"""
+        image = encode_for_request(task.raster.to_image())
+        lines.append(f"  이미지 인코딩: {image.summary()}")
+        return image
+
+    def _encode_tiles(self, task: PageTask, tiles: list[BoundingBox], lines: list[str]) -> list[EncodedImage]:
+        """모델 요청용 단 타일 이미지 인코딩 (타일별 토큰 예산, 선택한 인코딩 출력)
+
+        타일 영역은 크롭 DPI 기준 픽셀이므로 세그멘테이션 래스터 크기로 축척해서 잘라냅니다.
+        """
+        page = task.raster.to_image()
+        scale_x = page.width / task.width
+        scale_y = page.height / task.height
+        images = []
+        for index, tile in enumerate(tiles, 1):
+            image = encode_for_request(
+                page.crop((
+                    int(tile.x1 * scale_x), int(tile.y1 * scale_y),
+                    int(round(tile.x2 * scale_x)), int(round(tile.y2 * scale_y))
+                )),
+                token_budget=settings.column_tile_token_budget
+            )
+            lines.append(f"  단 타일 {index} 인코딩: {image.summary()}")
+            images.append(image)
+        return images
+
+    def _record_encoding(self, page_number: int, *images: EncodedImage):
+        """선택한 이미지 인코딩을 페이지 Agentic 로그에 기록 (단 타일이면 타일별 목록)"""
+        log = self.vision_client.get_log(page_number)
+        if log is not None:
+            if len(images) == 1:
+                log.image_encoding = images[0].describe()
+            else:
+                log.image_encoding = {"tiles": [image.describe() for image in images]}
+
+    def _record_usage(self, page_number: int, usage: UsageScope):
+        """페이지 세그멘테이션 토큰 사용량을 페이지 Agentic 로그에 기록"""
+        log = self.vision_client.get_log(page_number)
+        if log is not None:
+            log.usage = usage.total
+
+    def _set_segmentation(
+        self,
+        task: PageTask,
+        items: list[ExtractedItem],
+        passages: list[PassageInfo],
+        lines: list[str]
+    ):
+        """세그멘테이션 결과를 페이지 작업에 반영하고 출력 줄 추가"""
+        lines.append(f"  발견된 문항: {len(items)}개")
+        if passages:
+            lines.append(f"  공유 지문: {len(passages)}개")
+
+        for item in items:
+            ref_info = f" [→{item.passage_ref}]" if item.passage_ref else ""
+            lines.append(f"    - 문항 {item.item_number}: "
+                         f"({item.bbox.x1:.0f}, {item.bbox.y1:.0f}) - "
+                         f"({item.bbox.x2:.0f}, {item.bbox.y2:.0f}){ref_info}")
+
+        for passage in passages:
+            bbox_count = len(passage.bbox_list) if passage.bbox_list else 1
+            lines.append(f"    - 지문 [{passage.item_range}]: "
+                         f"({passage.bbox.x1:.0f}, {passage.bbox.y1:.0f}) - "
+                         f"({passage.bbox.x2:.0f}, {passage.bbox.y2:.0f})"
+                         f" ({bbox_count}개 영역)")
+
+        task.items = items
+        task.passages = passages
+
+    def _print_agentic_summary(self, usage: Optional[UsageScope] = None):
+        """Agentic Vision 실행 요약 출력
+
+        Args:
+            usage: 실행 범위의 토큰 사용량 (단계별 합계 출력)
+        """
         logs = self.vision_client.get_logs()
         if not logs:
             return
@@ -167,6 +670,14 @@ class ItemExtractionPipeline:
             act_count = sum(1 for s in log.steps if s.step_type == "act")
             observe_count = sum(1 for s in log.steps if s.step_type == "observe")
             print(f"  Think: {think_count}, Act: {act_count}, Observe: {observe_count}")
+            if log.usage is not None:
+                print(f"  {log.usage.summary()}")
+
+        if usage is not None and usage.total.calls:
+            # 저널에서 재사용한 페이지는 이번 실행 합계에 포함되지 않음
+            print(f"\n이번 실행 {usage.total.summary()}")
+            for stage, stage_usage in sorted(usage.by_stage.items()):
+                print(f"  {stage}: {stage_usage.summary()}")
 
     def save_result(self, result: ExtractionResult, output_path: Optional[Path] = None) -> Path:
         """결과 저장
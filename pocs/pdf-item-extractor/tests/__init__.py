@@ -0,0 +1 @@
+"""Tests for PDF Item Extractor POC"""
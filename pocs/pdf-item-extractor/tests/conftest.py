@@ -0,0 +1,63 @@
+"""공용 테스트 fixture"""
+
+from pathlib import Path
+
+import fitz  # PyMuPDF
+import pytest
+
+from src.extractors.page_cache import PageCache
+from src.extractors.pdf_extractor import PDFExtractor
+
+
+# 합성 시험지 페이지 (A4, pt)
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+SEPARATOR_X = 297.5
+LEFT_X, RIGHT_X = 40, 310
+
+# (x, 기준선 y, 텍스트, 글자 크기)
+EXAM_LINES = [
+    (LEFT_X, 100, "1. What is the sum of 2 and 3?", 11),
+    (LEFT_X + 12, 120, "Choose the correct answer below.", 10),
+    (LEFT_X + 12, 140, "(1) 4  (2) 5  (3) 6", 10),
+    (LEFT_X, 260, "2. Find the value of x.", 11),
+    (LEFT_X + 12, 280, "x + 1 = 3", 10),
+    (RIGHT_X, 100, "[3 ~ 4] Read the passage and answer.", 11),
+    (RIGHT_X + 12, 120, "The passage text starts here.", 10),
+    (RIGHT_X + 12, 140, "It continues for one more line.", 10),
+    (RIGHT_X, 220, "3. What is the main idea?", 11),
+    (RIGHT_X + 12, 240, "(1) first  (2) second", 10),
+    (RIGHT_X, 360, "4. Which detail is correct?", 11),
+    (RIGHT_X + 12, 380, "(1) yes  (2) no", 10),
+]
+
+
+def write_exam_pdf(
+    path: Path, separator: bool = True, lines: list = EXAM_LINES, pages: int = 1
+) -> Path:
+    """2단 구분선, 머리글 가로선, 쪽번호 상자가 있는 합성 시험지 PDF (모든 페이지 동일)"""
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        page.draw_line((30, 60), (PAGE_WIDTH - 30, 60))
+        if separator:
+            page.draw_line((SEPARATOR_X, 70), (SEPARATOR_X, 780))
+        page.draw_rect(fitz.Rect(270, 800, 325, 820))
+        for x, y, text, size in lines:
+            page.insert_text((x, y), text, fontsize=size)
+        # 4번 문항의 그림
+        page.draw_rect(fitz.Rect(RIGHT_X + 12, 400, RIGHT_X + 150, 480))
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def exam_pdf(tmp_path) -> Path:
+    return write_exam_pdf(tmp_path / "exam.pdf")
+
+
+@pytest.fixture
+def extractor(exam_pdf):
+    """72 DPI(1pt = 1px) 추출기, 메모리 페이지 캐시만 사용"""
+    with PDFExtractor(exam_pdf, dpi=72, page_cache=PageCache(max_bytes=64 * 1024 * 1024)) as extractor:
+        yield extractor
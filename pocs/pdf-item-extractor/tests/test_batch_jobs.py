@@ -0,0 +1,169 @@
+"""배치 작업 요청 직렬화 테스트"""
+
+import json
+
+import pytest
+from google.genai import types
+
+from src.agents import batch_jobs
+from src.agents.batch_jobs import BatchJobRunner, BatchRequest, parse_request_payload, request_payload
+from src.agents.response_cache import ResponseCache
+
+
+IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+
+
+def make_contents(image: bytes = IMAGE) -> list[types.Content]:
+    return [types.Content(role="user", parts=[
+        types.Part.from_bytes(data=image, mime_type="image/png"),
+        types.Part.from_text(text="문항을 찾아주세요"),
+    ])]
+
+
+def make_config() -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        temperature=0.0,
+        max_output_tokens=2048,
+        response_mime_type="application/json",
+        system_instruction="시스템 프롬프트",
+        tools=[types.Tool(code_execution=types.ToolCodeExecution())],
+    )
+
+
+def round_trip(contents, config):
+    # 작업 파일처럼 JSON 문자열을 거쳐 복원
+    payload = json.loads(json.dumps(request_payload(contents, config)))
+    return parse_request_payload(payload)
+
+
+class TestRequestPayload:
+    """request_payload / parse_request_payload 왕복 테스트"""
+
+    def test_rest_field_names(self):
+        payload = request_payload(make_contents(), make_config())
+
+        assert set(payload) == {"contents", "generationConfig", "tools", "systemInstruction"}
+        assert payload["generationConfig"] == {
+            "temperature": 0.0, "maxOutputTokens": 2048, "responseMimeType": "application/json"
+        }
+        assert "inlineData" in payload["contents"][0]["parts"][0]
+
+    def test_contents_round_trip(self):
+        contents, _ = round_trip(make_contents(), make_config())
+
+        assert contents == make_contents()
+        assert contents[0].parts[0].inline_data.data == IMAGE
+
+    def test_config_round_trip(self):
+        _, config = round_trip(make_contents(), make_config())
+
+        assert config.temperature == 0.0
+        assert config.max_output_tokens == 2048
+        assert config.response_mime_type == "application/json"
+        assert config.tools[0].code_execution is not None
+        # 문자열 system_instruction은 Content로 복원
+        assert config.system_instruction.parts[0].text == "시스템 프롬프트"
+
+    def test_cached_content_round_trip(self):
+        _, config = round_trip(make_contents(), types.GenerateContentConfig(cached_content="cachedContents/abc"))
+
+        assert config.cached_content == "cachedContents/abc"
+
+    def test_without_config(self):
+        payload = request_payload(make_contents())
+        contents, config = parse_request_payload(payload)
+
+        assert set(payload) == {"contents"}
+        assert contents == make_contents()
+        assert config == types.GenerateContentConfig()
+
+    def test_non_generation_fields_dropped(self):
+        config = types.GenerateContentConfig(temperature=0.5, http_options=types.HttpOptions(timeout=1000))
+        payload = request_payload(make_contents(), config)
+
+        assert payload["generationConfig"] == {"temperature": 0.5}
+
+
+class FakeBackend:
+    """작업 파일을 기록하고 요청마다 고정 응답을 돌려주는 백엔드"""
+
+    def __init__(self):
+        self.submitted: list[list[dict]] = []
+
+    def submit(self, model, requests_path, display_name):
+        records = [json.loads(line) for line in requests_path.read_text(encoding="utf-8").splitlines()]
+        self.submitted.append(records)
+        return f"batches/fake-{len(self.submitted)}"
+
+    def state(self, job_name):
+        return "JOB_STATE_SUCCEEDED", None
+
+    def download(self, job_name, output_path):
+        response = {"candidates": [{"content": {"role": "model", "parts": [{"text": "응답"}]}}]}
+        lines = [json.dumps({"key": record["key"], "response": response}) for record in self.submitted[-1]]
+        output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return output_path
+
+
+@pytest.fixture
+def runner(tmp_path):
+    runner = BatchJobRunner(client=None, model="test-model", backend="local", work_dir=tmp_path, poll_interval=0)
+    runner.backend = FakeBackend()
+    return runner
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    """image_part 대체: 호출된 이미지를 기록하고 파일 참조 파트 반환"""
+    calls = []
+
+    def fake_image_part(client, data, mime_type):
+        calls.append(data)
+        return types.Part.from_uri(file_uri=f"files/{len(calls)}", mime_type=mime_type)
+
+    monkeypatch.setattr(batch_jobs, "image_part", fake_image_part)
+    return calls
+
+
+class TestBatchJobRunner:
+    """작업 파일 이름 / 업로드 대상 테스트"""
+
+    def test_requests_path_uses_inline_digest(self, runner, uploads):
+        requests = [BatchRequest(key="1", contents=make_contents())]
+        path = runner._requests_path(requests, "job")
+
+        # 업로드 URI가 달라도 이름은 인라인 이미지 기준으로 같음
+        runner._attach_uploads(requests)
+        runner._attach_uploads(requests)
+        assert runner._requests_path(requests, "job") == path
+        assert runner._requests_path([BatchRequest(key="1", contents=make_contents(b"other"))], "job") != path
+
+    def test_attach_uploads_replaces_inline_parts(self, runner, uploads):
+        requests = [BatchRequest(key="1", contents=make_contents(), config=make_config(), cache_key="c")]
+        attached = runner._attach_uploads(requests)
+
+        assert uploads == [IMAGE]
+        assert attached[0].contents[0].parts[0].file_data.file_uri == "files/1"
+        assert attached[0].contents[0].parts[1].text == "문항을 찾아주세요"
+        assert (attached[0].config, attached[0].cache_key) == (requests[0].config, "c")
+        # 원본 요청은 인라인 그대로
+        assert requests[0].contents[0].parts[0].inline_data.data == IMAGE
+
+    def test_run_uploads_only_pending(self, runner, uploads, tmp_path, monkeypatch):
+        cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=0, max_bytes=1024)
+        monkeypatch.setattr(batch_jobs, "get_response_cache", lambda: cache)
+        cache.put("cached", "test-model", "캐시 응답")
+        requests = [
+            BatchRequest(key="1", contents=make_contents(b"cached image"), cache_key="cached"),
+            BatchRequest(key="2", contents=make_contents(), cache_key="new"),
+        ]
+        try:
+            results = runner.run(requests, lambda response: response.text, "job")
+        finally:
+            cache.close()
+
+        assert uploads == [IMAGE]
+        assert [record["key"] for record in runner.backend.submitted[0]] == ["2"]
+        assert results["1"].cached and results["1"].text == "캐시 응답"
+        assert results["2"].text == "응답"
+        assert not list(tmp_path.glob("*.job"))
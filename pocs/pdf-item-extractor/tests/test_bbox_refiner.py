@@ -0,0 +1,137 @@
+"""bbox 보정기 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.schemas import BoundingBox, ExtractedItem, PassageInfo
+from src.extractors.bbox_refiner import BBoxRefiner
+
+from .conftest import LEFT_X
+
+
+LINE_A = {"bbox": (50.0, 100.0, 200.0, 112.0), "text": "first line", "size": 11}
+LINE_B = {"bbox": (50.0, 115.0, 180.0, 127.0), "text": "second line", "size": 11}
+SEPARATOR = (297.0, 70.0, 298.0, 780.0)
+
+
+def make_elements(lines=(LINE_A, LINE_B), images=(), drawings=(SEPARATOR,)) -> dict:
+    return {
+        "rect": (595.0, 842.0),
+        "lines": list(lines),
+        "images": list(images),
+        "drawings": list(drawings),
+    }
+
+
+def make_refiner(dpi: int = 72) -> BBoxRefiner:
+    return BBoxRefiner(SimpleNamespace(dpi=dpi))
+
+
+def box(x1, y1, x2, y2) -> BoundingBox:
+    return BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2)
+
+
+class TestRefineBBox:
+    """단일 bbox 보정 테스트"""
+
+    def test_loose_bbox_snaps_to_lines(self):
+        result = make_refiner().refine_bbox(box(30, 80, 260, 150), make_elements())
+
+        assert result.snapped
+        assert result.cut_lines == []
+        # 라인 경계 + 여백 2pt, 오른쪽/아래는 픽셀 올림
+        assert (result.bbox.x1, result.bbox.y1) == (48, 98)
+        assert (result.bbox.x2, result.bbox.y2) == (203, 130)
+
+    def test_scaled_to_dpi(self):
+        result = make_refiner(dpi=144).refine_bbox(box(60, 160, 520, 300), make_elements())
+
+        assert (result.bbox.x1, result.bbox.y1) == (96, 196)
+        assert (result.bbox.x2, result.bbox.y2) == (405, 259)
+
+    def test_partially_covered_line_reported_as_cut(self):
+        # 두 번째 라인 높이의 1/4만 bbox 안에 있음
+        result = make_refiner().refine_bbox(box(30, 80, 260, 118), make_elements())
+
+        assert result.snapped
+        assert result.cut_lines == ["second line"]
+        assert result.bbox.y2 == 115
+
+    def test_barely_touched_line_ignored(self):
+        # 두 번째 라인 높이의 1/12만 걸침 (CUT_RATIO 미만)
+        result = make_refiner().refine_bbox(box(30, 80, 260, 116), make_elements())
+
+        assert result.cut_lines == []
+        assert result.bbox.y2 == 115
+
+    def test_separator_drawing_not_included(self):
+        result = make_refiner().refine_bbox(box(30, 80, 320, 150), make_elements())
+
+        assert result.bbox.x2 == 203
+
+    def test_contained_drawing_included(self):
+        figure = (60.0, 130.0, 240.0, 200.0)
+        elements = make_elements(drawings=(SEPARATOR, figure))
+        result = make_refiner().refine_bbox(box(30, 80, 260, 210), elements)
+
+        assert result.bbox.x2 == 243
+        assert result.bbox.y2 == 203
+
+    def test_no_elements_keeps_original(self):
+        original = box(300, 400, 400, 500)
+        result = make_refiner().refine_bbox(original, make_elements())
+
+        assert not result.snapped
+        assert result.bbox == original
+
+    def test_clamped_to_page(self):
+        edge = {"bbox": (0.5, 0.5, 594.5, 10.0), "text": "edge", "size": 9}
+        result = make_refiner().refine_bbox(box(0, 0, 595, 20), make_elements(lines=(edge,)))
+
+        assert (result.bbox.x1, result.bbox.y1) == (0, 0)
+        assert result.bbox.x2 == 596
+
+    def test_overlapping_line_after_snap_reported(self):
+        # 그림 옆으로 삐져나온 라인은 보정 후에도 일부만 포함됨
+        figure = (60.0, 130.0, 240.0, 200.0)
+        label = {"bbox": (230.0, 150.0, 400.0, 162.0), "text": "overlapping label", "size": 11}
+        elements = make_elements(lines=(LINE_A, LINE_B, label), drawings=(figure,))
+        result = make_refiner().refine_bbox(box(30, 80, 250, 205), elements)
+
+        assert "overlapping label" in result.cut_lines
+
+
+class TestRefinePage:
+    """페이지 일괄 보정 테스트"""
+
+    def test_cut_item_confidence_halved(self):
+        items = [
+            ExtractedItem(item_number="1", page_number=1, bbox=box(30, 80, 260, 118), confidence=0.9),
+            ExtractedItem(item_number="2", page_number=1, bbox=box(30, 80, 260, 150)),
+        ]
+        warnings = make_refiner().refine_page(1, items, elements=make_elements())
+
+        assert items[0].confidence == 0.45
+        assert items[1].confidence == 1.0
+        assert items[1].bbox == box(48, 98, 203, 130)
+        assert warnings == ["문항 1: 텍스트 라인 절단 1개 (second line)"]
+
+    def test_passage_bbox_list_refined(self):
+        passage = PassageInfo(
+            passage_id="1-2", page_number=1, item_range="1~2",
+            bbox=box(30, 80, 260, 150),
+            bbox_list=[box(30, 80, 260, 114), box(30, 114, 260, 150)],
+        )
+        warnings = make_refiner().refine_page(1, [], [passage], elements=make_elements())
+
+        assert passage.bbox == box(48, 98, 203, 130)
+        assert passage.bbox_list == [box(48, 98, 203, 115), box(48, 113, 183, 130)]
+        assert warnings == []
+
+    def test_reads_elements_from_pdf(self, extractor):
+        items = [ExtractedItem(item_number="1", page_number=1, bbox=box(20, 75, 290, 150))]
+        BBoxRefiner(extractor).refine_page(1, items)
+
+        assert items[0].bbox.x1 == pytest.approx(LEFT_X - 2, abs=1)
+        assert items[0].bbox.y1 > 75
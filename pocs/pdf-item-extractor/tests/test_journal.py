@@ -0,0 +1,99 @@
+"""페이지 저널 테스트"""
+
+from src.core.journal import PageJournal, segmentation_settings_hash
+from src.core.schemas import BoundingBox, ExtractedItem, PageRecord
+
+
+SETTINGS_HASH = segmentation_settings_hash({"text_segmentation": True, "segment_dpi": 150})
+
+
+def record(page_number: int, **overrides) -> PageRecord:
+    values = {
+        "page_number": page_number,
+        "pdf_hash": "pdf-a",
+        "dpi": 200,
+        "model_version": "model-a",
+        "segmenter": "agentic_vision",
+        "settings_hash": SETTINGS_HASH,
+        "items": [ExtractedItem(
+            item_number=str(page_number), page_number=page_number,
+            bbox=BoundingBox(x1=0, y1=0, x2=10, y2=10)
+        )],
+    }
+    values.update(overrides)
+    return PageRecord(**values)
+
+
+def load(journal: PageJournal, model_version: str = "model-a", settings_hash: str = SETTINGS_HASH):
+    return journal.load("pdf-a", 200, model_version, settings_hash)
+
+
+class TestPageJournal:
+    """PageJournal 테스트"""
+
+    def test_resume_returns_appended_pages(self, tmp_path):
+        journal = PageJournal(tmp_path / "journal" / "doc.jsonl")
+        journal.append(record(1))
+        journal.append(record(2))
+
+        records = load(journal)
+
+        assert sorted(records) == [1, 2]
+        assert records[2].items[0].item_number == "2"
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert load(PageJournal(tmp_path / "none.jsonl")) == {}
+
+    def test_truncated_last_line_ignored(self, tmp_path):
+        """중단으로 잘린 마지막 줄은 무시하고 완료된 페이지만 재사용"""
+        path = tmp_path / "doc.jsonl"
+        journal = PageJournal(path)
+        journal.append(record(1))
+        line = record(2).model_dump_json()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line[:len(line) // 2])
+
+        assert list(load(journal)) == [1]
+
+        # 재실행 후 기록은 잘린 줄에 붙지 않고 새 줄에서 시작
+        resumed = PageJournal(path)
+        resumed.append(record(3))
+        resumed.append(record(4))
+        assert sorted(load(resumed)) == [1, 3, 4]
+
+    def test_last_record_wins(self, tmp_path):
+        journal = PageJournal(tmp_path / "doc.jsonl")
+        journal.append(record(1, items=[]))
+        journal.append(record(1))
+
+        assert len(load(journal)[1].items) == 1
+
+    def test_filters_pdf_dpi_and_settings(self, tmp_path):
+        journal = PageJournal(tmp_path / "doc.jsonl")
+        journal.append(record(1, pdf_hash="pdf-b"))
+        journal.append(record(2, dpi=100))
+        journal.append(record(3, settings_hash="other"))
+        journal.append(record(4))
+
+        assert list(load(journal)) == [4]
+        assert load(journal, settings_hash="changed") == {}
+
+    def test_model_compared_only_for_agentic_vision_pages(self, tmp_path):
+        """텍스트 레이어로 분할한 페이지는 모델이 바뀌어도 재사용"""
+        journal = PageJournal(tmp_path / "doc.jsonl")
+        journal.append(record(1, segmenter="text_layer", model_version=""))
+        journal.append(record(2))
+
+        assert list(load(journal, model_version="model-b")) == [1]
+
+    def test_reset_removes_journal(self, tmp_path):
+        journal = PageJournal(tmp_path / "doc.jsonl")
+        journal.append(record(1))
+        journal.reset()
+
+        assert load(journal) == {}
+
+
+def test_settings_hash_depends_on_values():
+    assert segmentation_settings_hash({"a": 1, "b": 2}) == segmentation_settings_hash({"b": 2, "a": 1})
+    assert segmentation_settings_hash({"a": 1}) != segmentation_settings_hash({"a": 2})
@@ -0,0 +1,89 @@
+"""증분 JSON 파서 테스트"""
+
+import pytest
+
+from src.core.json_stream import IncrementalJSONParser
+
+
+RESPONSE = """```json
+{
+  "page": 3,
+  "items": [
+    {"item_number": "1", "box_2d": [10, 20, 300, 400], "note": "괄호 } 와 ] 포함"},
+    {"item_number": "2", "box_2d": [310, 20, 600, 400], "sub": {"a": [1, {"b": 2}]}}
+  ],
+  "passages": [
+    {"passage_id": "3-4", "text": "따옴표 \\"{\\" 이스케이프"}
+  ]
+}
+```
+설명 텍스트 {"무시": true}"""
+
+EXPECTED = [
+    ("items", {"item_number": "1", "box_2d": [10, 20, 300, 400], "note": "괄호 } 와 ] 포함"}),
+    ("items", {"item_number": "2", "box_2d": [310, 20, 600, 400], "sub": {"a": [1, {"b": 2}]}}),
+    ("passages", {"passage_id": "3-4", "text": '따옴표 "{" 이스케이프'}),
+]
+
+
+def feed_chunks(text: str, size: int) -> tuple[IncrementalJSONParser, list]:
+    parser = IncrementalJSONParser()
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return parser, completed
+
+
+class TestIncrementalJSONParser:
+    """펜스/분할 청크 입력 테스트"""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, len(RESPONSE)])
+    def test_fenced_response_any_chunking(self, size):
+        parser, completed = feed_chunks(RESPONSE, size)
+
+        assert completed == EXPECTED
+        assert parser.done
+        assert parser.text == RESPONSE
+
+    def test_objects_emitted_as_soon_as_closed(self):
+        parser = IncrementalJSONParser()
+        first_end = RESPONSE.index("포함\"}") + len("포함\"}")
+
+        assert parser.feed(RESPONSE[:first_end - 1]) == []
+        assert parser.feed(RESPONSE[first_end - 1:first_end]) == EXPECTED[:1]
+
+    def test_split_inside_escape(self):
+        split = RESPONSE.index("\\\"{") + 1
+        parser = IncrementalJSONParser()
+        completed = parser.feed(RESPONSE[:split]) + parser.feed(RESPONSE[split:])
+
+        assert completed == EXPECTED
+
+    def test_top_level_array(self):
+        _, completed = feed_chunks('```\n[{"item_number": "1"}, 5, {"item_number": "2"}]\n```', 3)
+
+        assert completed == [(None, {"item_number": "1"}), (None, {"item_number": "2"})]
+
+    def test_nested_array_key_not_target(self):
+        """최상위 객체의 배열만 대상 (중첩 객체 안의 배열 원소는 내보내지 않음)"""
+        _, completed = feed_chunks('{"meta": {"items": [{"x": 1}]}, "items": [{"y": 2}]}', 5)
+
+        assert completed == [("items", {"y": 2})]
+
+    def test_key_string_value_not_array_key(self):
+        _, completed = feed_chunks('{"label": "passages", "items": [{"n": 1}]}', 4)
+
+        assert completed == [("items", {"n": 1})]
+
+    def test_incomplete_response(self):
+        parser, completed = feed_chunks('{"items": [{"n": 1}, {"n": 2', 4)
+
+        assert completed == [("items", {"n": 1})]
+        assert not parser.done
+
+    def test_text_after_top_level_ignored(self):
+        parser = IncrementalJSONParser()
+        parser.feed('[{"n": 1}]')
+
+        assert parser.done
+        assert parser.feed(' [{"n": 2}]') == []
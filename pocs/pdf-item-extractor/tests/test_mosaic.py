@@ -0,0 +1,119 @@
+"""문항 이미지 모자이크 테스트"""
+
+import pytest
+from PIL import Image
+
+from src.parsers.mosaic import (
+    LABEL_HEIGHT, MOSAIC_GAP, build_mosaic, mosaic_layout, pack_groups, pack_label,
+)
+
+
+def to_mosaic_box(mosaic, cell, box: list[float]) -> list[float]:
+    """크롭 기준 box_2d를 모자이크 기준 box_2d로 변환 (모델 응답 흉내)"""
+    width, height = mosaic.image.size
+    ymin, xmin, ymax, xmax = box
+    return [
+        (cell.y + ymin / 1000 * cell.height) / height * 1000,
+        (cell.x + xmin / 1000 * cell.width) / width * 1000,
+        (cell.y + ymax / 1000 * cell.height) / height * 1000,
+        (cell.x + xmax / 1000 * cell.width) / width * 1000,
+    ]
+
+
+@pytest.fixture
+def mosaic():
+    crops = [Image.new("RGB", (400, 200), "red"), Image.new("RGB", (300, 500), "blue")]
+    return build_mosaic(crops, max_width=1536)
+
+
+class TestPackLabel:
+    """라벨 순서 테스트"""
+
+    @pytest.mark.parametrize("index, label", [(0, "A"), (25, "Z"), (26, "AA"), (27, "AB"), (52, "BA")])
+    def test_labels(self, index, label):
+        assert pack_label(index) == label
+
+
+class TestMosaicLayout:
+    """배치 계산 테스트"""
+
+    def test_single_row(self):
+        positions, width, height = mosaic_layout([(400, 200), (300, 500)], 1536)
+
+        assert positions == [(MOSAIC_GAP, MOSAIC_GAP), (MOSAIC_GAP * 2 + 400, MOSAIC_GAP)]
+        assert width == MOSAIC_GAP * 3 + 700
+        assert height == MOSAIC_GAP * 2 + LABEL_HEIGHT + 500
+
+    def test_wraps_to_next_row(self):
+        positions, _, _ = mosaic_layout([(400, 200), (300, 500)], 600)
+
+        assert positions[1] == (MOSAIC_GAP, MOSAIC_GAP * 2 + LABEL_HEIGHT + 200)
+
+    def test_wide_crop_widens_limit(self):
+        _, width, _ = mosaic_layout([(2000, 100)], 1536)
+
+        assert width == 2000 + MOSAIC_GAP * 2
+
+
+class TestBuildMosaic:
+    """모자이크 생성 테스트"""
+
+    def test_cells_match_pasted_crops(self, mosaic):
+        a, b = mosaic.cells
+
+        assert (a.label, a.width, a.height) == ("A", 400, 200)
+        assert (b.label, b.width, b.height) == ("B", 300, 500)
+        assert a.y == MOSAIC_GAP + LABEL_HEIGHT
+        assert mosaic.image.getpixel((a.x, a.y)) == (255, 0, 0)
+        assert mosaic.image.getpixel((b.x + b.width - 1, b.y + b.height - 1)) == (0, 0, 255)
+        assert mosaic.cell("B") is b
+        assert mosaic.cell("C") is None
+
+
+class TestToCropBox:
+    """모자이크 → 크롭 좌표 변환 테스트"""
+
+    @pytest.mark.parametrize("label", ["A", "B"])
+    def test_full_cell_maps_to_full_crop(self, mosaic, label):
+        cell = mosaic.cell(label)
+
+        assert mosaic.to_crop_box(cell, to_mosaic_box(mosaic, cell, [0, 0, 1000, 1000])) == [0, 0, 1000, 1000]
+
+    @pytest.mark.parametrize("label", ["A", "B"])
+    def test_sub_region(self, mosaic, label):
+        cell = mosaic.cell(label)
+        box = [100, 250, 600, 900]
+
+        assert mosaic.to_crop_box(cell, to_mosaic_box(mosaic, cell, box)) == box
+
+    def test_clamped_to_crop(self, mosaic):
+        cell = mosaic.cell("A")
+        # 라벨 띠와 옆 크롭까지 걸친 box
+        assert mosaic.to_crop_box(cell, [0, 0, 1000, 1000]) == [0, 0, 1000, 1000]
+        assert mosaic.to_crop_box(cell, to_mosaic_box(mosaic, cell, [-50, 500, 500, 1200])) == [0, 500, 500, 1000]
+
+    def test_string_numbers_accepted(self, mosaic):
+        cell = mosaic.cell("A")
+        box = [str(v) for v in to_mosaic_box(mosaic, cell, [0, 0, 1000, 1000])]
+
+        assert mosaic.to_crop_box(cell, box) == [0, 0, 1000, 1000]
+
+    @pytest.mark.parametrize("box", [None, [1, 2, 3], [1, 2, 3, "x"], "0,0,1,1"])
+    def test_malformed_returned_as_is(self, mosaic, box):
+        assert mosaic.to_crop_box(mosaic.cell("A"), box) == box
+
+
+class TestPackGroups:
+    """묶음 그룹 분할 테스트"""
+
+    def test_max_items(self):
+        groups = pack_groups([(100, 100)] * 5, "parts", max_items=2, token_budget=10_000,
+                             max_crop_tokens=10_000, max_width=1536)
+
+        assert groups == [[0, 1], [2, 3], [4]]
+
+    def test_large_crop_alone(self):
+        groups = pack_groups([(100, 100), (3000, 3000), (100, 100)], "mosaic", max_items=6,
+                             token_budget=10_000, max_crop_tokens=516, max_width=1536)
+
+        assert groups == [[1], [0, 2]]
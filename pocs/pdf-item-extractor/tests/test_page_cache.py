@@ -0,0 +1,123 @@
+"""페이지 캐시 테스트"""
+
+import os
+import time
+
+import pytest
+
+from src.extractors.page_cache import PageCache
+from src.extractors.page_renderer import PageRaster
+
+
+PDF_HASH = "a" * 64
+
+
+def page_key(page_number: int, fmt: str = "png") -> tuple[str, int, int, str]:
+    return (PDF_HASH, page_number, 100, fmt)
+
+
+def raster(size: int) -> PageRaster:
+    """size 바이트 그레이스케일 래스터"""
+    return PageRaster(width=size, height=1, mode="L", samples=bytes(size))
+
+
+class TestMemoryLRU:
+    """메모리 LRU 캐시 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        """예산을 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        cache = PageCache(max_bytes=300)
+        for page in (1, 2, 3):
+            cache.put(page_key(page), bytes(100), persist=False)
+
+        assert cache.get(page_key(1)) is not None  # 1을 최근 사용으로 갱신
+        cache.put(page_key(4), bytes(100), persist=False)
+
+        assert cache.peek(page_key(2)) is None
+        assert cache.peek(page_key(1)) is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.size_bytes == 300
+
+    def test_raster_size_counts_samples(self):
+        """PageRaster는 샘플 버퍼 크기로 예산을 계산"""
+        cache = PageCache(max_bytes=1000)
+        cache.put(page_key(1, "raw"), raster(600))
+        cache.put(page_key(2, "raw"), raster(600))
+
+        assert cache.peek(page_key(1, "raw")) is None
+        assert cache.size_bytes == 600
+
+    def test_item_larger_than_budget_not_kept(self):
+        """예산보다 큰 항목은 메모리에 두지 않음"""
+        cache = PageCache(max_bytes=100)
+        cache.put(page_key(1), bytes(50), persist=False)
+        cache.put(page_key(2), bytes(200), persist=False)
+
+        assert cache.peek(page_key(2)) is None
+        assert cache.peek(page_key(1)) is not None
+        assert cache.size_bytes == 50
+
+    def test_replacing_key_updates_size(self):
+        """같은 키를 다시 저장하면 이전 크기를 빼고 계산"""
+        cache = PageCache(max_bytes=1000)
+        cache.put(page_key(1), bytes(400), persist=False)
+        cache.put(page_key(1), bytes(100), persist=False)
+
+        assert cache.size_bytes == 100
+        cache.discard(page_key(1))
+        assert cache.size_bytes == 0
+
+    def test_miss_and_hit_rate(self):
+        cache = PageCache(max_bytes=1000)
+        assert cache.get(page_key(1)) is None
+        cache.put(page_key(1), b"png", persist=False)
+        assert cache.get(page_key(1)) == b"png"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+class TestDiskCache:
+    """디스크 캐시 테스트"""
+
+    def test_disk_hit_after_memory_eviction(self, tmp_path):
+        """메모리에서 제거된 인코딩 페이지는 디스크에서 다시 읽음"""
+        cache = PageCache(max_bytes=100, disk_dir=tmp_path)
+        cache.put(page_key(1), b"1" * 80)
+        cache.put(page_key(2), b"2" * 80)
+
+        assert cache.peek(page_key(1)) is None
+        assert cache.get(page_key(1)) == b"1" * 80
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_raw_raster_not_persisted(self, tmp_path):
+        """인코딩되지 않은 래스터는 디스크에 저장하지 않음"""
+        cache = PageCache(max_bytes=1000, disk_dir=tmp_path)
+        cache.put(page_key(1, "raw"), raster(10))
+
+        assert list(tmp_path.rglob("*")) == []
+
+    def test_disk_limit_prunes_oldest_files(self, tmp_path):
+        """디스크 최대 크기를 넘으면 사용 시각이 오래된 파일부터 삭제"""
+        cache = PageCache(max_bytes=10, disk_dir=tmp_path, disk_max_bytes=2500)
+        cache.put(page_key(1), bytes(1000))
+        cache.put(page_key(2), bytes(1000))
+        # 페이지 1을 최근 사용으로 갱신 (mtime 기준)
+        old = time.time() - 60
+        os.utime(cache._disk_path(page_key(2)), (old, old))
+        assert cache.get(page_key(1)) is not None
+
+        cache.put(page_key(3), bytes(1000))
+
+        remaining = sorted(path.name for path in tmp_path.rglob("*.png"))
+        assert remaining == ["p1_d100.png", "p3_d100.png"]
+        assert cache.stats()["disk_evictions"] == 1
+
+    def test_disk_unlimited_by_default(self, tmp_path):
+        cache = PageCache(max_bytes=10, disk_dir=tmp_path)
+        for page in range(5):
+            cache.put(page_key(page), bytes(1000))
+
+        assert len(list(tmp_path.rglob("*.png"))) == 5
@@ -0,0 +1,122 @@
+"""PDF 추출기 페이지 렌더링/캐시 테스트"""
+
+import pytest
+
+from src.extractors.page_cache import PageCache
+from src.extractors.pdf_extractor import PDFExtractor
+
+from .conftest import write_exam_pdf
+
+
+DPI = 72
+
+
+@pytest.fixture
+def three_page_pdf(tmp_path):
+    return write_exam_pdf(tmp_path / "exam3.pdf", pages=3)
+
+
+def open_extractor(path, disk_dir, disk_max_bytes: int = 0) -> PDFExtractor:
+    """디스크 캐시를 쓰는 새 추출기 (메모리 캐시는 인스턴스마다 비어 있음)"""
+    cache = PageCache(max_bytes=64 * 1024 * 1024, disk_dir=disk_dir, disk_max_bytes=disk_max_bytes)
+    return PDFExtractor(path, dpi=DPI, page_cache=cache)
+
+
+class TestRenderDiskCache:
+    """재실행 시 디스크 캐시 재사용 테스트"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_rerun_reads_disk_cache(self, three_page_pdf, tmp_path, workers):
+        disk_dir = tmp_path / "page_cache"
+        with open_extractor(three_page_pdf, disk_dir) as first:
+            rendered = first.render_pages([1, 2, 3], workers=workers)
+            assert first.page_cache.stats()["misses"] == 3
+
+        assert len(list(disk_dir.glob("*/*.png"))) == 3
+
+        with open_extractor(three_page_pdf, disk_dir) as second:
+            cached = second.render_pages([1, 2, 3], workers=workers)
+            stats = second.page_cache.stats()
+
+        assert (stats["disk_hits"], stats["misses"]) == (3, 0)
+        assert [r.samples for r in cached] == [r.samples for r in rendered]
+        assert (cached[0].width, cached[0].height) == (rendered[0].width, rendered[0].height)
+
+    def test_get_page_raster_reads_disk_cache(self, three_page_pdf, tmp_path):
+        disk_dir = tmp_path / "page_cache"
+        with open_extractor(three_page_pdf, disk_dir) as first:
+            rendered = first.get_page_raster(2)
+
+        with open_extractor(three_page_pdf, disk_dir) as second:
+            cached = second.get_page_raster(2)
+            assert second.page_cache.stats()["disk_hits"] == 1
+
+        assert cached.samples == rendered.samples
+
+    def test_dpi_cached_separately(self, three_page_pdf, tmp_path):
+        disk_dir = tmp_path / "page_cache"
+        with open_extractor(three_page_pdf, disk_dir) as first:
+            first.render_pages([1], dpi=DPI)
+
+        with open_extractor(three_page_pdf, disk_dir) as second:
+            raster = second.render_pages([1], dpi=DPI * 2)[0]
+            assert second.page_cache.stats()["misses"] == 1
+
+        assert raster.width == 595 * 2
+
+    def test_memory_only_cache_writes_nothing(self, three_page_pdf, tmp_path):
+        with PDFExtractor(three_page_pdf, dpi=DPI, page_cache=PageCache(max_bytes=64 * 1024 * 1024)) as extractor:
+            extractor.render_pages([1, 2], workers=2)
+            extractor.render_pages([1, 2], workers=2)
+            assert extractor.page_cache.stats()["hits"] == 2
+
+        assert not list(tmp_path.rglob("*.png"))
+
+
+class TestRenderDiskLimit:
+    """렌더링 경로의 디스크 캐시 크기 제한 테스트"""
+
+    def test_rerun_within_disk_budget(self, three_page_pdf, tmp_path):
+        """예산이 2페이지분이면 가장 오래된 페이지를 지우고, 재실행 시 그 페이지만 다시 렌더링"""
+        with open_extractor(three_page_pdf, tmp_path / "measure") as extractor:
+            extractor.render_pages([1], workers=1)
+        page_bytes = next((tmp_path / "measure").glob("*/*.png")).stat().st_size
+
+        disk_dir = tmp_path / "page_cache"
+        budget = page_bytes * 2 + page_bytes // 2
+        with open_extractor(three_page_pdf, disk_dir, budget) as first:
+            first.render_pages([1, 2, 3], workers=1)
+            assert first.page_cache.stats()["disk_evictions"] == 1
+
+        assert sorted(path.name for path in disk_dir.glob("*/*.png")) == ["p2_d72.png", "p3_d72.png"]
+
+        with open_extractor(three_page_pdf, disk_dir, budget) as second:
+            second.render_pages([1, 2, 3], workers=1)
+            stats = second.page_cache.stats()
+
+        assert (stats["disk_hits"], stats["misses"], stats["disk_evictions"]) == (2, 1, 1)
+        total = sum(path.stat().st_size for path in disk_dir.glob("*/*.png"))
+        assert total <= budget
+
+
+class TestRenderPool:
+    """렌더링 프로세스 풀 재사용 테스트"""
+
+    def test_pool_reused_across_calls(self, three_page_pdf):
+        with PDFExtractor(three_page_pdf, dpi=DPI, page_cache=PageCache(max_bytes=64 * 1024 * 1024)) as extractor:
+            extractor.render_pages([1, 2], workers=2)
+            pool = extractor._render_pool
+            pids = set(pool._executor._processes)
+            rasters = extractor.render_pages([2, 3], workers=2, dpi=DPI * 2)
+
+            assert extractor._render_pool is pool
+            assert set(pool._executor._processes) == pids
+            assert rasters[1].width == 595 * 2
+
+        assert extractor._render_pool is None
+
+    def test_sequential_render_starts_no_pool(self, three_page_pdf):
+        with PDFExtractor(three_page_pdf, dpi=DPI, page_cache=PageCache(max_bytes=64 * 1024 * 1024)) as extractor:
+            extractor.render_pages([1, 2, 3], workers=1)
+
+            assert extractor._render_pool is None
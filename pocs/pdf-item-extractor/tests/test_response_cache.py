@@ -0,0 +1,168 @@
+"""모델 응답 캐시 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+
+from src.agents import response_cache as response_cache_module
+from src.agents.response_cache import ResponseCache, parts_digest, response_cache_key
+
+
+class FakeClock:
+    """time.time() 대체용 시계"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache_module, "time", SimpleNamespace(time=fake.time))
+    return fake
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+
+    def factory(ttl_seconds: float = 0, max_bytes: int = 1024, bypass: bool = False) -> ResponseCache:
+        cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds, max_bytes, bypass=bypass)
+        caches.append(cache)
+        return cache
+
+    yield factory
+    for cache in caches:
+        cache.close()
+
+
+class TestResponseCacheKey:
+    """캐시 키 테스트"""
+
+    def test_stable_for_same_input(self):
+        config = types.GenerateContentConfig(temperature=0)
+        assert response_cache_key("m", "p", b"img", config) == response_cache_key("m", "p", b"img", config)
+
+    def test_changes_with_each_field(self):
+        base = response_cache_key("m", "p", b"img")
+        assert response_cache_key("m2", "p", b"img") != base
+        assert response_cache_key("m", "p2", b"img") != base
+        assert response_cache_key("m", "p", b"img2") != base
+        assert response_cache_key("m", "p", b"img", types.GenerateContentConfig(temperature=0)) != base
+
+    def test_field_boundaries(self):
+        assert response_cache_key("ab", "c", b"") != response_cache_key("a", "bc", b"")
+
+    def test_parts_digest_boundaries(self):
+        """파트 경계만 다른 묶음 입력은 다른 키"""
+        assert parts_digest([b"ab", b"c"]) != parts_digest([b"a", b"bc"])
+        assert parts_digest([b"abc"]) != parts_digest([b"abc", b""])
+        assert parts_digest([b"a", b"b"]) != parts_digest([b"b", b"a"])
+        assert parts_digest([b"a", b"b"]) == parts_digest([b"a", b"b"])
+
+
+class TestResponseCache:
+    """TTL / 크기 제거 테스트"""
+
+    def test_put_get(self, make_cache):
+        cache = make_cache()
+        cache.put("k", "model", "응답")
+
+        assert cache.get("k") == "응답"
+        assert cache.get("missing") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+        assert stats["size_bytes"] == len("응답".encode("utf-8"))
+
+    def test_empty_and_oversized_not_stored(self, make_cache):
+        cache = make_cache(max_bytes=10)
+        cache.put("empty", "model", "")
+        cache.put("big", "model", "x" * 11)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_ttl_expires_on_get(self, make_cache, clock):
+        cache = make_cache(ttl_seconds=60)
+        cache.put("k", "model", "text")
+
+        clock.now += 59
+        assert cache.get("k") == "text"
+        clock.now += 2
+        assert cache.get("k") is None
+        assert cache.stats()["expired"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_ttl_counts_from_creation_not_access(self, make_cache, clock):
+        cache = make_cache(ttl_seconds=60)
+        cache.put("k", "model", "text")
+        for _ in range(3):
+            clock.now += 25
+            cache.get("k")
+
+        assert cache.get("k") is None
+
+    def test_expired_entries_purged_on_put(self, make_cache, clock):
+        cache = make_cache(ttl_seconds=60)
+        cache.put("old", "model", "text")
+        clock.now += 120
+        cache.put("new", "model", "text")
+
+        assert cache.stats()["entries"] == 1
+        assert cache.stats()["expired"] == 1
+
+    def test_zero_ttl_never_expires(self, make_cache, clock):
+        cache = make_cache(ttl_seconds=0)
+        cache.put("k", "model", "text")
+        clock.now += 10 * 365 * 24 * 3600
+
+        assert cache.get("k") == "text"
+
+    def test_size_eviction_least_recently_used(self, make_cache, clock):
+        cache = make_cache(max_bytes=30)
+        for key in ("a", "b", "c"):
+            cache.put(key, "model", "x" * 10)
+            clock.now += 1
+        # a를 최근 사용으로 갱신 → 다음 저장 시 b가 제거됨
+        cache.get("a")
+        clock.now += 1
+        cache.put("d", "model", "x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get("d") is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["size_bytes"] == 30
+
+    def test_replace_does_not_double_count(self, make_cache):
+        cache = make_cache(max_bytes=20)
+        cache.put("k", "model", "x" * 15)
+        cache.put("k", "model", "y" * 15)
+
+        assert cache.get("k") == "y" * 15
+        assert cache.stats()["evictions"] == 0
+
+    def test_bypass_skips_lookup_but_writes(self, make_cache):
+        cache = make_cache(bypass=True)
+        cache.put("k", "model", "text")
+
+        assert cache.get("k") is None
+        assert cache.stats()["bypassed"] == 1
+        assert cache.stats()["entries"] == 1
+
+    def test_persists_across_instances(self, make_cache):
+        make_cache().put("k", "model", "text")
+
+        assert make_cache().get("k") == "text"
+
+    def test_clear(self, make_cache):
+        cache = make_cache()
+        cache.put("k", "model", "text")
+        cache.clear()
+
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,122 @@
+"""단계별 실행기 테스트"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.stage_runner import Stage, StagedRunner
+
+
+def run_with_timeout(runner: StagedRunner, inputs, timeout: float = 5.0) -> list:
+    """실행기가 종료되지 않으면 실패하도록 별도 스레드에서 실행"""
+    results = []
+    thread = threading.Thread(target=lambda: results.extend(runner.run(inputs)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "실행기가 종료되지 않았습니다"
+    return results
+
+
+def stage_threads() -> list[threading.Thread]:
+    return [thread for thread in threading.enumerate() if thread.name.startswith("stage-")]
+
+
+class TestStagedRunner:
+    """StagedRunner 테스트"""
+
+    def test_requires_stage(self):
+        with pytest.raises(ValueError):
+            StagedRunner([])
+
+    def test_results_pass_through_all_stages(self):
+        runner = StagedRunner([
+            Stage("double", lambda x: x * 2, workers=2),
+            Stage("inc", lambda x: x + 1, workers=3),
+        ], queue_size=1)
+
+        results = run_with_timeout(runner, range(20))
+
+        assert sorted(results) == [x * 2 + 1 for x in range(20)]
+        assert runner.errors == []
+
+    def test_none_is_dropped_and_expand_emits_each_value(self):
+        runner = StagedRunner([
+            Stage("split", lambda x: [x, x + 100], expand=True),
+            Stage("odd", lambda x: x if x % 2 else None),
+        ])
+
+        results = run_with_timeout(runner, [1, 2, 3])
+
+        assert sorted(results) == [1, 3, 101, 103]
+
+    def test_errors_collected_and_other_tasks_continue(self):
+        """실패한 작업은 오류로 기록하고 나머지 작업과 다음 단계는 계속 처리"""
+        def check(x):
+            if x == 3:
+                raise RuntimeError("page 3 failed")
+            return x
+
+        runner = StagedRunner([Stage("check", check, workers=2), Stage("out", lambda x: x)])
+
+        results = run_with_timeout(runner, range(6))
+
+        assert sorted(results) == [0, 1, 2, 4, 5]
+        assert len(runner.errors) == 1
+        error = runner.errors[0]
+        assert error.stage == "check"
+        assert error.task == 3
+        assert "page 3 failed" in error.traceback
+
+    def test_all_workers_shut_down(self):
+        """마지막 단계까지 종료 신호가 전달되어 워커 스레드가 모두 끝남"""
+        def slow(x):
+            time.sleep(0.01)
+            return x
+
+        runner = StagedRunner([
+            Stage("a", slow, workers=4),
+            Stage("b", lambda x: 1 / 0 if x == 0 else x, workers=2),
+            Stage("c", slow, workers=3),
+        ], queue_size=2)
+
+        run_with_timeout(runner, range(10))
+
+        assert stage_threads() == []
+
+    def test_errors_reset_between_runs(self):
+        runner = StagedRunner([Stage("fail", lambda x: 1 / 0)])
+
+        run_with_timeout(runner, [1])
+        assert len(runner.errors) == 1
+        run_with_timeout(runner, [])
+        assert runner.errors == []
+
+    def test_bounded_queue_limits_in_flight_inputs(self):
+        """느린 단계 앞의 큐가 가득 차면 입력 공급이 대기"""
+        started = []
+        release = threading.Event()
+
+        def blocked(x):
+            started.append(x)
+            release.wait(5)
+            return x
+
+        consumed = []
+
+        def inputs():
+            for x in range(10):
+                consumed.append(x)
+                yield x
+
+        runner = StagedRunner([Stage("blocked", blocked)], queue_size=2)
+        thread = threading.Thread(target=runner.run, args=(inputs(),), daemon=True)
+        thread.start()
+        time.sleep(0.2)
+
+        # 처리 중 1개 + 큐 2개 + 대기 중인 put 1개
+        assert len(consumed) <= 4
+        release.set()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert len(started) == 10
@@ -0,0 +1,133 @@
+"""텍스트 레이어 분할기 테스트 (합성 PDF)"""
+
+import pytest
+
+from src.core.schemas import ItemType
+from src.extractors.page_cache import PageCache
+from src.extractors.pdf_extractor import PDFExtractor
+from src.extractors.text_segmenter import ITEM_ANCHOR, PASSAGE_ANCHOR, TextLayerSegmenter
+
+from .conftest import EXAM_LINES, LEFT_X, RIGHT_X, SEPARATOR_X, write_exam_pdf
+
+
+def open_extractor(path, dpi: int = 72) -> PDFExtractor:
+    return PDFExtractor(path, dpi=dpi, page_cache=PageCache(max_bytes=64 * 1024 * 1024))
+
+
+class TestAnchorPatterns:
+    """문항/지문 번호 패턴 테스트"""
+
+    @pytest.mark.parametrize("text, number", [("12. 다음", "12"), (" 3 .", "3"), ("7.다음", "7")])
+    def test_item_anchor(self, text, number):
+        assert ITEM_ANCHOR.match(text).group(1) == number
+
+    @pytest.mark.parametrize("text", ["3.14 는 원주율", "x. 12", "123. 번호 아님"])
+    def test_item_anchor_rejects(self, text):
+        assert ITEM_ANCHOR.match(text) is None
+
+    @pytest.mark.parametrize("text", ["[4 ~ 6] 다음 글", "[4~6]", "[ 4 – 6 ]", "[4∼6]"])
+    def test_passage_anchor(self, text):
+        assert PASSAGE_ANCHOR.match(text).groups() == ("4", "6")
+
+
+class TestColumnDetection:
+    """단 구분선 검출 테스트"""
+
+    def test_separator_splits_two_columns(self, extractor):
+        layout = TextLayerSegmenter(extractor).detect_columns(1)
+
+        assert layout.has_separator
+        assert len(layout.columns) == 2
+        assert layout.columns[0] == (LEFT_X, SEPARATOR_X)
+        assert layout.columns[1][0] == SEPARATOR_X
+        # 본문은 머리글 가로선 아래, 쪽번호 상자 위 (구분선 범위)
+        assert layout.content[1] == pytest.approx(70)
+        assert layout.content[3] == pytest.approx(780)
+
+    def test_column_tiles_scaled_to_dpi(self, exam_pdf):
+        with open_extractor(exam_pdf, dpi=144) as extractor:
+            tiles = TextLayerSegmenter(extractor).column_tiles(1, margin=6.0)
+
+        assert len(tiles) == 2
+        assert tiles[0].x1 == (LEFT_X - 6) * 2
+        assert tiles[0].x2 == int((SEPARATOR_X + 6) * 2)
+        assert tiles[1].x1 == int((SEPARATOR_X - 6) * 2)
+        assert tiles[0].y1 == tiles[1].y1 == (70 - 6) * 2
+
+    def test_no_separator_single_column(self, tmp_path):
+        path = write_exam_pdf(tmp_path / "single.pdf", separator=False)
+        with open_extractor(path) as extractor:
+            segmenter = TextLayerSegmenter(extractor)
+            layout = segmenter.detect_columns(1)
+            tiles = segmenter.column_tiles(1)
+
+        assert not layout.has_separator
+        assert len(layout.columns) == 1
+        assert tiles == []
+
+
+class TestSegment:
+    """문항/지문 분할 테스트"""
+
+    def test_items_and_passage_in_reading_order(self, extractor):
+        result = TextLayerSegmenter(extractor).segment(1)
+
+        assert result.confidence == 1.0
+        assert result.notes == []
+        assert [item.item_number for item in result.items] == ["1", "2", "3", "4"]
+        assert [passage.passage_id for passage in result.passages] == ["3-4"]
+
+    def test_item_regions_follow_anchors(self, extractor):
+        items = {item.item_number: item for item in TextLayerSegmenter(extractor).segment(1).items}
+
+        # 1번은 다음 문항 번호 전까지의 줄을 포함
+        assert items["1"].bbox.x1 == LEFT_X
+        assert items["1"].bbox.y2 < items["2"].bbox.y1
+        # 4번은 아래 그림까지 포함
+        assert items["4"].bbox.y2 == pytest.approx(480)
+        assert items["3"].bbox.x1 == RIGHT_X
+
+    def test_passage_reference(self, extractor):
+        result = TextLayerSegmenter(extractor).segment(1)
+        items = {item.item_number: item for item in result.items}
+
+        assert items["1"].item_type == ItemType.STANDALONE
+        assert items["3"].passage_ref == "3-4"
+        assert items["4"].item_type == ItemType.PASSAGE_GROUP
+        passage = result.passages[0]
+        assert passage.item_range == "3~4"
+        assert passage.bbox.y2 < items["3"].bbox.y1
+
+    def test_coordinates_scaled_to_dpi(self, exam_pdf):
+        with open_extractor(exam_pdf, dpi=144) as extractor:
+            items = TextLayerSegmenter(extractor).segment(1).items
+
+        assert items[0].bbox.x1 == LEFT_X * 2
+
+    def test_number_gap_lowers_confidence(self, tmp_path):
+        lines = [line for line in EXAM_LINES if not line[2].startswith("2.")]
+        path = write_exam_pdf(tmp_path / "gap.pdf", lines=lines)
+        with open_extractor(path) as extractor:
+            result = TextLayerSegmenter(extractor).segment(1)
+
+        assert result.confidence == 0.5
+        assert any("불연속" in note for note in result.notes)
+
+    def test_small_numbered_list_not_anchor(self, tmp_path):
+        """본문 안의 작은 글자 번호 목록은 문항 번호로 보지 않음"""
+        lines = EXAM_LINES + [(LEFT_X, 160, "3. a numbered note in the body", 8)]
+        path = write_exam_pdf(tmp_path / "list.pdf", lines=lines)
+        with open_extractor(path) as extractor:
+            result = TextLayerSegmenter(extractor).segment(1)
+
+        assert [item.item_number for item in result.items] == ["1", "2", "3", "4"]
+        assert result.confidence == 1.0
+
+    def test_page_without_items(self, tmp_path):
+        path = write_exam_pdf(tmp_path / "empty.pdf", lines=[(LEFT_X, 100, "No numbered items", 11)])
+        with open_extractor(path) as extractor:
+            result = TextLayerSegmenter(extractor).segment(1)
+
+        assert result.items == []
+        assert result.confidence == 0.0
+        assert "문항 번호 없음" in result.notes